@@ -1,12 +1,15 @@
 """Main Streamlit app - Ad Network Management Hub"""
 import streamlit as st
 import os
-from typing import Optional
 from pathlib import Path
 from utils.session_manager import SessionManager
 from utils.network_manager import get_network_manager
 from network_configs import get_available_networks, get_network_display_names, get_network_config
-from utils.helpers import get_env_var
+from utils.health_probe import (
+    get_health_probe_service,
+    STATUS_OK, STATUS_CONFIGURED, STATUS_EMPTY, STATUS_ERROR, STATUS_NOT_SET, STATUS_PENDING
+)
+from utils.inventory_sync import get_inventory_sync_service
 
 
 
@@ -87,87 +90,37 @@ with st.sidebar:
     st.subheader("Connection Status")
     network_manager = get_network_manager()
     
+    # Rendered from the background health probe cache (never waits for network calls)
+    health_service = get_health_probe_service()
+    status_labels = {
+        STATUS_OK: "✅ {latency}",
+        STATUS_CONFIGURED: "✅ Active",
+        STATUS_EMPTY: "⚠️ 응답 없음",
+        STATUS_ERROR: "❌ 오류",
+        STATUS_NOT_SET: "⚠️ Not Set",
+        STATUS_PENDING: "⏳ 확인 중",
+    }
     for network in available_networks:
-        config = get_network_config(network)
         display_name = display_names.get(network, network.title())
-        
-        # Helper function to get env vars from Streamlit secrets or .env
-        def get_env(key: str) -> Optional[str]:
-            return get_env_var(key)
-        
-        # Check if network credentials are set
-        if network == "ironsource":
-            # Check IronSource credentials
-            bearer_token = get_env("IRONSOURCE_BEARER_TOKEN") or get_env("IRONSOURCE_API_TOKEN")
-            refresh_token = get_env("IRONSOURCE_REFRESH_TOKEN")
-            secret_key = get_env("IRONSOURCE_SECRET_KEY")
-            if bearer_token or (refresh_token and secret_key):
-                status = "✅ Active"
-            else:
-                status = "⚠️ Not Set"
-        elif network == "pangle":
-            # Check Pangle credentials
-            security_key = get_env("PANGLE_SECURITY_KEY")
-            user_id = get_env("PANGLE_USER_ID")
-            role_id = get_env("PANGLE_ROLE_ID")
-            if security_key and user_id and role_id:
-                status = "✅ Active"
-            else:
-                status = "⚠️ Not Set"
-        elif network == "bigoads":
-            # Check for BigOAds credentials
-            developer_id = get_env("BIGOADS_DEVELOPER_ID")
-            token = get_env("BIGOADS_TOKEN")
-            if developer_id and token:
-                status = "✅ Active"
-            else:
-                status = "⚠️ Not Set"
-        elif network == "mintegral":
-            # Check for Mintegral credentials
-            skey = get_env("MINTEGRAL_SKEY")
-            secret = get_env("MINTEGRAL_SECRET")
-            if skey and secret:
-                status = "✅ Active"
-            else:
-                status = "⚠️ Not Set"
-        elif network == "inmobi":
-            # Check for InMobi credentials
-            account_name = get_env("INMOBI_ACCOUNT_NAME")
-            account_id = get_env("INMOBI_ACCOUNT_ID")
-            username = get_env("INMOBI_USERNAME")
-            client_secret = get_env("INMOBI_CLIENT_SECRET")
-            # InMobi 인증 방식에 따라 필요한 필드 확인 (API 문서 참조 필요)
-            if account_name and account_id and username and client_secret:
-                status = "✅ Active"
-            else:
-                status = "⚠️ Not Set"
-        elif network == "fyber":
-            # Check for Fyber (DT) credentials
-            client_id = get_env("DT_CLIENT_ID")
-            client_secret = get_env("DT_CLIENT_SECRET")
-            access_token = get_env("FYBER_ACCESS_TOKEN")
-            publisher_id = get_env("FYBER_PUBLISHER_ID")
-            # Fyber 인증 방식에 따라 필요한 필드 확인 (API 문서 참조 필요)
-            if client_id and client_secret and access_token and publisher_id:
-                status = "✅ Active"
-            else:
-                status = "⚠️ Not Set"
-        elif network == "applovin":
-            # Check for AppLovin credentials
-            api_key = get_env("APPLOVIN_API_KEY")
-            if api_key:
-                status = "✅ Active"
-            else:
-                status = "⚠️ Not Set"
-        else:
-            # For other networks, check credentials
-            status = "⚠️ Not Set"
+        health = health_service.get_status(network)
+        latency = f"{health['latency_ms']:.0f}ms" if health["latency_ms"] is not None else ""
+        status = status_labels.get(health["status"], "⚠️ Not Set").format(latency=latency)
         
         col1, col2 = st.columns([2, 1])
         with col1:
             st.write(f"**{display_name}**")
         with col2:
-            st.write(status)
+            st.markdown(status, help=health["error"] if health["error"] else None)
+    
+    # Live checks only when NETWORK_HEALTH_PROBE is on (otherwise credentials only)
+    if health_service.running:
+        last_checked = health_service.last_checked()
+        col1, col2 = st.columns([2, 1])
+        with col1:
+            st.caption(f"Last check: {last_checked.strftime('%H:%M:%S')}" if last_checked else "Checking connections...")
+        with col2:
+            if st.button("🔄", key="refresh_connection_status", help="Connection status 다시 확인"):
+                health_service.request_refresh()
 
 # Main content
 st.title("🌐 Ad Network Management Hub")
@@ -185,20 +138,24 @@ st.subheader("📊 Network Statistics")
 
 # Get cached data
 apps_cache = SessionManager.get_cached_apps(current_network)
-last_sync = st.session_state.get('last_sync_time', {}).get(current_network)
+last_sync = SessionManager.get_last_sync_time(current_network)
+
+# Warm inventory from the background sync (read from cache, never waits for network calls)
+inventory_sync = get_inventory_sync_service()
 
 # Create statistics table
 stats_data = []
 for network in available_networks:
     network_display = display_names.get(network, network.title())
     apps = SessionManager.get_cached_apps(network)
-    sync_time = st.session_state.get('last_sync_time', {}).get(network)
+    sync_status = inventory_sync.get_status(network)
+    app_count = len(apps) if apps else sync_status["apps"]
     
     stats_data.append({
         "Network": network_display,
-        "Apps": len(apps) if apps else "-",
+        "Apps": app_count if app_count else "-",
         "Units": "-",  # Would need to aggregate from units_cache
-        "Last Sync": sync_time.strftime("%Y-%m-%d %H:%M") if sync_time else "Never"
+        "Last Sync": SessionManager.get_last_sync_age(network)
     })
 
 if stats_data:
@@ -206,6 +163,9 @@ if stats_data:
 else:
     st.info("No data available. Use 'View Lists' to fetch data from networks.")
 
+if inventory_sync.running:
+    st.caption(f"🔄 Background sync every {inventory_sync.interval / 60:.0f} min (INVENTORY_SYNC)")
+
 # Refresh button
 if st.button("🔄 Refresh All Networks"):
     with st.spinner("Refreshing network data..."):
@@ -214,6 +174,8 @@ if st.button("🔄 Refresh All Networks"):
             try:
                 apps = network_manager.get_apps(network)
                 SessionManager.cache_apps(network, apps)
+                if apps:
+                    inventory_sync.record_apps(network, apps)
                 st.success(f"✅ {display_names.get(network, network)} refreshed")
             except Exception as e:
                 st.error(f"❌ Failed to refresh {network}: {str(e)}")
@@ -227,18 +189,18 @@ col1, col2 = st.columns(2)
 
 with col1:
     st.write("**Created Apps**")
-    created_apps = st.session_state.get('created_apps', [])
+    created_apps = SessionManager.get_history('created_apps', limit=5)
     if created_apps:
-        for app in created_apps[-5:]:  # Show last 5
+        for app in created_apps:  # Show last 5
             st.write(f"- {app.get('name', 'Unknown')} ({app.get('network', 'unknown')})")
     else:
         st.info("No apps created yet")
 
 with col2:
     st.write("**Created Units**")
-    created_units = st.session_state.get('created_units', [])
+    created_units = SessionManager.get_history('created_units', limit=5)
     if created_units:
-        for unit in created_units[-5:]:  # Show last 5
+        for unit in created_units:  # Show last 5
             st.write(f"- {unit.get('name', 'Unknown')} ({unit.get('network', 'unknown')})")
     else:
         st.info("No units created yet")
@@ -0,0 +1,421 @@
+"""Bulk Create App - staged pipeline driven by a CSV of store URLs"""
+import csv
+import io
+import logging
+from concurrent.futures import ThreadPoolExecutor, FIRST_COMPLETED, wait
+from typing import Dict, Iterator, List
+
+import streamlit as st
+
+from utils.session_manager import SessionManager
+from utils.network_manager import get_network_manager
+from utils.request_scheduler import BULK, request_priority
+from utils.app_store_helper import fetch_store_details_concurrently
+from network_configs import get_network_config, get_network_display_names, NETWORK_REGISTRY
+
+logger = logging.getLogger(__name__)
+
+# Pipeline stages (in order)
+STAGE_STORE = "store"
+STAGE_CATEGORY = "category"
+STAGE_PAYLOAD = "payload"
+STAGE_CREATE_APP = "create_app"
+STAGE_CREATE_UNITS = "create_units"
+
+# Worker threads per stage
+_STAGE_WORKERS = {
+    STAGE_STORE: 6,
+    STAGE_CATEGORY: 2,
+    STAGE_PAYLOAD: 4,
+    STAGE_CREATE_APP: 6,
+    STAGE_CREATE_UNITS: 6,
+}
+
+# Networks whose default RV/IS/BN units are created right after app creation
+# (same set as the one-click UI, which calls create_ad_units_immediately for these)
+_UNIT_NETWORKS = ["ironsource", "inmobi", "bigoads", "fyber", "mintegral", "pangle", "vungle"]
+
+
+def parse_store_url_csv(csv_text: str) -> List[Dict]:
+    """Parse a CSV of store URLs into title rows
+
+    Each row is one title. Any cell containing an App Store URL is used as the iOS URL
+    and any cell containing a Google Play URL as the Android URL, so both
+    "ios_url,android_url" headers and header-less files work.
+
+    Args:
+        csv_text: CSV content
+
+    Returns:
+        List of {"ios_url": str or None, "android_url": str or None} (duplicates removed)
+    """
+    titles = []
+    seen = set()
+    for row in csv.reader(io.StringIO(csv_text or "")):
+        ios_url = None
+        android_url = None
+        for cell in row:
+            cell = cell.strip()
+            if not ios_url and ("apps.apple.com" in cell or "itunes.apple.com" in cell):
+                ios_url = cell
+            elif not android_url and "play.google.com" in cell:
+                android_url = cell
+        if not ios_url and not android_url:
+            continue
+        key = (ios_url, android_url)
+        if key in seen:
+            continue
+        seen.add(key)
+        titles.append({"ios_url": ios_url, "android_url": android_url})
+    return titles
+
+
+def _stage_store(title: Dict) -> Dict:
+    """Stage 1: fetch iOS/Android store metadata (both platforms in parallel)"""
+    store = {"ios_info": None, "android_info": None, "errors": []}
+    for platform, info, error in fetch_store_details_concurrently(title.get("ios_url"), title.get("android_url")):
+        if error:
+            store["errors"].append(f"{platform}: {error}")
+        elif info:
+            store[f"{platform}_info"] = info
+        else:
+            store["errors"].append(f"{platform}: 앱 정보를 찾을 수 없습니다.")
+    if not store["ios_info"] and not store["android_info"]:
+        raise Exception("; ".join(store["errors"]) or "스토어 정보 없음")
+    return store
+
+
+def _stage_category(store: Dict) -> Dict:
+    """Stage 2: category matching (IronSource taxonomy) and App match name"""
+    from components.one_click.category_matchers import match_ironsource_taxonomy
+
+    ios_info = store["ios_info"]
+    android_info = store["android_info"]
+
+    # Android category first (priority), then iOS - same as the one-click UI
+    android_category = android_info.get("category", "") if android_info else ""
+    ios_category = ios_info.get("category", "") if ios_info else ""
+    app_category = android_category or ios_category
+    taxonomy = "other"
+    if app_category:
+        ironsource_config = NETWORK_REGISTRY.get("ironsource")
+        taxonomy_options = ironsource_config._get_taxonomies() if ironsource_config and hasattr(ironsource_config, "_get_taxonomies") else []
+        taxonomy = match_ironsource_taxonomy(
+            app_category,
+            taxonomy_options,
+            android_category=android_category or None
+        ) or "other"
+
+    # Default App match name: Android package last part when package and bundle ID differ
+    app_match_name = None
+    android_package = android_info.get("package_name", "") if android_info else ""
+    ios_bundle_id = ios_info.get("bundle_id", "") if ios_info else ""
+    if android_package and ios_bundle_id and android_package != ios_bundle_id:
+        app_match_name = android_package.split(".")[-1].lower()
+
+    return {**store, "taxonomy": taxonomy, "app_match_name": app_match_name}
+
+
+def _stage_payload(network_key: str, matched: Dict, network_manager) -> Dict:
+    """Stage 3: mapped params, app payloads and unit payload templates for one network"""
+    from components.create_app_new_ui import build_network_preview
+
+    display_names = get_network_display_names()
+    preview_info, has_errors = build_network_preview(
+        network_key,
+        display_names.get(network_key, network_key.title()),
+        get_network_config(network_key),
+        matched["ios_info"],
+        matched["android_info"],
+        app_match_name=matched["app_match_name"],
+        network_manager=network_manager,
+        taxonomy=matched["taxonomy"]
+    )
+    if "error" in preview_info:
+        raise Exception(preview_info["error"])
+    return preview_info
+
+
+def _stage_create_app(
+    network_key: str,
+    payload: Dict,
+    preview_info: Dict,
+    network_manager
+) -> Dict:
+    """Stage 4: create the app on one network/platform"""
+    from components.create_app_new_ui import extract_app_info_from_response
+
+    response = network_manager.create_app(network_key, payload)
+    if not response or not (response.get("status") == 0 or response.get("code") == 0):
+        raise Exception(response.get("msg", "Unknown error") if response else "No response")
+    app_info = extract_app_info_from_response(network_key, response, preview_info["params"]) or {}
+    return {"response": response, "app_info": app_info}
+
+
+def _stage_create_units(
+    network_key: str,
+    platform: str,
+    app_info: Dict,
+    preview_info: Dict,
+    network_manager
+) -> List[Dict]:
+    """Stage 5: deactivate default units and create RV/IS/BN units from the preview templates"""
+    from components.create_app_new_ui import deactivate_existing_units, fill_unit_payload_template
+
+    app_code = app_info.get("appCode") or app_info.get("appId") or app_info.get("appKey")
+    if not app_code:
+        raise Exception("생성된 앱의 appCode를 찾을 수 없습니다.")
+
+    unit_payloads = preview_info.get("unit_payloads", {})
+    templates = unit_payloads.get(platform) or unit_payloads.get("default") or {}
+
+    slot_types = list(templates.keys())
+    unit_payloads = [fill_unit_payload_template(templates[slot_type], app_code, network_key) for slot_type in slot_types]
+
+    deactivate_existing_units(network_key, app_info, platform, network_manager)
+    # RV/IS/BN are independent: create them as one batch within the network's rate limit
+    # IronSource unit payloads carry no app key; it is passed next to them
+    app_key = app_info.get("appKey") if network_key == "ironsource" else None
+    unit_responses = network_manager.create_units(network_key, unit_payloads, app_key=app_key)
+
+    created_units = []
+    for slot_type, unit_payload, unit_response in zip(slot_types, unit_payloads, unit_responses):
+        unit_name = unit_payload.get("name") or unit_payload.get("placementName") or unit_payload.get("placement_name") or unit_payload.get("ad_slot_name") or unit_payload.get("mediationAdUnitName", "")
+        success = bool(unit_response) and (unit_response.get("status") == 0 or unit_response.get("code") == 0)
+        created_units.append({
+            "slot_type": slot_type,
+            "unit_name": unit_name,
+            "appCode": str(app_code),
+            "success": success,
+            "error": None if success else (unit_response.get("msg", "Unknown error") if unit_response else "No response")
+        })
+    return created_units
+
+
+def _run_at_bulk_priority(func, *args):
+    """Stage worker entry: run one stage at bulk priority
+
+    Interactive requests go first in the request scheduler, which also enforces
+    the per-network concurrency limits for the create calls.
+    """
+    with request_priority(BULK):
+        return func(*args)
+
+
+def run_bulk_create_pipeline(
+    titles: List[Dict],
+    networks: List[str],
+    create_units: bool = True
+) -> Iterator[Dict]:
+    """Run titles through store → category → payload → create app → create units
+
+    Every stage has its own worker pool and a title moves to the next stage as soon
+    as its previous stage finishes, so a slow store lookup for one title does not
+    hold back app creation for the others. Streamlit calls must stay in the caller:
+    this generator only yields events (in completion order).
+
+    Args:
+        titles: Rows from parse_store_url_csv
+        networks: Network keys to create apps on
+        create_units: Whether to create default RV/IS/BN units after app creation
+
+    Yields:
+        Event dicts: {"row", "stage", "network", "platform", "success", "msg", "data"}
+    """
+    network_manager = get_network_manager()
+
+    # Fetch BigOAds apps once per run for slot name lookups (shared by all payload workers)
+    from components.create_app_helpers import reset_bigoads_apps_cache
+    reset_bigoads_apps_cache()
+
+    executors = {
+        stage: ThreadPoolExecutor(max_workers=workers, thread_name_prefix=f"bulk_{stage}")
+        for stage, workers in _STAGE_WORKERS.items()
+    }
+    pending = {}
+
+    def submit(stage: str, context: Dict, func, *args):
+        pending[executors[stage].submit(_run_at_bulk_priority, func, *args)] = (stage, context)
+
+    for row, title in enumerate(titles):
+        submit(STAGE_STORE, {"row": row}, _stage_store, title)
+
+    try:
+        while pending:
+            done, _ = wait(list(pending), return_when=FIRST_COMPLETED)
+            for future in done:
+                stage, context = pending.pop(future)
+                event = {"row": context["row"], "stage": stage, "network": context.get("network"),
+                         "platform": context.get("platform"), "success": True, "msg": "", "data": None}
+                try:
+                    result = future.result()
+                except Exception as e:
+                    logger.warning(f"[Bulk] row={context['row']} stage={stage} network={context.get('network')} failed: {str(e)}")
+                    event.update({"success": False, "msg": str(e)})
+                    yield event
+                    continue
+
+                event["data"] = result
+                yield event
+
+                # Stream the output into the next stage
+                if stage == STAGE_STORE:
+                    submit(STAGE_CATEGORY, context, _stage_category, result)
+                elif stage == STAGE_CATEGORY:
+                    for network_key in networks:
+                        submit(STAGE_PAYLOAD, {**context, "network": network_key}, _stage_payload, network_key, result, network_manager)
+                elif stage == STAGE_PAYLOAD:
+                    network_key = context["network"]
+                    for platform, payload in result["payloads"].items():
+                        if "error" in payload:
+                            yield {**event, "stage": STAGE_CREATE_APP, "platform": platform, "success": False,
+                                   "msg": payload["error"], "data": None}
+                            continue
+                        submit(STAGE_CREATE_APP, {**context, "platform": platform, "preview": result},
+                               _stage_create_app, network_key, payload, result, network_manager)
+                elif stage == STAGE_CREATE_APP and create_units and context["network"] in _UNIT_NETWORKS:
+                    submit(STAGE_CREATE_UNITS, context, _stage_create_units, context["network"], context["platform"],
+                           result["app_info"], context["preview"], network_manager)
+    finally:
+        for executor in executors.values():
+            executor.shutdown(wait=False, cancel_futures=True)
+        reset_bigoads_apps_cache()
+
+
+def render_bulk_create_app_ui():
+    """Render the Bulk Create App UI (CSV of store URLs)"""
+    st.subheader("📦 Bulk Create App (CSV)")
+    st.markdown(
+        "한 줄에 한 타이틀씩 App Store / Google Play URL을 입력한 CSV를 업로드하세요. "
+        "(예: `ios_url,android_url` 헤더, 둘 중 하나는 비워도 됩니다)"
+    )
+
+    uploaded_file = st.file_uploader("CSV 파일", type=["csv"], key="bulk_create_csv")
+    csv_text = st.text_area(
+        "또는 직접 붙여넣기",
+        key="bulk_create_csv_text",
+        height=120,
+        placeholder="ios_url,android_url\nhttps://apps.apple.com/us/app/id123,https://play.google.com/store/apps/details?id=com.example.app"
+    )
+    if uploaded_file is not None:
+        csv_text = uploaded_file.getvalue().decode("utf-8-sig")
+
+    titles = parse_store_url_csv(csv_text)
+    if not titles:
+        st.info("💡 Store URL이 포함된 CSV를 입력해주세요.")
+        return
+
+    st.markdown(f"**{len(titles)}개 타이틀**")
+    st.dataframe(
+        [{"#": idx + 1, "iOS": t["ios_url"] or "-", "Android": t["android_url"] or "-"} for idx, t in enumerate(titles)],
+        width='stretch',
+        hide_index=True
+    )
+
+    display_names = get_network_display_names()
+    network_options = [
+        network_key for network_key, network_config in NETWORK_REGISTRY.items()
+        if network_key != "applovin" and network_config.supports_create_app()
+    ]
+    selected_networks = st.multiselect(
+        "네트워크 선택",
+        options=network_options,
+        default=st.session_state.get("bulk_create_networks", []),
+        format_func=lambda key: display_names.get(key, key.title()),
+        key="bulk_create_networks"
+    )
+    create_units = st.checkbox("앱 생성 후 기본 Ad Unit (RV/IS/BN) 생성", value=True, key="bulk_create_units")
+
+    if not st.button("🚀 Bulk 생성 시작", type="primary", width='stretch', disabled=not selected_networks):
+        return
+
+    # Per-title summary, updated as pipeline events stream in
+    summary = [
+        {"#": idx + 1, "App": "-", "Stage": "store", "Apps OK": 0, "Units OK": 0, "Errors": 0}
+        for idx in range(len(titles))
+    ]
+    events = []
+    progress_bar = st.progress(0)
+    table_placeholder = st.empty()
+    # Progress counts title x network jobs; a job finishes when all of its platforms
+    # are through their last stage (app creation, or unit creation when enabled)
+    expected_jobs = len(titles) * len(selected_networks)
+    finished_jobs = 0
+    open_platforms = {}  # (row, network) -> platforms still running
+
+    def finish_platform(key) -> int:
+        open_platforms[key] -= 1
+        return 1 if open_platforms[key] == 0 else 0
+
+    for event in run_bulk_create_pipeline(titles, selected_networks, create_units=create_units):
+        events.append(event)
+        row = summary[event["row"]]
+        row["Stage"] = event["stage"]
+        network_key = event["network"]
+
+        job_key = (event["row"], network_key)
+        if event["stage"] == STAGE_CREATE_UNITS or (
+            event["stage"] == STAGE_CREATE_APP
+            and not (event["success"] and create_units and network_key in _UNIT_NETWORKS)
+        ):
+            finished_jobs += finish_platform(job_key)
+
+        if not event["success"]:
+            row["Errors"] += 1
+            SessionManager.log_error(network_key or "bulk", f"[{event['stage']}] {event['msg']}")
+            if event["stage"] in (STAGE_STORE, STAGE_CATEGORY):
+                finished_jobs += len(selected_networks)
+            elif event["stage"] == STAGE_PAYLOAD:
+                finished_jobs += 1
+        elif event["stage"] == STAGE_CATEGORY:
+            info = event["data"]["android_info"] or event["data"]["ios_info"]
+            row["App"] = info.get("name", "-")
+        elif event["stage"] == STAGE_PAYLOAD:
+            open_platforms[job_key] = len(event["data"]["payloads"])
+            if not open_platforms[job_key]:
+                finished_jobs += 1
+        elif event["stage"] == STAGE_CREATE_APP:
+            row["Apps OK"] += 1
+            app_info = event["data"]["app_info"]
+            SessionManager.add_created_app(network_key, {
+                "appCode": app_info.get("appCode") or app_info.get("appId") or app_info.get("appKey"),
+                "name": row["App"],
+                "platform": event["platform"],
+                "app_info": app_info
+            })
+        elif event["stage"] == STAGE_CREATE_UNITS:
+            for unit in event["data"]:
+                if unit["success"]:
+                    row["Units OK"] += 1
+                    SessionManager.add_created_unit(network_key, {
+                        "name": unit["unit_name"],
+                        "appCode": unit["appCode"],
+                        "slotType": unit["slot_type"],
+                        "platform": event["platform"]
+                    })
+                else:
+                    row["Errors"] += 1
+
+        progress_bar.progress(min(1.0, finished_jobs / expected_jobs) if expected_jobs else 1.0)
+        table_placeholder.dataframe(summary, width='stretch', hide_index=True)
+
+    for row in summary:
+        row["Stage"] = "done"
+    progress_bar.progress(1.0)
+    table_placeholder.dataframe(summary, width='stretch', hide_index=True)
+    st.success(f"✅ Bulk 생성 완료: 앱 {sum(r['Apps OK'] for r in summary)}개, Ad Unit {sum(r['Units OK'] for r in summary)}개")
+
+    failed_events = [e for e in events if not e["success"]]
+    if failed_events:
+        with st.expander(f"❌ 실패 {len(failed_events)}건", expanded=True):
+            st.dataframe(
+                [{
+                    "#": e["row"] + 1,
+                    "Stage": e["stage"],
+                    "Network": display_names.get(e["network"], e["network"]) if e["network"] else "-",
+                    "Platform": e["platform"] or "-",
+                    "Error": e["msg"]
+                } for e in failed_events],
+                width='stretch',
+                hide_index=True
+            )
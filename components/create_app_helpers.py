@@ -116,6 +116,14 @@ def normalize_platform_str(platform_value: str, network: str = None) -> str:
 # Cache for BigOAds apps to avoid repeated API calls during preview generation
 _bigoads_apps_cache = None
 
+def reset_bigoads_apps_cache():
+    """Drop the cached BigOAds apps so the next lookup fetches them again
+    
+    Call at the start and end of a preview/bulk run so the run shares one fetch.
+    """
+    global _bigoads_apps_cache
+    _bigoads_apps_cache = None
+
 def get_bigoads_pkg_name_display(pkg_name: str, bundle_id: str, network_manager, app_name: str = None, platform_str: str = None, use_cache: bool = True) -> str:
     """Get BigOAds pkgNameDisplay by matching package name or bundleId
     
@@ -354,15 +362,18 @@ def generate_slot_name(pkg_name: str, platform_str: str, slot_type: str, network
     return f"{last_part}_{os}_{network_lower}_{adtype}_bidding"
 
 
-def create_default_slot(network: str, app_info: dict, slot_type: str, network_manager, config):
-    """Create a default slot with predefined settings"""
-    import streamlit as st
-    import logging
-    from utils.ui_helpers import handle_api_response
-    from utils.session_manager import SessionManager
+def build_default_slot_payload(network: str, app_info: dict, slot_type: str, network_manager) -> tuple:
+    """Build the default slot payload (RV/IS/BN predefined settings)
     
-    logger = logging.getLogger(__name__)
+    Args:
+        network: Network name
+        app_info: App info (appCode/appId, pkgName, bundleId, name, platformStr)
+        slot_type: "rv", "is" or "bn"
+        network_manager: Network manager instance (for slot name generation)
     
+    Returns:
+        Tuple of (payload, slot_name)
+    """
     # Validate app_info
     if not app_info:
         raise ValueError("app_info is required")
@@ -422,6 +433,21 @@ def create_default_slot(network: str, app_info: dict, slot_type: str, network_ma
             "bannerSize": [2]  # Array format: [2] for 320x50
         })
     
+    return payload, slot_name
+
+
+def create_default_slot(network: str, app_info: dict, slot_type: str, network_manager, config):
+    """Create a default slot with predefined settings"""
+    import streamlit as st
+    import logging
+    from utils.ui_helpers import handle_api_response
+    from utils.session_manager import SessionManager
+    
+    logger = logging.getLogger(__name__)
+    
+    payload, slot_name = build_default_slot_payload(network, app_info, slot_type, network_manager)
+    app_code = app_info.get("appCode") or app_info.get("appId")
+    
     # Log final payload before API call
     logger.info(f"[BigOAds] create_default_slot final payload: {payload}")
     
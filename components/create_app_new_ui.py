@@ -1,51 +1,79 @@
 """New Create App UI - Simplified with Store URL input and network selection"""
 import streamlit as st
 import logging
+import hashlib
+import inspect
+import json
+import os
+import time
 from typing import Dict, List, Optional, Tuple
 from utils.session_manager import SessionManager
 from utils.network_manager import get_network_manager
 from utils.ui_helpers import handle_api_response
 from utils.helpers import mask_sensitive_data
 from network_configs import get_network_config, get_network_display_names, NETWORK_REGISTRY
-from utils.app_store_helper import get_ios_app_details, get_android_app_details
+from utils.app_store_helper import fetch_store_details_concurrently
 
 logger = logging.getLogger(__name__)
 
 
-def create_ad_units_immediately(network_key: str, network_display: str, app_response: dict, mapped_params: dict, 
-                                 platform: str, config, network_manager, app_name: str):
-    """Create ad units immediately after app creation success
-    Automatically deactivates existing ad units before creating new ones.
+def fill_unit_payload_template(unit_payload_template: Dict, app_code, network_key: str) -> Dict:
+    """Return a copy of a preview unit payload with {APP_CODE} replaced by the created app code
     
     Args:
-        network_key: Network identifier (e.g., "bigoads", "inmobi")
-        network_display: Network display name
-        app_response: App creation response
-        mapped_params: Mapped parameters from preview
-        platform: Platform string ("Android" or "iOS")
-        config: Network config object
-        network_manager: Network manager instance
-        app_name: App name
+        unit_payload_template: Unit payload from preview_data[network]["unit_payloads"]
+        app_code: Created app code/appId/appKey
+        network_key: Network identifier (Mintegral app_id is converted to int)
     
     Returns:
-        List of created unit results
+        Filled unit payload
     """
     import json
     
-    created_units = []
+    # Deep copy the template payload
+    unit_payload = json.loads(json.dumps(unit_payload_template))
     
-    # Extract app info to get appId/appCode
-    app_info = extract_app_info_from_response(network_key, app_response, mapped_params)
+    def replace_app_code(obj):
+        if isinstance(obj, dict):
+            for key, value in obj.items():
+                if isinstance(value, str) and "{APP_CODE}" in value:
+                    replaced_value = value.replace("{APP_CODE}", str(app_code).strip())
+                    # For Mintegral, convert app_id to integer
+                    if network_key == "mintegral" and key == "app_id":
+                        try:
+                            obj[key] = int(replaced_value)
+                        except (ValueError, TypeError):
+                            obj[key] = replaced_value
+                    else:
+                        obj[key] = replaced_value
+                elif isinstance(value, (dict, list)):
+                    replace_app_code(value)
+        elif isinstance(obj, list):
+            for item in obj:
+                replace_app_code(item)
     
-    if not app_info:
-        return created_units
+    replace_app_code(unit_payload)
+    return unit_payload
+
+
+def deactivate_existing_units(network_key: str, app_info: Dict, platform: str, network_manager) -> Dict:
+    """Deactivate/archive ad units that already exist on a newly created app
     
-    app_code = app_info.get("appCode") or app_info.get("appId") or app_info.get("appKey")
-    if not app_code:
-        return created_units
+    IronSource: pause existing ad units, Vungle: deactivate placements,
+    Unity: archive ad units of the platform's store. Other networks: no-op.
+    Does not touch Streamlit, so it can run in worker threads.
     
-    # Step 1: Deactivate existing ad units (if needed)
-    # This must be done before creating new units to avoid conflicts
+    Args:
+        network_key: Network identifier
+        app_info: App info from extract_app_info_from_response
+        platform: Platform string ("Android" or "iOS")
+        network_manager: Network manager instance
+    
+    Returns:
+        {"count": number of deactivated units, "error": error message or None}
+    """
+    count = 0
+    app_code = app_info.get("appCode") or app_info.get("appId") or app_info.get("appKey")
     try:
         if network_key == "ironsource":
             # IronSource: Deactivate existing ad units
@@ -53,60 +81,50 @@ def create_ad_units_immediately(network_key: str, network_display: str, app_resp
             
             app_key = app_info.get("appKey") or app_code
             if app_key:
-                with st.spinner(f"⏸️ {network_display} - {platform}: 기존 Ad Units 비활성화 중..."):
-                    existing_units = get_ironsource_units(app_key)
-                    
-                    if existing_units:
-                        deactivate_payloads = []
-                        for unit in existing_units:
-                            mediation_adunit_id = unit.get("mediationAdUnitId") or unit.get("mediationAdunitId") or unit.get("id")
-                            if mediation_adunit_id:
-                                deactivate_payloads.append({
-                                    "mediationAdUnitId": str(mediation_adunit_id).strip(),
-                                    "isPaused": True
-                                })
-                        
-                        if deactivate_payloads:
-                            deactivate_response = network_manager._update_ironsource_ad_units(app_key, deactivate_payloads)
-                            if deactivate_response.get("status") == 0:
-                                st.success(f"✅ {network_display} - {platform}: {len(deactivate_payloads)}개 기존 Ad Units 비활성화 완료!")
-                                logger.info(f"[{network_display}] Deactivated {len(deactivate_payloads)} existing ad units for {platform}")
-                            else:
-                                st.warning(f"⚠️ {network_display} - {platform}: 기존 Ad Units 비활성화 실패 (계속 진행)")
-                                logger.warning(f"[{network_display}] Failed to deactivate existing ad units for {platform}: {deactivate_response.get('msg', 'Unknown error')}")
-                        else:
-                            logger.info(f"[{network_display}] No existing ad units to deactivate for {platform}")
-                    else:
-                        logger.info(f"[{network_display}] No existing ad units found for {platform}")
+                existing_units = get_ironsource_units(app_key)
+                deactivate_payloads = []
+                for unit in existing_units or []:
+                    mediation_adunit_id = unit.get("mediationAdUnitId") or unit.get("mediationAdunitId") or unit.get("id")
+                    if mediation_adunit_id:
+                        deactivate_payloads.append({
+                            "mediationAdUnitId": str(mediation_adunit_id).strip(),
+                            "isPaused": True
+                        })
+                
+                if deactivate_payloads:
+                    deactivate_response = network_manager._update_ironsource_ad_units(app_key, deactivate_payloads)
+                    if deactivate_response.get("status") != 0:
+                        error_msg = deactivate_response.get("msg", "Unknown error")
+                        logger.warning(f"[IronSource] Failed to deactivate existing ad units for {platform}: {error_msg}")
+                        return {"count": 0, "error": error_msg}
+                    count = len(deactivate_payloads)
+                    logger.info(f"[IronSource] Deactivated {count} existing ad units for {platform}")
+                else:
+                    logger.info(f"[IronSource] No existing ad units to deactivate for {platform}")
         
         elif network_key == "vungle":
             # Vungle: Deactivate existing placements
             vungle_app_id = app_info.get("vungleAppId") or app_code
             if vungle_app_id:
-                with st.spinner(f"⏸️ {network_display} - {platform}: 기존 Placements 비활성화 중..."):
-                    try:
-                        existing_placements = network_manager._get_vungle_placements_by_app_id(str(vungle_app_id))
-                        for placement in existing_placements:
-                            initial_placement_id = placement.get("id")
-                            if initial_placement_id:
-                                # Get full placement details to get accurate ID
-                                placement_details = network_manager._vungle_api.get_placement(str(initial_placement_id))
-                                if placement_details and placement_details.get("result"):
-                                    placement_id = placement_details["result"].get("id")
-                                    if placement_id:
-                                        # Deactivate placement
-                                        deactivate_response = network_manager._vungle_api.update_placement(
-                                            str(placement_id),
-                                            {"isActive": False}
-                                        )
-                                        if deactivate_response and deactivate_response.get("code") == 0:
-                                            logger.info(f"[Vungle] Deactivated placement {placement_id} for {platform}")
-                        
-                        if existing_placements:
-                            st.success(f"✅ {network_display} - {platform}: {len(existing_placements)}개 기존 Placements 비활성화 완료!")
-                    except Exception as e:
-                        logger.warning(f"[Vungle] Failed to deactivate existing placements for {platform}: {str(e)}")
-                        st.warning(f"⚠️ {network_display} - {platform}: 기존 Placements 비활성화 실패 (계속 진행)")
+                existing_placements = network_manager._get_vungle_placements_by_app_id(str(vungle_app_id))
+                for placement in existing_placements:
+                    initial_placement_id = placement.get("id")
+                    if initial_placement_id:
+                        # Get full placement details to get accurate ID
+                        placement_details = network_manager._get_api("vungle").get_placement(str(initial_placement_id))
+                        if placement_details and placement_details.get("result"):
+                            placement_id = placement_details["result"].get("id")
+                            if placement_id:
+                                # Deactivate placement
+                                deactivate_response = network_manager._get_api("vungle").update_placement(
+                                    str(placement_id),
+                                    {"isActive": False}
+                                )
+                                if deactivate_response and deactivate_response.get("code") == 0:
+                                    logger.info(f"[Vungle] Deactivated placement {placement_id} for {platform}")
+                count = len(existing_placements)
+                if existing_placements:
+                    network_manager.forget_created_units("vungle", str(vungle_app_id))
         
         elif network_key == "unity":
             # Unity: Archive existing ad units
@@ -117,56 +135,78 @@ def create_ad_units_immediately(network_key: str, network_display: str, app_resp
                 platform_lower = platform.lower()
                 if platform_lower == "ios":
                     target_stores = ["apple"]
-                    platform_display = "iOS"
                 elif platform_lower == "android":
                     target_stores = ["google"]
-                    platform_display = "Android"
                 else:
                     # If platform is not specified, archive both stores
                     target_stores = ["apple", "google"]
-                    platform_display = platform
                 
-                with st.spinner(f"📦 {network_display} - {platform_display}: 기존 Ad Units Archive 중..."):
-                    try:
-                        # Get existing ad units from API
-                        ad_units_dict = network_manager._get_unity_ad_units(project_id)
-                        
-                        if ad_units_dict:
-                            archived_count = 0
-                            # Archive ad units for target stores only
-                            for store_name in target_stores:
-                                if store_name in ad_units_dict and ad_units_dict[store_name]:
-                                    ad_units = ad_units_dict[store_name]
-                                    
-                                    # Build archive payload: {ad_unit_id: {"archive": True}}
-                                    archive_payload = {}
-                                    for ad_unit_id, ad_unit_data in ad_units.items():
-                                        archive_payload[ad_unit_id] = {
-                                            "archive": True
-                                        }
-                                    
-                                    if archive_payload:
-                                        # Archive ad units for this store
-                                        archive_response = network_manager._update_unity_ad_units(project_id, store_name, archive_payload)
-                                        if archive_response.get("status") == 0:
-                                            archived_count += len(archive_payload)
-                                            store_display = "iOS" if store_name == "apple" else "Android"
-                                            logger.info(f"[Unity] Archived {len(archive_payload)} ad units for {store_display} (project_id: {project_id})")
-                                        else:
-                                            logger.warning(f"[Unity] Failed to archive ad units for {store_name}: {archive_response.get('msg', 'Unknown error')}")
-                            
-                            if archived_count > 0:
-                                st.success(f"✅ {network_display} - {platform_display}: {archived_count}개 기존 Ad Units Archive 완료!")
-                            else:
-                                logger.info(f"[Unity] No existing ad units to archive for {platform_display} (project_id: {project_id})")
-                        else:
-                            logger.info(f"[Unity] No existing ad units found for project {project_id}")
-                    except Exception as e:
-                        logger.warning(f"[Unity] Failed to archive existing ad units for {platform_display}: {str(e)}")
-                        st.warning(f"⚠️ {network_display} - {platform_display}: 기존 Ad Units Archive 실패 (계속 진행)")
+                # Get existing ad units from API
+                ad_units_dict = network_manager._get_unity_ad_units(project_id)
+                for store_name in target_stores:
+                    ad_units = (ad_units_dict or {}).get(store_name)
+                    if not ad_units:
+                        continue
+                    
+                    # Build archive payload: {ad_unit_id: {"archive": True}}
+                    archive_payload = {ad_unit_id: {"archive": True} for ad_unit_id in ad_units}
+                    archive_response = network_manager._update_unity_ad_units(project_id, store_name, archive_payload)
+                    if archive_response.get("status") == 0:
+                        count += len(archive_payload)
+                        logger.info(f"[Unity] Archived {len(archive_payload)} ad units for {store_name} (project_id: {project_id})")
+                    else:
+                        logger.warning(f"[Unity] Failed to archive ad units for {store_name}: {archive_response.get('msg', 'Unknown error')}")
     except Exception as e:
-        logger.warning(f"[{network_display}] Error deactivating existing ad units for {platform}: {str(e)}")
-        st.warning(f"⚠️ {network_display} - {platform}: 기존 Ad Units 비활성화 중 오류 발생 (계속 진행)")
+        logger.warning(f"[{network_key}] Error deactivating existing ad units for {platform}: {str(e)}")
+        return {"count": count, "error": str(e)}
+    
+    return {"count": count, "error": None}
+
+
+def create_ad_units_immediately(network_key: str, network_display: str, app_response: dict, mapped_params: dict, 
+                                 platform: str, config, network_manager, app_name: str):
+    """Create ad units immediately after app creation success
+    Automatically deactivates existing ad units before creating new ones.
+    
+    Args:
+        network_key: Network identifier (e.g., "bigoads", "inmobi")
+        network_display: Network display name
+        app_response: App creation response
+        mapped_params: Mapped parameters from preview
+        platform: Platform string ("Android" or "iOS")
+        config: Network config object
+        network_manager: Network manager instance
+        app_name: App name
+    
+    Returns:
+        List of created unit results
+    """
+    created_units = []
+    
+    # Extract app info to get appId/appCode
+    app_info = extract_app_info_from_response(network_key, app_response, mapped_params)
+    
+    if not app_info:
+        return created_units
+    
+    app_code = app_info.get("appCode") or app_info.get("appId") or app_info.get("appKey")
+    if not app_code:
+        return created_units
+    
+    # Step 1: Deactivate existing ad units (if needed)
+    # This must be done before creating new units to avoid conflicts
+    action_label = {
+        "ironsource": "기존 Ad Units 비활성화",
+        "vungle": "기존 Placements 비활성화",
+        "unity": "기존 Ad Units Archive",
+    }.get(network_key)
+    if action_label:
+        with st.spinner(f"⏸️ {network_display} - {platform}: {action_label} 중..."):
+            deactivate_result = deactivate_existing_units(network_key, app_info, platform, network_manager)
+        if deactivate_result["error"]:
+            st.warning(f"⚠️ {network_display} - {platform}: {action_label} 실패 (계속 진행)")
+        elif deactivate_result["count"] > 0:
+            st.success(f"✅ {network_display} - {platform}: {deactivate_result['count']}개 {action_label} 완료!")
     
     # Try to use pre-prepared unit payloads from preview_data
     preview_data = st.session_state.get("preview_data", {})
@@ -182,30 +222,8 @@ def create_ad_units_immediately(network_key: str, network_display: str, app_resp
         
         for slot_type, unit_payload_template in platform_units.items():
             try:
-                # Deep copy the template payload
-                unit_payload = json.loads(json.dumps(unit_payload_template))
-                
-                # Replace {APP_CODE} placeholder with actual app_code
-                def replace_app_code(obj):
-                    if isinstance(obj, dict):
-                        for key, value in obj.items():
-                            if isinstance(value, str) and "{APP_CODE}" in value:
-                                replaced_value = value.replace("{APP_CODE}", str(app_code).strip())
-                                # For Mintegral, convert app_id to integer
-                                if network_key == "mintegral" and key == "app_id":
-                                    try:
-                                        obj[key] = int(replaced_value)
-                                    except (ValueError, TypeError):
-                                        obj[key] = replaced_value
-                                else:
-                                    obj[key] = replaced_value
-                            elif isinstance(value, (dict, list)):
-                                replace_app_code(value)
-                    elif isinstance(obj, list):
-                        for item in obj:
-                            replace_app_code(item)
-                
-                replace_app_code(unit_payload)
+                # Fill {APP_CODE} placeholder in a copy of the template payload
+                unit_payload = fill_unit_payload_template(unit_payload_template, app_code, network_key)
                 
                 # Create unit
                 with st.spinner(f"{network_display} - {platform} {slot_type} Unit 생성 중..."):
@@ -460,7 +478,8 @@ def map_store_info_to_network_params(
     ios_info: Optional[Dict],
     android_info: Optional[Dict],
     network: str,
-    config
+    config,
+    taxonomy: Optional[str] = None
 ) -> Dict:
     """Map App Store info to network-specific parameters
     
@@ -469,6 +488,7 @@ def map_store_info_to_network_params(
         android_info: Android app details from Play Store
         network: Network identifier
         config: Network configuration object
+        taxonomy: IronSource taxonomy to use as-is (skips session state lookup)
     
     Returns:
         Dictionary with network-specific parameters filled in
@@ -490,9 +510,11 @@ def map_store_info_to_network_params(
         if android_info:
             params["androidStoreUrl"] = f"https://play.google.com/store/apps/details?id={android_info.get('package_name')}"
         
-        # Use taxonomy from session state (user-selected or auto-matched)
-        # If not in session state, try to match from App Store category
-        if "ironsource_taxonomy" in st.session_state:
+        # Use explicit taxonomy (bulk mode) or taxonomy from session state (user-selected or auto-matched)
+        # If neither is available, try to match from App Store category
+        if taxonomy:
+            params["taxonomy"] = taxonomy
+        elif "ironsource_taxonomy" in st.session_state:
             params["taxonomy"] = st.session_state.ironsource_taxonomy
         else:
             # Map App Store category to IronSource taxonomy
@@ -645,6 +667,535 @@ def map_store_info_to_network_params(
     return params
 
 
+def build_network_preview(
+    network_key: str,
+    network_display: str,
+    config,
+    ios_info: Optional[Dict],
+    android_info: Optional[Dict],
+    app_match_name: Optional[str] = None,
+    network_manager=None,
+    taxonomy: Optional[str] = None
+) -> Tuple[Dict, bool]:
+    """Build mapped params, app payloads and unit payload templates for one network
+    
+    Does not touch st.session_state, so it can run outside the Streamlit script thread
+    (e.g., bulk create pipeline workers).
+    
+    Args:
+        network_key: Network identifier (e.g., "bigoads", "inmobi")
+        network_display: Network display name
+        config: Network config object
+        ios_info: iOS app details from App Store (or None)
+        android_info: Android app details from Play Store (or None)
+        app_match_name: Selected App match name used for ad unit names (or None)
+        network_manager: Network manager instance (default: get_network_manager())
+        taxonomy: IronSource taxonomy (None: use session state / auto-match)
+    
+    Returns:
+        Tuple of (preview_info, has_errors)
+    """
+    has_errors = False
+    
+    # Map store info to network parameters
+    mapped_params = map_store_info_to_network_params(
+        ios_info,
+        android_info,
+        network_key,
+        config,
+        taxonomy=taxonomy
+    )
+    
+    # Build payloads for preview (check required fields during payload building)
+    payloads = {}
+    
+    # Handle networks that support both iOS and Android
+    if network_key in ["ironsource", "inmobi", "bigoads", "fyber", "pangle", "vungle"]:
+        if android_info:
+            try:
+                android_payload = config.build_app_payload(mapped_params, platform="Android")
+                payloads["Android"] = android_payload
+            except Exception as e:
+                payloads["Android"] = {"error": str(e)}
+                has_errors = True
+        
+        if ios_info:
+            try:
+                ios_payload = config.build_app_payload(mapped_params, platform="iOS")
+                payloads["iOS"] = ios_payload
+            except Exception as e:
+                payloads["iOS"] = {"error": str(e)}
+                has_errors = True
+    elif network_key == "mintegral":
+        # Mintegral requires separate payloads for iOS and Android (single os field)
+        # Check required fields per platform
+        missing_required_android = []
+        missing_required_ios = []
+        
+        if android_info:
+            # Check Android required fields
+            android_params = mapped_params.copy()
+            android_params["os"] = "ANDROID"
+            android_params["package"] = mapped_params.get("android_package", "")
+            android_params["store_url"] = mapped_params.get("android_store_url", "")
+            
+            required_fields = config.get_app_creation_fields()
+            for field in required_fields:
+                if field.required and field.name not in android_params:
+                    from network_configs.base_config import ConditionalField
+                    if isinstance(field, ConditionalField):
+                        if field.should_show(android_params):
+                            missing_required_android.append(field.label or field.name)
+                    else:
+                        missing_required_android.append(field.label or field.name)
+            
+            if missing_required_android:
+                payloads["Android"] = {"error": f"필수 필드 누락: {', '.join(missing_required_android)}"}
+                has_errors = True
+            else:
+                try:
+                    android_payload = config.build_app_payload(android_params)
+                    payloads["Android"] = android_payload
+                except Exception as e:
+                    payloads["Android"] = {"error": str(e)}
+                    has_errors = True
+        
+        if ios_info:
+            # Check iOS required fields
+            ios_params = mapped_params.copy()
+            ios_params["os"] = "IOS"
+            ios_params["package"] = mapped_params.get("ios_package", "")
+            ios_params["store_url"] = mapped_params.get("ios_store_url", "")
+            
+            required_fields = config.get_app_creation_fields()
+            for field in required_fields:
+                if field.required and field.name not in ios_params:
+                    from network_configs.base_config import ConditionalField
+                    if isinstance(field, ConditionalField):
+                        if field.should_show(ios_params):
+                            missing_required_ios.append(field.label or field.name)
+                    else:
+                        missing_required_ios.append(field.label or field.name)
+            
+            if missing_required_ios:
+                payloads["iOS"] = {"error": f"필수 필드 누락: {', '.join(missing_required_ios)}"}
+                has_errors = True
+            else:
+                try:
+                    ios_payload = config.build_app_payload(ios_params)
+                    payloads["iOS"] = ios_payload
+                except Exception as e:
+                    payloads["iOS"] = {"error": str(e)}
+                    has_errors = True
+    else:
+        # Single platform or other networks - check required fields
+        required_fields = config.get_app_creation_fields()
+        missing_required = []
+        for field in required_fields:
+            if field.required and field.name not in mapped_params:
+                from network_configs.base_config import ConditionalField
+                if isinstance(field, ConditionalField):
+                    if field.should_show(mapped_params):
+                        missing_required.append(field.label or field.name)
+                else:
+                    missing_required.append(field.label or field.name)
+        
+        if missing_required:
+            return {
+                "display": network_display,
+                "error": f"필수 필드 누락: {', '.join(missing_required)}",
+                "params": mapped_params
+            }, True
+        else:
+            try:
+                payload = config.build_app_payload(mapped_params)
+                payloads["default"] = payload
+            except Exception as e:
+                payloads["default"] = {"error": str(e)}
+                has_errors = True
+    
+    # Prepare ad unit payloads for preview (with placeholder for appCode)
+    unit_payloads = {}
+    if config.supports_create_unit():
+        from components.create_app_helpers import generate_slot_name
+        if network_manager is None:
+            network_manager = get_network_manager()
+        
+        # Get app name
+        app_name = None
+        if ios_info:
+            app_name = ios_info.get("name", "")
+        if not app_name and android_info:
+            app_name = android_info.get("name", "")
+        
+        # Generate unit payloads for each platform
+        for platform_key, platform_payload in payloads.items():
+            if "error" in platform_payload:
+                continue
+            
+            platform_str = platform_key if platform_key != "default" else "Android"
+            platform_lower = platform_str.lower()
+            
+            # Get package name/bundle ID for unit name generation
+            # Use user-selected App match name for both Android and iOS if available
+            selected_app_match_name = app_match_name
+            
+            if platform_lower == "android":
+                # For Android, use selected App match name if available, otherwise use package name
+                if selected_app_match_name:
+                    # Use selected App match name (already lowercase)
+                    pkg_name = selected_app_match_name
+                    bundle_id = ""
+                else:
+                    # Fallback to package name
+                    pkg_name = mapped_params.get("android_package", mapped_params.get("androidPkgName", mapped_params.get("android_store_id", mapped_params.get("androidBundle", ""))))
+                    if not pkg_name and network_key == "inmobi":
+                        android_info = (android_info or {})
+                        if android_info:
+                            pkg_name = android_info.get("package_name", "")
+                    bundle_id = ""
+                
+                # Always use selected App match name for unit name generation (for consistency)
+                android_package_for_unit = selected_app_match_name
+            else:  # iOS
+                # For Pangle, use pkg_name from mapped_params (same as create_unit_common.py)
+                if network_key == "pangle":
+                    # Pangle iOS: use pkgName from mapped_params (create_unit_common.py logic)
+                    pkg_name = mapped_params.get("ios_package", mapped_params.get("iosPkgName", mapped_params.get("ios_store_id", mapped_params.get("iosBundle", ""))))
+                    if not pkg_name:
+                        ios_info = (ios_info or {})
+                        if ios_info:
+                            pkg_name = ios_info.get("package_name", "") or ios_info.get("bundle_id", "")
+                    bundle_id = ""
+                else:
+                    pkg_name = ""
+                    # For Vungle iOS, avoid using iTunesId (ios_store_id might be iTunesId)
+                    # Use bundle_id directly from store_info_ios
+                    if network_key == "vungle":
+                        ios_info = (ios_info or {})
+                        if ios_info:
+                            bundle_id = ios_info.get("bundle_id", "")  # Use bundle_id, not iTunesId
+                        else:
+                            bundle_id = mapped_params.get("ios_bundle_id", mapped_params.get("iosBundle", ""))
+                    else:
+                        bundle_id = mapped_params.get("ios_bundle_id", mapped_params.get("iosPkgName", mapped_params.get("ios_store_id", mapped_params.get("iosBundle", ""))))
+                        if not bundle_id and network_key == "inmobi":
+                            ios_info = (ios_info or {})
+                            if ios_info:
+                                bundle_id = ios_info.get("bundle_id", "")
+                
+                # For iOS, prioritize user-selected identifier (App match name)
+                # If not selected, use Android package name
+                if selected_app_match_name:
+                    android_package_for_unit = selected_app_match_name
+                else:
+                    # Fallback: try to use Android package name if available
+                    android_package_for_unit = mapped_params.get("android_package", mapped_params.get("androidPkgName", ""))
+                    if android_package_for_unit and '.' in android_package_for_unit:
+                        android_package_for_unit = android_package_for_unit.split('.')[-1].lower()
+            
+            # Generate unit payloads for RV, IS, BN
+            platform_unit_payloads = {}
+            for slot_type in ["rv", "is", "bn"]:
+                # For Pangle, use the same logic as create_unit_common.py
+                # (no android_package_name, no bundle_id to match the exact same generation logic)
+                if network_key == "pangle":
+                    slot_name = generate_slot_name(
+                        pkg_name,
+                        platform_lower,
+                        slot_type,
+                        network_key,
+                        network_manager=network_manager,
+                        app_name=app_name
+                    )
+                else:
+                    # Use selected App match name for both Android and iOS if available
+                    # For Android: pass as android_package_name to ensure consistent naming
+                    # For iOS: pass as android_package_name (already prioritized in generate_slot_name)
+                    slot_name = generate_slot_name(
+                        pkg_name,
+                        platform_lower,
+                        slot_type,
+                        network_key,
+                        bundle_id=bundle_id,
+                        network_manager=network_manager,
+                        app_name=app_name,
+                        android_package_name=android_package_for_unit if android_package_for_unit else None
+                    )
+                
+                # For Pangle, create payload even if slot_name is empty (slot_name is not required)
+                if slot_name or network_key == "pangle":
+                    # Build unit payload with placeholder for appCode/appId/site_id
+                    # Each network has different required parameters
+                    if network_key == "bigoads":
+                        unit_payload = {
+                            "appCode": "{APP_CODE}",  # Placeholder
+                            "name": slot_name,
+                        }
+                        if slot_type.lower() == "rv":
+                            unit_payload.update({"adType": 4, "auctionType": 3, "musicSwitch": 1})
+                        elif slot_type.lower() == "is":
+                            unit_payload.update({"adType": 3, "auctionType": 3, "musicSwitch": 1})
+                        elif slot_type.lower() == "bn":
+                            unit_payload.update({"adType": 2, "auctionType": 3, "bannerAutoRefresh": 2, "bannerSize": [2]})
+                    elif network_key == "ironsource":
+                        # IronSource: mediationAdUnitName, adFormat
+                        ad_format_map = {
+                            "rv": "rewarded",
+                            "is": "interstitial",
+                            "bn": "banner"
+                        }
+                        ad_format = ad_format_map.get(slot_type.lower(), "rewarded")
+                        unit_payload = {
+                            "mediationAdUnitName": slot_name,
+                            "adFormat": ad_format,
+                        }
+                        # Add reward for rewarded format
+                        if ad_format == "rewarded":
+                            unit_payload["reward"] = {
+                                "rewardItemName": "Reward",
+                                "rewardAmount": 1
+                            }
+                    elif network_key == "pangle":
+                        # Pangle: app_id, bidding_type, ad_slot_type, ad_slot_name
+                        ad_slot_type_map = {
+                            "rv": 5,  # Rewarded Video
+                            "is": 6,  # Interstitial
+                            "bn": 2   # Banner
+                        }
+                        ad_slot_type = ad_slot_type_map.get(slot_type.lower(), 5)
+                        unit_payload = {
+                            "app_id": "{APP_CODE}",  # Placeholder
+                            "bidding_type": 1,  # Default: Bidding
+                            "ad_slot_type": ad_slot_type,
+                            "ad_slot_name": slot_name if slot_name else "",  # Ad slot name
+                        }
+                        # Add type-specific fields
+                        if ad_slot_type == 5:  # Rewarded Video
+                            unit_payload.update({
+                                "render_type": 1,
+                                "orientation": 1,
+                                "reward_is_callback": 0,
+                                "reward_name": "Reward",
+                                "reward_count": 1,
+                            })
+                        elif ad_slot_type == 6:  # Interstitial
+                            unit_payload.update({
+                                "render_type": 1,
+                                "orientation": 1,
+                            })
+                        elif ad_slot_type == 2:  # Banner
+                            unit_payload.update({
+                                "render_type": 1,
+                                "slide_banner": 1,
+                                "width": 640,
+                                "height": 100,
+                            })
+                    elif network_key == "mintegral":
+                        # Mintegral: app_id, placement_name, ad_type
+                        ad_type_map = {
+                            "rv": "rewarded_video",
+                            "is": "new_interstitial",
+                            "bn": "banner"
+                        }
+                        ad_type = ad_type_map.get(slot_type.lower(), "rewarded_video")
+                        unit_payload = {
+                            "app_id": "{APP_CODE}",  # Placeholder (will be replaced)
+                            "placement_name": slot_name,
+                            "ad_type": ad_type,
+                            "integrate_type": "sdk",
+                        }
+                        # Add type-specific fields
+                        if ad_type == "rewarded_video":
+                            unit_payload["skip_time"] = -1  # Non Skippable
+                        elif ad_type == "new_interstitial":
+                            unit_payload.update({
+                                "content_type": "both",
+                                "ad_space_type": 1,
+                                "skip_time": -1,
+                            })
+                        elif ad_type == "banner":
+                            unit_payload.update({
+                                "show_close_button": 0,
+                                "auto_fresh": 0,
+                            })
+                    elif network_key == "inmobi":
+                        # InMobi: appId, placementName, placementType
+                        placement_type_map = {
+                            "rv": "REWARDED_VIDEO",
+                            "is": "INTERSTITIAL",
+                            "bn": "BANNER"
+                        }
+                        placement_type = placement_type_map.get(slot_type.lower(), "INTERSTITIAL")
+                        unit_payload = {
+                            "appId": "{APP_CODE}",  # Placeholder
+                            "placementName": slot_name,
+                            "placementType": placement_type,
+                            "isAudienceBiddingEnabled": False,
+                        }
+                    elif network_key == "fyber":
+                        # Fyber: name, appId, placementType
+                        placement_type_map = {
+                            "rv": "Rewarded",
+                            "is": "Interstitial",
+                            "bn": "Banner"
+                        }
+                        placement_type = placement_type_map.get(slot_type.lower(), "Rewarded")
+                        unit_payload = {
+                            "name": slot_name,
+                            "appId": "{APP_CODE}",  # Placeholder
+                            "placementType": placement_type,
+                            "coppa": False,
+                        }
+                    elif network_key == "vungle":
+                        # Vungle: application, name, type, allowEndCards, isHBParticipation
+                        type_map = {
+                            "rv": "Rewarded",
+                            "is": "Interstitial",
+                            "bn": "Banner"
+                        }
+                        unit_type = type_map.get(slot_type.lower(), "Rewarded")
+                        unit_payload = {
+                            "application": "{APP_CODE}",  # Placeholder (vungleAppId)
+                            "name": slot_name,
+                            "type": unit_type,
+                            "allowEndCards": True,  # Default value
+                            "isHBParticipation": True,  # Default value (In-app bidding)
+                        }
+                    else:
+                        # For other networks, try config.build_unit_payload if available
+                        if hasattr(config, 'build_unit_payload'):
+                            try:
+                                # Map slot_type to network-specific format
+                                unit_payload_data = {
+                                    "appCode": "{APP_CODE}",  # Placeholder (generic)
+                                    "name": slot_name,
+                                    "slotType": slot_type.lower()
+                                }
+                                # Try to map to network-specific field names
+                                if network_key in ["inmobi", "mintegral", "pangle"]:
+                                    # These networks use different field names
+                                    if network_key == "inmobi":
+                                        unit_payload_data["appId"] = "{APP_CODE}"
+                                    elif network_key == "mintegral":
+                                        unit_payload_data["app_id"] = "{APP_CODE}"
+                                    elif network_key == "pangle":
+                                        unit_payload_data["app_id"] = "{APP_CODE}"
+                                
+                                unit_payload = config.build_unit_payload(unit_payload_data)
+                            except Exception as e:
+                                logger.warning(f"Failed to build unit payload for {network_key} {platform_str} {slot_type}: {str(e)}")
+                                continue
+                        else:
+                            unit_payload = {
+                                "appCode": "{APP_CODE}",  # Placeholder
+                                "name": slot_name,
+                            }
+                    
+                    platform_unit_payloads[slot_type.upper()] = unit_payload
+            
+            if platform_unit_payloads:
+                unit_payloads[platform_key] = platform_unit_payloads
+    
+    return {
+        "display": network_display,
+        "payloads": payloads,
+        "params": mapped_params,
+        "unit_payloads": unit_payloads  # Add unit payloads
+    }, has_errors
+
+
+# Previews embed names looked up in fetched app lists (BigOAds pkgNameDisplay for slot
+# names); a cached preview is rebuilt after this long so apps created elsewhere show up
+PREVIEW_APP_LISTS_TTL_SECONDS = 300
+
+
+def _app_lists_stamp() -> Optional[str]:
+    """Version of the app lists previews read (last BigOAds inventory sync; None if sync is off)"""
+    from utils.inventory_sync import get_inventory_sync_service
+    synced = get_inventory_sync_service().last_synced("bigoads")
+    return synced.isoformat() if synced else None
+
+
+def _preview_input_hash(
+    network_key: str,
+    config,
+    ios_info: Optional[Dict],
+    android_info: Optional[Dict],
+    app_match_name: Optional[str],
+    taxonomy: Optional[str]
+) -> str:
+    """Hash of everything build_network_preview depends on (store info, selected options, config and app list versions)"""
+    config_cls = type(config)
+    try:
+        # Config module mtime as config version (edited configs invalidate cached previews)
+        config_version = os.path.getmtime(inspect.getfile(config_cls))
+    except (TypeError, OSError):
+        config_version = None
+    key = {
+        "network": network_key,
+        "ios": ios_info,
+        "android": android_info,
+        "app_match_name": app_match_name,
+        "taxonomy": taxonomy if network_key == "ironsource" else None,
+        "config": [config_cls.__module__, config_cls.__qualname__, config_version],
+        "app_lists": _app_lists_stamp(),
+    }
+    return hashlib.sha1(json.dumps(key, sort_keys=True, default=str).encode("utf-8")).hexdigest()
+
+
+def get_network_preview_cached(
+    preview_cache: Dict,
+    network_key: str,
+    network_display: str,
+    config,
+    ios_info: Optional[Dict],
+    android_info: Optional[Dict],
+    app_match_name: Optional[str] = None,
+    taxonomy: Optional[str] = None
+) -> Tuple[Dict, bool]:
+    """Memoized build_network_preview
+    
+    Reuses the cached preview of a network while its inputs are unchanged, so a
+    Streamlit rerun only recomputes the networks whose inputs actually changed.
+    Previews with errors are not cached (a failed app list fetch is retried on the
+    next run), and cached ones expire after PREVIEW_APP_LISTS_TTL_SECONDS.
+    
+    Args:
+        preview_cache: Cache dict (network_key -> (input_hash, preview_info, built_at))
+        network_key: Network identifier
+        network_display: Network display name
+        config: Network config object
+        ios_info: iOS app details (or None)
+        android_info: Android app details (or None)
+        app_match_name: Selected App match name (or None)
+        taxonomy: IronSource taxonomy (or None)
+    
+    Returns:
+        Tuple of (preview_info, has_errors)
+    """
+    input_hash = _preview_input_hash(network_key, config, ios_info, android_info, app_match_name, taxonomy)
+    cached = preview_cache.get(network_key)
+    if cached and cached[0] == input_hash and time.time() - cached[2] < PREVIEW_APP_LISTS_TTL_SECONDS:
+        return cached[1], False
+    
+    logger.info(f"[{network_display}] Rebuilding preview (inputs changed)")
+    preview_info, has_errors = build_network_preview(
+        network_key,
+        network_display,
+        config,
+        ios_info,
+        android_info,
+        app_match_name=app_match_name,
+        taxonomy=taxonomy
+    )
+    if has_errors:
+        preview_cache.pop(network_key, None)
+    else:
+        preview_cache[network_key] = (input_hash, preview_info, time.time())
+    return preview_info, has_errors
+
+
 def render_new_create_app_ui():
     """Render the new simplified Create App UI"""
     st.subheader("📱 Create App (New)")
@@ -685,29 +1236,24 @@ def render_new_create_app_ui():
         ios_info = None
         android_info = None
         
-        if ios_url:
-            with st.spinner("iOS 앱 정보를 가져오는 중..."):
-                try:
-                    ios_info = get_ios_app_details(ios_url)
-                    if ios_info:
-                        st.session_state.store_info_ios = ios_info
-                        st.success(f"✅ iOS 앱 정보 조회 성공: {ios_info.get('name', 'N/A')}")
-                    else:
-                        st.error("❌ iOS 앱 정보를 찾을 수 없습니다.")
-                except Exception as e:
-                    st.error(f"❌ iOS 앱 정보 조회 실패: {str(e)}")
-        
-        if android_url:
-            with st.spinner("Android 앱 정보를 가져오는 중..."):
-                try:
-                    android_info = get_android_app_details(android_url)
-                    if android_info:
-                        st.session_state.store_info_android = android_info
-                        st.success(f"✅ Android 앱 정보 조회 성공: {android_info.get('name', 'N/A')}")
+        # iOS / Android 동시 조회 - 먼저 응답한 플랫폼부터 바로 표시
+        if ios_url or android_url:
+            platform_labels = {"ios": "iOS", "android": "Android"}
+            with st.spinner("앱 스토어 정보를 가져오는 중..."):
+                for platform, info, error in fetch_store_details_concurrently(ios_url, android_url):
+                    label = platform_labels[platform]
+                    if error:
+                        st.error(f"❌ {label} 앱 정보 조회 실패: {error}")
+                    elif info:
+                        if platform == "ios":
+                            ios_info = info
+                            st.session_state.store_info_ios = info
+                        else:
+                            android_info = info
+                            st.session_state.store_info_android = info
+                        st.success(f"✅ {label} 앱 정보 조회 성공: {info.get('name', 'N/A')}")
                     else:
-                        st.error("❌ Android 앱 정보를 찾을 수 없습니다.")
-                except Exception as e:
-                    st.error(f"❌ Android 앱 정보 조회 실패: {str(e)}")
+                        st.error(f"❌ {label} 앱 정보를 찾을 수 없습니다.")
         
         if not ios_url and not android_url:
             st.warning("⚠️ 최소 하나의 Store URL을 입력해주세요.")
@@ -1059,14 +1605,26 @@ def render_new_create_app_ui():
             if "preview_data" not in st.session_state:
                 st.session_state.preview_data = {}
             
+            # Per-network preview memo (only networks whose inputs changed are rebuilt on rerun)
+            if "preview_cache" not in st.session_state:
+                st.session_state.preview_cache = {}
+            
             # Clear BigOAds apps cache at the start of preview generation
             # This ensures we fetch fresh data once per preview generation and reuse it
-            from components import create_app_helpers
-            create_app_helpers._bigoads_apps_cache = None
+            from components.create_app_helpers import reset_bigoads_apps_cache
+            reset_bigoads_apps_cache()
             
             preview_data = {}
             has_errors = False
             
+            # User-selected App match name (used for Android and iOS Ad Unit names)
+            app_match_name = None
+            if "ios_ad_unit_identifier" in st.session_state:
+                app_match_name = st.session_state.ios_ad_unit_identifier.get("value", None)
+            
+            # IronSource taxonomy (user-selected or auto-matched)
+            ironsource_taxonomy = st.session_state.get("ironsource_taxonomy")
+            
             for network_key in selected_networks:
                 network_display = available_networks[network_key]
                 config = get_network_config(network_key)
@@ -1080,419 +1638,21 @@ def render_new_create_app_ui():
                     }
                     continue
                 
-                # Map store info to network parameters
-                mapped_params = map_store_info_to_network_params(
+                preview_data[network_key], network_has_errors = get_network_preview_cached(
+                    st.session_state.preview_cache,
+                    network_key,
+                    network_display,
+                    config,
                     st.session_state.store_info_ios,
                     st.session_state.store_info_android,
-                    network_key,
-                    config
+                    app_match_name=app_match_name,
+                    taxonomy=ironsource_taxonomy
                 )
-                
-                # Build payloads for preview (check required fields during payload building)
-                payloads = {}
-                
-                # Handle networks that support both iOS and Android
-                if network_key in ["ironsource", "inmobi", "bigoads", "fyber", "pangle", "vungle"]:
-                    if st.session_state.store_info_android:
-                        try:
-                            android_payload = config.build_app_payload(mapped_params, platform="Android")
-                            payloads["Android"] = android_payload
-                        except Exception as e:
-                            payloads["Android"] = {"error": str(e)}
-                            has_errors = True
-                    
-                    if st.session_state.store_info_ios:
-                        try:
-                            ios_payload = config.build_app_payload(mapped_params, platform="iOS")
-                            payloads["iOS"] = ios_payload
-                        except Exception as e:
-                            payloads["iOS"] = {"error": str(e)}
-                            has_errors = True
-                elif network_key == "mintegral":
-                    # Mintegral requires separate payloads for iOS and Android (single os field)
-                    # Check required fields per platform
-                    missing_required_android = []
-                    missing_required_ios = []
-                    
-                    if st.session_state.store_info_android:
-                        # Check Android required fields
-                        android_params = mapped_params.copy()
-                        android_params["os"] = "ANDROID"
-                        android_params["package"] = mapped_params.get("android_package", "")
-                        android_params["store_url"] = mapped_params.get("android_store_url", "")
-                        
-                        required_fields = config.get_app_creation_fields()
-                        for field in required_fields:
-                            if field.required and field.name not in android_params:
-                                from network_configs.base_config import ConditionalField
-                                if isinstance(field, ConditionalField):
-                                    if field.should_show(android_params):
-                                        missing_required_android.append(field.label or field.name)
-                                else:
-                                    missing_required_android.append(field.label or field.name)
-                        
-                        if missing_required_android:
-                            payloads["Android"] = {"error": f"필수 필드 누락: {', '.join(missing_required_android)}"}
-                            has_errors = True
-                        else:
-                            try:
-                                android_payload = config.build_app_payload(android_params)
-                                payloads["Android"] = android_payload
-                            except Exception as e:
-                                payloads["Android"] = {"error": str(e)}
-                                has_errors = True
-                    
-                    if st.session_state.store_info_ios:
-                        # Check iOS required fields
-                        ios_params = mapped_params.copy()
-                        ios_params["os"] = "IOS"
-                        ios_params["package"] = mapped_params.get("ios_package", "")
-                        ios_params["store_url"] = mapped_params.get("ios_store_url", "")
-                        
-                        required_fields = config.get_app_creation_fields()
-                        for field in required_fields:
-                            if field.required and field.name not in ios_params:
-                                from network_configs.base_config import ConditionalField
-                                if isinstance(field, ConditionalField):
-                                    if field.should_show(ios_params):
-                                        missing_required_ios.append(field.label or field.name)
-                                else:
-                                    missing_required_ios.append(field.label or field.name)
-                        
-                        if missing_required_ios:
-                            payloads["iOS"] = {"error": f"필수 필드 누락: {', '.join(missing_required_ios)}"}
-                            has_errors = True
-                        else:
-                            try:
-                                ios_payload = config.build_app_payload(ios_params)
-                                payloads["iOS"] = ios_payload
-                            except Exception as e:
-                                payloads["iOS"] = {"error": str(e)}
-                                has_errors = True
-                else:
-                    # Single platform or other networks - check required fields
-                    required_fields = config.get_app_creation_fields()
-                    missing_required = []
-                    for field in required_fields:
-                        if field.required and field.name not in mapped_params:
-                            from network_configs.base_config import ConditionalField
-                            if isinstance(field, ConditionalField):
-                                if field.should_show(mapped_params):
-                                    missing_required.append(field.label or field.name)
-                            else:
-                                missing_required.append(field.label or field.name)
-                    
-                    if missing_required:
-                        preview_data[network_key] = {
-                            "display": network_display,
-                            "error": f"필수 필드 누락: {', '.join(missing_required)}",
-                            "params": mapped_params
-                        }
-                        has_errors = True
-                    else:
-                        try:
-                            payload = config.build_app_payload(mapped_params)
-                            payloads["default"] = payload
-                        except Exception as e:
-                            payloads["default"] = {"error": str(e)}
-                            has_errors = True
-                
-                # Only add to preview_data if not already added (for error case in else branch)
-                if network_key not in preview_data or "error" not in preview_data.get(network_key, {}):
-                    # Prepare ad unit payloads for preview (with placeholder for appCode)
-                    unit_payloads = {}
-                    if config.supports_create_unit():
-                        from components.create_app_helpers import generate_slot_name
-                        network_manager = get_network_manager()
-                        
-                        # Get app name
-                        app_name = None
-                        if st.session_state.store_info_ios:
-                            app_name = st.session_state.store_info_ios.get("name", "")
-                        if not app_name and st.session_state.store_info_android:
-                            app_name = st.session_state.store_info_android.get("name", "")
-                        
-                        # Generate unit payloads for each platform
-                        for platform_key, platform_payload in payloads.items():
-                            if "error" in platform_payload:
-                                continue
-                            
-                            platform_str = platform_key if platform_key != "default" else "Android"
-                            platform_lower = platform_str.lower()
-                            
-                            # Get package name/bundle ID for unit name generation
-                            # Use user-selected App match name for both Android and iOS if available
-                            selected_app_match_name = None
-                            if "ios_ad_unit_identifier" in st.session_state:
-                                selected_app_match_name = st.session_state.ios_ad_unit_identifier.get("value", None)
-                            
-                            if platform_lower == "android":
-                                # For Android, use selected App match name if available, otherwise use package name
-                                if selected_app_match_name:
-                                    # Use selected App match name (already lowercase)
-                                    pkg_name = selected_app_match_name
-                                    bundle_id = ""
-                                else:
-                                    # Fallback to package name
-                                    pkg_name = mapped_params.get("android_package", mapped_params.get("androidPkgName", mapped_params.get("android_store_id", mapped_params.get("androidBundle", ""))))
-                                    if not pkg_name and network_key == "inmobi":
-                                        android_info = st.session_state.get("store_info_android", {})
-                                        if android_info:
-                                            pkg_name = android_info.get("package_name", "")
-                                    bundle_id = ""
-                                
-                                # Always use selected App match name for unit name generation (for consistency)
-                                android_package_for_unit = selected_app_match_name
-                            else:  # iOS
-                                # For Pangle, use pkg_name from mapped_params (same as create_unit_common.py)
-                                if network_key == "pangle":
-                                    # Pangle iOS: use pkgName from mapped_params (create_unit_common.py logic)
-                                    pkg_name = mapped_params.get("ios_package", mapped_params.get("iosPkgName", mapped_params.get("ios_store_id", mapped_params.get("iosBundle", ""))))
-                                    if not pkg_name:
-                                        ios_info = st.session_state.get("store_info_ios", {})
-                                        if ios_info:
-                                            pkg_name = ios_info.get("package_name", "") or ios_info.get("bundle_id", "")
-                                    bundle_id = ""
-                                else:
-                                    pkg_name = ""
-                                    # For Vungle iOS, avoid using iTunesId (ios_store_id might be iTunesId)
-                                    # Use bundle_id directly from store_info_ios
-                                    if network_key == "vungle":
-                                        ios_info = st.session_state.get("store_info_ios", {})
-                                        if ios_info:
-                                            bundle_id = ios_info.get("bundle_id", "")  # Use bundle_id, not iTunesId
-                                        else:
-                                            bundle_id = mapped_params.get("ios_bundle_id", mapped_params.get("iosBundle", ""))
-                                    else:
-                                        bundle_id = mapped_params.get("ios_bundle_id", mapped_params.get("iosPkgName", mapped_params.get("ios_store_id", mapped_params.get("iosBundle", ""))))
-                                        if not bundle_id and network_key == "inmobi":
-                                            ios_info = st.session_state.get("store_info_ios", {})
-                                            if ios_info:
-                                                bundle_id = ios_info.get("bundle_id", "")
-                                
-                                # For iOS, prioritize user-selected identifier (App match name)
-                                # If not selected, use Android package name
-                                if selected_app_match_name:
-                                    android_package_for_unit = selected_app_match_name
-                                else:
-                                    # Fallback: try to use Android package name if available
-                                    android_package_for_unit = mapped_params.get("android_package", mapped_params.get("androidPkgName", ""))
-                                    if android_package_for_unit and '.' in android_package_for_unit:
-                                        android_package_for_unit = android_package_for_unit.split('.')[-1].lower()
-                            
-                            # Generate unit payloads for RV, IS, BN
-                            platform_unit_payloads = {}
-                            for slot_type in ["rv", "is", "bn"]:
-                                # For Pangle, use the same logic as create_unit_common.py
-                                # (no android_package_name, no bundle_id to match the exact same generation logic)
-                                if network_key == "pangle":
-                                    slot_name = generate_slot_name(
-                                        pkg_name,
-                                        platform_lower,
-                                        slot_type,
-                                        network_key,
-                                        network_manager=network_manager,
-                                        app_name=app_name
-                                    )
-                                else:
-                                    # Use selected App match name for both Android and iOS if available
-                                    # For Android: pass as android_package_name to ensure consistent naming
-                                    # For iOS: pass as android_package_name (already prioritized in generate_slot_name)
-                                    slot_name = generate_slot_name(
-                                        pkg_name,
-                                        platform_lower,
-                                        slot_type,
-                                        network_key,
-                                        bundle_id=bundle_id,
-                                        network_manager=network_manager,
-                                        app_name=app_name,
-                                        android_package_name=android_package_for_unit if android_package_for_unit else None
-                                    )
-                                
-                                # For Pangle, create payload even if slot_name is empty (slot_name is not required)
-                                if slot_name or network_key == "pangle":
-                                    # Build unit payload with placeholder for appCode/appId/site_id
-                                    # Each network has different required parameters
-                                    if network_key == "bigoads":
-                                        unit_payload = {
-                                            "appCode": "{APP_CODE}",  # Placeholder
-                                            "name": slot_name,
-                                        }
-                                        if slot_type.lower() == "rv":
-                                            unit_payload.update({"adType": 4, "auctionType": 3, "musicSwitch": 1})
-                                        elif slot_type.lower() == "is":
-                                            unit_payload.update({"adType": 3, "auctionType": 3, "musicSwitch": 1})
-                                        elif slot_type.lower() == "bn":
-                                            unit_payload.update({"adType": 2, "auctionType": 3, "bannerAutoRefresh": 2, "bannerSize": [2]})
-                                    elif network_key == "ironsource":
-                                        # IronSource: mediationAdUnitName, adFormat
-                                        ad_format_map = {
-                                            "rv": "rewarded",
-                                            "is": "interstitial",
-                                            "bn": "banner"
-                                        }
-                                        ad_format = ad_format_map.get(slot_type.lower(), "rewarded")
-                                        unit_payload = {
-                                            "mediationAdUnitName": slot_name,
-                                            "adFormat": ad_format,
-                                        }
-                                        # Add reward for rewarded format
-                                        if ad_format == "rewarded":
-                                            unit_payload["reward"] = {
-                                                "rewardItemName": "Reward",
-                                                "rewardAmount": 1
-                                            }
-                                    elif network_key == "pangle":
-                                        # Pangle: app_id, bidding_type, ad_slot_type, ad_slot_name
-                                        ad_slot_type_map = {
-                                            "rv": 5,  # Rewarded Video
-                                            "is": 6,  # Interstitial
-                                            "bn": 2   # Banner
-                                        }
-                                        ad_slot_type = ad_slot_type_map.get(slot_type.lower(), 5)
-                                        unit_payload = {
-                                            "app_id": "{APP_CODE}",  # Placeholder
-                                            "bidding_type": 1,  # Default: Bidding
-                                            "ad_slot_type": ad_slot_type,
-                                            "ad_slot_name": slot_name if slot_name else "",  # Ad slot name
-                                        }
-                                        # Add type-specific fields
-                                        if ad_slot_type == 5:  # Rewarded Video
-                                            unit_payload.update({
-                                                "render_type": 1,
-                                                "orientation": 1,
-                                                "reward_is_callback": 0,
-                                                "reward_name": "Reward",
-                                                "reward_count": 1,
-                                            })
-                                        elif ad_slot_type == 6:  # Interstitial
-                                            unit_payload.update({
-                                                "render_type": 1,
-                                                "orientation": 1,
-                                            })
-                                        elif ad_slot_type == 2:  # Banner
-                                            unit_payload.update({
-                                                "render_type": 1,
-                                                "slide_banner": 1,
-                                                "width": 640,
-                                                "height": 100,
-                                            })
-                                    elif network_key == "mintegral":
-                                        # Mintegral: app_id, placement_name, ad_type
-                                        ad_type_map = {
-                                            "rv": "rewarded_video",
-                                            "is": "new_interstitial",
-                                            "bn": "banner"
-                                        }
-                                        ad_type = ad_type_map.get(slot_type.lower(), "rewarded_video")
-                                        unit_payload = {
-                                            "app_id": "{APP_CODE}",  # Placeholder (will be replaced)
-                                            "placement_name": slot_name,
-                                            "ad_type": ad_type,
-                                            "integrate_type": "sdk",
-                                        }
-                                        # Add type-specific fields
-                                        if ad_type == "rewarded_video":
-                                            unit_payload["skip_time"] = -1  # Non Skippable
-                                        elif ad_type == "new_interstitial":
-                                            unit_payload.update({
-                                                "content_type": "both",
-                                                "ad_space_type": 1,
-                                                "skip_time": -1,
-                                            })
-                                        elif ad_type == "banner":
-                                            unit_payload.update({
-                                                "show_close_button": 0,
-                                                "auto_fresh": 0,
-                                            })
-                                    elif network_key == "inmobi":
-                                        # InMobi: appId, placementName, placementType
-                                        placement_type_map = {
-                                            "rv": "REWARDED_VIDEO",
-                                            "is": "INTERSTITIAL",
-                                            "bn": "BANNER"
-                                        }
-                                        placement_type = placement_type_map.get(slot_type.lower(), "INTERSTITIAL")
-                                        unit_payload = {
-                                            "appId": "{APP_CODE}",  # Placeholder
-                                            "placementName": slot_name,
-                                            "placementType": placement_type,
-                                            "isAudienceBiddingEnabled": False,
-                                        }
-                                    elif network_key == "fyber":
-                                        # Fyber: name, appId, placementType
-                                        placement_type_map = {
-                                            "rv": "Rewarded",
-                                            "is": "Interstitial",
-                                            "bn": "Banner"
-                                        }
-                                        placement_type = placement_type_map.get(slot_type.lower(), "Rewarded")
-                                        unit_payload = {
-                                            "name": slot_name,
-                                            "appId": "{APP_CODE}",  # Placeholder
-                                            "placementType": placement_type,
-                                            "coppa": False,
-                                        }
-                                    elif network_key == "vungle":
-                                        # Vungle: application, name, type, allowEndCards, isHBParticipation
-                                        type_map = {
-                                            "rv": "Rewarded",
-                                            "is": "Interstitial",
-                                            "bn": "Banner"
-                                        }
-                                        unit_type = type_map.get(slot_type.lower(), "Rewarded")
-                                        unit_payload = {
-                                            "application": "{APP_CODE}",  # Placeholder (vungleAppId)
-                                            "name": slot_name,
-                                            "type": unit_type,
-                                            "allowEndCards": True,  # Default value
-                                            "isHBParticipation": True,  # Default value (In-app bidding)
-                                        }
-                                    else:
-                                        # For other networks, try config.build_unit_payload if available
-                                        if hasattr(config, 'build_unit_payload'):
-                                            try:
-                                                # Map slot_type to network-specific format
-                                                unit_payload_data = {
-                                                    "appCode": "{APP_CODE}",  # Placeholder (generic)
-                                                    "name": slot_name,
-                                                    "slotType": slot_type.lower()
-                                                }
-                                                # Try to map to network-specific field names
-                                                if network_key in ["inmobi", "mintegral", "pangle"]:
-                                                    # These networks use different field names
-                                                    if network_key == "inmobi":
-                                                        unit_payload_data["appId"] = "{APP_CODE}"
-                                                    elif network_key == "mintegral":
-                                                        unit_payload_data["app_id"] = "{APP_CODE}"
-                                                    elif network_key == "pangle":
-                                                        unit_payload_data["app_id"] = "{APP_CODE}"
-                                                
-                                                unit_payload = config.build_unit_payload(unit_payload_data)
-                                            except Exception as e:
-                                                logger.warning(f"Failed to build unit payload for {network_key} {platform_str} {slot_type}: {str(e)}")
-                                                continue
-                                        else:
-                                            unit_payload = {
-                                                "appCode": "{APP_CODE}",  # Placeholder
-                                                "name": slot_name,
-                                            }
-                                    
-                                    platform_unit_payloads[slot_type.upper()] = unit_payload
-                            
-                            if platform_unit_payloads:
-                                unit_payloads[platform_key] = platform_unit_payloads
-                    
-                    preview_data[network_key] = {
-                        "display": network_display,
-                        "payloads": payloads,
-                        "params": mapped_params,
-                        "unit_payloads": unit_payloads  # Add unit payloads
-                    }
+                has_errors = has_errors or network_has_errors
             
             # Clear BigOAds apps cache after preview generation is complete
-            from components import create_app_helpers
-            create_app_helpers._bigoads_apps_cache = None
+            from components.create_app_helpers import reset_bigoads_apps_cache
+            reset_bigoads_apps_cache()
             
             # Store preview_data in session state
             st.session_state.preview_data = preview_data
@@ -1554,6 +1714,9 @@ def render_new_create_app_ui():
             create_button = st.button("🚀 선택한 네트워크에 앱 생성", type="primary", width='stretch', disabled=has_errors)
             
             if create_button:
+                # Created apps change existing app lists (e.g. BigOAds slot names), so rebuild previews next run
+                st.session_state.preview_cache = {}
+                
                 # Initialize results tracking
                 if "creation_results" not in st.session_state:
                     st.session_state.creation_results = {}
@@ -1723,8 +1886,8 @@ def render_new_create_app_ui():
                             
                             if results:
                                 # Store response and results
-                                st.session_state[f"{network_key}_last_app_response"] = results[-1][2]
-                                st.session_state[f"{network_key}_create_app_results"] = results
+                                SessionManager.stash_payload(f"{network_key}_last_app_response", results[-1][2])
+                                SessionManager.stash_payload(f"{network_key}_create_app_results", results)
                                 
                                 # Process results (similar to existing logic)
                                 from components.create_app_ui import (
@@ -1791,7 +1954,7 @@ def render_new_create_app_ui():
                                         response = network_manager.create_app(network_key, payload)
                                 
                                 # Store response
-                                st.session_state[f"{network_key}_last_app_response"] = response
+                                SessionManager.stash_payload(f"{network_key}_last_app_response", response)
                                 
                                 # Check if response is successful (status: 0)
                                 is_success = response.get('status') == 0 or response.get('code') == 0
@@ -2198,21 +2361,38 @@ def render_new_create_app_ui():
                             
                             progress_bar = st.progress(0)
                             status_text = st.empty()
+                            network_manager = get_network_manager()
                             
+                            def track_unit_result(unit_info, success, error=None):
+                                """Track one unit creation result in creation_results"""
+                                platform_display = "Android" if unit_info["platform_str"].lower() == "android" else "iOS"
+                                network_key = unit_info["network"]
+                                if network_key not in st.session_state.creation_results:
+                                    st.session_state.creation_results[network_key] = {"network": unit_info["network_display"], "apps": [], "units": []}
+                                unit_result = {
+                                    "platform": platform_display,
+                                    "app_name": unit_info["app_info"].get("name", "Unknown"),
+                                    "unit_name": unit_info["slot_name"],
+                                    "unit_type": unit_info["slot_type"].upper(),
+                                    "success": success
+                                }
+                                if not success:
+                                    unit_result["error"] = error
+                                st.session_state.creation_results[network_key]["units"].append(unit_result)
+                            
+                            # Phase 1: build payloads (and deactivate existing Vungle placements once per app)
+                            status_text.text(f"Payload 준비 중... (0/{total_units})")
+                            payloads_by_network = {}
+                            units_by_network = {}
+                            deactivated_vungle_apps = set()
                             for idx, unit_info in enumerate(all_units_to_create):
                                 network_key = unit_info["network"]
-                                network_display = unit_info["network_display"]
                                 app_info = unit_info["app_info"]
                                 slot_type = unit_info["slot_type"]
                                 slot_name = unit_info["slot_name"]
                                 platform_str = unit_info["platform_str"]
                                 
-                                progress = (idx + 1) / total_units
-                                progress_bar.progress(progress)
-                                status_text.text(f"생성 중: {network_display} - {slot_type.upper()} ({idx + 1}/{total_units})")
-                                
                                 try:
-                                    network_manager = get_network_manager()
                                     config = get_network_config(network_key)
                                     
                                     if network_key == "vungle":
@@ -2220,19 +2400,21 @@ def render_new_create_app_ui():
                                         vungle_app_id = app_info.get("vungleAppId")
                                         platform_value = app_info.get("platform", "")
                                         
-                                        # Deactivate existing placements first
-                                        if vungle_app_id:
+                                        # Deactivate existing placements first (before any new placement is created)
+                                        if vungle_app_id and vungle_app_id not in deactivated_vungle_apps:
+                                            deactivated_vungle_apps.add(vungle_app_id)
                                             try:
                                                 existing_placements = network_manager._get_vungle_placements_by_app_id(str(vungle_app_id))
                                                 for placement in existing_placements:
                                                     initial_placement_id = placement.get("id")
                                                     if initial_placement_id:
                                                         # Get full placement details to get accurate ID
-                                                        placement_details = network_manager._vungle_api.get_placement(str(initial_placement_id))
+                                                        placement_details = network_manager._get_api("vungle").get_placement(str(initial_placement_id))
                                                         if placement_details and placement_details.get("result"):
                                                             placement_id = placement_details["result"].get("id")
                                                             if placement_id:
-                                                                network_manager._vungle_api.update_placement(str(placement_id), {"status": "inactive"})
+                                                                network_manager._get_api("vungle").update_placement(str(placement_id), {"status": "inactive"})
+                                                network_manager.forget_created_units("vungle", str(vungle_app_id))
                                             except Exception as e:
                                                 logger.warning(f"[Vungle] Failed to deactivate existing placements: {str(e)}")
                                         
@@ -2243,8 +2425,6 @@ def render_new_create_app_ui():
                                             ad_type=slot_type,
                                             platform=platform_value
                                         )
-                                        
-                                        response = network_manager.create_unit(network_key, unit_payload)
                                     elif network_key == "applovin":
                                         # AppLovin: use create_unit with special payload
                                         ad_format_map = {"rv": "REWARD", "is": "INTER", "bn": "BANNER"}
@@ -2260,51 +2440,45 @@ def render_new_create_app_ui():
                                             unit_payload["package_name"] = app_info.get("package_name", "")
                                         else:
                                             unit_payload["bundle_id"] = app_info.get("bundleId", "")
-                                        
-                                        response = network_manager.create_unit(network_key, unit_payload)
                                     else:
-                                        # Standard networks: use create_default_slot
-                                        from components.create_app_helpers import create_default_slot
-                                        create_default_slot(
-                                            network_key,
-                                            app_info,
-                                            slot_type,
-                                            network_manager,
-                                            config
-                                        )
-                                        response = {"status": 0}  # Assume success if no exception
-                                    
-                                    success_count += 1
-                                    
-                                    # Track unit creation result
-                                    platform_display = "Android" if platform_str.lower() == "android" else "iOS"
-                                    if network_key not in st.session_state.creation_results:
-                                        st.session_state.creation_results[network_key] = {"network": network_display, "apps": [], "units": []}
-                                    st.session_state.creation_results[network_key]["units"].append({
-                                        "platform": platform_display,
-                                        "app_name": app_info.get("name", "Unknown"),
-                                        "unit_name": slot_name,
-                                        "unit_type": slot_type.upper(),
-                                        "success": True
-                                    })
+                                        # Standard networks: default slot payload
+                                        from components.create_app_helpers import build_default_slot_payload
+                                        unit_payload, _ = build_default_slot_payload(network_key, app_info, slot_type, network_manager)
                                     
+                                    payloads_by_network.setdefault(network_key, []).append(unit_payload)
+                                    units_by_network.setdefault(network_key, []).append(unit_info)
                                 except Exception as e:
                                     failure_count += 1
-                                    
-                                    # Track unit creation failure
-                                    platform_display = "Android" if platform_str.lower() == "android" else "iOS"
-                                    if network_key not in st.session_state.creation_results:
-                                        st.session_state.creation_results[network_key] = {"network": network_display, "apps": [], "units": []}
-                                    st.session_state.creation_results[network_key]["units"].append({
-                                        "platform": platform_display,
-                                        "app_name": app_info.get("name", "Unknown"),
-                                        "unit_name": slot_name,
-                                        "unit_type": slot_type.upper(),
-                                        "success": False,
-                                        "error": str(e)
-                                    })
-                                    
+                                    track_unit_result(unit_info, False, str(e))
                                     logger.error(f"Error creating {slot_type} unit for {network_key}: {str(e)}", exc_info=True)
+                                
+                                progress_bar.progress((idx + 1) / total_units * 0.3)
+                            
+                            # Phase 2: create units on all networks in parallel (per-network rate limits apply)
+                            status_text.text(f"생성 중: {', '.join(units_by_network.keys())} ({sum(len(u) for u in units_by_network.values())}개)")
+                            responses_by_network = network_manager.create_units_across_networks(payloads_by_network)
+                            progress_bar.progress(0.9)
+                            
+                            # Phase 3: record results
+                            for network_key, unit_infos in units_by_network.items():
+                                for unit_info, response in zip(unit_infos, responses_by_network.get(network_key, [])):
+                                    if response and (response.get("status") == 0 or response.get("code") == 0):
+                                        success_count += 1
+                                        track_unit_result(unit_info, True)
+                                        if network_key not in ["vungle", "applovin"]:
+                                            result_data = response.get("result") or {}
+                                            app_info = unit_info["app_info"]
+                                            SessionManager.add_created_unit(network_key, {
+                                                "slotCode": result_data.get("slotCode", "N/A") if isinstance(result_data, dict) else "N/A",
+                                                "name": unit_info["slot_name"],
+                                                "appCode": app_info.get("appCode") or app_info.get("appId"),
+                                                "slotType": unit_info["slot_type"]
+                                            })
+                                    else:
+                                        failure_count += 1
+                                        error_msg = response.get("msg", "Unknown error") if response else "No response"
+                                        track_unit_result(unit_info, False, error_msg)
+                                        logger.error(f"Error creating {unit_info['slot_type']} unit for {network_key}: {error_msg}")
                             
                             progress_bar.empty()
                             status_text.empty()
@@ -2336,11 +2510,11 @@ def render_new_create_app_ui():
                         
                         # Get response to check success and extract info
                         response_key = f"{network_key}_last_app_response"
-                        response = st.session_state.get(response_key)
+                        response = SessionManager.get_payload(response_key)
                         
                         # For multi-platform networks, check if we have results stored
                         results_key = f"{network_key}_create_app_results"
-                        results = st.session_state.get(results_key, [])
+                        results = SessionManager.get_payload(results_key, [])
                         
                         if response and isinstance(response, dict):
                             is_success = response.get('status') == 0 or response.get('code') == 0
@@ -2957,12 +3131,8 @@ def render_new_create_app_ui():
                                                             
                                                             try:
                                                                 # Use VungleAPI to get placement details first
-                                                                if network_manager._vungle_api is None:
-                                                                    from utils.network_apis.vungle_api import VungleAPI
-                                                                    network_manager._vungle_api = VungleAPI()
-                                                                
                                                                 # GET /placements/{id} to get full placement details
-                                                                get_response = network_manager._vungle_api.get_placement(str(initial_placement_id))
+                                                                get_response = network_manager._get_api("vungle").get_placement(str(initial_placement_id))
                                                                 
                                                                 if get_response and (get_response.get('status') == 0 or get_response.get('code') == 0):
                                                                     # Extract id from GET placement response
@@ -2975,7 +3145,7 @@ def render_new_create_app_ui():
                                                                             "status": "inactive"
                                                                         }
                                                                         
-                                                                        update_response = network_manager._vungle_api.update_placement(str(placement_id), update_payload)
+                                                                        update_response = network_manager._get_api("vungle").update_placement(str(placement_id), update_payload)
                                                                         
                                                                         if update_response and (update_response.get('status') == 0 or update_response.get('code') == 0):
                                                                             deactivated_count += 1
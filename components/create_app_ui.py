@@ -121,8 +121,8 @@ def render_create_app_ui(current_network: str, network_display: str, config):
         
     # Display persisted create app response if exists (for all networks)
     response_key = f"{current_network}_last_app_response"
-    if response_key in st.session_state:
-        last_response = st.session_state[response_key]
+    last_response = SessionManager.get_payload(response_key)
+    if last_response:
         st.info(f"📥 Last Create App Response (persisted) - {network_display}")
         with st.expander("📥 Last API Response", expanded=True):
             import json
@@ -132,7 +132,7 @@ def render_create_app_ui(current_network: str, network_display: str, config):
                 st.subheader("📝 Result Data")
                 st.json(_mask_sensitive_data(result))
         if st.button("🗑️ Clear Response", key=f"clear_{current_network}_response"):
-            del st.session_state[response_key]
+            SessionManager.clear_payload(response_key)
             st.rerun()
         st.divider()
     
@@ -247,7 +247,7 @@ def render_create_app_ui(current_network: str, network_display: str, config):
                             # Store responses and process results
                             if results:
                                 # Store the last response (for backward compatibility)
-                                st.session_state[f"{current_network}_last_app_response"] = results[-1][2]
+                                SessionManager.stash_payload(f"{current_network}_last_app_response", results[-1][2])
                                 
                                 # Process all results
                                 if current_network == "ironsource":
@@ -280,7 +280,7 @@ def render_create_app_ui(current_network: str, network_display: str, config):
                             response = network_manager.create_app(current_network, payload)
                                     
                             # Store response in session_state to persist it (for all networks)
-                            st.session_state[f"{current_network}_last_app_response"] = response
+                            SessionManager.stash_payload(f"{current_network}_last_app_response", response)
                             
                             result = handle_api_response(response)
                             
@@ -25,12 +25,13 @@ def render_app_code_selector(current_network: str, network_manager):
     # For other networks (Mintegral, InMobi), fetch from API automatically
     api_apps = []
     if current_network in ["mintegral", "inmobi"]:
+        # Latest 3 apps (server-side limit, cached in network manager until refresh or app creation)
+        refresh_apps = st.button("🔄 최근 App 새로고침", key=f"{current_network}_refresh_recent_apps")
+        st.caption(f"🕒 Last sync: {SessionManager.get_last_sync_age(current_network)}")
         try:
             with st.spinner("Loading apps from API..."):
-                api_apps = network_manager.get_apps(current_network)
-                # Get latest 3 apps only
+                api_apps = network_manager.get_recent_apps(current_network, limit=3, refresh=refresh_apps)
                 if api_apps:
-                    api_apps = api_apps[:3]
                     st.success(f"✅ Loaded {len(api_apps)} apps from API")
         except Exception as e:
             logger.warning(f"[{current_network}] Failed to load apps from API: {str(e)}")
@@ -7,7 +7,7 @@ from utils.ui_helpers import handle_api_response
 from components.create_app_helpers import (
     normalize_platform_str as _normalize_platform_str,
     generate_slot_name as _generate_slot_name,
-    create_default_slot as _create_default_slot
+    build_default_slot_payload as _build_default_slot_payload
 )
 
 logger = logging.getLogger(__name__)
@@ -134,14 +134,33 @@ def render_create_unit_common_ui(
             else:
                 with st.spinner("Creating all 3 slots..."):
                     results = []
+                    slot_requests = []
                     for slot_type in ["rv", "is", "bn"]:
                         try:
-                            _create_default_slot(current_network, app_info_to_use, slot_type, network_manager, config)
-                            results.append({"type": slot_type.upper(), "status": "success"})
+                            payload, slot_name = _build_default_slot_payload(current_network, app_info_to_use, slot_type, network_manager)
+                            slot_requests.append((slot_type, slot_name, payload))
                         except Exception as e:
                             error_msg = str(e)
                             logger.error(f"[BigOAds] Error creating {slot_type.upper()} slot: {error_msg}")
                             results.append({"type": slot_type.upper(), "status": "error", "error": error_msg})
+                    
+                    # Create slots as one batch (network manager applies BigOAds rate limit)
+                    responses = network_manager.create_units(current_network, [payload for _, _, payload in slot_requests])
+                    app_code = app_info_to_use.get("appCode") or app_info_to_use.get("appId")
+                    for (slot_type, slot_name, payload), response in zip(slot_requests, responses):
+                        result = handle_api_response(response)
+                        if result:
+                            SessionManager.add_created_unit(current_network, {
+                                "slotCode": result.get("slotCode", "N/A"),
+                                "name": slot_name,
+                                "appCode": app_code,
+                                "slotType": slot_type
+                            })
+                            results.append({"type": slot_type.upper(), "status": "success"})
+                        else:
+                            error_msg = response.get("msg", "Unknown error")
+                            logger.error(f"[BigOAds] Error creating {slot_type.upper()} slot: {error_msg}")
+                            results.append({"type": slot_type.upper(), "status": "error", "error": error_msg})
                 
                 # Store results in session state to persist across reruns
                 st.session_state[batch_results_key] = results
@@ -361,7 +380,7 @@ def render_create_unit_common_ui(
         # IronSource Create Ad Unit section
         # Get app keys from Create App response (default) - minimize space
         ironsource_response_key = f"{current_network}_last_app_response"
-        ironsource_response = st.session_state.get(ironsource_response_key)
+        ironsource_response = SessionManager.get_payload(ironsource_response_key)
         
         default_android_app_key = None
         default_ios_app_key = None
@@ -403,7 +422,7 @@ def render_create_unit_common_ui(
                         try:
                             api_apps = network_manager.get_apps(current_network)
                             if api_apps:
-                                st.session_state["ironsource_api_apps_for_create_unit"] = api_apps
+                                SessionManager.stash_payload("ironsource_api_apps_for_create_unit", api_apps)
                                 st.success(f"✅ Loaded {len(api_apps)} apps from API")
                             else:
                                 st.warning("⚠️ No apps found")
@@ -416,8 +435,8 @@ def render_create_unit_common_ui(
             ios_app_key = default_ios_app_key
             
             with col2:
-                if "ironsource_api_apps_for_create_unit" in st.session_state:
-                    api_apps = st.session_state["ironsource_api_apps_for_create_unit"]
+                if SessionManager.has_payload("ironsource_api_apps_for_create_unit"):
+                    api_apps = SessionManager.get_payload("ironsource_api_apps_for_create_unit", [])
                     if api_apps:
                         # Group apps by name (Android + iOS)
                         app_groups = {}
@@ -469,8 +488,8 @@ def render_create_unit_common_ui(
                 app_name_for_slot = default_app_name or ""
                 
                 # Try to get from API apps list if available
-                if not bundle_id and "ironsource_api_apps_for_create_unit" in st.session_state:
-                    api_apps = st.session_state["ironsource_api_apps_for_create_unit"]
+                if not bundle_id and SessionManager.has_payload("ironsource_api_apps_for_create_unit"):
+                    api_apps = SessionManager.get_payload("ironsource_api_apps_for_create_unit", [])
                     for app in api_apps:
                         if app.get("appKey") == android_app_key and app.get("platform", "").lower() == "android":
                             bundle_id = app.get("bundleId", "")
@@ -664,8 +683,8 @@ def render_create_unit_common_ui(
                 app_name_for_slot = default_app_name or ""
                 
                 # Try to get from API apps list if available
-                if not bundle_id and "ironsource_api_apps_for_create_unit" in st.session_state:
-                    api_apps = st.session_state["ironsource_api_apps_for_create_unit"]
+                if not bundle_id and SessionManager.has_payload("ironsource_api_apps_for_create_unit"):
+                    api_apps = SessionManager.get_payload("ironsource_api_apps_for_create_unit", [])
                     for app in api_apps:
                         if app.get("appKey") == ios_app_key and app.get("platform", "").lower() == "ios":
                             bundle_id = app.get("bundleId", "")
@@ -940,18 +959,18 @@ def render_create_unit_common_ui(
                                             
                                             create_payloads.append((slot_key, slot_config, payload))
                                         
-                                        # Create placements sequentially
+                                        # Create placements concurrently (within the network's rate limit), results keep slot order
+                                        responses = network_manager.create_units(current_network, [payload for _, _, payload in create_payloads])
                                         results = []
-                                        for slot_key, slot_config, payload in create_payloads:
-                                            response = network_manager.create_unit(current_network, payload)
+                                        for (slot_key, slot_config, payload), response in zip(create_payloads, responses):
                                             result = handle_api_response(response)
-                                            results.append((slot_key, response, result))
+                                            results.append((slot_key, slot_config, response, result))
                                         
                                         # Process results
                                         success_count = 0
                                         failed_count = 0
                                         
-                                        for slot_key, response, result in results:
+                                        for slot_key, slot_config, response, result in results:
                                             if response.get("status") == 0 or response.get("code") == 0:
                                                 success_count += 1
                                                 if result:
@@ -1074,18 +1093,18 @@ def render_create_unit_common_ui(
                                     
                                     create_payloads.append((slot_key, slot_config, payload))
                                 
-                                # Create placements sequentially
+                                # Create placements concurrently (within the network's rate limit), results keep slot order
+                                responses = network_manager.create_units(current_network, [payload for _, _, payload in create_payloads])
                                 results = []
-                                for slot_key, slot_config, payload in create_payloads:
-                                    response = network_manager.create_unit(current_network, payload)
+                                for (slot_key, slot_config, payload), response in zip(create_payloads, responses):
                                     result = handle_api_response(response)
-                                    results.append((slot_key, response, result))
+                                    results.append((slot_key, slot_config, response, result))
                                 
                                 # Process results
                                 success_count = 0
                                 failed_count = 0
                                 
-                                for slot_key, response, result in results:
+                                for slot_key, slot_config, response, result in results:
                                     if response.get("status") == 0 or response.get("code") == 0:
                                         success_count += 1
                                         if result:
@@ -18,7 +18,7 @@ def render_unity_create_unit_ui(current_network: str):
     """
     # Get Project ID from Create App response or manual input
     unity_response_key = f"{current_network}_last_app_response"
-    unity_response = st.session_state.get(unity_response_key)
+    unity_response = SessionManager.get_payload(unity_response_key)
     
     project_id = None
     if unity_response and unity_response.get("status") == 0:
@@ -6,6 +6,7 @@ after creating an app, before creating new units.
 import streamlit as st
 from utils.network_manager import get_network_manager
 from utils.ui_helpers import handle_api_response
+from utils.session_manager import SessionManager
 from utils.ad_network_query import get_ironsource_units
 
 
@@ -24,7 +25,7 @@ def render_ironsource_deactivate_ad_units(current_network: str):
     
     # Get IronSource Create App response from cache
     ironsource_response_key = f"{current_network}_last_app_response"
-    ironsource_response = st.session_state.get(ironsource_response_key)
+    ironsource_response = SessionManager.get_payload(ironsource_response_key)
     
     android_app_key = None
     ios_app_key = None
@@ -52,7 +53,6 @@ def render_ironsource_deactivate_ad_units(current_network: str):
                 ios_app_key = result_data.get("appKey")
     
     # Also check session state for app info
-    from utils.session_manager import SessionManager
     last_app_info = SessionManager.get_last_created_app_info(current_network)
     if last_app_info:
         android_app_key = android_app_key or last_app_info.get("appKey")
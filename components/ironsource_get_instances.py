@@ -4,7 +4,6 @@ This component handles the IronSource-specific workflow of querying instances
 after creating ad units.
 """
 import streamlit as st
-import pandas as pd
 from utils.network_manager import get_network_manager
 from utils.session_manager import SessionManager
 
@@ -24,7 +23,7 @@ def render_ironsource_get_instances(current_network: str):
     
     # Get IronSource Create App response from cache
     ironsource_response_key = f"{current_network}_last_app_response"
-    ironsource_response = st.session_state.get(ironsource_response_key)
+    ironsource_response = SessionManager.get_payload(ironsource_response_key)
     
     android_app_key = None
     ios_app_key = None
@@ -114,6 +113,7 @@ def render_ironsource_get_instances(current_network: str):
                                         })
                                     
                                     if instance_data:
+                                        import pandas as pd  # deferred: only needed when instances are shown
                                         df = pd.DataFrame(instance_data)
                                         st.dataframe(df, width='stretch', hide_index=True)
                                         st.divider()
@@ -170,6 +170,7 @@ def render_ironsource_get_instances(current_network: str):
                                         })
                                     
                                     if instance_data:
+                                        import pandas as pd  # deferred: only needed when instances are shown
                                         df = pd.DataFrame(instance_data)
                                         st.dataframe(df, width='stretch', hide_index=True)
                                         st.divider()
@@ -187,3 +188,42 @@ def render_ironsource_get_instances(current_network: str):
                         with st.expander("🔍 Exception Details", expanded=False):
                             st.code(traceback.format_exc())
 
+    
+    # Bulk GET (many app keys at once, rate-limited, results kept in the instance index)
+    with st.expander("📦 Bulk GET Instances", expanded=False):
+        bulk_keys_input = st.text_area(
+            "App Keys (one per line or comma-separated)",
+            placeholder="appKey1\nappKey2",
+            key="ironsource_bulk_app_keys_input"
+        )
+        refresh = st.checkbox("Refetch already loaded app keys", value=False, key="ironsource_bulk_refresh")
+        if st.button("🔍 GET Instances for All", width='stretch', key="get_ironsource_bulk_instances"):
+            app_keys = [key.strip() for key in bulk_keys_input.replace(",", "\n").splitlines() if key.strip()]
+            if not app_keys:
+                st.error("❌ Please enter at least one App Key")
+            else:
+                from utils.ad_network_query import load_ironsource_instances
+                from utils.request_scheduler import BULK, request_priority
+                with st.spinner(f"📡 Fetching instances for {len(app_keys)} apps..."):
+                    try:
+                        # Bulk reads yield to interactive requests in the request scheduler
+                        with request_priority(BULK):
+                            index = load_ironsource_instances(app_keys, refresh=refresh)
+                        summary = []
+                        for app_key in dict.fromkeys(app_keys):
+                            instances = index.instances_for(app_key)
+                            summary.append({
+                                "App Key": app_key,
+                                "Instances": len(instances) if instances is not None else "N/A",
+                                "Bidders": sum(1 for inst in instances or [] if inst.get("isBidder")),
+                                "Error": index.errors.get(app_key, "")
+                            })
+                        import pandas as pd  # deferred: only needed when instances are shown
+                        st.dataframe(pd.DataFrame(summary), width='stretch', hide_index=True)
+                        failed = [row for row in summary if row["Error"]]
+                        if failed:
+                            st.warning(f"⚠️ {len(failed)} app keys failed")
+                        else:
+                            st.success(f"✅ Loaded instances for {len(summary)} apps")
+                    except Exception as e:
+                        st.error(f"❌ Error fetching instances: {str(e)}")
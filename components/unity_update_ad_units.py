@@ -5,6 +5,7 @@ after creating a Unity project, before creating new units.
 """
 import streamlit as st
 from utils.network_manager import get_network_manager
+from utils.session_manager import SessionManager
 from utils.ui_helpers import handle_api_response
 
 
@@ -23,7 +24,7 @@ def render_unity_update_ad_units(current_network: str):
     
     # Get Unity Create App response from cache
     unity_response_key = f"{current_network}_last_app_response"
-    unity_response = st.session_state.get(unity_response_key)
+    unity_response = SessionManager.get_payload(unity_response_key)
     
     project_id = None
     stores_data = {}
@@ -161,3 +162,63 @@ def render_unity_update_ad_units(current_network: str):
     else:
         st.info("💡 Project ID를 입력하거나 Create App을 먼저 실행해주세요.")
 
+    
+    render_unity_bulk_provisioning()
+
+
+def render_unity_bulk_provisioning():
+    """Render bulk provisioning for many Unity projects (archive → create ad units → placements)"""
+    st.divider()
+    st.subheader("🚀 Bulk Provision (Unity)")
+    st.info("💡 여러 Project ID를 입력하면 Store별로 기존 Ad Units archive 후 RV/IS/BN Ad Units(bidding placement 포함)를 한 번에 생성합니다.")
+    
+    project_ids_input = st.text_area(
+        "Project IDs (one per line or comma-separated)",
+        placeholder="de39f42a-2319-4f34-a1b4-cd555f457192",
+        key="unity_bulk_project_ids"
+    )
+    col1, col2, col3 = st.columns(3)
+    with col1:
+        include_apple = st.checkbox("Apple (iOS)", value=True, key="unity_bulk_apple")
+    with col2:
+        include_google = st.checkbox("Google (Android)", value=True, key="unity_bulk_google")
+    with col3:
+        archive_existing = st.checkbox("Archive existing ad units", value=True, key="unity_bulk_archive")
+    
+    if st.button("🚀 Provision All", type="primary", width='stretch', key="unity_bulk_provision"):
+        from utils.unity_provisioning import UnityProvisionTarget, provision_unity_targets
+        
+        project_ids = list(dict.fromkeys(
+            pid.strip() for pid in project_ids_input.replace(",", "\n").splitlines() if pid.strip()
+        ))
+        stores = [store for store, selected in (("apple", include_apple), ("google", include_google)) if selected]
+        if not project_ids or not stores:
+            st.error("❌ Please enter at least one Project ID and select a store")
+            return
+        
+        targets = [
+            UnityProvisionTarget(project_id, store_name, archive=archive_existing)
+            for project_id in project_ids
+            for store_name in stores
+        ]
+        with st.spinner(f"Provisioning {len(targets)} targets..."):
+            report = provision_unity_targets(targets)
+        
+        if report["failed"]:
+            st.warning(f"⚠️ {report['succeeded']}/{report['total']} targets provisioned")
+        else:
+            st.success(f"✅ {report['succeeded']}/{report['total']} targets provisioned")
+        
+        import pandas as pd  # deferred: only needed for the report table
+        st.dataframe(pd.DataFrame([
+            {
+                "Project ID": row["project_id"],
+                "Store": row["store_name"],
+                "Status": "✅" if row["status"] == "success" else "❌",
+                "Archived": row["archived"],
+                "Created Ad Units": ", ".join(row["created_ad_units"]) or "-",
+                "Failed Step": row["failed_step"] or "",
+                "Error": row["error"] or "",
+            }
+            for row in report["targets"]
+        ]), width='stretch', hide_index=True)
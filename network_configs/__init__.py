@@ -1,29 +1,101 @@
 """Network configuration registry"""
+import importlib
+import logging
+import threading
+import time
+from collections.abc import Mapping
+
 from .base_config import NetworkConfig, Field, ConditionalField
-from .bigoads_config import BigOAdsConfig
-from .ironsource_config import IronSourceConfig
-from .pangle_config import PangleConfig
-from .mintegral_config import MintegralConfig
-from .inmobi_config import InMobiConfig
-from .fyber_config import FyberConfig
-from .applovin_config import AppLovinConfig
-from .unity_config import UnityConfig
-from .vungle_config import VungleConfig
 
-# Network registry
-NETWORK_REGISTRY = {
-    'bigoads': BigOAdsConfig(),
-    'ironsource': IronSourceConfig(),
-    'pangle': PangleConfig(),
-    'mintegral': MintegralConfig(),
-    'inmobi': InMobiConfig(),
-    'fyber': FyberConfig(),
-    'applovin': AppLovinConfig(),
-    'unity': UnityConfig(),
-    'vungle': VungleConfig(),
+logger = logging.getLogger(__name__)
+
+# Network configs: key -> (module, class, display name)
+# Configs are imported and instantiated on first access; display names are kept here
+# (must match config.display_name) so listing networks does not load every config.
+NETWORK_CONFIG_CLASSES = {
+    'bigoads': ('.bigoads_config', 'BigOAdsConfig', 'BIGO Ads'),
+    'ironsource': ('.ironsource_config', 'IronSourceConfig', 'IronSource'),
+    'pangle': ('.pangle_config', 'PangleConfig', 'TikTok (Pangle)'),
+    'mintegral': ('.mintegral_config', 'MintegralConfig', 'Mintegral'),
+    'inmobi': ('.inmobi_config', 'InMobiConfig', 'InMobi'),
+    'fyber': ('.fyber_config', 'FyberConfig', 'Fyber (DT)'),
+    'applovin': ('.applovin_config', 'AppLovinConfig', 'AppLovin'),
+    'unity': ('.unity_config', 'UnityConfig', 'Unity'),
+    'vungle': ('.vungle_config', 'VungleConfig', 'Vungle (Liftoff)'),
     # Future networks will be added here
 }
 
+# Credentials required per network (alternative env key sets; any one complete set is enough)
+# Kept next to the config classes so credential checks do not load every config.
+NETWORK_CREDENTIAL_KEYS = {
+    'ironsource': [['IRONSOURCE_BEARER_TOKEN'], ['IRONSOURCE_API_TOKEN'], ['IRONSOURCE_REFRESH_TOKEN', 'IRONSOURCE_SECRET_KEY']],
+    'pangle': [['PANGLE_SECURITY_KEY', 'PANGLE_USER_ID', 'PANGLE_ROLE_ID']],
+    'bigoads': [['BIGOADS_DEVELOPER_ID', 'BIGOADS_TOKEN']],
+    'mintegral': [['MINTEGRAL_SKEY', 'MINTEGRAL_SECRET']],
+    # InMobi 인증 방식에 따라 필요한 필드 확인 (API 문서 참조 필요)
+    'inmobi': [['INMOBI_ACCOUNT_NAME', 'INMOBI_ACCOUNT_ID', 'INMOBI_USERNAME', 'INMOBI_CLIENT_SECRET']],
+    # Fyber 인증 방식에 따라 필요한 필드 확인 (API 문서 참조 필요)
+    'fyber': [['DT_CLIENT_ID', 'DT_CLIENT_SECRET', 'FYBER_ACCESS_TOKEN', 'FYBER_PUBLISHER_ID']],
+    'applovin': [['APPLOVIN_API_KEY']],
+    'unity': [['UNITY_KEY_ID', 'UNITY_SECRET_KEY', 'UNITY_ORGANIZATION_ID']],
+    'vungle': [['VUNGLE_SECRET_TOKEN'], ['LIFTOFF_SECRET_TOKEN'], ['VUNGLE_JWT_TOKEN'], ['LIFTOFF_JWT_TOKEN']],
+}
+
+
+class LazyNetworkRegistry(Mapping):
+    """Read-only network -> config mapping that instantiates each config on first access"""
+
+    def __init__(self, config_classes: dict):
+        self._config_classes = config_classes
+        self._configs = {}
+        self._lock = threading.Lock()
+        # Config load time in ms (for import profiling)
+        self.load_times = {}
+
+    def __getitem__(self, network_name: str) -> NetworkConfig:
+        config = self._configs.get(network_name)
+        if config is not None:
+            return config
+        if network_name not in self._config_classes:
+            raise KeyError(network_name)
+        with self._lock:
+            config = self._configs.get(network_name)
+            if config is None:
+                module_path, class_name, _ = self._config_classes[network_name]
+                start = time.perf_counter()
+                config_cls = getattr(importlib.import_module(module_path, __name__), class_name)
+                config = config_cls()
+                self._configs[network_name] = config
+                self.load_times[network_name] = (time.perf_counter() - start) * 1000
+                logger.debug(f"[Config] Loaded {class_name} in {self.load_times[network_name]:.1f} ms")
+        return config
+
+    def __iter__(self):
+        return iter(self._config_classes)
+
+    def __len__(self) -> int:
+        return len(self._config_classes)
+
+    def __contains__(self, network_name) -> bool:
+        return network_name in self._config_classes
+
+    def is_loaded(self, network_name: str) -> bool:
+        """Whether the config has been instantiated already"""
+        return network_name in self._configs
+
+
+# Network registry
+NETWORK_REGISTRY = LazyNetworkRegistry(NETWORK_CONFIG_CLASSES)
+
+
+def __getattr__(name: str):
+    """Lazy access to config classes (e.g., from network_configs import BigOAdsConfig)"""
+    for module_path, class_name, _ in NETWORK_CONFIG_CLASSES.values():
+        if class_name == name:
+            return getattr(importlib.import_module(module_path, __name__), class_name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
 def get_network_config(network_name: str) -> NetworkConfig:
     """Get network configuration by name"""
     return NETWORK_REGISTRY.get(network_name.lower())
@@ -34,5 +106,8 @@ def get_available_networks() -> list[str]:
 
 def get_network_display_names() -> dict[str, str]:
     """Get display names for all networks"""
-    return {key: config.display_name for key, config in NETWORK_REGISTRY.items()}
+    return {key: display_name for key, (_, _, display_name) in NETWORK_CONFIG_CLASSES.items()}
 
+def get_network_credential_keys(network_name: str) -> list[list[str]]:
+    """Get the alternative credential key sets for a network (empty if unknown)"""
+    return NETWORK_CREDENTIAL_KEYS.get(network_name.lower(), [])
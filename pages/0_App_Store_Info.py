@@ -4,11 +4,104 @@ App Store / Google Play Store 정보 조회 UI
 import streamlit as st
 from typing import Optional
 from dotenv import load_dotenv
-from utils.app_store_helper import get_ios_app_details, get_android_app_details
+from utils.app_store_helper import fetch_store_details_concurrently
 
 # .env 파일 로드
 load_dotenv()
 
+def render_android_result(result: dict, stored_url: Optional[str]):
+    """Android (Google Play Store) 조회 결과 표시"""
+    col_icon_header, col_title_header = st.columns([0.25, 0.75])
+    with col_icon_header:
+        st.markdown('<div style="padding-top: 0.3rem;">', unsafe_allow_html=True)
+        st.image("icons/google-play-4.svg", width=180)
+        st.markdown('</div>', unsafe_allow_html=True)
+    with col_title_header:
+        st.markdown("""
+        <div style="padding-top: 0.5rem;">
+            <h3 style="margin: 0; line-height: 1.2;">Android (Google Play Store)</h3>
+        </div>
+        """, unsafe_allow_html=True)
+    
+    # 아이콘과 제목
+    col_icon, col_title = st.columns([0.5, 2.5], gap="small")
+    with col_icon:
+        if result.get("icon_url"):
+            st.image(result.get("icon_url"), width=80)
+    with col_title:
+        developer_name = result.get('developer', '-')
+        app_name = result.get('name', '알 수 없음')
+        st.markdown(f"### {app_name} <span style='color: #666; font-size: 1rem; font-weight: normal;'>by {developer_name}</span>", unsafe_allow_html=True)
+        if stored_url:
+            st.caption(stored_url)
+    
+    st.markdown("---")
+    
+    # 정보 표시: name, package_name, icon_url, developer, category
+    col1, col2 = st.columns(2)
+    with col1:
+        st.markdown(f"**Package Name**")
+        st.text(result.get("package_name", "-"))
+    
+    with col2:
+        st.markdown(f"**카테고리**")
+        st.text(result.get("category", "-"))
+
+
+def render_ios_result(result: dict, stored_url: Optional[str]):
+    """iOS (App Store) 조회 결과 표시"""
+    col_icon_header, col_title_header = st.columns([0.25, 0.75])
+    with col_icon_header:
+        st.markdown('<div class="platform-header-icon">', unsafe_allow_html=True)
+        st.image("icons/available-on-the-app-store.svg", width=180)
+        st.markdown('</div>', unsafe_allow_html=True)
+    with col_title_header:
+        st.markdown('<div class="platform-header-title">', unsafe_allow_html=True)
+        st.markdown("### iOS (App Store)")
+        st.markdown('</div>', unsafe_allow_html=True)
+    
+    # 아이콘과 제목
+    col_icon, col_title = st.columns([0.5, 2.5], gap="small")
+    with col_icon:
+        if result.get("icon_url"):
+            st.image(result.get("icon_url"), width=80)
+    with col_title:
+        developer_name = result.get('developer', '-')
+        app_name = result.get('name', '알 수 없음')
+        st.markdown(f"### {app_name} <span style='color: #666; font-size: 1rem; font-weight: normal;'>by {developer_name}</span>", unsafe_allow_html=True)
+        if stored_url:
+            st.caption(stored_url)
+    
+    st.markdown("---")
+    
+    # 정보 표시: name, app_id, bundle_id, icon_url, developer, category
+    col1, col2 = st.columns(2)
+    with col1:
+        st.markdown(f"**Bundle ID**")
+        st.text(result.get("bundle_id", "-"))
+
+        st.markdown(f"**App ID**")
+        st.text(result.get("app_id", "-"))          
+
+    with col2:
+        st.markdown(f"**카테고리**")
+        st.text(result.get("category", "-"))
+
+
+def render_store_result(slot, platform: str, result: Optional[dict], stored_url: Optional[str]):
+    """플랫폼 결과를 placeholder에 표시 (결과가 없으면 비움)"""
+    if not result:
+        slot.empty()
+        return
+    with slot.container():
+        if platform == "android":
+            render_android_result(result, stored_url)
+        else:
+            if st.session_state.get("android_result"):
+                st.markdown("<br>", unsafe_allow_html=True)
+            render_ios_result(result, stored_url)
+
+
 def main():
     st.set_page_config(
         page_title="앱 스토어 정보 조회",
@@ -127,6 +220,11 @@ org.telegram.messenger
     # 2단 레이아웃 (왼쪽: 입력, 오른쪽: 결과)
     col_left, col_right = st.columns([1, 1.5], gap="large")
     
+    # 오른쪽: 플랫폼별 결과 placeholder - 조회 중에는 도착하는 순서대로 채움
+    with col_right:
+        android_slot = st.empty()
+        ios_slot = st.empty()
+    
     # 왼쪽: URL 입력 영역
     with col_left:
         st.subheader("🔗 URL 입력")
@@ -158,126 +256,42 @@ org.telegram.messenger
         
         # 조회 버튼 클릭 시 처리
         if fetch_button:
-            # Android 조회
+            # URL 검증 - 유효한 URL만 조회 대상으로
+            fetch_android_url = None
+            fetch_ios_url = None
             if android_url:
                 if "play.google.com" not in android_url:
                     st.error("⚠️ 올바른 Google Play Store URL을 입력해주세요.")
                 else:
-                    with st.spinner("Google Play Store 정보를 가져오는 중..."):
-                        try:
-                            android_result = get_android_app_details(android_url)
-                            st.session_state.android_result = android_result
-                            st.session_state.stored_android_url = android_url
-                        except Exception as e:
-                            st.error(str(e))
-                            st.session_state.android_result = None
-                            st.session_state.stored_android_url = None
+                    fetch_android_url = android_url
             else:
                 st.session_state.android_result = None
                 st.session_state.stored_android_url = None
             
-            # iOS 조회
             if ios_url:
                 if "apps.apple.com" not in ios_url and "itunes.apple.com" not in ios_url:
                     st.error("⚠️ 올바른 App Store URL을 입력해주세요.")
                 else:
-                    with st.spinner("App Store 정보를 가져오는 중..."):
-                        try:
-                            ios_result = get_ios_app_details(ios_url)
-                            st.session_state.ios_result = ios_result
-                            st.session_state.stored_ios_url = ios_url
-                        except Exception as e:
-                            st.error(str(e))
-                            st.session_state.ios_result = None
-                            st.session_state.stored_ios_url = None
+                    fetch_ios_url = ios_url
             else:
                 st.session_state.ios_result = None
                 st.session_state.stored_ios_url = None
-    
-    # 오른쪽: 결과 표시 영역
-    with col_right:
-        # 결과가 있을 때만 표시
-        if st.session_state.ios_result or st.session_state.android_result:
-            # Android 결과 표시 (먼저)
-            if st.session_state.android_result:
-                col_icon_header, col_title_header = st.columns([0.25, 0.75])
-                with col_icon_header:
-                    st.markdown('<div style="padding-top: 0.3rem;">', unsafe_allow_html=True)
-                    st.image("icons/google-play-4.svg", width=180)
-                    st.markdown('</div>', unsafe_allow_html=True)
-                with col_title_header:
-                    st.markdown("""
-                    <div style="padding-top: 0.5rem;">
-                        <h3 style="margin: 0; line-height: 1.2;">Android (Google Play Store)</h3>
-                    </div>
-                    """, unsafe_allow_html=True)
-                result = st.session_state.android_result
-                
-                # 아이콘과 제목
-                col_icon, col_title = st.columns([0.5, 2.5], gap="small")
-                with col_icon:
-                    if result.get("icon_url"):
-                        st.image(result.get("icon_url"), width=80)
-                with col_title:
-                    developer_name = result.get('developer', '-')
-                    app_name = result.get('name', '알 수 없음')
-                    st.markdown(f"### {app_name} <span style='color: #666; font-size: 1rem; font-weight: normal;'>by {developer_name}</span>", unsafe_allow_html=True)
-                    if st.session_state.stored_android_url:
-                        st.caption(st.session_state.stored_android_url)
-                
-                st.markdown("---")
-                
-                # 정보 표시: name, package_name, icon_url, developer, category
-                col1, col2 = st.columns(2)
-                with col1:
-                    st.markdown(f"**Package Name**")
-                    st.text(result.get("package_name", "-"))
-                
-                with col2:
-                    st.markdown(f"**카테고리**")
-                    st.text(result.get("category", "-"))
             
-            # iOS 결과 표시 (나중에)
-            if st.session_state.ios_result:
-                if st.session_state.android_result:
-                    st.markdown("<br>", unsafe_allow_html=True)
-                col_icon_header, col_title_header = st.columns([0.25, 0.75])
-                with col_icon_header:
-                    st.markdown('<div class="platform-header-icon">', unsafe_allow_html=True)
-                    st.image("icons/available-on-the-app-store.svg", width=180)
-                    st.markdown('</div>', unsafe_allow_html=True)
-                with col_title_header:
-                    st.markdown('<div class="platform-header-title">', unsafe_allow_html=True)
-                    st.markdown("### iOS (App Store)")
-                    st.markdown('</div>', unsafe_allow_html=True)
-                result = st.session_state.ios_result
-                
-                # 아이콘과 제목
-                col_icon, col_title = st.columns([0.5, 2.5], gap="small")
-                with col_icon:
-                    if result.get("icon_url"):
-                        st.image(result.get("icon_url"), width=80)
-                with col_title:
-                    developer_name = result.get('developer', '-')
-                    app_name = result.get('name', '알 수 없음')
-                    st.markdown(f"### {app_name} <span style='color: #666; font-size: 1rem; font-weight: normal;'>by {developer_name}</span>", unsafe_allow_html=True)
-                    if st.session_state.stored_ios_url:
-                        st.caption(st.session_state.stored_ios_url)
-                
-                st.markdown("---")
-                
-                # 정보 표시: name, app_id, bundle_id, icon_url, developer, category
-                col1, col2 = st.columns(2)
-                with col1:
-                    st.markdown(f"**Bundle ID**")
-                    st.text(result.get("bundle_id", "-"))
-
-                    st.markdown(f"**App ID**")
-                    st.text(result.get("app_id", "-"))          
-
-                with col2:
-                    st.markdown(f"**카테고리**")
-                    st.text(result.get("category", "-"))
+            # Android / iOS 동시 조회 (공유 timeout budget)
+            if fetch_android_url or fetch_ios_url:
+                with st.spinner("스토어 정보를 가져오는 중..."):
+                    for platform, result, error in fetch_store_details_concurrently(fetch_ios_url, fetch_android_url):
+                        if error:
+                            st.error(error)
+                        stored_url = (fetch_android_url if platform == "android" else fetch_ios_url) if result else None
+                        st.session_state[f"{platform}_result"] = result
+                        st.session_state[f"stored_{platform}_url"] = stored_url
+                        slot = android_slot if platform == "android" else ios_slot
+                        render_store_result(slot, platform, result, stored_url)
+    
+    # 오른쪽: 결과 표시 영역 - 조회 전/후 모두 세션에 저장된 결과로 채움 (Android 먼저, iOS 나중에)
+    render_store_result(android_slot, "android", st.session_state.android_result, st.session_state.stored_android_url)
+    render_store_result(ios_slot, "ios", st.session_state.ios_result, st.session_state.stored_ios_url)
 
 if __name__ == "__main__":
     main()
\ No newline at end of file
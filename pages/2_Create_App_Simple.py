@@ -3,6 +3,7 @@ import streamlit as st
 import logging
 from utils.session_manager import SessionManager
 from components.create_app_new_ui import render_new_create_app_ui
+from components.bulk_create_app import render_bulk_create_app_ui
 
 logger = logging.getLogger(__name__)
 
@@ -21,8 +22,19 @@ st.markdown("**Store URL만 입력하면 여러 네트워크에 자동으로 앱
 
 st.markdown("---")
 
-# Render the new simplified UI
-render_new_create_app_ui()
+mode = st.radio(
+    "모드",
+    options=["single", "bulk"],
+    format_func=lambda m: "단일 앱" if m == "single" else "Bulk (CSV)",
+    horizontal=True,
+    key="create_app_simple_mode"
+)
+
+if mode == "bulk":
+    render_bulk_create_app_ui()
+else:
+    # Render the new simplified UI
+    render_new_create_app_ui()
 
 # Help section
 with st.expander("ℹ️ 사용 방법"):
@@ -45,6 +57,11 @@ with st.expander("ℹ️ 사용 방법"):
        - "🚀 선택한 네트워크에 앱 생성" 버튼을 클릭하면
        - 선택한 모든 네트워크에 순차적으로 앱이 생성됩니다
     
+    ### Bulk (CSV) 모드
+    
+    - 한 줄에 한 타이틀씩 iOS / Android Store URL이 들어간 CSV를 업로드합니다
+    - 스토어 조회 → 카테고리 매칭 → Payload 생성 → 앱 생성 → 기본 Ad Unit 생성이 타이틀별로 병렬 진행됩니다
+    
     ### 특징
     
     - ✅ **자동 파라미터 매핑**: App Store 정보를 자동으로 네트워크별 파라미터로 변환
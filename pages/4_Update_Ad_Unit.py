@@ -1532,9 +1532,34 @@ from utils.ad_network_query import (
     extract_app_identifiers,
     get_mintegral_units_by_placement,
     find_app_by_package_name,
-    find_app_by_name
+    find_app_by_name,
+    prefetch_ironsource_instances,
+    prefetch_pangle_units,
+    clear_unit_caches
 )
 from network_configs import get_network_display_names
+from utils.session_manager import SessionManager
+from utils.request_scheduler import BULK, request_priority, with_current_priority
+from utils.grid_view import (
+    SELECTION_PAGE_SIZES,
+    GRID_PAGE_SIZES,
+    GRID_FULL_EDITOR_MAX_ROWS,
+    build_ad_unit_index,
+    page_bounds,
+    page_count,
+    merge_editor_diff,
+    apply_grid_edits
+)
+from utils.grid_io import (
+    ARROW_AVAILABLE,
+    FILE_TYPES,
+    optimize_grid_dtypes,
+    export_grid,
+    import_grid,
+    save_grid_run,
+    list_grid_runs,
+    load_grid_run
+)
 
 logger = logging.getLogger(__name__)
 
@@ -1643,10 +1668,11 @@ with st.expander("📡 AppLovin Ad Units 조회 및 검색", expanded=False):
         st.write("")  # Spacing
         st.write("")  # Spacing
         if st.button("📡 조회", type="primary", width='stretch'):
-            st.session_state.applovin_ad_units_raw = None
+            SessionManager.clear_payload("applovin_ad_units_raw")
+            SessionManager.clear_payload("applovin_ad_unit_index")
     
     # Load ad units data
-    if "applovin_ad_units_raw" not in st.session_state or st.session_state.applovin_ad_units_raw is None:
+    if SessionManager.get_payload("applovin_ad_units_raw") is None:
         if st.button("📡 Get Ad Units", type="secondary", width='stretch'):
             # Show prominent loading message
             loading_placeholder = st.empty()
@@ -1678,7 +1704,9 @@ with st.expander("📡 AppLovin Ad Units 조회 및 검색", expanded=False):
                     status_text.text("✅ 완료!")
                     
                     if ad_units_list:
-                        st.session_state.applovin_ad_units_raw = ad_units_list
+                        SessionManager.stash_payload("applovin_ad_units_raw", ad_units_list)
+                        # Search keys, token index, display order and facet counts are built once here
+                        SessionManager.stash_payload("applovin_ad_unit_index", build_ad_unit_index(ad_units_list))
                         progress_bar.progress(100)
                         loading_placeholder.empty()
                         st.success(f"✅ {len(ad_units_list)}개의 Ad Unit이 조회되었습니다!")
@@ -1686,7 +1714,7 @@ with st.expander("📡 AppLovin Ad Units 조회 및 검색", expanded=False):
                         progress_bar.progress(100)
                         loading_placeholder.empty()
                         st.json(data)
-                        st.session_state.applovin_ad_units_raw = []
+                        SessionManager.stash_payload("applovin_ad_units_raw", [])
                 else:
                     progress_bar.progress(100)
                     loading_placeholder.empty()
@@ -1695,68 +1723,61 @@ with st.expander("📡 AppLovin Ad Units 조회 및 검색", expanded=False):
                     st.json(error_info)
                     if "status_code" in result:
                         st.error(f"Status Code: {result['status_code']}")
-                    st.session_state.applovin_ad_units_raw = []
+                    SessionManager.stash_payload("applovin_ad_units_raw", [])
             except Exception as e:
                 progress_bar.progress(100)
                 loading_placeholder.empty()
                 st.error(f"❌ 오류 발생: {str(e)}")
-                st.session_state.applovin_ad_units_raw = []
+                SessionManager.stash_payload("applovin_ad_units_raw", [])
     
     # Display filtered and selectable ad units
-    if st.session_state.get("applovin_ad_units_raw"):
-        ad_units_list = st.session_state.applovin_ad_units_raw
+    ad_units_list = SessionManager.get_payload("applovin_ad_units_raw")
+    if ad_units_list:
         
-        # Apply search filter
-        filtered_units = ad_units_list
-        if search_query:
-            search_lower = search_query.lower()
-            filtered_units = [
-                unit for unit in ad_units_list
-                if search_lower in unit.get("name", "").lower() or search_lower in unit.get("package_name", "").lower()
-            ]
+        # Index built when the list was fetched (rebuilt only if its payload was evicted)
+        unit_index = SessionManager.get_payload("applovin_ad_unit_index")
+        if unit_index is None:
+            unit_index = build_ad_unit_index(ad_units_list)
+            SessionManager.stash_payload("applovin_ad_unit_index", unit_index)
         
-        if filtered_units:
-            st.info(f"📊 검색 결과: {len(filtered_units)}개 (전체: {len(ad_units_list)}개)")
-            
-            # Sort by platform ASC, ad_format DESC (alphabetical order: REWARD > INTER > BANNER)
-            def sort_key(unit):
-                platform = unit.get("platform", "").lower()
-                ad_format = unit.get("ad_format", "")
-                # For platform: android < ios (ASC)
-                # For ad_format: alphabetical order DESC (REWARD > INTER > BANNER)
-                # Use tuple with negative for DESC: (platform ASC, -ad_format for DESC)
-                # But since we can't negate strings, we'll use a two-step sort
-                return (platform, ad_format)
+        # Facet filters with counts for the current search
+        facet_counts = unit_index.facet_counts(search_query)
+        facet_cols = st.columns([1, 1, 1])
+        with facet_cols[0]:
+            platform_filter = st.multiselect(
+                "Platform",
+                sorted(unit_index.facets["platform"]),
+                format_func=lambda value: f"{value or '(empty)'} ({facet_counts['platform'].get(value, 0)})",
+                key="ad_units_platform_filter"
+            )
+        with facet_cols[1]:
+            format_filter = st.multiselect(
+                "Ad Format",
+                sorted(unit_index.facets["ad_format"], reverse=True),
+                format_func=lambda value: f"{value or '(empty)'} ({facet_counts['ad_format'].get(value, 0)})",
+                key="ad_units_format_filter"
+            )
+        with facet_cols[2]:
+            st.write("")
+            st.caption(
+                f"📦 패키지 {len(facet_counts['package_name'])}개 · "
+                + ", ".join(f"{package or '(empty)'} ({count})" for package, count in facet_counts["package_name"].most_common(3))
+            )
+        
+        filtered_positions = unit_index.search(search_query, set(platform_filter), set(format_filter))
+        
+        if filtered_positions:
+            st.info(f"📊 검색 결과: {len(filtered_positions)}개 (전체: {len(ad_units_list)}개)")
             
-            # First sort by platform ASC, then by ad_format DESC
-            # Sort by platform first
-            filtered_units_sorted = sorted(filtered_units, key=lambda x: x.get("platform", "").lower())
-            # Then sort by ad_format DESC within each platform group
-            from itertools import groupby
-            result = []
-            for platform_key, group in groupby(filtered_units_sorted, key=lambda x: x.get("platform", "").lower()):
-                group_list = list(group)
-                # Sort group by ad_format DESC (reverse alphabetical: REWARD > INTER > BANNER)
-                group_list_sorted = sorted(group_list, key=lambda x: x.get("ad_format", ""), reverse=True)
-                result.extend(group_list_sorted)
-            filtered_units_sorted = result
+            # Sorted by platform ASC, ad_format DESC (REWARD > INTER > BANNER)
+            filtered_units_sorted = [unit_index.units[position] for position in filtered_positions]
             
-            # 선택 상태를 저장할 session state 초기화
-            if "ad_unit_selections" not in st.session_state:
-                st.session_state.ad_unit_selections = {}
+            # 선택 상태: 필터된 unit은 기본적으로 선택, 해제한 unit ID만 set으로 저장
+            if "ad_unit_deselected" not in st.session_state:
+                st.session_state.ad_unit_deselected = set()
+            deselected = st.session_state.ad_unit_deselected
             
-            # 자동 선택: 필터된 모든 unit을 기본적으로 선택 (처음 로드되거나 필터가 변경될 때)
             if filtered_units_sorted:
-                # 필터된 unit들의 ID 목록
-                filtered_unit_ids = {unit.get("id", "") for unit in filtered_units_sorted}
-                
-                # 필터된 unit 중 선택되지 않은 것이 있으면 자동으로 선택
-                for unit in filtered_units_sorted:
-                    unit_id = unit.get("id", "")
-                    if unit_id not in st.session_state.ad_unit_selections:
-                        # 새로 필터된 unit은 자동으로 선택
-                        st.session_state.ad_unit_selections[unit_id] = True
-                    # 이미 선택 상태가 있으면 그대로 유지
                 # Add custom CSS for better table styling with reduced spacing and dark mode support
                 st.markdown("""
                 <style>
@@ -1828,6 +1849,44 @@ with st.expander("📡 AppLovin Ad Units 조회 및 검색", expanded=False):
                 </style>
                 """, unsafe_allow_html=True)
                 
+                # Pagination: only the visible window of rows is rendered
+                page_cols = st.columns([1, 1, 1, 1, 2])
+                with page_cols[0]:
+                    page_size = st.selectbox("Rows per page", SELECTION_PAGE_SIZES, key="ad_unit_page_size")
+                total_pages = page_count(len(filtered_units_sorted), page_size)
+                if st.session_state.get("ad_unit_page", 1) > total_pages:
+                    st.session_state["ad_unit_page"] = total_pages
+                with page_cols[1]:
+                    page = st.number_input("Page", min_value=1, max_value=total_pages, value=1, step=1, key="ad_unit_page")
+                page, start, end = page_bounds(len(filtered_units_sorted), int(page), page_size)
+                visible_units = filtered_units_sorted[start:end]
+                
+                def _set_filtered_selection(selected: bool):
+                    filtered_ids = [unit_index.ids[position] for position in filtered_positions]
+                    if selected:
+                        deselected.difference_update(filtered_ids)
+                    else:
+                        deselected.update(filtered_ids)
+                    # Drop checkbox widget state of the visible rows so they re-render from the set
+                    for unit in visible_units:
+                        st.session_state.pop(f"ad_unit_checkbox_{unit.get('id', '')}", None)
+                
+                with page_cols[2]:
+                    st.write("")
+                    st.button("✅ 전체 선택", key="ad_unit_select_all", on_click=_set_filtered_selection, args=(True,), width='stretch')
+                with page_cols[3]:
+                    st.write("")
+                    st.button("⬜ 전체 해제", key="ad_unit_deselect_all", on_click=_set_filtered_selection, args=(False,), width='stretch')
+                with page_cols[4]:
+                    st.write("")
+                    st.caption(f"{start + 1}-{end} / {len(filtered_units_sorted)} (page {page}/{total_pages})")
+                
+                def _toggle_unit_selection(unit_id: str):
+                    if st.session_state.get(f"ad_unit_checkbox_{unit_id}", True):
+                        deselected.discard(unit_id)
+                    else:
+                        deselected.add(unit_id)
+                
                 # Create table with individual checkboxes (more reliable than data_editor)
                 # Header with better styling
                 header_cols = st.columns([0.4, 1.5, 1.5, 0.8, 0.9, 2.2])
@@ -1844,36 +1903,27 @@ with st.expander("📡 AppLovin Ad Units 조회 및 검색", expanded=False):
                 with header_cols[5]:
                     st.markdown('<div class="ad-unit-table-header">Package Name</div>', unsafe_allow_html=True)
                 
-                # Display each row with checkbox
-                selected_unit_ids = []
-                for idx, unit in enumerate(filtered_units_sorted):
+                # Display each visible row with checkbox
+                for unit in visible_units:
                     unit_id = unit.get("id", "")
                     unit_name = unit.get("name", "")
                     platform = unit.get("platform", "")
                     ad_format = unit.get("ad_format", "")
                     package_name = unit.get("package_name", "")
                     
-                    # Get current selection state from session_state (always use latest value)
-                    is_selected = st.session_state.ad_unit_selections.get(unit_id, False)
-                    
                     # Create row with columns - better proportions
                     row_cols = st.columns([0.4, 1.5, 1.5, 0.8, 0.9, 2.2])
                     
-                    # Alternate row background for better readability (with dark mode support)
-                    # Use CSS variables or minimal styling that works in both modes
-                    # In dark mode, Streamlit handles background, so we use minimal styling
-                    row_style = ""
-                    
                     with row_cols[0]:
-                        # Checkbox with unique key - centered
-                        checkbox_key = f"ad_unit_checkbox_{unit_id}"
-                        # Always read latest value from session_state to reflect button clicks
-                        current_value = st.session_state.ad_unit_selections.get(unit_id, False)
-                        new_selection = st.checkbox("Select ad unit", value=current_value, key=checkbox_key, label_visibility="collapsed")
-                        
-                        # Always update session state to keep it in sync
-                        # This ensures button clicks are reflected in checkboxes
-                        st.session_state.ad_unit_selections[unit_id] = new_selection
+                        # Checkbox with unique key; changes update the deselected set via callback
+                        st.checkbox(
+                            "Select ad unit",
+                            value=unit_id not in deselected,
+                            key=f"ad_unit_checkbox_{unit_id}",
+                            on_change=_toggle_unit_selection,
+                            args=(unit_id,),
+                            label_visibility="collapsed"
+                        )
                     
                     with row_cols[1]:
                         st.markdown(f'<div class="ad-unit-table-cell" style="color: #ffffff !important;"><code class="ad-unit-code" style="color: #ffffff !important;">{unit_id}</code></div>', unsafe_allow_html=True)
@@ -1900,26 +1950,22 @@ with st.expander("📡 AppLovin Ad Units 조회 및 검색", expanded=False):
                     with row_cols[5]:
                         display_pkg = package_name[:35] + "..." if len(package_name) > 35 else package_name if package_name else ""
                         st.markdown(f'<div class="ad-unit-table-cell" style="color: #ffffff !important;"><code class="ad-unit-code" style="color: #ffffff !important;">{display_pkg}</code></div>', unsafe_allow_html=True)
-                    
-                    # Track selected units
-                    if st.session_state.ad_unit_selections.get(unit_id, False):
-                        selected_unit_ids.append(unit_id)
                 
-                # Get selected rows for compatibility (convert to dict format)
-                selected_rows_dict = []
-                for unit in filtered_units_sorted:
-                    unit_id = unit.get("id", "")
-                    if unit_id in selected_unit_ids:
-                        selected_rows_dict.append({
-                            "id": unit_id,
-                            "name": unit.get("name", ""),
-                            "platform": unit.get("platform", ""),
-                            "ad_format": unit.get("ad_format", ""),
-                            "package_name": unit.get("package_name", "")
-                        })
+                # Selected rows across all pages: filtered units minus the deselected set
+                selected_rows_dict = [
+                    {
+                        "id": unit.get("id", ""),
+                        "name": unit.get("name", ""),
+                        "platform": unit.get("platform", ""),
+                        "ad_format": unit.get("ad_format", ""),
+                        "package_name": unit.get("package_name", "")
+                    }
+                    for unit in filtered_units_sorted
+                    if unit.get("id", "") not in deselected
+                ]
                 
                 # selected_ad_unit_ids는 하위 호환성을 위해 유지
-                st.session_state.selected_ad_unit_ids = selected_unit_ids
+                st.session_state.selected_ad_unit_ids = [row["id"] for row in selected_rows_dict]
                 
                 if len(selected_rows_dict) > 0:
                     st.markdown(f"**선택된 Ad Units: {len(selected_rows_dict)}개**")
@@ -2283,13 +2329,10 @@ with st.expander("📡 AppLovin Ad Units 조회 및 검색", expanded=False):
                                         project_id = app_ids.get("projectId") or app_id
                                         app_key = project_id  # Use projectId for Unity unit lookup
                                     
-                                    # For Pangle, query all ad units (no app_id filter in API call)
-                                    # Filter by app_id on client side for better performance
+                                    # For Pangle, app_id is sent as a server-side filter (cached per app)
                                     if actual_network == "pangle":
-                                        # Pangle: Query all ad units, filter by app_id on client side
-                                        # app_id will be passed to get_pangle_units for client-side filtering
                                         if app_id:
-                                            logger.debug(f"[Pangle] Will query all ad units and filter by app_id: {app_id} on client side")
+                                            logger.debug(f"[Pangle] Will query ad units filtered by app_id: {app_id}")
                                         else:
                                             logger.warning(f"[Pangle] ⚠️ app_id not available, will query all ad units")
                                     
@@ -2299,12 +2342,10 @@ with st.expander("📡 AppLovin Ad Units 조회 및 검색", expanded=False):
                                         logger.debug(f"[BigOAds] Extracted app_code: {app_ids.get('app_code')}, app_key: {app_key}, app_id: {app_id}")
                                     
                                     # Get units for this app (sequential: app -> units)
-                                    # For Pangle, query all ad units and filter by app_id on client side
-                                    # For other networks, use app_key or app_id
+                                    # For Pangle, use app_id; for other networks, use app_key or app_id
                                     if actual_network == "pangle":
-                                        # Pangle: Pass app_id for client-side filtering (API will query all ad units)
                                         unit_lookup_id = app_id or ""
-                                        logger.info(f"[Pangle] Before get_network_units: app_id={app_id} (will filter on client side)")
+                                        logger.info(f"[Pangle] Before get_network_units: app_id={app_id}")
                                     else:
                                         unit_lookup_id = app_key or app_id or ""
                                     
@@ -2861,11 +2902,37 @@ with st.expander("📡 AppLovin Ad Units 조회 및 검색", expanded=False):
                                 status_text.text(f"🔄 {len(tasks)}개 작업 처리 중... (병렬 처리)")
                                 progress_bar.progress(20)
                                 
+                                # Fresh unit lists for this run; rows of the same app then share one fetch
+                                clear_unit_caches()
+                                prefetch_units = [
+                                    {"name": row["name"], "platform": row["platform"], "package_name": row["package_name"]}
+                                    for row in selected_rows_dict
+                                ]
+                                
+                                # IronSource: load instances for all matched apps at once (rows then read the index)
+                                if "ironsource" in network_mapping.values():
+                                    status_text.text("🔄 IronSource Instance 일괄 조회 중...")
+                                    try:
+                                        prefetch_ironsource_instances(prefetch_units)
+                                    except Exception as e:
+                                        logger.warning(f"[IronSource] Instance prefetch failed, falling back to per-app fetch: {str(e)}")
+                                
+                                # Pangle: one app_id-filtered request per batch of matched apps
+                                if "pangle" in network_mapping.values():
+                                    status_text.text("🔄 Pangle Ad Units 일괄 조회 중...")
+                                    try:
+                                        prefetch_pangle_units(prefetch_units)
+                                    except Exception as e:
+                                        logger.warning(f"[Pangle] Unit prefetch failed, falling back to per-app fetch: {str(e)}")
+                                
                                 completed_tasks = 0
+                                # Bulk lookups yield to interactive requests in the request scheduler
+                                with request_priority(BULK):
+                                    bulk_process_network_unit = with_current_priority(process_network_unit)
                                 with ThreadPoolExecutor(max_workers=min(len(st.session_state.selected_ad_networks), 5)) as executor:
                                     future_to_task = {
                                         executor.submit(
-                                            process_network_unit,
+                                            bulk_process_network_unit,
                                             {"applovin_unit": task["applovin_unit"]},
                                             task["selected_network"]
                                         ): task
@@ -2917,7 +2984,12 @@ with st.expander("📡 AppLovin Ad Units 조회 및 검색", expanded=False):
                                     # Reset the prepared flag so data will be sorted and reordered
                                     if st.session_state.get("_applovin_data_prepared", False):
                                         st.session_state["_applovin_data_prepared"] = False
-                                    st.session_state.applovin_data = pd.concat([st.session_state.applovin_data, new_df], ignore_index=True)
+                                    # Paged editor edits are keyed by row label; fold them in before the index changes
+                                    base_df = apply_grid_edits(st.session_state.applovin_data, st.session_state.pop("applovin_data_edits", None))
+                                    st.session_state.pop("_applovin_grid_window", None)
+                                    st.session_state.applovin_data = optimize_grid_dtypes(
+                                        pd.concat([base_df.astype("object"), new_df], ignore_index=True)
+                                    )
                                     
                                     progress_bar.progress(100)
                                     status_text.text("✅ 완료!")
@@ -2964,8 +3036,8 @@ st.divider()
 
 # Initialize session state
 if "applovin_data" not in st.session_state:
-    # Start with empty DataFrame
-    st.session_state.applovin_data = pd.DataFrame({
+    # Start with empty DataFrame (low-cardinality columns become categoricals)
+    st.session_state.applovin_data = optimize_grid_dtypes(pd.DataFrame({
         "id": pd.Series(dtype="string"),
         "name": pd.Series(dtype="string"),
         "platform": pd.Series(dtype="string"),
@@ -2981,7 +3053,7 @@ if "applovin_data" not in st.session_state:
         "segment_name": pd.Series(dtype="string"),
         "segment_id": pd.Series(dtype="string"),
         "disabled": pd.Series(dtype="string")
-    })
+    }))
     # Mark that sorting is needed when data is first initialized
     st.session_state["_applovin_data_sort_needed"] = True
 
@@ -3011,6 +3083,13 @@ if len(st.session_state.applovin_data) > 0:
     
     # Only sort and reorder on first time (when data is first added)
     if not st.session_state.get(data_prepared_key, False):
+        # Fold pending paged editor edits in before sorting resets the row labels
+        if st.session_state.get("applovin_data_edits"):
+            st.session_state.applovin_data = apply_grid_edits(
+                st.session_state.applovin_data, st.session_state.pop("applovin_data_edits")
+            )
+        st.session_state.pop("_applovin_grid_window", None)
+        
         # Reorder columns if needed
         col_order_key = "_applovin_data_column_order"
         current_cols = list(st.session_state.applovin_data.columns)
@@ -3032,8 +3111,9 @@ if len(st.session_state.applovin_data) > 0:
             
             # Create temporary columns for sorting
             temp_df = st.session_state.applovin_data.copy()
-            temp_df["_sort_ad_format"] = temp_df["ad_format"].map(ad_format_order).fillna(99)
-            temp_df["_sort_platform"] = temp_df["platform"].map(platform_order).fillna(99)
+            # (map on object values: categorical columns would map to a categorical that cannot take 99)
+            temp_df["_sort_ad_format"] = temp_df["ad_format"].astype("object").map(ad_format_order).fillna(99)
+            temp_df["_sort_platform"] = temp_df["platform"].astype("object").map(platform_order).fillna(99)
             
             # Sort
             temp_df = temp_df.sort_values(
@@ -3053,112 +3133,223 @@ if len(st.session_state.applovin_data) > 0:
         # Mark as prepared (sorted and reordered) - never sort again
         st.session_state[data_prepared_key] = True
 
-# Data editor with fixed key to prevent focus loss
-# Note: st.data_editor automatically triggers reruns on edit
-# We minimize DataFrame changes to reduce focus loss
-data_editor_key = "applovin_data_editor"
-edited_df = st.data_editor(
-    st.session_state.applovin_data,
-    num_rows="dynamic",
-    width='stretch',
-    key=data_editor_key,
-    column_config={
-        "id": st.column_config.TextColumn(
-            "id",
-            help="AppLovin Ad Unit ID",
-            required=True
-        ),
-        "name": st.column_config.TextColumn(
-            "name",
-            help="Ad Unit 이름 (선택사항)"
-        ),
-        "platform": st.column_config.SelectboxColumn(
-            "platform",
-            options=["android", "ios"],
-            required=True
-        ),
-        "ad_format": st.column_config.SelectboxColumn(
-            "ad_format",
-            options=["BANNER", "INTER", "REWARD"],
-            required=True
-        ),
-        "package_name": st.column_config.TextColumn(
-            "package_name",
-            help="앱 패키지명 (선택사항)"
-        ),
-        "ad_network": st.column_config.TextColumn(
-            "ad_network",
-            help="네트워크 이름 (읽기 전용 - 상단에서 선택)",
-            required=True,
-            disabled=True
-        ),
-        "ad_network_app_id": st.column_config.TextColumn(
-            "ad_network_app_id",
-            help="Ad Network App ID (선택사항)"
-        ),
-        "ad_network_app_key": st.column_config.TextColumn(
-            "ad_network_app_key",
-            help="Ad Network App Key (선택사항)"
-        ),
-        "ad_unit_id": st.column_config.TextColumn(
-            "ad_unit_id",
-            help="Ad Network의 Ad Unit ID",
-            required=True
-        ),
-        "countries_type": st.column_config.SelectboxColumn(
-            "countries_type",
-            options=["", "INCLUDE", "EXCLUDE"],
-            help="INCLUDE 또는 EXCLUDE (공란 가능)"
-        ),
-        "countries": st.column_config.TextColumn(
-            "countries",
-            help="국가 코드 (쉼표로 구분, 예: us,kr, 공란 가능)"
-        ),
-        "cpm": st.column_config.NumberColumn(
-            "cpm",
-            help="CPM 값 (기본값: 0)",
-            min_value=0.0,
-            step=0.01,
-            format="%.2f",
-            required=True,
-            default=0.0
-        ),
-        "segment_name": st.column_config.TextColumn(
-            "segment_name",
-            help="Segment Name (공란 가능)"
-        ),
-        "segment_id": st.column_config.TextColumn(
-            "segment_id",
-            help="Segment ID (비워두면 'None', 공란 가능)"
-        ),
-        "disabled": st.column_config.SelectboxColumn(
-            "disabled",
-            options=["FALSE", "TRUE"],
-            help="비활성화 여부 (기본값: FALSE)",
-            default="FALSE"
+# Import (CSV/Parquet/Arrow) and saved runs
+with st.expander("📁 Import / Saved Runs", expanded=False):
+    if not ARROW_AVAILABLE:
+        st.caption("ℹ️ pyarrow가 설치되어 있지 않아 CSV만 지원합니다.")
+    uploaded_grid = st.file_uploader("Grid 파일", type=FILE_TYPES, key="applovin_grid_upload")
+    if uploaded_grid is not None and st.button("📥 Import (replace table)", key="applovin_grid_import"):
+        try:
+            st.session_state.applovin_data = import_grid(uploaded_grid.getvalue(), uploaded_grid.name)
+            st.session_state["_applovin_data_prepared"] = False
+            st.session_state.pop("applovin_data_editor", None)
+            st.session_state.pop("applovin_data_edits", None)
+            st.success(f"✅ {len(st.session_state.applovin_data)}개 행을 불러왔습니다.")
+            st.rerun()
+        except Exception as e:
+            st.error(f"❌ 파일을 읽을 수 없습니다: {str(e)}")
+    
+    saved_runs = list_grid_runs() if ARROW_AVAILABLE else []
+    if saved_runs:
+        run_labels = {
+            f"{run['name']} ({run['size'] / 1024:.0f} KB, {run['modified'].strftime('%Y-%m-%d %H:%M')})": run["path"]
+            for run in saved_runs
+        }
+        selected_run = st.selectbox("Saved runs", list(run_labels.keys()), key="applovin_grid_saved_run")
+        if st.button("📂 Load run (replace table)", key="applovin_grid_load_run"):
+            try:
+                st.session_state.applovin_data = load_grid_run(run_labels[selected_run])
+                st.session_state["_applovin_data_prepared"] = False
+                st.session_state.pop("applovin_data_editor", None)
+                st.session_state.pop("applovin_data_edits", None)
+                st.rerun()
+            except Exception as e:
+                st.error(f"❌ 저장된 run을 불러올 수 없습니다: {str(e)}")
+
+grid_column_config = {
+    "id": st.column_config.TextColumn(
+        "id",
+        help="AppLovin Ad Unit ID",
+        required=True
+    ),
+    "name": st.column_config.TextColumn(
+        "name",
+        help="Ad Unit 이름 (선택사항)"
+    ),
+    "platform": st.column_config.SelectboxColumn(
+        "platform",
+        options=["android", "ios"],
+        required=True
+    ),
+    "ad_format": st.column_config.SelectboxColumn(
+        "ad_format",
+        options=["BANNER", "INTER", "REWARD"],
+        required=True
+    ),
+    "package_name": st.column_config.TextColumn(
+        "package_name",
+        help="앱 패키지명 (선택사항)"
+    ),
+    "ad_network": st.column_config.TextColumn(
+        "ad_network",
+        help="네트워크 이름 (읽기 전용 - 상단에서 선택)",
+        required=True,
+        disabled=True
+    ),
+    "ad_network_app_id": st.column_config.TextColumn(
+        "ad_network_app_id",
+        help="Ad Network App ID (선택사항)"
+    ),
+    "ad_network_app_key": st.column_config.TextColumn(
+        "ad_network_app_key",
+        help="Ad Network App Key (선택사항)"
+    ),
+    "ad_unit_id": st.column_config.TextColumn(
+        "ad_unit_id",
+        help="Ad Network의 Ad Unit ID",
+        required=True
+    ),
+    "countries_type": st.column_config.SelectboxColumn(
+        "countries_type",
+        options=["", "INCLUDE", "EXCLUDE"],
+        help="INCLUDE 또는 EXCLUDE (공란 가능)"
+    ),
+    "countries": st.column_config.TextColumn(
+        "countries",
+        help="국가 코드 (쉼표로 구분, 예: us,kr, 공란 가능)"
+    ),
+    "cpm": st.column_config.NumberColumn(
+        "cpm",
+        help="CPM 값 (기본값: 0)",
+        min_value=0.0,
+        step=0.01,
+        format="%.2f",
+        required=True,
+        default=0.0
+    ),
+    "segment_name": st.column_config.TextColumn(
+        "segment_name",
+        help="Segment Name (공란 가능)"
+    ),
+    "segment_id": st.column_config.TextColumn(
+        "segment_id",
+        help="Segment ID (비워두면 'None', 공란 가능)"
+    ),
+    "disabled": st.column_config.SelectboxColumn(
+        "disabled",
+        options=["FALSE", "TRUE"],
+        help="비활성화 여부 (기본값: FALSE)",
+        default="FALSE"
+    )
+}
+
+grid_rows = len(st.session_state.applovin_data)
+if grid_rows <= GRID_FULL_EDITOR_MAX_ROWS:
+    # Data editor with fixed key to prevent focus loss
+    # Note: st.data_editor automatically triggers reruns on edit
+    # We minimize DataFrame changes to reduce focus loss
+    data_editor_key = "applovin_data_editor"
+    edited_df = st.data_editor(
+        st.session_state.applovin_data,
+        num_rows="dynamic",
+        width='stretch',
+        key=data_editor_key,
+        column_config=grid_column_config,
+        hide_index=True
+    )
+    
+    def current_grid():
+        return edited_df
+else:
+    # Large grids: edit one page at a time; edits are kept as {row label: {column: value}}
+    if "applovin_data_edits" not in st.session_state:
+        st.session_state.applovin_data_edits = {}
+    grid_page_cols = st.columns([1, 1, 3])
+    with grid_page_cols[0]:
+        grid_page_size = st.selectbox("Rows per page", GRID_PAGE_SIZES, key="applovin_grid_page_size")
+    grid_total_pages = page_count(grid_rows, grid_page_size)
+    if st.session_state.get("applovin_grid_page", 1) > grid_total_pages:
+        st.session_state["applovin_grid_page"] = grid_total_pages
+    with grid_page_cols[1]:
+        grid_page = st.number_input("Page", min_value=1, max_value=grid_total_pages, value=1, step=1, key="applovin_grid_page")
+    grid_page, grid_start, grid_end = page_bounds(grid_rows, int(grid_page), grid_page_size)
+    with grid_page_cols[2]:
+        st.write("")
+        st.caption(
+            f"{grid_start + 1}-{grid_end} / {grid_rows} rows (page {grid_page}/{grid_total_pages}), "
+            f"{len(st.session_state.applovin_data_edits)} edited · 행 추가/삭제는 {GRID_FULL_EDITOR_MAX_ROWS}행 이하에서 가능"
         )
-    },
-    hide_index=True
-)
+    
+    # The window passed to the editor stays the same object while the page is shown (keeps editor state and focus)
+    window_key = (grid_page, grid_page_size, grid_rows)
+    cached_window = st.session_state.get("_applovin_grid_window")
+    if cached_window is None or cached_window[0] != window_key:
+        grid_window = apply_grid_edits(
+            st.session_state.applovin_data.iloc[grid_start:grid_end], st.session_state.applovin_data_edits
+        )
+        st.session_state["_applovin_grid_window"] = (window_key, grid_window)
+    else:
+        grid_window = cached_window[1]
+    
+    data_editor_key = f"applovin_data_editor_p{grid_page}_{grid_page_size}"
+    st.data_editor(
+        grid_window,
+        num_rows="fixed",
+        width='stretch',
+        key=data_editor_key,
+        column_config=grid_column_config,
+        hide_index=True
+    )
+    merge_editor_diff(st.session_state.applovin_data_edits, list(grid_window.index), st.session_state.get(data_editor_key))
+    
+    def current_grid():
+        return apply_grid_edits(st.session_state.applovin_data, st.session_state.applovin_data_edits)
 
 # DO NOT update session_state here to prevent focus loss
 # We will update session_state only when "Update All Ad Units" button is clicked
 # This prevents reruns during editing and maintains focus
 
+# Export (current editor contents; serialized only on demand)
+if grid_rows > 0:
+    export_cols = st.columns([1, 1, 1])
+    with export_cols[0]:
+        export_type = st.selectbox("Export format", FILE_TYPES, key="applovin_grid_export_type", label_visibility="collapsed")
+    with export_cols[1]:
+        if st.button("📦 Export", key="applovin_grid_export_prepare", width='stretch'):
+            timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+            SessionManager.stash_payload("applovin_grid_export", {
+                "data": export_grid(current_grid(), export_type),
+                "file_name": f"applovin_ad_units_{timestamp}.{export_type}",
+                "mime": "text/csv" if export_type == "csv" else "application/octet-stream"
+            })
+    with export_cols[2]:
+        if ARROW_AVAILABLE and st.button("💾 Save run", key="applovin_grid_save_run", width='stretch'):
+            path = save_grid_run(current_grid())
+            st.success(f"✅ Saved: {path}")
+    prepared_export = SessionManager.get_payload("applovin_grid_export")
+    if prepared_export:
+        st.download_button(
+            label=f"📥 Download {prepared_export['file_name']} ({len(prepared_export['data']) / 1024:.0f} KB)",
+            data=prepared_export["data"],
+            file_name=prepared_export["file_name"],
+            mime=prepared_export["mime"],
+            key="applovin_grid_export"
+        )
+
 st.divider()
 
 # Validation and Submit
-if len(edited_df) > 0:
+if grid_rows > 0:
     st.divider()
     
     if st.button("🚀 Update All Ad Units", type="primary", width='stretch'):
         # Save edited data to session_state before validation and API call
-        df_to_process = edited_df.copy()
+        df_to_process = current_grid().copy()
         
         # Auto-fill ad_network_app_id for rows with same ad_network, package_name, platform
         if "ad_network" in df_to_process.columns and "package_name" in df_to_process.columns and "platform" in df_to_process.columns and "ad_network_app_id" in df_to_process.columns:
             # Group by ad_network, package_name, platform
-            grouped = df_to_process.groupby(["ad_network", "package_name", "platform"])
+            grouped = df_to_process.groupby(["ad_network", "package_name", "platform"], observed=True)
             
             filled_count = 0
             for (ad_network, package_name, platform), group in grouped:
@@ -3182,8 +3373,10 @@ if len(edited_df) > 0:
             if filled_count > 0:
                 st.info(f"ℹ️ {filled_count}개의 행에 ad_network_app_id가 자동으로 채워졌습니다.")
         
-        # Save to session_state after auto-fill
+        # Save to session_state after auto-fill (paged edits are now part of the data)
         st.session_state.applovin_data = df_to_process
+        st.session_state.pop("applovin_data_edits", None)
+        st.session_state.pop("_applovin_grid_window", None)
         
         # Validate data
         errors = []
@@ -0,0 +1,78 @@
+"""Benchmark app-name matching on a synthetic 10k-app account
+
+    python scripts/benchmark_app_name_matcher.py [--apps 10000] [--queries 1000]
+
+Compares the old per-query substring scan with the trigram index
+(containment-only lookups as used by find_app_by_name, and fuzzy search),
+plus the cost of a cached get_app_name_index call.
+"""
+import argparse
+import os
+import random
+import sys
+import time
+from typing import Dict, List, Optional
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from utils.app_name_matcher import AppNameIndex, clear_app_name_index, get_app_name_index  # noqa: E402
+
+WORDS = ["aim", "master", "block", "puzzle", "merge", "tower", "defense", "idle", "farm", "city",
+         "racing", "shooter", "zombie", "hero", "legend", "pixel", "magic", "ocean", "space", "dragon"]
+SUFFIXES = [" iOS RV", " Android IS", "", " ios"]
+
+
+def synthetic_apps(count: int) -> List[Dict]:
+    return [
+        {"appId": str(i), "name": " ".join(random.sample(WORDS, 3)).title() + f" {i}",
+         "platform": random.choice(["android", "ios"])}
+        for i in range(count)
+    ]
+
+
+def naive_match(apps: List[Dict], query: str) -> Optional[Dict]:
+    """Linear scan the index replaced (query in name or name in query)"""
+    q = query.lower().strip()
+    for app in apps:
+        name = app["name"].lower()
+        if q in name or name in q:
+            return app
+    return None
+
+
+def timed_ms(fn) -> tuple:
+    start = time.perf_counter()
+    result = fn()
+    return result, (time.perf_counter() - start) * 1000
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--apps", type=int, default=10000)
+    parser.add_argument("--queries", type=int, default=1000)
+    parser.add_argument("--seed", type=int, default=7)
+    args = parser.parse_args()
+
+    random.seed(args.seed)
+    apps = synthetic_apps(args.apps)
+    queries = [apps[random.randrange(len(apps))]["name"] + random.choice(SUFFIXES) for _ in range(args.queries)]
+
+    _, naive_ms = timed_ms(lambda: [naive_match(apps, q) for q in queries])
+    index, build_ms = timed_ms(lambda: AppNameIndex(apps))
+    strict_hits, strict_ms = timed_ms(lambda: sum(1 for q in queries if index.best_match(q, min_similarity=None)))
+    fuzzy_hits, fuzzy_ms = timed_ms(lambda: sum(1 for q in queries if index.best_match(q)))
+
+    clear_app_name_index("benchmark")
+    get_app_name_index("benchmark", apps)
+    _, cached_ms = timed_ms(lambda: [get_app_name_index("benchmark", apps) for _ in range(100)])
+
+    print(f"apps={len(apps)} queries={len(queries)}")
+    print(f"naive substring scan:      {naive_ms:8.1f} ms total")
+    print(f"index build:               {build_ms:8.1f} ms")
+    print(f"indexed containment search:{strict_ms:8.1f} ms total, hits={strict_hits}")
+    print(f"indexed fuzzy search:      {fuzzy_ms:8.1f} ms total, hits={fuzzy_hits}")
+    print(f"cached index lookup:       {cached_ms / 100:8.2f} ms per call")
+
+
+if __name__ == "__main__":
+    main()
@@ -7,13 +7,68 @@ in the Update Ad Unit page.
 import logging
 import json
 import re
+import threading
+import time
 from typing import Dict, List, Optional, Tuple
 from utils.network_manager import get_network_manager
 from utils.helpers import get_env_var
+from utils.http_json import parse_json, request as http_request, summarize_for_log
+from utils.inventory_sync import get_warm_apps
+from utils.request_scheduler import BULK, request_priority
+from utils.app_name_matcher import get_app_name_index
+from utils.app_records import AppRecord, UnitRecord, get_app_record_batch, normalize_platform
 
 logger = logging.getLogger(__name__)
 
 
+def _get_network_name_index(network: str, apps: List[Dict]):
+    """Get the cached app name index for a network's app list"""
+    return get_app_name_index(
+        network,
+        apps,
+        platform_getter=lambda app: _normalize_platform_for_matching(app.get("platform", ""), network)
+    )
+
+
+def find_app_candidates_by_name(
+    network: str,
+    app_name: str,
+    platform: Optional[str] = None,
+    limit: int = 5,
+    apps: Optional[List[Dict]] = None
+) -> List[Tuple[Dict, float]]:
+    """Find ranked app candidates by name from a network
+    
+    Names are normalized (platform/format suffixes such as " iOS RV" and
+    punctuation removed) and looked up in a per-network trigram index.
+    Only containment matches count (no fuzzy matches), since callers use the
+    answer without review; an app name contained in the query counts for Unity only.
+    
+    Args:
+        network: Network name (e.g., "ironsource", "bigoads", "inmobi", "unity")
+        app_name: App name to search for
+        platform: Optional platform filter ("android" or "ios")
+        limit: Maximum number of candidates
+        apps: Optional pre-fetched network apps list (to avoid an extra API call)
+    
+    Returns:
+        List of (app, score) sorted by score desc (1.0 = exact normalized match)
+    """
+    if apps is None:
+        apps = get_warm_apps(network)
+    if not apps:
+        logger.warning(f"[{network}] No apps found")
+        return []
+    
+    # Unity: one project can have both iOS and Android, so skip the platform filter
+    if network == "unity":
+        platform = None
+    
+    index = _get_network_name_index(network, apps)
+    return index.search(app_name, platform=platform, limit=limit,
+                        min_similarity=None, name_in_query=network == "unity")
+
+
 def find_app_by_name(network: str, app_name: str, platform: Optional[str] = None) -> Optional[Dict]:
     """Find an app by name from a network
     
@@ -26,69 +81,15 @@ def find_app_by_name(network: str, app_name: str, platform: Optional[str] = None
         App dict with appKey/appCode/appId if found, None otherwise
     """
     try:
-        network_manager = get_network_manager()
-        apps = network_manager.get_apps(network)
-        
-        if not apps:
-            logger.warning(f"[{network}] No apps found")
-            return None
-        
-        # For Unity, name matching doesn't need platform check (one project can have both iOS and Android)
-        if network == "unity":
-            app_name_lower = app_name.lower().strip()
-            for app in apps:
-                app_name_in_list = app.get("name") or app.get("appName") or ""
-                if app_name_lower in app_name_in_list.lower() or app_name_in_list.lower() in app_name_lower:
-                    logger.info(f"[Unity] Found app by name: '{app_name_in_list}' matches '{app_name}'")
-                    return app
-            logger.warning(f"[Unity] App '{app_name}' not found by name")
-            return None
-        
-        # For Fyber, add more detailed logging
-        if network == "fyber":
-            app_name_lower = app_name.lower().strip()
-            logger.info(f"[Fyber] Searching for app by name: '{app_name}', platform filter: {platform}")
-            logger.info(f"[Fyber] Total apps available: {len(apps)}")
-            
-            for idx, app in enumerate(apps):
-                app_name_in_list = app.get("name") or app.get("appName") or ""
-                app_platform = app.get("platform", "")
-                app_bundle = app.get("bundle") or app.get("bundleId", "")
-                
-                logger.info(f"[Fyber] App[{idx}]: name='{app_name_in_list}', platform='{app_platform}', bundle='{app_bundle}'")
-                
-                if app_name_lower in app_name_in_list.lower():
-                    # Check platform if provided
-                    if platform:
-                        platform_normalized = _normalize_platform_for_matching(app_platform, network)
-                        target_platform = platform.lower()
-                        logger.info(f"[Fyber] Platform check: app_platform='{app_platform}' -> normalized='{platform_normalized}', target='{target_platform}'")
-                        if platform_normalized != target_platform:
-                            logger.info(f"[Fyber] Platform mismatch, skipping")
-                            continue
-                    
-                    logger.info(f"[Fyber] ✓ Found matching app: '{app_name_in_list}'")
-                    return app
-            
-            logger.warning(f"[Fyber] App '{app_name}' not found")
+        candidates = find_app_candidates_by_name(network, app_name, platform, limit=1)
+        if not candidates:
+            logger.warning(f"[{network}] App '{app_name}' not found")
             return None
         
-        # For other networks, use standard name matching with platform check
-        app_name_lower = app_name.lower().strip()
-        for app in apps:
-            app_name_in_list = app.get("name") or app.get("appName") or ""
-            if app_name_lower in app_name_in_list.lower():
-                # Check platform if provided
-                if platform:
-                    app_platform = app.get("platform", "")
-                    platform_normalized = _normalize_platform_for_matching(app_platform, network)
-                    if platform_normalized != platform.lower():
-                        continue
-                
-                return app
-        
-        logger.warning(f"[{network}] App '{app_name}' not found")
-        return None
+        app, score = candidates[0]
+        app_name_in_list = app.get("name") or app.get("appName") or ""
+        logger.info(f"[{network}] Found app by name: '{app_name_in_list}' matches '{app_name}' (score={score}, platform filter: {platform})")
+        return app
     except Exception as e:
         logger.error(f"[{network}] Error finding app by name: {str(e)}")
         return None
@@ -97,6 +98,9 @@ def find_app_by_name(network: str, app_name: str, platform: Optional[str] = None
 def find_app_by_package_name(network: str, package_name: str, platform: Optional[str] = None) -> Optional[Dict]:
     """Find an app by package name from a network
     
+    Looks up the columnar AppRecordBatch of the app list, which indexes the
+    network's package field once (Fyber bundle, Unity stores.storeId, pkgName/...).
+    
     Args:
         network: Network name (e.g., "ironsource", "bigoads", "inmobi", "unity")
         package_name: Package name to search for (e.g., "com.example.app")
@@ -106,113 +110,27 @@ def find_app_by_package_name(network: str, package_name: str, platform: Optional
         App dict with appKey/appCode/appId if found, None otherwise
     """
     try:
-        network_manager = get_network_manager()
-        apps = network_manager.get_apps(network)
+        apps = get_warm_apps(network)
         
         if not apps:
             logger.warning(f"[{network}] No apps found")
             return None
         
-        # For Unity, check stores.storeId
-        if network == "unity":
-            package_name_lower = package_name.lower().strip()
-            target_platform = platform.lower() if platform else None
-            
-            for app in apps:
-                stores_str = app.get("stores", "")
-                if not stores_str:
-                    continue
-                
-                # Parse stores JSON string
-                try:
-                    import json
-                    if isinstance(stores_str, str):
-                        stores = json.loads(stores_str)
-                    else:
-                        stores = stores_str
-                except (json.JSONDecodeError, TypeError):
-                    logger.warning(f"[Unity] Failed to parse stores JSON: {stores_str}")
-                    continue
-                
-                # Check apple storeId (iOS)
-                if target_platform in (None, "ios"):
-                    apple_store = stores.get("apple", {})
-                    apple_store_id = apple_store.get("storeId", "")
-                    if apple_store_id and package_name_lower == apple_store_id.lower():
-                        return app
-                
-                # Check google storeId (Android)
-                if target_platform in (None, "android"):
-                    google_store = stores.get("google", {})
-                    google_store_id = google_store.get("storeId", "")
-                    if google_store_id and package_name_lower == google_store_id.lower():
-                        return app
-            
-            logger.warning(f"[Unity] App with package name '{package_name}' not found in stores")
-            return None
-        
-        # For Fyber, check bundle field
-        if network == "fyber":
-            package_name_lower = package_name.lower().strip()
-            # For Fyber Android, remove trailing "2" if present (e.g., "com.example.app2" -> "com.example.app")
-            package_name_normalized = package_name_lower
-            if platform and platform.lower() == "android" and package_name_normalized.endswith("2"):
-                package_name_normalized = package_name_normalized[:-1]  # Remove trailing "2"
-                logger.info(f"[Fyber] Normalized package_name from '{package_name_lower}' to '{package_name_normalized}' (removed trailing '2')")
-            
-            for app in apps:
-                # Fyber uses "bundle" field for package name
-                app_bundle = app.get("bundle") or app.get("bundleId") or app.get("packageName", "")
-                
-                if app_bundle:
-                    app_bundle_lower = app_bundle.lower()
-                    # Try exact match first
-                    if package_name_lower == app_bundle_lower:
-                        # Check platform if provided
-                        if platform:
-                            app_platform = app.get("platform", "")
-                            platform_normalized = _normalize_platform_for_matching(app_platform, network)
-                            if platform_normalized != platform.lower():
-                                continue
-                        
-                        logger.info(f"[Fyber] Found app by bundle (exact match): {app_bundle}, platform: {app.get('platform')}")
-                        return app
-                    
-                    # For Android, try normalized match (without trailing "2")
-                    if platform and platform.lower() == "android" and package_name_normalized == app_bundle_lower:
-                        app_platform = app.get("platform", "")
-                        platform_normalized = _normalize_platform_for_matching(app_platform, network)
-                        if platform_normalized == platform.lower():
-                            logger.info(f"[Fyber] Found app by bundle (normalized match, removed '2'): {app_bundle}, platform: {app.get('platform')}")
-                            return app
-            
-            logger.warning(f"[Fyber] App with package name '{package_name}' not found in bundle field")
-            return None
+        batch = get_app_record_batch(network, apps)
+        row = batch.find_by_package(package_name, platform)
         
-        # For other networks, use standard package name matching
-        package_name_lower = package_name.lower().strip()
-        for app in apps:
-            # Check various package name fields
-            app_pkg = (
-                app.get("pkgName", "") or 
-                app.get("packageName", "") or 
-                app.get("bundleId", "") or
-                app.get("package", "") or
-                app.get("pkgNameDisplay", "")  # BigOAds uses pkgNameDisplay
-            )
-            
-            if app_pkg and package_name_lower == app_pkg.lower():
-                # Check platform if provided
-                if platform:
-                    app_platform = app.get("platform", "")
-                    platform_normalized = _normalize_platform_for_matching(app_platform, network)
-                    if platform_normalized != platform.lower():
-                        continue
-                
-                return app
+        # For Fyber Android, retry without trailing "2" (e.g., "com.example.app2" -> "com.example.app")
+        if row is None and network == "fyber" and platform and platform.lower() == "android":
+            package_name_normalized = package_name.lower().strip()
+            if package_name_normalized.endswith("2"):
+                row = batch.find_by_package(package_name_normalized[:-1], platform)
+                if row is not None:
+                    logger.info(f"[Fyber] Found app by bundle (normalized match, removed '2'): {batch.package_names[row]}, platform: {batch.platforms[row]}")
         
-        logger.warning(f"[{network}] App with package name '{package_name}' not found")
-        return None
+        if row is None:
+            logger.warning(f"[{network}] App with package name '{package_name}' not found")
+            return None
+        return batch.apps[row]
     except Exception as e:
         logger.error(f"[{network}] Error finding app by package name: {str(e)}")
         return None
@@ -228,48 +146,7 @@ def _normalize_platform_for_matching(platform: str, network: str) -> str:
     Returns:
         Normalized platform string ("android" or "ios")
     """
-    if not platform:
-        return ""
-    
-    platform_str = str(platform).strip()
-    platform_upper = platform_str.upper()
-    platform_lower = platform_str.lower()
-    
-    # Handle BigOAds format: 1 = android, 2 = ios
-    if network == "bigoads":
-        try:
-            platform_value = int(platform_str) if platform_str.isdigit() else None
-            if platform_value == 1:
-                return "android"
-            elif platform_value == 2:
-                return "ios"
-        except (ValueError, TypeError):
-            pass
-    
-    # Handle Mintegral format: "ANDROID" or "IOS"
-    if platform_upper == "ANDROID" or platform_upper == "AND":
-        return "android"
-    elif platform_upper == "IOS" or platform_upper == "IPHONE":
-        return "ios"
-    
-    # Handle Fyber format: "android" or "ios" (lowercase)
-    if network == "fyber":
-        if platform_lower in ["android", "and"]:
-            return "android"
-        elif platform_lower in ["ios", "iphone", "iphoneos"]:
-            return "ios"
-    
-    # Handle common formats
-    if platform_lower in ["android", "1", "and", "aos"]:
-        return "android"
-    elif platform_lower in ["ios", "2", "iphone", "iphoneos"]:
-        return "ios"
-    elif platform_str == "Android":
-        return "android"
-    elif platform_str == "iOS":
-        return "ios"
-    
-    return platform_lower
+    return normalize_platform(platform, network)
 
 
 def get_ironsource_app_by_name(app_name: str, platform: Optional[str] = None) -> Optional[Dict]:
@@ -337,24 +214,244 @@ def get_bigoads_app_by_name(app_name: str, platform: Optional[str] = None) -> Op
     return find_app_by_name("bigoads", app_name, platform)
 
 
+# Loaded instance lists are reused for this long before get_ironsource_instances refetches
+IRONSOURCE_INSTANCE_TTL_SECONDS = 600
+
+
+def _instance_key(app_key: str, ad_format, is_bidder, network_name) -> Tuple:
+    return (app_key, str(ad_format or "").lower(), bool(is_bidder), str(network_name or "").lower())
+
+
+class IronSourceInstanceIndex:
+    """In-memory IronSource instances for many apps
+    
+    Keyed by (appKey, adFormat, isBidder, networkName) so portfolio-wide
+    reconciliation and unit matching read instances without further API calls.
+    """
+    
+    def __init__(self):
+        self._lock = threading.Lock()
+        # app_key -> (loaded_at, instances); the list object is kept stable for UnitFormatIndex reuse
+        self._by_app: Dict[str, Tuple[float, List[Dict]]] = {}
+        self._by_key: Dict[Tuple, List[Dict]] = {}
+        # app_key -> last error message
+        self.errors: Dict[str, str] = {}
+    
+    def add(self, app_key: str, instances: List[Dict]):
+        """Replace the instances of one app"""
+        with self._lock:
+            previous = self._by_app.get(app_key)
+            if previous:
+                for key in [key for key in self._by_key if key[0] == app_key]:
+                    del self._by_key[key]
+            self._by_app[app_key] = (time.time(), instances)
+            self.errors.pop(app_key, None)
+            for instance in instances:
+                key = _instance_key(app_key, instance.get("adFormat"), instance.get("isBidder"), instance.get("networkName"))
+                self._by_key.setdefault(key, []).append(instance)
+    
+    def instances_for(self, app_key: str, max_age: Optional[float] = None) -> Optional[List[Dict]]:
+        """Instances of an app, or None if not loaded (or older than max_age seconds)"""
+        with self._lock:
+            entry = self._by_app.get(app_key)
+        if entry is None or (max_age is not None and time.time() - entry[0] > max_age):
+            return None
+        return entry[1]
+    
+    def find(self, app_key: str, ad_format: Optional[str] = None, is_bidder: Optional[bool] = None,
+             network_name: Optional[str] = None) -> List[Dict]:
+        """Instances of an app matching the given key parts (None = any)"""
+        if ad_format is not None and is_bidder is not None and network_name is not None:
+            with self._lock:
+                return list(self._by_key.get(_instance_key(app_key, ad_format, is_bidder, network_name), []))
+        instances = self.instances_for(app_key) or []
+        return [
+            instance for instance in instances
+            if (ad_format is None or str(instance.get("adFormat", "")).lower() == ad_format.lower())
+            and (is_bidder is None or bool(instance.get("isBidder")) == is_bidder)
+            and (network_name is None or str(instance.get("networkName", "")).lower() == network_name.lower())
+        ]
+    
+    def app_keys(self) -> List[str]:
+        """Loaded app keys"""
+        with self._lock:
+            return list(self._by_app)
+    
+    def clear(self):
+        with self._lock:
+            self._by_app.clear()
+            self._by_key.clear()
+            self.errors.clear()
+
+
+_ironsource_instance_index = IronSourceInstanceIndex()
+
+
+def get_ironsource_instance_index() -> IronSourceInstanceIndex:
+    """Process-wide IronSource instance index"""
+    return _ironsource_instance_index
+
+
+# Per-app unit lists (Pangle/Vungle) are reused for this long
+UNIT_CACHE_TTL_SECONDS = 300
+
+# App IDs per Pangle code/query request when prefetching
+PANGLE_PREFETCH_BATCH = 20
+
+
+class AppUnitCache:
+    """Unit lists of one network keyed by app ID
+    
+    Filled from server-filtered responses or from one full fetch grouped by app,
+    so repeated per-app lookups (one per AppLovin row) are dictionary hits.
+    """
+    
+    def __init__(self, network: str, ttl: float = UNIT_CACHE_TTL_SECONDS):
+        self.network = network
+        self.ttl = ttl
+        self._lock = threading.Lock()
+        # app_id (str) -> (loaded_at, units)
+        self._by_app: Dict[str, Tuple[float, List[Dict]]] = {}
+    
+    def get(self, app_id) -> Optional[List[Dict]]:
+        """Units of an app, or None if not cached (or expired)"""
+        with self._lock:
+            entry = self._by_app.get(str(app_id))
+        if entry is None or time.time() - entry[0] > self.ttl:
+            return None
+        return entry[1]
+    
+    def put_grouped(self, units: List[Dict], app_id_of, app_ids: Optional[List] = None):
+        """Store units grouped by app
+        
+        Args:
+            units: Units of one or more apps
+            app_id_of: Function returning a unit's app ID
+            app_ids: Requested app IDs (cached as empty when they have no units)
+        """
+        grouped: Dict[str, List[Dict]] = {str(app_id): [] for app_id in app_ids or []}
+        for unit in units:
+            app_id = app_id_of(unit)
+            if app_id not in (None, ""):
+                grouped.setdefault(str(app_id), []).append(unit)
+        now = time.time()
+        with self._lock:
+            for app_id, app_units in grouped.items():
+                self._by_app[app_id] = (now, app_units)
+    
+    def clear(self):
+        with self._lock:
+            self._by_app.clear()
+
+
+_unit_caches = {network: AppUnitCache(network) for network in ("pangle", "vungle")}
+
+
+def clear_unit_caches():
+    """Drop cached per-app unit lists and IronSource instances (e.g., at the start of a fresh lookup run)"""
+    for cache in _unit_caches.values():
+        cache.clear()
+    _ironsource_instance_index.clear()
+
+
+def load_ironsource_instances(app_keys: List[str], refresh: bool = False) -> IronSourceInstanceIndex:
+    """Fetch instances for many IronSource apps concurrently into the index
+    
+    Args:
+        app_keys: IronSource app keys
+        refresh: Refetch keys that are already loaded (and fresh)
+    
+    Returns:
+        The instance index (failed keys are listed in index.errors)
+    """
+    index = _ironsource_instance_index
+    keys = [
+        key for key in dict.fromkeys(app_keys)
+        if key and (refresh or index.instances_for(key, IRONSOURCE_INSTANCE_TTL_SECONDS) is None)
+    ]
+    if not keys:
+        return index
+    
+    logger.info(f"[IronSource] Loading instances for {len(keys)} apps")
+    responses = get_network_manager()._get_ironsource_instances_bulk(keys)
+    for app_key, response in responses.items():
+        if response.get("status") == 0:
+            index.add(app_key, response.get("result", []) or [])
+        else:
+            index.errors[app_key] = response.get("msg", "Unknown error")
+            logger.error(f"[IronSource] Failed to get instances for {app_key}: {index.errors[app_key]}")
+    return index
+
+
+def _resolve_matched_app_ids(network: str, applovin_units: List[Dict], field: str) -> List:
+    """Resolve the network apps of many AppLovin units against one fetched app list
+    
+    Matching mirrors match_applovin_unit_to_network (package name first, then name).
+    
+    Args:
+        network: Network name
+        applovin_units: AppLovin unit dicts with name, platform, package_name
+        field: AppRecord field to collect (e.g., "app_key", "app_id")
+    
+    Returns:
+        Matched values (unmatched units are skipped)
+    """
+    batch = get_app_record_batch(network, get_warm_apps(network))
+    if not len(batch):
+        return []
+    
+    matched = []
+    for unit in applovin_units:
+        platform = (unit.get("platform") or "").lower() or None
+        row = batch.find_by_package(unit.get("package_name", ""), platform)
+        record = batch.record(row) if row is not None else None
+        if record is None and unit.get("name"):
+            candidates = find_app_candidates_by_name(network, unit["name"], platform, limit=1, apps=batch.apps)
+            if candidates:
+                record = AppRecord.from_api(network, candidates[0][0])
+        value = getattr(record, field) if record is not None else None
+        if value not in (None, ""):
+            matched.append(value)
+    return matched
+
+
+def prefetch_ironsource_instances(applovin_units: List[Dict]) -> IronSourceInstanceIndex:
+    """Resolve the IronSource apps of many AppLovin units and bulk-load their instances
+    
+    Args:
+        applovin_units: AppLovin unit dicts with name, platform, package_name
+    
+    Returns:
+        The instance index (per-row lookups afterwards hit it)
+    """
+    with request_priority(BULK):
+        return load_ironsource_instances(_resolve_matched_app_ids("ironsource", applovin_units, "app_key"))
+
+
 def get_ironsource_instances(app_key: str) -> List[Dict]:
     """Get IronSource instances for an app
     
     API: GET https://platform.ironsrc.com/levelPlay/network/instances/v4/{appKey}/
     
+    Served from the instance index when loaded recently (see load_ironsource_instances).
+    
     Args:
         app_key: IronSource app key
     
     Returns:
         List of instance dicts with instanceId, adFormat, networkName, etc.
     """
+    instances = _ironsource_instance_index.instances_for(app_key, IRONSOURCE_INSTANCE_TTL_SECONDS)
+    if instances is not None:
+        return instances
     try:
         network_manager = get_network_manager()
         instances_response = network_manager._get_ironsource_instances(app_key)
         
         if instances_response.get("status") == 0:
-            instances = instances_response.get("result", [])
+            instances = instances_response.get("result", []) or []
             logger.info(f"[IronSource] Instances count: {len(instances)}")
+            _ironsource_instance_index.add(app_key, instances)
             return instances
         else:
             logger.error(f"[IronSource] Failed to get instances: {instances_response.get('msg', 'Unknown error')}")
@@ -392,25 +489,22 @@ def get_ironsource_units(app_key: str) -> List[Dict]:
         masked_headers = {k: "***MASKED***" if k.lower() == "authorization" else v for k, v in headers.items()}
         logger.info(f"[IronSource] Request Headers: {json.dumps(masked_headers, indent=2)}")
         
-        import requests
-        response = requests.get(url, headers=headers, timeout=30)
+        response = http_request("GET", url, headers=headers, timeout=30)
         
         logger.info(f"[IronSource] Response Status: {response.status_code}")
         
         if response.status_code == 200:
-            # Handle empty response
-            response_text = response.text.strip()
-            if not response_text:
-                logger.warning(f"[IronSource] Empty response body (status {response.status_code})")
-                return []
-            
             try:
-                result = response.json()
-                logger.info(f"[IronSource] Response Body: {json.dumps(result, indent=2)}")
+                result = parse_json(response)
             except json.JSONDecodeError as e:
                 logger.error(f"[IronSource] JSON decode error: {str(e)}")
-                logger.error(f"[IronSource] Response text: {response_text[:500]}")
+                logger.error(f"[IronSource] Response text: {response.text[:500]}")
+                return []
+            # Handle empty response
+            if result is None:
+                logger.warning(f"[IronSource] Empty response body (status {response.status_code})")
                 return []
+            logger.info(f"[IronSource] Response Body: {summarize_for_log(result)}")
             
             # IronSource API 응답 형식에 맞게 파싱
             units = []
@@ -459,9 +553,7 @@ def match_applovin_unit_to_network(
     # For Vungle, use applications API directly (more reliable than placements)
     if network == "vungle":
         try:
-            from utils.network_manager import get_network_manager
-            network_manager = get_network_manager()
-            apps = network_manager.get_apps("vungle")
+            apps = get_warm_apps("vungle")
             
             if not apps:
                 logger.warning(f"[Vungle] No apps found")
@@ -503,70 +595,18 @@ def match_applovin_unit_to_network(
                             }
             
             # Match by app name (works for both iOS and Android)
-            # For iOS, AppLovin app names may have suffixes like " iOS RV", " iOS IS", " iOS BN"
-            # We need to normalize the app name by removing these suffixes before matching
+            # AppLovin app names may have suffixes like " iOS RV", " iOS IS", " iOS BN";
+            # the name index normalizes them away and ranks exact > containment (no fuzzy matches)
             if app_name:
-                # Normalize AppLovin app name: remove " iOS RV", " iOS IS", " iOS BN", etc.
-                normalized_applovin_name = app_name
-                # Remove common suffixes from AppLovin ad unit names
-                suffixes_to_remove = [" ios rv", " ios is", " ios bn", " ios", " android rv", " android is", " android bn", " android"]
-                for suffix in suffixes_to_remove:
-                    if normalized_applovin_name.lower().endswith(suffix):
-                        normalized_applovin_name = normalized_applovin_name[:-len(suffix)].strip()
-                        break
-                
-                logger.info(f"[Vungle] Matching {platform} app: AppLovin name='{app_name}' (normalized='{normalized_applovin_name}')")
-                
-                best_match = None
-                best_match_score = 0
-                
-                for app in apps:
-                    app_platform = app.get("platform", "").lower()
-                    app_platform_normalized = _normalize_platform_for_matching(app_platform, network)
-                    
-                    if app_platform_normalized != target_platform_normalized:
-                        continue
-                    
-                    app_name_match = app.get("name", "")
-                    if not app_name_match:
-                        continue
-                    
-                    app_name_match_lower = app_name_match.lower()
-                    normalized_applovin_name_lower = normalized_applovin_name.lower()
-                    
-                    # Try exact match with normalized name (highest priority)
-                    if normalized_applovin_name_lower == app_name_match_lower:
-                        vungle_app_id = app.get("vungleAppId") or app.get("id", "")
-                        store_info = app.get("store", {})
-                        app_store_id = store_info.get("id", "") if isinstance(store_info, dict) else ""
-                        logger.info(f"[Vungle] Matched {platform} app by exact normalized app_name: '{normalized_applovin_name}' == '{app_name_match}' -> {vungle_app_id}")
-                        return {
-                            "appId": vungle_app_id,
-                            "vungleAppId": vungle_app_id,
-                            "applicationId": app.get("id", ""),
-                            "name": app_name_match,
-                            "platform": app_platform,
-                            "packageName": app_store_id,
-                            "storeId": app_store_id
-                        }
-                    
-                    # Try if normalized name is contained in Vungle name (high priority)
-                    if normalized_applovin_name_lower in app_name_match_lower:
-                        best_match = app
-                        best_match_score = 2
-                    
-                    # Try if Vungle name is contained in normalized name (medium priority)
-                    elif app_name_match_lower in normalized_applovin_name_lower and best_match_score < 1:
-                        best_match = app
-                        best_match_score = 1
-                
-                # Return best match if found
-                if best_match:
+                index = _get_network_name_index(network, apps)
+                match = index.best_match(app_name, platform=target_platform_normalized, min_similarity=None)
+                if match:
+                    best_match, best_match_score = match
                     vungle_app_id = best_match.get("vungleAppId") or best_match.get("id", "")
                     app_name_match = best_match.get("name", "")
                     store_info = best_match.get("store", {})
                     app_store_id = store_info.get("id", "") if isinstance(store_info, dict) else ""
-                    logger.info(f"[Vungle] Matched {platform} app by partial app_name: '{normalized_applovin_name}' in '{app_name_match}' (score={best_match_score}) -> {vungle_app_id}")
+                    logger.info(f"[Vungle] Matched {platform} app by app_name: '{app_name}' -> '{app_name_match}' (score={best_match_score}) -> {vungle_app_id}")
                     return {
                         "appId": vungle_app_id,
                         "vungleAppId": vungle_app_id,
@@ -653,6 +693,165 @@ def match_applovin_unit_to_network(
     return None
 
 
+# Declarative unit matching spec per network
+#   format_keys:    unit fields holding the ad format (first non-None wins)
+#   format_type:    "int" (numeric adType) or "str" (case-insensitive)
+#   platform_field: how to read the unit's own platform ("vungle_application", "unity_store") - used as a filter
+#   marker_key:     name field searched for "_aos_"/"_ios_" markers to break ties between same-format units
+#   prefer_key:     boolean field preferred among same-format units (e.g., IronSource isBidder)
+UNIT_MATCH_SPECS: Dict[str, Dict] = {
+    "ironsource": {"format_keys": ("adFormat",), "format_type": "str", "prefer_key": "isBidder"},
+    "inmobi": {"format_keys": ("placementType",), "format_type": "str", "marker_key": "placementName"},
+    "mintegral": {"format_keys": ("ad_type",), "format_type": "str", "marker_key": "placement_name"},
+    "fyber": {"format_keys": ("placementType",), "format_type": "str", "marker_key": "name"},
+    "bigoads": {"format_keys": ("adType", "ad_type", "adTypeCode", "type"), "format_type": "int", "marker_key": "name"},
+    "vungle": {"format_keys": ("type",), "format_type": "str", "platform_field": "vungle_application", "marker_key": "name"},
+    "unity": {"format_keys": ("adFormat",), "format_type": "str", "platform_field": "unity_store"},
+    "pangle": {"format_keys": ("adType",), "format_type": "int", "marker_key": "name"},
+}
+_DEFAULT_UNIT_MATCH_SPEC = {"format_keys": ("adFormat",), "format_type": "str"}
+_PLATFORM_MARKERS = {"android": "_aos_", "ios": "_ios_"}
+
+
+def _normalize_unit_format(value, format_type: str):
+    """Normalize a unit/target format value for comparison (None if not comparable)"""
+    if value is None:
+        return None
+    if format_type == "int":
+        try:
+            return int(value)
+        except (ValueError, TypeError):
+            return None
+    return str(value).lower()
+
+
+def _unit_platform(unit: Dict, platform_field: str, network: str) -> str:
+    """Read the normalized platform stored on a unit itself"""
+    if platform_field == "vungle_application":
+        application = unit.get("application", {})
+        if isinstance(application, str):
+            try:
+                application = json.loads(application)
+            except (json.JSONDecodeError, TypeError):
+                application = {}
+        if not isinstance(application, dict):
+            return ""
+        return _normalize_platform_for_matching(application.get("platform", "").lower(), network)
+    if platform_field == "unity_store":
+        unit_platform = unit.get("platform", "").lower()
+        return {"apple": "ios", "google": "android"}.get(unit_platform, unit_platform)
+    return ""
+
+
+class UnitFormatIndex:
+    """Compiled (format, platform) lookup table over one fetched unit list
+    
+    Built once per unit list from UNIT_MATCH_SPECS, so resolving REWARD/INTER/BANNER
+    for the same app does not rescan every unit per lookup.
+    """
+    
+    def __init__(self, network: str, units: List[Dict]):
+        self.network = network
+        self.units = units
+        self.spec = UNIT_MATCH_SPECS.get(network, _DEFAULT_UNIT_MATCH_SPEC)
+        format_type = self.spec["format_type"]
+        platform_field = self.spec.get("platform_field")
+        marker_key = self.spec.get("marker_key")
+        prefer_key = self.spec.get("prefer_key")
+        
+        # (format, platform or None) -> units in original order
+        self._buckets: Dict[Tuple, List[Dict]] = {}
+        # (format, platform or None, marker platform) -> first unit whose name has the marker
+        self._marked: Dict[Tuple, Dict] = {}
+        # (format, platform or None) -> first preferred unit (e.g., bidding instance)
+        self._preferred: Dict[Tuple, Dict] = {}
+        
+        for unit in units:
+            raw_format = None
+            for key in self.spec["format_keys"]:
+                raw_format = unit.get(key)
+                if raw_format is not None:
+                    break
+            unit_format = _normalize_unit_format(raw_format, format_type)
+            if unit_format is None:
+                continue
+            
+            keys = [(unit_format, None)]
+            if platform_field:
+                keys.append((unit_format, _unit_platform(unit, platform_field, network)))
+            
+            marker_platform = None
+            if marker_key:
+                unit_name = str(unit.get(marker_key, "") or "").lower()
+                for marker_platform_name, marker in _PLATFORM_MARKERS.items():
+                    if marker in unit_name:
+                        marker_platform = marker_platform_name
+                        break
+            
+            for key in keys:
+                self._buckets.setdefault(key, []).append(unit)
+                if marker_platform:
+                    self._marked.setdefault(key + (marker_platform,), unit)
+                if prefer_key and unit.get(prefer_key, False):
+                    self._preferred.setdefault(key, unit)
+    
+    def resolve(self, ad_format: str, platform: Optional[str] = None) -> Optional[Dict]:
+        """Resolve the unit for an AppLovin ad format (REWARD, INTER, BANNER)
+        
+        Args:
+            ad_format: AppLovin ad format
+            platform: Optional platform ("android" or "ios")
+        
+        Returns:
+            Matched unit dict, or None if not found
+        """
+        target_format = _normalize_unit_format(
+            map_ad_format_to_network_format(ad_format, self.network),
+            self.spec["format_type"]
+        )
+        bucket_platform = None
+        if platform and self.spec.get("platform_field"):
+            bucket_platform = _normalize_platform_for_matching(platform, self.network)
+        key = (target_format, bucket_platform)
+        matching_units = self._buckets.get(key, [])
+        
+        if not matching_units:
+            logger.warning(f"[{self.network}] No units found for format '{target_format}' (platform={bucket_platform})")
+            return None
+        if len(matching_units) == 1:
+            return matching_units[0]
+        
+        if self.spec.get("prefer_key"):
+            preferred = self._preferred.get(key)
+            if preferred:
+                return preferred
+            logger.warning(f"[{self.network}] Multiple units found for format '{target_format}' but none have {self.spec['prefer_key']}")
+        elif self.spec.get("marker_key") and platform:
+            marker_platform = "android" if platform.lower() == "android" else "ios"
+            marked = self._marked.get(key + (marker_platform,))
+            if marked:
+                return marked
+            logger.warning(f"[{self.network}] Multiple units found for format '{target_format}' but none have platform indicator '{_PLATFORM_MARKERS[marker_platform]}'")
+        return matching_units[0]
+    
+    def resolve_many(self, requests: List[Tuple[str, Optional[str]]]) -> List[Optional[Dict]]:
+        """Resolve several (ad_format, platform) pairs against the same unit list"""
+        return [self.resolve(ad_format, platform) for ad_format, platform in requests]
+
+
+# Last compiled index per network (reused while the same unit list object is passed)
+_unit_format_indexes: Dict[str, UnitFormatIndex] = {}
+
+
+def get_unit_format_index(network: str, network_units: List[Dict]) -> UnitFormatIndex:
+    """Get the compiled UnitFormatIndex for a fetched unit list (built once per list)"""
+    index = _unit_format_indexes.get(network)
+    if index is None or index.units is not network_units or len(index.units) != len(network_units):
+        index = UnitFormatIndex(network, network_units)
+        _unit_format_indexes[network] = index
+    return index
+
+
 def find_matching_unit(
     network_units: List[Dict],
     ad_format: str,
@@ -670,371 +869,29 @@ def find_matching_unit(
     Returns:
         Matched unit dict with placementId/adUnitId, or None if not found
     """
-    target_format = map_ad_format_to_network_format(ad_format, network)
-    
-    # For IronSource, use GET Instance API (instances instead of ad units)
-    # Instances have instanceId, adFormat, networkName, etc.
-    if network == "ironsource":
-        # First, collect all matching instances by adFormat
-        matching_instances = []
-        for instance in network_units:
-            instance_format = instance.get("adFormat", "").lower()
-            if instance_format == target_format.lower():
-                matching_instances.append(instance)
-        
-        # If multiple matches, prioritize bidding instances (isBidder: true)
-        if len(matching_instances) > 1:
-            # First try to find bidding instances
-            bidding_instances = [inst for inst in matching_instances if inst.get("isBidder", False)]
-            if bidding_instances:
-                logger.info(f"[IronSource] Found {len(bidding_instances)} bidding instances for format '{target_format}'")
-                return bidding_instances[0]  # Return first bidding instance
-            
-            # If no bidding instances, return first match
-            logger.warning(f"[IronSource] Multiple instances found for format '{target_format}' but none are bidding instances")
-            return matching_instances[0]
-        elif len(matching_instances) == 1:
-            return matching_instances[0]
-        else:
-            logger.warning(f"[IronSource] No instances found for format '{target_format}'")
-            return None
-    
-    # For InMobi, match by placementType
-    if network == "inmobi":
-        # InMobi uses placementType field (e.g., "REWARDED_VIDEO", "INTERSTITIAL", "BANNER")
-        matching_units = []
-        for unit in network_units:
-            unit_format = unit.get("placementType", "").upper()
-            if unit_format == target_format.upper():
-                matching_units.append(unit)
-        
-        # If multiple matches and platform is provided, prioritize by platform indicator in placementName
-        if len(matching_units) > 1 and platform:
-            platform_normalized = platform.lower()
-            platform_indicator = "_aos_" if platform_normalized == "android" else "_ios_"
-            
-            for unit in matching_units:
-                placement_name = unit.get("placementName", "").lower()
-                if platform_indicator in placement_name:
-                    logger.info(f"[InMobi] Found unit with platform indicator '{platform_indicator}' in placementName: {unit.get('placementName')}")
-                    return unit
-            
-            # If no unit has platform indicator, return first match
-            logger.warning(f"[InMobi] Multiple units found for format '{target_format}' but none have platform indicator '{platform_indicator}' in placementName")
-            return matching_units[0] if matching_units else None
-        elif len(matching_units) == 1:
-            return matching_units[0]
-        else:
-            return None
-    
-    # For Mintegral, match by ad_type
-    if network == "mintegral":
-        # Mintegral uses ad_type field (e.g., "rewarded_video", "new_interstitial", "banner")
-        matching_units = []
-        for unit in network_units:
-            unit_format = unit.get("ad_type", "").lower()
-            if unit_format == target_format.lower():
-                matching_units.append(unit)
-        
-        # If multiple matches and platform is provided, prioritize by platform indicator in placement_name
-        if len(matching_units) > 1 and platform:
-            platform_normalized = platform.lower()
-            platform_indicator = "_aos_" if platform_normalized == "android" else "_ios_"
-            
-            for unit in matching_units:
-                placement_name = unit.get("placement_name", "").lower()
-                if platform_indicator in placement_name:
-                    logger.info(f"[Mintegral] Found unit with platform indicator '{platform_indicator}' in placement_name: {unit.get('placement_name')}")
-                    return unit
-            
-            # If no unit has platform indicator, return first match
-            logger.warning(f"[Mintegral] Multiple units found for format '{target_format}' but none have platform indicator '{platform_indicator}' in placement_name")
-            return matching_units[0] if matching_units else None
-        elif len(matching_units) == 1:
-            return matching_units[0]
-        else:
-            return None
-    
-    # For Fyber, match by placementType
-    if network == "fyber":
-        # Fyber uses placementType field (e.g., "Rewarded", "Interstitial", "Banner")
-        matching_units = []
-        for unit in network_units:
-            unit_format = unit.get("placementType", "")
-            # Case-insensitive comparison
-            if unit_format.lower() == target_format.lower():
-                matching_units.append(unit)
-        
-        # If multiple matches and platform is provided, prioritize by platform indicator in name
-        if len(matching_units) > 1 and platform:
-            platform_normalized = platform.lower()
-            platform_indicator = "_aos_" if platform_normalized == "android" else "_ios_"
-            
-            for unit in matching_units:
-                placement_name = unit.get("name", "").lower()
-                if platform_indicator in placement_name:
-                    logger.info(f"[Fyber] Found unit with platform indicator '{platform_indicator}' in name: {unit.get('name')}")
-                    return unit
-            
-            # If no unit has platform indicator, return first match
-            logger.warning(f"[Fyber] Multiple units found for format '{target_format}' but none have platform indicator '{platform_indicator}' in name")
-            return matching_units[0] if matching_units else None
-        elif len(matching_units) == 1:
-            return matching_units[0]
-        else:
-            return None
-    
-    # For BigOAds, match by adType (numeric)
-    if network == "bigoads":
-        # BigOAds uses adType field (2: Banner, 3: Interstitial, 4: Reward Video)
-        matching_units = []
-        target_ad_type = target_format  # target_format is already the numeric adType
-        logger.info(f"[BigOAds] Finding unit: ad_format={ad_format}, target_format={target_format}, target_ad_type={target_ad_type} (type: {type(target_ad_type)})")
-        logger.info(f"[BigOAds] Total units to check: {len(network_units)}")
-        
-        # Debug: Log all units' adType values
-        for idx, unit in enumerate(network_units):
-            unit_ad_type = unit.get("adType")
-            unit_name = unit.get("name", "N/A")
-            unit_slot_code = unit.get("slotCode", "N/A")
-            logger.info(f"[BigOAds] Unit[{idx}]: name={unit_name}, slotCode={unit_slot_code}, adType={unit_ad_type} (type: {type(unit_ad_type)}), all_keys={list(unit.keys())}")
-        
-        for unit in network_units:
-            unit_ad_type = unit.get("adType")
-            unit_name = unit.get("name", "N/A")
-            
-            # Check if adType field exists
-            if unit_ad_type is None:
-                logger.warning(f"[BigOAds] Unit '{unit_name}' has no 'adType' field. Available keys: {list(unit.keys())}")
-                # Try alternative field names
-                unit_ad_type = unit.get("ad_type") or unit.get("adTypeCode") or unit.get("type")
-                if unit_ad_type is not None:
-                    logger.info(f"[BigOAds] Found alternative field: {unit_ad_type}")
-                else:
-                    logger.warning(f"[BigOAds] No adType found in unit '{unit_name}', skipping")
-                    continue
-            
-            logger.info(f"[BigOAds] Checking unit: name={unit_name}, adType={unit_ad_type} (type: {type(unit_ad_type)})")
-            # Compare as integers if possible
-            try:
-                unit_ad_type_int = int(unit_ad_type)
-                target_ad_type_int = int(target_ad_type)
-                if unit_ad_type_int == target_ad_type_int:
-                    logger.info(f"[BigOAds] ✓ Match found: {unit_name} (adType={unit_ad_type_int} == target={target_ad_type_int})")
-                    matching_units.append(unit)
-                else:
-                    logger.info(f"[BigOAds] ✗ No match: {unit_name} (adType={unit_ad_type_int} != target={target_ad_type_int})")
-            except (ValueError, TypeError) as e:
-                # If conversion fails, skip
-                logger.warning(f"[BigOAds] Cannot compare adType: {unit_name}, adType={unit_ad_type}, error={e}")
-                continue
-        
-        logger.info(f"[BigOAds] Total matching units found: {len(matching_units)}")
-        
-        # If multiple matches and platform is provided, prioritize by platform indicator in name
-        if len(matching_units) > 1 and platform:
-            platform_normalized = platform.lower()
-            platform_indicator = "_aos_" if platform_normalized == "android" else "_ios_"
-            
-            for unit in matching_units:
-                slot_name = unit.get("name", "").lower()
-                if platform_indicator in slot_name:
-                    logger.info(f"[BigOAds] Found unit with platform indicator '{platform_indicator}' in name: {unit.get('name')}")
-                    return unit
-            
-            # If no unit has platform indicator, return first match
-            logger.warning(f"[BigOAds] Multiple units found for format '{target_format}' but none have platform indicator '{platform_indicator}' in name")
-            return matching_units[0] if matching_units else None
-        elif len(matching_units) == 1:
-            return matching_units[0]
-        else:
-            return None
-    
-    # For Vungle, match by type (not placementType)
-    if network == "vungle":
-        # Vungle uses "type" field (e.g., "interstitial", "rewarded", "banner")
-        # Note: API response uses "type" field, not "placementType"
-        matching_units = []
-        logger.info(f"[Vungle] Finding unit: ad_format={ad_format}, target_format={target_format}")
-        logger.info(f"[Vungle] Total units to check: {len(network_units)}")
-        
-        # Map target_format to lowercase for comparison
-        # target_format is "Rewarded", "Interstitial", "Banner" from map_ad_format_to_network_format
-        # But actual API response uses lowercase: "interstitial", "rewarded", "banner"
-        type_mapping = {
-            "rewarded": "rewarded",
-            "interstitial": "interstitial",
-            "banner": "banner"
-        }
-        target_type = type_mapping.get(target_format.lower(), target_format.lower())
-        
-        for idx, unit in enumerate(network_units):
-            # Get type field (should be lowercase in API response)
-            unit_type = unit.get("type", "").lower()
-            unit_name = unit.get("name", "N/A")
-            unit_reference_id = unit.get("referenceID", "N/A")
-            
-            # Also check application.platform for platform matching
-            application = unit.get("application", {})
-            if isinstance(application, str):
-                try:
-                    import json
-                    application = json.loads(application)
-                except (json.JSONDecodeError, TypeError):
-                    application = {}
-            unit_platform = application.get("platform", "").lower()
-            
-            logger.info(f"[Vungle] Unit[{idx}]: name={unit_name}, type={unit_type}, referenceID={unit_reference_id}, platform={unit_platform}")
-            
-            # Match by type (lowercase comparison)
-            if unit_type == target_type:
-                # Also check platform if provided
-                if platform:
-                    platform_normalized = _normalize_platform_for_matching(platform, network)
-                    unit_platform_normalized = _normalize_platform_for_matching(unit_platform, network)
-                    if platform_normalized == unit_platform_normalized:
-                        logger.info(f"[Vungle] ✓ Match found: {unit_name} (type={unit_type} == target={target_type}, platform={unit_platform_normalized})")
-                        matching_units.append(unit)
-                    else:
-                        logger.info(f"[Vungle] ✗ Platform mismatch: {unit_name} (type={unit_type} matches but platform {unit_platform_normalized} != {platform_normalized})")
-                else:
-                    logger.info(f"[Vungle] ✓ Match found: {unit_name} (type={unit_type} == target={target_type})")
-                    matching_units.append(unit)
-        
-        logger.info(f"[Vungle] Total matching units found: {len(matching_units)}")
-        
-        # If multiple matches and platform is provided, prioritize by platform indicator in name
-        if len(matching_units) > 1 and platform:
-            platform_normalized = platform.lower()
-            platform_indicator = "_aos_" if platform_normalized == "android" else "_ios_"
-            
-            for unit in matching_units:
-                placement_name = unit.get("name", "").lower()
-                if platform_indicator in placement_name:
-                    logger.info(f"[Vungle] Found unit with platform indicator '{platform_indicator}' in name: {unit.get('name')}, referenceID={unit.get('referenceID')}")
-                    return unit
-            
-            # If no unit has platform indicator, return first match
-            logger.warning(f"[Vungle] Multiple units found for format '{target_format}' but none have platform indicator '{platform_indicator}' in name")
-            matched_unit = matching_units[0] if matching_units else None
-            if matched_unit:
-                logger.info(f"[Vungle] Returning first match: {matched_unit.get('name')}, referenceID={matched_unit.get('referenceID')}")
-            return matched_unit
-        elif len(matching_units) == 1:
-            matched_unit = matching_units[0]
-            logger.info(f"[Vungle] Returning single match: {matched_unit.get('name')}, referenceID={matched_unit.get('referenceID')}")
-            return matched_unit
-        else:
-            logger.warning(f"[Vungle] No matching units found for format '{target_format}' (target_type={target_type})")
-            return None
-    
-    # For Unity, match by ad format and platform
-    if network == "unity":
-        # Unity ad units have adFormat field (rewarded, interstitial, banner)
-        # Match by ad format and platform
-        matching_units = []
-        for unit in network_units:
-            unit_format = unit.get("adFormat", "").lower()
-            unit_platform = unit.get("platform", "").lower()
-            
-            # Map platform: apple -> ios, google -> android
-            platform_mapping = {
-                "apple": "ios",
-                "google": "android"
-            }
-            unit_platform_normalized = platform_mapping.get(unit_platform, unit_platform)
-            
-            # Check format match (target_format is "Rewarded", "Interstitial", "Banner")
-            # unit_format is "rewarded", "interstitial", "banner"
-            if unit_format == target_format.lower():
-                # If platform is provided, check platform match
-                if platform:
-                    target_platform_normalized = _normalize_platform_for_matching(platform, network)
-                    if unit_platform_normalized == target_platform_normalized:
-                        matching_units.append(unit)
-                else:
-                    # No platform filter, match any
-                    matching_units.append(unit)
-        
-        if len(matching_units) == 1:
-            matched_unit = matching_units[0]
-            logger.info(f"[Unity] Found matching unit: {matched_unit.get('name')}, adFormat: {matched_unit.get('adFormat')}, platform: {matched_unit.get('platform')}")
-            return matched_unit
-        elif len(matching_units) > 1:
-            # If multiple matches, return first one (or could prioritize by platform)
-            logger.warning(f"[Unity] Multiple units found for format '{target_format}', returning first match")
-            return matching_units[0]
-        else:
-            logger.warning(f"[Unity] No matching units found for format '{target_format}' (target_format={target_format.lower()})")
-            return None
-    
-    # For Pangle, match by adType (numeric)
-    if network == "pangle":
-        # Pangle uses adType field (2: Banner, 5: Rewarded Video, 6: Interstitial)
-        matching_units = []
-        target_ad_type = target_format  # target_format is already the numeric adType from map_ad_format_to_network_format
-        logger.info(f"[Pangle] Finding unit: ad_format={ad_format}, target_format={target_format}, target_ad_type={target_ad_type} (type: {type(target_ad_type)})")
-        logger.info(f"[Pangle] Total units to check: {len(network_units)}")
-        
-        # Debug: Log all units' adType values
-        for idx, unit in enumerate(network_units):
-            unit_ad_type = unit.get("adType")
-            unit_name = unit.get("name", "N/A")
-            unit_slot_code = unit.get("slotCode") or unit.get("adSlotId", "N/A")
-            logger.info(f"[Pangle] Unit[{idx}]: name={unit_name}, slotCode={unit_slot_code}, adType={unit_ad_type} (type: {type(unit_ad_type)}), all_keys={list(unit.keys())}")
-        
-        for unit in network_units:
-            unit_ad_type = unit.get("adType")
-            unit_name = unit.get("name", "N/A")
-            
-            # Check if adType field exists
-            if unit_ad_type is None:
-                logger.warning(f"[Pangle] Unit '{unit_name}' has no 'adType' field. Available keys: {list(unit.keys())}")
-                continue
-            
-            logger.info(f"[Pangle] Checking unit: name={unit_name}, adType={unit_ad_type} (type: {type(unit_ad_type)})")
-            # Compare as integers if possible
-            try:
-                unit_ad_type_int = int(unit_ad_type)
-                target_ad_type_int = int(target_ad_type)
-                if unit_ad_type_int == target_ad_type_int:
-                    logger.info(f"[Pangle] ✓ Match found: {unit_name} (adType={unit_ad_type_int} == target={target_ad_type_int})")
-                    matching_units.append(unit)
-                else:
-                    logger.info(f"[Pangle] ✗ No match: {unit_name} (adType={unit_ad_type_int} != target={target_ad_type_int})")
-            except (ValueError, TypeError) as e:
-                # If conversion fails, skip
-                logger.warning(f"[Pangle] Cannot compare adType: {unit_name}, adType={unit_ad_type}, error={e}")
-                continue
-        
-        logger.info(f"[Pangle] Total matching units found: {len(matching_units)}")
-        
-        # If multiple matches and platform is provided, prioritize by platform indicator in name
-        if len(matching_units) > 1 and platform:
-            platform_normalized = platform.lower()
-            platform_indicator = "_aos_" if platform_normalized == "android" else "_ios_"
-            
-            for unit in matching_units:
-                slot_name = unit.get("name", "").lower()
-                if platform_indicator in slot_name:
-                    logger.info(f"[Pangle] Found unit with platform indicator '{platform_indicator}' in name: {unit.get('name')}")
-                    return unit
-            
-            # If no unit has platform indicator, return first match
-            logger.warning(f"[Pangle] Multiple units found for format '{target_format}' but none have platform indicator '{platform_indicator}' in name")
-            return matching_units[0] if matching_units else None
-        elif len(matching_units) == 1:
-            return matching_units[0]
-        else:
-            return None
+    matched_unit = get_unit_format_index(network, network_units).resolve(ad_format, platform)
+    if matched_unit:
+        record = UnitRecord.from_api(network, matched_unit)
+        logger.info(f"[{network}] Matched unit for format={ad_format}, platform={platform}: {record.name or record.unit_id}")
+    return matched_unit
+
+
+def find_matching_units(
+    network_units: List[Dict],
+    requests: List[Tuple[str, Optional[str]]],
+    network: str
+) -> List[Optional[Dict]]:
+    """Batch version of find_matching_unit
     
-    # For other networks or when platform is not provided, use simple format matching
-    for unit in network_units:
-        unit_format = unit.get("adFormat", "").lower()
-        if unit_format == target_format.lower():
-            return unit
+    Args:
+        network_units: List of ad units from network API
+        requests: List of (ad_format, platform) pairs
+        network: Network name
     
-    return None
+    Returns:
+        Matched unit (or None) per request, in request order
+    """
+    return get_unit_format_index(network, network_units).resolve_many(requests)
 
 
 def get_inmobi_units(app_id: str) -> List[Dict]:
@@ -1079,8 +936,7 @@ def get_inmobi_units(app_id: str) -> List[Dict]:
         masked_headers = {k: "***MASKED***" if k in ["x-client-secret"] else v for k, v in headers.items()}
         logger.info(f"[InMobi] Request Headers: {json.dumps(masked_headers, indent=2)}")
         
-        import requests
-        response = requests.get(url, headers=headers, params=params, timeout=30)
+        response = http_request("GET", url, headers=headers, params=params, timeout=30)
         
         logger.info(f"[InMobi] Response Status: {response.status_code}")
         
@@ -1180,8 +1036,7 @@ def get_mintegral_units(app_id: str) -> List[Dict]:
         masked_params = {k: '***MASKED***' if k in ['skey', 'sign'] else v for k, v in params.items()}
         logger.info(f"[Mintegral] Request Params: {json.dumps(masked_params, indent=2)}")
         
-        import requests
-        response = requests.get(url, params=params, timeout=30)
+        response = http_request("GET", url, params=params, timeout=30)
         
         logger.info(f"[Mintegral] Response Status: {response.status_code}")
         
@@ -1280,8 +1135,7 @@ def get_mintegral_units_by_placement(placement_id: int) -> List[Dict]:
         masked_params = {k: '***MASKED***' if k in ['skey', 'sign'] else v for k, v in params.items()}
         logger.info(f"[Mintegral] Request Params: {json.dumps(masked_params, indent=2)}")
         
-        import requests
-        response = requests.get(url, params=params, timeout=30)
+        response = http_request("GET", url, params=params, timeout=30)
         
         logger.info(f"[Mintegral] Response Status: {response.status_code}")
         
@@ -1368,8 +1222,7 @@ def get_fyber_units(app_id: str) -> List[Dict]:
         masked_headers = {k: "***MASKED***" if k.lower() == "authorization" else v for k, v in headers.items()}
         logger.info(f"[Fyber] Request Headers: {json.dumps(masked_headers, indent=2)}")
         
-        import requests
-        response = requests.get(url, headers=headers, params=params, timeout=30)
+        response = http_request("GET", url, headers=headers, params=params, timeout=30)
         
         logger.info(f"[Fyber] Response Status: {response.status_code}")
         
@@ -1468,8 +1321,7 @@ def get_bigoads_units(app_code: str) -> List[Dict]:
         masked_headers = {k: "***MASKED***" if k in ["X-BIGO-Sign"] else v for k, v in headers.items()}
         logger.info(f"[BigOAds] Request Headers: {json.dumps(masked_headers, indent=2)}")
         
-        import requests
-        response = requests.post(url, json=payload, headers=headers, timeout=30)
+        response = http_request("POST", url, operation="read", json=payload, headers=headers, timeout=30)
         
         logger.info(f"[BigOAds] Response Status: {response.status_code}")
         
@@ -1565,9 +1417,24 @@ def get_unity_projects() -> List[Dict]:
         return []
 
 
+def _vungle_placement_app_id(placement: Dict) -> Optional[str]:
+    """applicationId of a placement (application may be a dict or a JSON string)"""
+    app_info = placement.get("application", {})
+    if isinstance(app_info, str):
+        try:
+            app_info = json.loads(app_info)
+        except (json.JSONDecodeError, TypeError):
+            return None
+    return str(app_info.get("id")) if isinstance(app_info, dict) and app_info.get("id") is not None else None
+
+
 def get_vungle_units(app_id: Optional[str] = None) -> List[Dict]:
     """Get placements (units) for a Vungle app
     
+    Uses GET /placements?applicationId={appId}. If the server is seen ignoring the
+    filter, one full placement list is fetched and indexed by applicationId instead.
+    Results are cached per app for UNIT_CACHE_TTL_SECONDS.
+    
     Args:
         app_id: Optional applicationId to filter by (if None, returns all placements)
                Note: This should be the applicationId, not vungleAppId
@@ -1579,8 +1446,18 @@ def get_vungle_units(app_id: Optional[str] = None) -> List[Dict]:
         network_manager = get_network_manager()
         
         if app_id:
-            # Use GET /placements?applicationId={appId} API
-            placements = network_manager._get_vungle_placements_by_app_id(app_id)
+            cache = _unit_caches["vungle"]
+            placements = cache.get(app_id)
+            if placements is not None:
+                return placements
+            if network_manager.vungle_app_filter_ignored:
+                # Full list (conditional GET, active only) grouped by app
+                cache.put_grouped(get_vungle_placements(), _vungle_placement_app_id, [app_id])
+                placements = cache.get(app_id) or []
+            else:
+                # Use GET /placements?applicationId={appId} API
+                placements = network_manager._get_vungle_placements_by_app_id(app_id)
+                cache.put_grouped(placements, lambda placement: app_id, [app_id])
             logger.info(f"[Vungle] Retrieved {len(placements)} placements for applicationId={app_id}")
             return placements
         else:
@@ -1594,6 +1471,96 @@ def get_vungle_units(app_id: Optional[str] = None) -> List[Dict]:
         return []
 
 
+def get_pangle_units(app_code: Optional[str] = None) -> List[Dict]:
+    """Get ad units for a Pangle app
+    
+    The app_id filter is sent to the server; the response is grouped by appId
+    and cached, so later lookups for the same app (or apps included in a
+    prefetch) do not call the API.
+    
+    Args:
+        app_code: Pangle app ID (if empty, returns all ad units)
+    
+    Returns:
+        List of ad unit dicts
+    """
+    try:
+        network_manager = get_network_manager()
+        if not app_code:
+            return network_manager.get_units("pangle", "") or []
+        
+        cache = _unit_caches["pangle"]
+        units = cache.get(app_code)
+        if units is None:
+            units = network_manager.get_units("pangle", app_code)
+            if units is None:
+                # Failed request: not cached, so the next lookup retries
+                return []
+            cache.put_grouped(units, lambda unit: unit.get("appId"), [app_code])
+            units = cache.get(app_code) or []
+        return units
+    except Exception as e:
+        logger.error(f"[Pangle] Error getting units: {str(e)}")
+        return []
+
+
+def prefetch_pangle_units(applovin_units: List[Dict]) -> int:
+    """Resolve the Pangle apps of many AppLovin units and load their units in batched requests
+    
+    Args:
+        applovin_units: AppLovin unit dicts with name, platform, package_name
+    
+    Returns:
+        Number of apps loaded
+    """
+    with request_priority(BULK):
+        loaded = load_pangle_units(_resolve_matched_app_ids("pangle", applovin_units, "app_id"))
+    if loaded:
+        logger.info(f"[Pangle] Prefetched ad units for {loaded} apps")
+    return loaded
+
+
+def load_pangle_units(app_ids: List, refresh: bool = False) -> int:
+    """Load ad units of many Pangle apps into the unit cache (PANGLE_PREFETCH_BATCH apps per request)
+    
+    Args:
+        app_ids: Pangle app IDs
+        refresh: Refetch apps that are already cached
+    
+    Returns:
+        Number of apps loaded (apps of failed requests are not cached)
+    """
+    cache = _unit_caches["pangle"]
+    app_ids = [
+        str(app_id) for app_id in dict.fromkeys(app_ids)
+        if app_id not in (None, "") and (refresh or cache.get(app_id) is None)
+    ]
+    if not app_ids:
+        return 0
+    client = get_network_manager()._get_api("pangle")
+    loaded = 0
+    for start in range(0, len(app_ids), PANGLE_PREFETCH_BATCH):
+        chunk = app_ids[start:start + PANGLE_PREFETCH_BATCH]
+        units = client.get_units(app_codes=chunk)
+        if units is None:
+            logger.warning(f"[Pangle] Failed to load ad units for {len(chunk)} apps")
+            continue
+        cache.put_grouped(units, lambda unit: unit.get("appId"), chunk)
+        loaded += len(chunk)
+    return loaded
+
+
+def load_vungle_units() -> int:
+    """Load the full Vungle placement list into the unit cache, grouped by applicationId
+    
+    Returns:
+        Number of apps with placements
+    """
+    placements = get_vungle_placements()
+    _unit_caches["vungle"].put_grouped(placements, _vungle_placement_app_id)
+    return len({_vungle_placement_app_id(placement) for placement in placements} - {None})
+
+
 def get_unity_units(project_id: str) -> List[Dict]:
     """Get ad units for a Unity project
     
@@ -1670,9 +1637,7 @@ def get_network_units(network: str, app_code: str) -> List[Dict]:
     elif network == "unity":
         return get_unity_units(app_code)  # app_code is projectId for Unity
     elif network == "pangle":
-        # Use network_manager.get_units for Pangle
-        network_manager = get_network_manager()
-        return network_manager.get_units("pangle", app_code)
+        return get_pangle_units(app_code)
     
     logger.warning(f"[{network}] get_network_units not implemented yet")
     return []
@@ -1791,81 +1756,8 @@ def extract_app_identifiers(app: Dict, network: str) -> Dict[str, Optional[str]]
         network: Network name
     
     Returns:
-        Dict with app_id, app_key, app_code (network-specific)
+        Dict with app_id, app_key, app_code (network-specific; Unity adds projectId and stores)
     """
-    result = {
-        "app_id": None,
-        "app_key": None,
-        "app_code": None
-    }
-    
-    if network == "ironsource":
-        result["app_key"] = app.get("appKey")
-        result["app_code"] = app.get("appKey")  # For IronSource, appKey is the app code
-    elif network == "bigoads":
-        app_code = app.get("appCode")
-        # Handle "N/A" as None (from _get_bigoads_apps default value)
-        if app_code == "N/A" or not app_code:
-            app_code = None
-        result["app_code"] = app_code
-        result["app_id"] = app.get("appId")
-        # Debug logging for BigOAds
-        logger.info(f"[BigOAds] extract_app_identifiers: app keys={list(app.keys())}, appCode={app.get('appCode')}, extracted app_code={app_code}")
-    elif network == "inmobi":
-        result["app_id"] = app.get("appId") or app.get("id")
-        result["app_code"] = str(result["app_id"]) if result["app_id"] else None
-    elif network == "mintegral":
-        result["app_id"] = app.get("app_id") or app.get("id")
-        result["app_code"] = str(result["app_id"]) if result["app_id"] else None
-    elif network == "fyber":
-        # Fyber uses "id" field for appId
-        # Note: _get_fyber_apps converts to standard format with "appId" field
-        # But original API response uses "id" field
-        app_id_value = app.get("id") or app.get("appId")
-        
-        # Handle "N/A" as None (from _get_fyber_apps default value)
-        if app_id_value == "N/A" or app_id_value == "":
-            app_id_value = None
-        
-        result["app_id"] = app_id_value
-        result["app_code"] = str(app_id_value) if app_id_value else None
-        logger.info(f"[Fyber] extract_app_identifiers: app keys={list(app.keys())}, id={app.get('id')}, appId={app.get('appId')}, extracted app_id={app_id_value}")
-    elif network == "vungle":
-        # Vungle uses vungleAppId from application object
-        # match_applovin_unit_to_network returns app with "vungleAppId" and "appId" fields
-        # Priority: vungleAppId > appId > applicationId > id
-        vungle_app_id = app.get("vungleAppId") or app.get("appId") or app.get("applicationId") or app.get("id")
-        result["app_id"] = vungle_app_id
-        result["app_code"] = str(vungle_app_id) if vungle_app_id else None
-        # Debug logging for Vungle
-        logger.info(f"[Vungle] extract_app_identifiers: app keys={list(app.keys())}, vungleAppId={app.get('vungleAppId')}, appId={app.get('appId')}, extracted app_id={vungle_app_id}")
-    elif network == "unity":
-        # Unity uses gameId from stores (platform-specific)
-        # projectId is stored for reference, but gameId will be extracted based on platform
-        project_id = app.get("projectId") or app.get("id")
-        result["projectId"] = project_id  # Store projectId for reference
-        result["app_code"] = str(project_id) if project_id else None
-        
-        # Store stores info for later gameId extraction
-        stores_str = app.get("stores", "")
-        stores = None
-        if stores_str:
-            try:
-                import json
-                if isinstance(stores_str, str):
-                    stores = json.loads(stores_str)
-                else:
-                    stores = stores_str
-            except (json.JSONDecodeError, TypeError):
-                pass
-        
-        result["stores"] = stores  # Store stores for gameId extraction
-        result["app_id"] = project_id  # For now, use projectId (gameId will be extracted separately)
-    else:
-        # Generic fallback
-        result["app_code"] = app.get("appCode") or app.get("appKey") or app.get("appId")
-        result["app_id"] = app.get("appId") or app.get("id")
-        result["app_key"] = app.get("appKey")
-    
+    result = AppRecord.from_api(network, app).identifiers()
+    logger.info(f"[{network}] extract_app_identifiers: {result.get('app_code')} (app_id={result.get('app_id')}, app_key={result.get('app_key')})")
     return result
-
@@ -0,0 +1,261 @@
+"""Indexed fuzzy app-name matching for network app lists"""
+import copy
+import logging
+import math
+import re
+import threading
+from collections import defaultdict
+from typing import Callable, Dict, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+# AppLovin / 네트워크 앱 이름 끝에 붙는 플랫폼/포맷 접미사 (예: "Aim Master iOS RV")
+_PLATFORM_TOKENS = {"ios", "android", "aos", "iphone", "ipad"}
+_FORMAT_TOKENS = {"rv", "is", "bn", "rewarded", "interstitial", "banner"}
+_PUNCT_RE = re.compile(r"[^\w\s]+", re.UNICODE)
+_SPACE_RE = re.compile(r"\s+")
+
+# Score tiers (higher is better)
+SCORE_EXACT = 1.0
+SCORE_QUERY_IN_NAME = 0.9    # normalized query contained in app name
+SCORE_NAME_IN_QUERY = 0.7    # app name contained in normalized query
+FUZZY_MIN_SIMILARITY = 0.6   # trigram Dice coefficient threshold
+_FUZZY_WEIGHT = 0.6          # fuzzy matches always rank below containment
+
+
+def normalize_app_name(name: Optional[str]) -> str:
+    """Normalize an app name for matching
+
+    Lowercases, replaces punctuation with spaces and strips trailing
+    platform/format suffixes such as " iOS RV" or " Android".
+
+    Args:
+        name: Raw app name
+
+    Returns:
+        Normalized name ("" if nothing is left)
+    """
+    if not name:
+        return ""
+    text = _PUNCT_RE.sub(" ", str(name).lower())
+    tokens = _SPACE_RE.split(text.strip())
+    # 접미사는 "<platform> <format>" 또는 "<platform>" 형태로만 제거 (이름 전체를 지우지 않음)
+    if len(tokens) > 1 and tokens[-1] in _FORMAT_TOKENS and tokens[-2] in _PLATFORM_TOKENS:
+        tokens = tokens[:-2]
+    elif len(tokens) > 1 and tokens[-1] in _PLATFORM_TOKENS:
+        tokens = tokens[:-1]
+    return " ".join(t for t in tokens if t)
+
+
+def _trigrams(text: str) -> set:
+    """Return the set of character trigrams of a normalized string"""
+    if len(text) < 3:
+        return {text} if text else set()
+    return {text[i:i + 3] for i in range(len(text) - 2)}
+
+
+class AppNameIndex:
+    """Trigram inverted index over one network's app list
+
+    The index is built once per app list; lookups only touch the posting
+    lists of the query's rarest trigrams instead of scanning the whole account.
+    """
+
+    def __init__(
+        self,
+        apps: List[Dict],
+        name_getter: Optional[Callable[[Dict], str]] = None,
+        platform_getter: Optional[Callable[[Dict], str]] = None
+    ):
+        """
+        Args:
+            apps: Network app dicts
+            name_getter: Returns the display name of an app (default: name/appName)
+            platform_getter: Returns the normalized platform ("android"/"ios") of an app
+        """
+        self._name_getter = name_getter or (lambda app: app.get("name") or app.get("appName") or "")
+        self._platform_getter = platform_getter or (lambda app: str(app.get("platform", "")).lower())
+        self.apps = apps
+        self._names: List[str] = []
+        self._platforms: List[str] = []
+        self._gram_sets: List[frozenset] = []
+        self._exact: Dict[str, List[int]] = defaultdict(list)
+        self._grams: Dict[str, List[int]] = defaultdict(list)
+
+        for idx, app in enumerate(apps):
+            normalized = normalize_app_name(self._name_getter(app))
+            grams = frozenset(_trigrams(normalized))
+            self._names.append(normalized)
+            self._platforms.append(self._platform_getter(app) or "")
+            self._gram_sets.append(grams)
+            if not normalized:
+                continue
+            self._exact[normalized].append(idx)
+            for gram in grams:
+                self._grams[gram].append(idx)
+
+    def __len__(self) -> int:
+        return len(self.apps)
+
+    def _containing(self, normalized: str, query_grams: set) -> List[int]:
+        """Ids whose normalized name contains the query (rarest posting list first)"""
+        if len(normalized) < 3:
+            # trigram이 없는 짧은 query는 선형 탐색 (드문 경우)
+            return [idx for idx, name in enumerate(self._names) if name and normalized in name]
+        postings = sorted((self._grams.get(gram, []) for gram in query_grams), key=len)
+        if not postings or not postings[0]:
+            return []
+        candidates = set(postings[0])
+        for posting in postings[1:]:
+            candidates.intersection_update(posting)
+            if not candidates:
+                return []
+        return [idx for idx in candidates if normalized in self._names[idx]]
+
+    def _contained(self, normalized: str) -> List[int]:
+        """Ids whose normalized name is a substring of the query"""
+        ids = []
+        length = len(normalized)
+        seen = set()
+        for i in range(length):
+            for j in range(i + 1, length + 1):
+                sub = normalized[i:j]
+                if sub in seen:
+                    continue
+                seen.add(sub)
+                ids.extend(self._exact.get(sub, ()))
+        return ids
+
+    def _similar(self, query_grams: set, min_similarity: float) -> Dict[int, float]:
+        """Ids whose trigram Dice similarity with the query is >= min_similarity
+
+        Prefix filtering: a candidate must share at least
+        k = ceil(t*|q| / (2-t)) grams, so it has to appear in one of the
+        |q|-k+1 rarest query grams.
+        """
+        q_len = len(query_grams)
+        min_shared = max(1, math.ceil(min_similarity * q_len / (2 - min_similarity)))
+        rarest = sorted(query_grams, key=lambda gram: len(self._grams.get(gram, ())))
+        candidates = set()
+        for gram in rarest[:q_len - min_shared + 1]:
+            candidates.update(self._grams.get(gram, ()))
+        result = {}
+        for idx in candidates:
+            grams = self._gram_sets[idx]
+            similarity = 2.0 * len(query_grams & grams) / (q_len + len(grams))
+            if similarity >= min_similarity:
+                result[idx] = similarity
+        return result
+
+    def search(
+        self,
+        query: str,
+        platform: Optional[str] = None,
+        limit: int = 5,
+        min_similarity: Optional[float] = FUZZY_MIN_SIMILARITY,
+        name_in_query: bool = True
+    ) -> List[Tuple[Dict, float]]:
+        """Return ranked (app, score) candidates for a query name
+
+        Args:
+            query: App name to look up (normalized internally)
+            platform: Optional normalized platform filter ("android" or "ios")
+            limit: Maximum number of candidates
+            min_similarity: Minimum trigram similarity for fuzzy candidates (None disables fuzzy)
+            name_in_query: Also match apps whose name is contained in the query
+
+        Returns:
+            List of (app, score) sorted by score desc, then original list order
+        """
+        normalized = normalize_app_name(query)
+        if not normalized:
+            return []
+        target_platform = platform.lower() if platform else None
+
+        def platform_ok(idx: int) -> bool:
+            return target_platform is None or self._platforms[idx] == target_platform
+
+        scores: Dict[int, float] = {}
+        for idx in self._exact.get(normalized, ()):
+            if platform_ok(idx):
+                scores[idx] = SCORE_EXACT
+
+        if len(scores) < limit:
+            query_grams = _trigrams(normalized)
+            for idx in self._containing(normalized, query_grams):
+                if idx not in scores and platform_ok(idx):
+                    scores[idx] = SCORE_QUERY_IN_NAME + 0.09 * len(normalized) / len(self._names[idx])
+            if name_in_query:
+                for idx in self._contained(normalized):
+                    if idx not in scores and platform_ok(idx):
+                        scores[idx] = SCORE_NAME_IN_QUERY + 0.09 * len(self._names[idx]) / len(normalized)
+            if min_similarity is not None and len(scores) < limit and len(normalized) >= 3:
+                for idx, similarity in self._similar(query_grams, min_similarity).items():
+                    if idx not in scores and platform_ok(idx):
+                        scores[idx] = _FUZZY_WEIGHT * similarity
+
+        ranked = sorted(scores.items(), key=lambda item: (-item[1], item[0]))
+        return [(self.apps[idx], round(score, 4)) for idx, score in ranked[:limit]]
+
+    def best_match(self, query: str, platform: Optional[str] = None, **kwargs) -> Optional[Tuple[Dict, float]]:
+        """Return the top (app, score) candidate or None"""
+        results = self.search(query, platform=platform, limit=1, **kwargs)
+        return results[0] if results else None
+
+
+# network -> (fingerprint, AppNameIndex)
+_index_cache: Dict[str, Tuple[Tuple, AppNameIndex]] = {}
+_index_lock = threading.Lock()
+
+
+def _apps_fingerprint(apps: List[Dict], name_getter: Callable[[Dict], str]) -> Tuple:
+    """Cheap fingerprint so the index is rebuilt only when the app list changes"""
+    return (len(apps), hash(tuple((name_getter(app), str(app.get("platform", ""))) for app in apps)))
+
+
+def get_app_name_index(
+    network: str,
+    apps: List[Dict],
+    name_getter: Optional[Callable[[Dict], str]] = None,
+    platform_getter: Optional[Callable[[Dict], str]] = None
+) -> AppNameIndex:
+    """Get the cached AppNameIndex for a network, rebuilding it if the app list changed
+
+    Args:
+        network: Network name (cache key)
+        apps: Current app list for the network
+        name_getter: Optional name accessor (see AppNameIndex)
+        platform_getter: Optional normalized platform accessor (see AppNameIndex)
+
+    Returns:
+        AppNameIndex for the given apps
+    """
+    with _index_lock:
+        cached = _index_cache.get(network)
+    # Keyed on content (names and platforms), so a list changed in place is re-indexed
+    getter = name_getter or (lambda app: app.get("name") or app.get("appName") or "")
+    fingerprint = _apps_fingerprint(apps, getter)
+    if cached and cached[0] == fingerprint:
+        index = cached[1]
+        if index.apps is not apps:
+            # Equal content from a new fetch: reuse the index for the new list object
+            index = copy.copy(index)
+            index.apps = apps
+            with _index_lock:
+                _index_cache[network] = (fingerprint, index)
+        return index
+    index = AppNameIndex(apps, name_getter=getter, platform_getter=platform_getter)
+    with _index_lock:
+        _index_cache[network] = (fingerprint, index)
+    logger.info(f"[{network}] Built app name index for {len(apps)} apps")
+    return index
+
+
+def clear_app_name_index(network: Optional[str] = None):
+    """Drop cached indexes (all networks if network is None)"""
+    with _index_lock:
+        if network is None:
+            _index_cache.clear()
+        else:
+            _index_cache.pop(network, None)
+
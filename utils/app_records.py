@@ -0,0 +1,254 @@
+"""Normalized app/unit records built from the app/unit dicts network clients return"""
+import json
+import logging
+from collections import defaultdict
+from typing import Dict, Iterator, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+# Placeholder values some clients put in place of a missing id
+_MISSING_VALUES = (None, "", "N/A")
+
+# Source keys per normalized app field, in priority order
+#   app_code: None means str(app_id)
+_DEFAULT_APP_KEYS = {
+    "app_code": ("appCode", "appKey", "appId"),
+    "app_id": ("appId", "id"),
+    "app_key": ("appKey",),
+    "name": ("name", "appName", "app_name"),
+    "package_name": ("pkgName", "packageName", "bundleId", "package", "pkgNameDisplay"),
+    "platform": ("platform",),
+}
+NETWORK_APP_KEYS: Dict[str, Dict[str, Optional[Tuple[str, ...]]]] = {
+    "ironsource": {"app_code": ("appKey",), "app_id": (), "app_key": ("appKey",)},
+    "bigoads": {"app_code": ("appCode",), "app_id": ("appId",), "app_key": ()},
+    "inmobi": {"app_code": None, "app_id": ("appId", "id"), "app_key": ()},
+    "mintegral": {"app_code": None, "app_id": ("app_id", "id"), "app_key": ()},
+    "fyber": {"app_code": None, "app_id": ("id", "appId"), "app_key": (),
+              "package_name": ("bundle", "bundleId", "packageName")},
+    "vungle": {"app_code": None, "app_id": ("vungleAppId", "appId", "applicationId", "id"), "app_key": (),
+               "package_name": ("storeId", "packageName", "bundleId")},
+    # Unity package names live in stores (one project = both platforms)
+    "unity": {"app_code": None, "app_id": ("projectId", "id"), "app_key": (), "package_name": ()},
+}
+
+# Source keys per normalized unit field, in priority order
+UNIT_KEYS = {
+    "unit_id": ("slotCode", "placementId", "placement_id", "mediationAdUnitId", "adUnitId", "instanceId", "id"),
+    "name": ("name", "slotName", "placementName", "placement_name", "mediationAdUnitName", "instanceName"),
+    "app_code": ("appCode", "appKey", "appId", "app_id"),
+    "ad_format": ("adFormat", "adType", "ad_type", "placementType", "type"),
+}
+
+
+def normalize_platform(platform, network: Optional[str] = None) -> str:
+    """Normalize a platform value from any network to "android" / "ios"
+
+    Args:
+        platform: Platform value from API (e.g., "ANDROID", "iOS", 1, 2)
+        network: Network name (BigOAds uses 1/2)
+
+    Returns:
+        "android", "ios", or the lowercased input if unknown
+    """
+    if not platform:
+        return ""
+    platform_str = str(platform).strip()
+    platform_lower = platform_str.lower()
+    if network == "bigoads" and platform_str.isdigit():
+        if platform_str == "1":
+            return "android"
+        if platform_str == "2":
+            return "ios"
+    if platform_lower in ("android", "and", "aos", "1", "google"):
+        return "android"
+    if platform_lower in ("ios", "iphone", "iphoneos", "2", "apple"):
+        return "ios"
+    return platform_lower
+
+
+def _first(data: Dict, keys: Tuple[str, ...]):
+    for key in keys:
+        value = data.get(key)
+        if value not in _MISSING_VALUES:
+            return value
+    return None
+
+
+def parse_unity_stores(stores) -> Dict:
+    """Parse Unity project stores (JSON string or dict) -> {"apple": {...}, "google": {...}}"""
+    if isinstance(stores, dict):
+        return stores
+    if not stores:
+        return {}
+    try:
+        parsed = json.loads(stores)
+    except (json.JSONDecodeError, TypeError):
+        logger.warning(f"[Unity] Failed to parse stores JSON: {stores}")
+        return {}
+    return parsed if isinstance(parsed, dict) else {}
+
+
+class AppRecord:
+    """One network app with normalized identifiers
+
+    Network-specific fields that are not normalized stay in `extras`.
+    """
+
+    __slots__ = ("network", "app_code", "app_id", "app_key", "name", "package_name", "platform", "extras")
+
+    def __init__(self, network: str, app_code: Optional[str] = None, app_id=None, app_key: Optional[str] = None,
+                 name: str = "", package_name: str = "", platform: str = "", extras: Optional[Dict] = None):
+        self.network = network
+        self.app_code = app_code
+        self.app_id = app_id
+        self.app_key = app_key
+        self.name = name
+        self.package_name = package_name
+        self.platform = platform
+        self.extras = extras or {}
+
+    @classmethod
+    def from_api(cls, network: str, app: Dict) -> "AppRecord":
+        """Build a record from an app dict returned by a network client"""
+        keys = {**_DEFAULT_APP_KEYS, **NETWORK_APP_KEYS.get(network, {})}
+        app_id = _first(app, keys["app_id"])
+        if keys["app_code"] is None:
+            app_code = str(app_id) if app_id is not None else None
+        else:
+            app_code = _first(app, keys["app_code"])
+        consumed = set()
+        for field_keys in keys.values():
+            consumed.update(field_keys or ())
+        return cls(
+            network=network,
+            app_code=app_code,
+            app_id=app_id,
+            app_key=_first(app, keys["app_key"]),
+            name=_first(app, keys["name"]) or "",
+            package_name=_first(app, keys["package_name"]) or "",
+            platform=normalize_platform(app.get("platform", ""), network),
+            extras={key: value for key, value in app.items() if key not in consumed}
+        )
+
+    def identifiers(self) -> Dict[str, Optional[str]]:
+        """app_id / app_key / app_code (plus projectId/stores for Unity)"""
+        result = {"app_id": self.app_id, "app_key": self.app_key, "app_code": self.app_code}
+        if self.network == "unity":
+            result["projectId"] = self.app_id
+            result["stores"] = parse_unity_stores(self.extras.get("stores")) or None
+        return result
+
+    def __repr__(self) -> str:
+        return f"AppRecord({self.network!r}, app_code={self.app_code!r}, name={self.name!r}, platform={self.platform!r})"
+
+
+class UnitRecord:
+    """One network ad unit / placement with normalized fields"""
+
+    __slots__ = ("network", "unit_id", "name", "app_code", "ad_format", "extras")
+
+    def __init__(self, network: str, unit_id=None, name: str = "", app_code=None, ad_format=None,
+                 extras: Optional[Dict] = None):
+        self.network = network
+        self.unit_id = unit_id
+        self.name = name
+        self.app_code = app_code
+        self.ad_format = ad_format
+        self.extras = extras or {}
+
+    @classmethod
+    def from_api(cls, network: str, unit: Dict) -> "UnitRecord":
+        """Build a record from a unit dict returned by a network client"""
+        consumed = {key for keys in UNIT_KEYS.values() for key in keys}
+        return cls(
+            network=network,
+            unit_id=_first(unit, UNIT_KEYS["unit_id"]),
+            name=_first(unit, UNIT_KEYS["name"]) or "",
+            app_code=_first(unit, UNIT_KEYS["app_code"]),
+            ad_format=_first(unit, UNIT_KEYS["ad_format"]),
+            extras={key: value for key, value in unit.items() if key not in consumed}
+        )
+
+    def __repr__(self) -> str:
+        return f"UnitRecord({self.network!r}, unit_id={self.unit_id!r}, name={self.name!r}, ad_format={self.ad_format!r})"
+
+
+class AppRecordBatch:
+    """Columnar form of one fetched app list
+
+    Keeps one list per normalized field plus a package-name index, so matching
+    loops read plain columns instead of probing alternative keys per app.
+    `apps` is the original list; row i of every column describes apps[i].
+    """
+
+    __slots__ = ("network", "apps", "app_codes", "app_ids", "app_keys", "names", "package_names", "platforms",
+                 "_by_package")
+
+    def __init__(self, network: str, apps: List[Dict]):
+        self.network = network
+        self.apps = apps
+        self.app_codes: List[Optional[str]] = []
+        self.app_ids: List = []
+        self.app_keys: List[Optional[str]] = []
+        self.names: List[str] = []
+        self.package_names: List[str] = []
+        self.platforms: List[str] = []
+        # lowercased package name -> [(row, platform)] in list order
+        self._by_package: Dict[str, List[Tuple[int, str]]] = defaultdict(list)
+
+        for row, app in enumerate(apps):
+            record = AppRecord.from_api(network, app)
+            self.app_codes.append(record.app_code)
+            self.app_ids.append(record.app_id)
+            self.app_keys.append(record.app_key)
+            self.names.append(record.name)
+            self.package_names.append(record.package_name)
+            self.platforms.append(record.platform)
+            if network == "unity":
+                stores = parse_unity_stores(record.extras.get("stores"))
+                for store, store_platform in (("apple", "ios"), ("google", "android")):
+                    store_id = (stores.get(store) or {}).get("storeId")
+                    if store_id:
+                        self._by_package[str(store_id).lower()].append((row, store_platform))
+            elif record.package_name:
+                self._by_package[str(record.package_name).lower()].append((row, record.platform))
+
+    def __len__(self) -> int:
+        return len(self.apps)
+
+    def __iter__(self) -> Iterator[AppRecord]:
+        for row in range(len(self.apps)):
+            yield self.record(row)
+
+    def record(self, row: int) -> AppRecord:
+        """Row as an AppRecord (rebuilt from the source dict, so extras such as Unity stores are kept)"""
+        return AppRecord.from_api(self.network, self.apps[row])
+
+    def find_by_package(self, package_name: str, platform: Optional[str] = None) -> Optional[int]:
+        """Row of the first app with this package name (case-insensitive), or None
+
+        Args:
+            package_name: Package name / bundle id / store id
+            platform: Optional platform filter ("android" or "ios")
+        """
+        if not package_name:
+            return None
+        target_platform = normalize_platform(platform, self.network) if platform else None
+        for row, app_platform in self._by_package.get(package_name.lower().strip(), ()):
+            if target_platform is None or app_platform == target_platform:
+                return row
+        return None
+
+
+# Last batch per network (reused while the same app list object is passed)
+_app_record_batches: Dict[str, AppRecordBatch] = {}
+
+
+def get_app_record_batch(network: str, apps: List[Dict]) -> AppRecordBatch:
+    """Get the columnar batch for a fetched app list (built once per list)"""
+    batch = _app_record_batches.get(network)
+    if batch is None or batch.apps is not apps or len(batch) != len(apps):
+        batch = AppRecordBatch(network, apps)
+        _app_record_batches[network] = batch
+    return batch
@@ -1,17 +1,16 @@
 """Helper functions for App Store information retrieval"""
+import importlib.util
 import requests
 import re
-from typing import Optional
+import time
+from concurrent.futures import ThreadPoolExecutor, TimeoutError as FuturesTimeoutError, as_completed
+from typing import Iterator, Optional, Tuple
 
-# google-play-scraper 라이브러리 import (선택적)
-try:
-    from google_play_scraper import app
-    PLAY_STORE_AVAILABLE = True
-except ImportError:
-    PLAY_STORE_AVAILABLE = False
+# google-play-scraper 라이브러리 (선택적) - 설치 여부만 확인하고 import는 첫 조회 시 수행
+PLAY_STORE_AVAILABLE = importlib.util.find_spec("google_play_scraper") is not None
 
 
-def get_ios_app_details(app_store_url: str) -> Optional[dict]:
+def get_ios_app_details(app_store_url: str, timeout: float = 30) -> Optional[dict]:
     """Extract app details from App Store URL - 필요한 필드만: name, app_id, bundle_id, icon_url, developer, category"""
     match = re.search(r'/id(\d+)', app_store_url)
     if not match:
@@ -21,7 +20,7 @@ def get_ios_app_details(app_store_url: str) -> Optional[dict]:
     itunes_url = f"https://itunes.apple.com/lookup?id={app_id}"
     
     try:
-        response = requests.get(itunes_url, timeout=30)
+        response = requests.get(itunes_url, timeout=timeout)
         
         if response.status_code == 200:
             data = response.json()
@@ -62,6 +61,7 @@ def get_android_app_details(play_store_url: str) -> Optional[dict]:
     package_name = match.group(1)
     
     try:
+        from google_play_scraper import app
         result = app(package_name, lang='en', country='us')
         
         # google_play_scraper는 딕셔너리를 반환합니다
@@ -93,3 +93,58 @@ def get_android_app_details(play_store_url: str) -> Optional[dict]:
         else:
             raise Exception(f"오류 발생: {error_msg}")
 
+
+def fetch_store_details_concurrently(
+    ios_url: Optional[str],
+    android_url: Optional[str],
+    timeout: float = 20.0
+) -> Iterator[Tuple[str, Optional[dict], Optional[str]]]:
+    """Fetch iOS and Android store details in parallel under one shared timeout budget
+    
+    Yields each platform as soon as it returns so the caller can render partial
+    results. Streamlit calls must stay in the caller (main thread).
+    
+    The iOS lookup gets the budget as its HTTP timeout. google-play-scraper has no
+    timeout option, so an Android lookup that overruns the budget is reported as a
+    timeout but its worker thread keeps running in the background until the
+    scraper returns (cancel_futures only drops futures that have not started).
+    
+    Args:
+        ios_url: App Store URL (skipped if empty)
+        android_url: Google Play Store URL (skipped if empty)
+        timeout: Total time budget in seconds shared by both platforms
+    
+    Yields:
+        (platform, details, error) - platform is "ios" or "android";
+        details is None when not found or on error; error is the error message or None
+    """
+    tasks = {}
+    if ios_url:
+        tasks["ios"] = (get_ios_app_details, ios_url, {"timeout": timeout})
+    if android_url:
+        tasks["android"] = (get_android_app_details, android_url, {})
+    if not tasks:
+        return
+    
+    deadline = time.monotonic() + timeout
+    executor = ThreadPoolExecutor(max_workers=len(tasks))
+    futures = {
+        executor.submit(func, url, **kwargs): platform
+        for platform, (func, url, kwargs) in tasks.items()
+    }
+    pending = set(futures)
+    try:
+        for future in as_completed(futures, timeout=max(0.0, deadline - time.monotonic())):
+            pending.discard(future)
+            platform = futures[future]
+            try:
+                yield platform, future.result(), None
+            except Exception as e:
+                yield platform, None, str(e)
+    except FuturesTimeoutError:
+        for future in pending:
+            yield futures[future], None, f"시간 초과: {timeout:.0f}초 안에 응답이 없습니다."
+    finally:
+        # 남은 작업은 기다리지 않음 (응답이 늦은 스토어가 전체 UI를 막지 않도록)
+        # 이미 실행 중인 Play 스크레이퍼는 중단할 수 없어 응답이 올 때까지 스레드가 남음
+        executor.shutdown(wait=False, cancel_futures=True)
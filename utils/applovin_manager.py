@@ -5,6 +5,7 @@ import json
 import logging
 import pandas as pd
 from utils.helpers import get_env_var
+from utils.http_json import request as http_request
 
 logger = logging.getLogger(__name__)
 
@@ -298,7 +299,8 @@ def update_ad_unit_settings(
         logger.info(f"[AppLovin] API Request: POST {url}")
         logger.info(f"[AppLovin] Request Payload: {json.dumps(data, indent=2)}")
         
-        response = requests.post(
+        response = http_request(
+            "POST",
             url,
             headers=headers,
             data=json.dumps(data),
@@ -390,7 +392,8 @@ def get_ad_units(api_key: str) -> Tuple[bool, Dict]:
     try:
         logger.info(f"[AppLovin] API Request: GET {url}")
         
-        response = requests.get(
+        response = http_request(
+            "GET",
             url,
             headers=headers,
             timeout=30
@@ -440,7 +443,8 @@ def get_ad_unit_details(api_key: str, ad_unit_id: str) -> Tuple[bool, Dict]:
     try:
         logger.info(f"[AppLovin] API Request: GET {url}")
         
-        response = requests.get(
+        response = http_request(
+            "GET",
             url,
             headers=headers,
             timeout=30
@@ -0,0 +1,226 @@
+"""Client-side dedup keys and a local ledger for app/unit create calls"""
+import hashlib
+import json
+import logging
+import os
+import threading
+import time
+from typing import Dict, Optional, Set
+
+from utils.app_records import normalize_platform
+from utils.helpers import get_env_var
+
+logger = logging.getLogger(__name__)
+
+# Ledger file (override with CREATE_LEDGER_PATH)
+DEFAULT_LEDGER_PATH = os.path.join(os.path.expanduser("~"), ".ad-network-hub", "create_ledger.json")
+
+# Completed creates are remembered this long
+LEDGER_TTL_SECONDS = 7 * 24 * 60 * 60
+
+STATE_PENDING = "pending"
+STATE_DONE = "done"
+STATE_INFLIGHT = "inflight"  # returned by claim() while a concurrent create of the key runs
+
+# Payload keys per dedup field, in priority order (payload shapes differ by network)
+DEDUP_FIELD_KEYS = {
+    # Vungle placements carry their app in "application", Pangle ad units in "site_id"
+    "parent": ("appKey", "appCode", "appId", "app_id", "application", "site_id"),
+    "platform": ("platform", "os"),
+    "store_id": ("pkgName", "package", "packageName", "package_name", "bundleId", "bundle",
+                 "storeUrl", "store_url", "download_url", "itunesId", "store", "stores"),
+    "slot_type": ("adFormat", "ad_format", "adType", "ad_type", "ad_slot_type", "placementType", "ad_space_type", "type"),
+    "name": ("name", "appName", "app_name", "mediationAdUnitName", "placementName", "placement_name"),
+}
+
+
+def is_dedup_enabled() -> bool:
+    """Whether create calls are deduplicated (on unless CREATE_DEDUP=false)"""
+    return str(get_env_var("CREATE_DEDUP") or "").lower() not in ("0", "false", "no")
+
+
+def _field_value(payload: Dict, keys) -> str:
+    for key in keys:
+        value = payload.get(key)
+        if value in (None, "", [], {}):
+            continue
+        if isinstance(value, dict):
+            # Vungle "store": {"id": ...}; Unity "stores": {"apple": {...}, "google": {...}}
+            value = value.get("id") or json.dumps(value, sort_keys=True, default=str)
+        return str(value).strip()
+    return ""
+
+
+def dedup_fields(network: str, kind: str, payload: Dict, app_key: Optional[str] = None) -> Dict[str, str]:
+    """Identifying fields of a create payload: network, kind, parent app, platform, store ID, slot type, name"""
+    fields = {"network": network, "kind": kind}
+    for field, keys in DEDUP_FIELD_KEYS.items():
+        fields[field] = _field_value(payload or {}, keys)
+    if app_key:
+        fields["parent"] = str(app_key)
+    fields["platform"] = normalize_platform(fields["platform"], network)
+    fields["name"] = fields["name"].lower()
+    return fields
+
+
+def create_dedup_key(network: str, kind: str, payload: Dict, app_key: Optional[str] = None) -> Optional[str]:
+    """Deterministic dedup key for a create call
+
+    Args:
+        network: Network name
+        kind: "app" or "unit"
+        payload: Create payload
+        app_key: Parent app key passed next to the payload (IronSource units)
+
+    Returns:
+        "<network>:<kind>:<hash>", or None if the payload has nothing identifying
+        (apps need a name or store ID, units a name and a parent app)
+    """
+    fields = dedup_fields(network, kind, payload, app_key)
+    if kind == "app" and not (fields["name"] or fields["store_id"]):
+        return None
+    if kind == "unit" and not (fields["name"] and fields["parent"]):
+        return None
+    digest = hashlib.sha1(json.dumps(fields, sort_keys=True).encode("utf-8")).hexdigest()[:20]
+    return f"{network}:{kind}:{digest}"
+
+
+class CreateLedger:
+    """Local record of create calls by dedup key (JSON file, thread-safe)
+
+    claim() before calling the API, then complete() on success or release()
+    otherwise. A second claim of the same key while the first one runs is
+    refused right away (double-click, rerun during a spinner). A key left
+    pending (timeout, crash, outcome unknown) is reported as unknown so the
+    caller can check the network's inventory before creating again.
+    """
+
+    def __init__(self, path: Optional[str] = None, ttl: float = LEDGER_TTL_SECONDS):
+        self.path = path
+        self.ttl = ttl
+        self._lock = threading.Lock()
+        self._inflight: Set[str] = set()
+        self._entries: Dict[str, Dict] = self._load()
+
+    def _load(self) -> Dict[str, Dict]:
+        if not self.path or not os.path.isfile(self.path):
+            return {}
+        try:
+            with open(self.path, "r", encoding="utf-8") as f:
+                entries = json.load(f)
+        except (OSError, ValueError) as e:
+            logger.warning(f"[CreateLedger] Failed to read {self.path}: {str(e)}")
+            return {}
+        now = time.time()
+        return {
+            key: entry for key, entry in entries.items()
+            if isinstance(entry, dict) and now - entry.get("updated", 0) <= self.ttl
+        }
+
+    def _save_locked(self):
+        if not self.path:
+            return
+        try:
+            os.makedirs(os.path.dirname(self.path), exist_ok=True)
+            tmp_path = f"{self.path}.tmp"
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                json.dump(self._entries, f, ensure_ascii=False, default=str)
+            os.replace(tmp_path, self.path)
+        except OSError as e:
+            logger.warning(f"[CreateLedger] Failed to write {self.path}: {str(e)}")
+
+    def _get_locked(self, key: str) -> Optional[Dict]:
+        entry = self._entries.get(key)
+        if entry is not None and time.time() - entry.get("updated", 0) > self.ttl:
+            del self._entries[key]
+            return None
+        return entry
+
+    def claim(self, key: str, fields: Optional[Dict] = None) -> Optional[Dict]:
+        """Reserve a key before its create call
+
+        Returns:
+            None: go ahead and create (complete/release must follow)
+            {"state": "done", "response": ...}: already created
+            {"state": "pending", ...}: an earlier attempt's outcome is unknown; the key
+                is reserved, so check inventory, then create or complete/release
+            {"state": "inflight"}: another create of the key is still running (not reserved)
+        """
+        with self._lock:
+            entry = self._get_locked(key)
+            if entry is not None and entry["state"] == STATE_DONE:
+                return entry
+            if key in self._inflight:
+                logger.info(f"[CreateLedger] Create {key} is already in flight")
+                return {"state": STATE_INFLIGHT}
+            self._inflight.add(key)
+            self._entries[key] = {"state": STATE_PENDING, "fields": fields or {}, "updated": time.time()}
+            self._save_locked()
+            return entry
+
+    def complete(self, key: str, response: Dict):
+        """Record a successful create"""
+        with self._lock:
+            entry = self._entries.get(key) or {}
+            self._entries[key] = {
+                "state": STATE_DONE,
+                "fields": entry.get("fields", {}),
+                "response": response,
+                "updated": time.time(),
+            }
+            self._save_locked()
+            self._inflight.discard(key)
+
+    def release(self, key: str, outcome_unknown: bool = False):
+        """Release a claim after a failed create (kept pending if the call may have gone through)"""
+        with self._lock:
+            if not outcome_unknown:
+                self._entries.pop(key, None)
+            self._save_locked()
+            self._inflight.discard(key)
+
+    def forget(self, key: str):
+        """Drop a key (e.g., the created app/unit was deleted and should be created again)"""
+        with self._lock:
+            if self._entries.pop(key, None) is not None:
+                self._save_locked()
+
+    def forget_units(self, network: str, parent: str) -> int:
+        """Drop the network's unit entries under a parent app (its units were deactivated or archived)
+
+        Returns:
+            Number of entries dropped
+        """
+        parent = str(parent or "")
+        if not parent:
+            return 0
+        with self._lock:
+            keys = [
+                key for key, entry in self._entries.items()
+                if (entry.get("fields") or {}).get("network") == network
+                and entry["fields"].get("kind") == "unit"
+                and entry["fields"].get("parent") == parent
+                and key not in self._inflight
+            ]
+            for key in keys:
+                del self._entries[key]
+            if keys:
+                self._save_locked()
+        return len(keys)
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+_create_ledger: Optional[CreateLedger] = None
+_create_ledger_lock = threading.Lock()
+
+
+def get_create_ledger() -> CreateLedger:
+    """Get the process-wide create ledger"""
+    global _create_ledger
+    if _create_ledger is None:
+        with _create_ledger_lock:
+            if _create_ledger is None:
+                _create_ledger = CreateLedger(get_env_var("CREATE_LEDGER_PATH") or DEFAULT_LEDGER_PATH)
+    return _create_ledger
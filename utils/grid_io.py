@@ -0,0 +1,168 @@
+"""Columnar (Parquet/Arrow) import and export for the Update Ad Unit grid"""
+import io
+import logging
+import os
+import re
+from datetime import datetime
+from typing import Dict, List, Optional
+
+import pandas as pd
+
+from utils.helpers import get_env_var
+
+logger = logging.getLogger(__name__)
+
+# Optional columnar backend (CSV only without it)
+try:
+    import pyarrow as pa
+    import pyarrow.feather as feather
+    import pyarrow.parquet as pq
+except ImportError:
+    pa = None
+
+ARROW_AVAILABLE = pa is not None
+
+GRID_COLUMNS = [
+    "id", "name", "platform", "ad_format", "package_name",
+    "ad_network", "ad_network_app_id", "ad_network_app_key", "ad_unit_id",
+    "countries_type", "countries", "cpm",
+    "segment_name", "segment_id", "disabled"
+]
+
+# Low-cardinality columns stored as categoricals; the editor's selectbox options are
+# always included so edits never introduce an unknown category
+CATEGORICAL_COLUMNS = {
+    "platform": ["android", "ios"],
+    "ad_format": ["BANNER", "INTER", "REWARD"],
+    "ad_network": [],
+    "countries_type": ["", "INCLUDE", "EXCLUDE"],
+    "disabled": ["FALSE", "TRUE"],
+}
+
+# Saved runs (Arrow IPC files, read back memory-mapped)
+DEFAULT_RUNS_DIR = os.path.join(os.path.expanduser("~"), ".ad-network-hub", "update_grid_runs")
+MAX_SAVED_RUNS = 20
+
+FILE_TYPES = ["parquet", "arrow", "feather", "csv"] if ARROW_AVAILABLE else ["csv"]
+
+
+def optimize_grid_dtypes(df: pd.DataFrame) -> pd.DataFrame:
+    """Cast grid columns to compact dtypes (categoricals, string, float cpm)
+
+    Args:
+        df: Grid DataFrame (any dtypes, e.g. all-object from CSV)
+
+    Returns:
+        New DataFrame with GRID_COLUMNS first (missing ones added empty)
+    """
+    df = df.copy()
+    for column in GRID_COLUMNS:
+        if column not in df.columns:
+            df[column] = pd.Series(dtype="float64" if column == "cpm" else "string", index=df.index)
+    for column in GRID_COLUMNS:
+        if column == "cpm":
+            df[column] = pd.to_numeric(df[column], errors="coerce")
+        elif column in CATEGORICAL_COLUMNS:
+            values = df[column].astype("string")
+            observed = [value for value in values.dropna().unique() if value not in CATEGORICAL_COLUMNS[column]]
+            df[column] = pd.Categorical(values, categories=CATEGORICAL_COLUMNS[column] + sorted(observed))
+        else:
+            df[column] = df[column].astype("string")
+    extra = [column for column in df.columns if column not in GRID_COLUMNS]
+    return df[GRID_COLUMNS + extra]
+
+
+def export_grid(df: pd.DataFrame, file_type: str) -> bytes:
+    """Serialize the grid
+
+    Args:
+        df: Grid DataFrame
+        file_type: "parquet", "arrow"/"feather" (Arrow IPC) or "csv"
+
+    Returns:
+        File content
+    """
+    if file_type == "csv":
+        return df.to_csv(index=False).encode("utf-8-sig")
+    if not ARROW_AVAILABLE:
+        raise RuntimeError("pyarrow is required for Parquet/Arrow export")
+    table = pa.Table.from_pandas(optimize_grid_dtypes(df), preserve_index=False)
+    sink = io.BytesIO()
+    if file_type == "parquet":
+        pq.write_table(table, sink, compression="zstd")
+    else:
+        feather.write_feather(table, sink, compression="zstd")
+    return sink.getvalue()
+
+
+def import_grid(data: bytes, file_name: str) -> pd.DataFrame:
+    """Load a grid file (type from the extension) with compact dtypes"""
+    extension = os.path.splitext(file_name)[1].lower().lstrip(".")
+    if extension == "csv":
+        # Everything is read as text; optimize_grid_dtypes assigns the real dtypes
+        df = pd.read_csv(io.BytesIO(data), dtype=str, keep_default_na=False, encoding="utf-8-sig")
+    elif not ARROW_AVAILABLE:
+        raise RuntimeError("pyarrow is required to read Parquet/Arrow files")
+    elif extension == "parquet":
+        df = pq.read_table(pa.BufferReader(data)).to_pandas()
+    elif extension in ("arrow", "feather"):
+        df = feather.read_table(pa.BufferReader(data)).to_pandas()
+    else:
+        raise ValueError(f"Unsupported file type: {file_name}")
+    return optimize_grid_dtypes(df)
+
+
+def _runs_dir() -> str:
+    return get_env_var("UPDATE_GRID_RUNS_DIR") or DEFAULT_RUNS_DIR
+
+
+def save_grid_run(df: pd.DataFrame, label: str = "") -> Optional[str]:
+    """Save the grid as an Arrow IPC file for later runs (oldest runs pruned)
+
+    Returns:
+        File path, or None if pyarrow is not installed
+    """
+    if not ARROW_AVAILABLE:
+        return None
+    runs_dir = _runs_dir()
+    os.makedirs(runs_dir, exist_ok=True)
+    slug = re.sub(r"[^A-Za-z0-9_-]+", "_", label).strip("_")[:40]
+    file_name = f"{datetime.now().strftime('%Y%m%d_%H%M%S')}{'_' + slug if slug else ''}.arrow"
+    path = os.path.join(runs_dir, file_name)
+    # Uncompressed so reads can be memory-mapped without decompression
+    feather.write_feather(pa.Table.from_pandas(optimize_grid_dtypes(df), preserve_index=False), path,
+                          compression="uncompressed")
+    for old in list_grid_runs()[MAX_SAVED_RUNS:]:
+        try:
+            os.remove(old["path"])
+        except OSError as e:
+            logger.warning(f"[GridIO] Failed to prune {old['path']}: {str(e)}")
+    logger.info(f"[GridIO] Saved {len(df)} rows to {path}")
+    return path
+
+
+def list_grid_runs() -> List[Dict]:
+    """Saved runs, newest first: [{"name", "path", "size", "modified"}]"""
+    runs_dir = _runs_dir()
+    if not os.path.isdir(runs_dir):
+        return []
+    runs = []
+    for entry in os.scandir(runs_dir):
+        if entry.is_file() and entry.name.endswith(".arrow"):
+            stat = entry.stat()
+            runs.append({
+                "name": entry.name[:-len(".arrow")],
+                "path": entry.path,
+                "size": stat.st_size,
+                "modified": datetime.fromtimestamp(stat.st_mtime),
+            })
+    return sorted(runs, key=lambda run: run["modified"], reverse=True)
+
+
+def load_grid_run(path: str) -> pd.DataFrame:
+    """Read a saved run through a memory map"""
+    if not ARROW_AVAILABLE:
+        raise RuntimeError("pyarrow is required to load saved runs")
+    with pa.memory_map(path, "r") as source:
+        table = pa.ipc.open_file(source).read_all()
+    return optimize_grid_dtypes(table.to_pandas())
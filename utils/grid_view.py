@@ -0,0 +1,198 @@
+"""Windowed views over large AppLovin unit lists and the Update Ad Unit grid"""
+import logging
+import re
+import time
+from collections import Counter, OrderedDict, defaultdict
+from typing import Dict, List, Optional, Set, Tuple
+
+logger = logging.getLogger(__name__)
+
+# Rows rendered per page
+SELECTION_PAGE_SIZES = [25, 50, 100, 200]
+GRID_PAGE_SIZES = [100, 250, 500]
+
+# Grids up to this many rows keep the single full editor (rows can be added/deleted)
+GRID_FULL_EDITOR_MAX_ROWS = 500
+
+_SEARCH_CACHE_SIZE = 16
+
+# Search tokens: runs of word characters (a query's runs always lie inside a unit's runs)
+_TOKEN_RE = re.compile(r"\w+")
+
+FACET_FIELDS = ("platform", "ad_format", "package_name")
+
+
+class AdUnitIndex:
+    """AppLovin ad unit list indexed for the unit picker (built once per get_ad_units result)
+
+    Holds the units in display order (platform ASC, then ad_format DESC:
+    REWARD > INTER > BANNER; ties in API order), a lowercase name/package key
+    per unit, a token -> positions index, and facet counts by platform,
+    ad_format and package_name. Positions returned by search() index `units`.
+    """
+
+    def __init__(self, units: List[Dict]):
+        by_format = sorted(units, key=lambda unit: unit.get("ad_format", ""), reverse=True)
+        self.units = sorted(by_format, key=lambda unit: unit.get("platform", "").lower())
+        self.ids = [unit.get("id", "") for unit in self.units]
+        self._facet_values = {
+            "platform": [(unit.get("platform") or "").lower() for unit in self.units],
+            "ad_format": [unit.get("ad_format") or "" for unit in self.units],
+            "package_name": [unit.get("package_name") or "" for unit in self.units],
+        }
+        # name and package_name joined with NUL so a match cannot span both fields
+        self._search_keys = [
+            f"{(unit.get('name') or '').lower()}\x00{(unit.get('package_name') or '').lower()}"
+            for unit in self.units
+        ]
+        postings = defaultdict(list)
+        for position, key in enumerate(self._search_keys):
+            for token in set(_TOKEN_RE.findall(key)):
+                postings[token].append(position)
+        self._postings: Dict[str, List[int]] = dict(postings)
+        self.facets = self._count_facets(range(len(self.units)))
+        # query -> (positions, facet counts), LRU
+        self._search_cache: "OrderedDict[str, Tuple[List[int], Dict[str, Counter]]]" = OrderedDict()
+        self._token_cache: "OrderedDict[str, Set[int]]" = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self.units)
+
+    def _count_facets(self, positions) -> Dict[str, Counter]:
+        return {
+            field: Counter(values[position] for position in positions)
+            for field, values in self._facet_values.items()
+        }
+
+    def _token_candidates(self, query_token: str) -> Set[int]:
+        """Positions of units having a token that contains query_token"""
+        cached = self._token_cache.get(query_token)
+        if cached is not None:
+            self._token_cache.move_to_end(query_token)
+            return cached
+        candidates = set()
+        for token, positions in self._postings.items():
+            if query_token in token:
+                candidates.update(positions)
+        self._token_cache[query_token] = candidates
+        while len(self._token_cache) > _SEARCH_CACHE_SIZE * 4:
+            self._token_cache.popitem(last=False)
+        return candidates
+
+    def _search(self, query: str) -> Tuple[List[int], Dict[str, Counter]]:
+        cached = self._search_cache.get(query)
+        if cached is not None:
+            self._search_cache.move_to_end(query)
+            return cached
+
+        # Narrow from the longest cached prefix of this query (typing extends the query)
+        base: Optional[Tuple[List[int], Dict[str, Counter]]] = None
+        for prefix in sorted(self._search_cache, key=len, reverse=True):
+            if query.startswith(prefix):
+                base = self._search_cache[prefix]
+                break
+        candidates = base[0] if base is not None else range(len(self.units))
+
+        query_tokens = _TOKEN_RE.findall(query)
+        if query_tokens:
+            token_hits = set.intersection(*(self._token_candidates(token) for token in query_tokens))
+            candidates = [position for position in candidates if position in token_hits]
+        keys = self._search_keys
+        # Token hits are a superset; the substring check keeps the original match semantics
+        positions = [position for position in candidates if query in keys[position]]
+
+        if base is None or len(positions) * 2 <= len(base[0]):
+            facets = self._count_facets(positions)
+        else:
+            # Fewer units dropped than kept: update the prefix's counts instead of recounting
+            kept = set(positions)
+            facets = {field: Counter(counts) for field, counts in base[1].items()}
+            for field, values in self._facet_values.items():
+                facets[field].subtract(values[position] for position in base[0] if position not in kept)
+                facets[field] += Counter()  # drop zero counts
+
+        result = (positions, facets)
+        self._search_cache[query] = result
+        while len(self._search_cache) > _SEARCH_CACHE_SIZE:
+            self._search_cache.popitem(last=False)
+        return result
+
+    def search(self, query: Optional[str], platforms: Optional[Set[str]] = None,
+               ad_formats: Optional[Set[str]] = None) -> List[int]:
+        """Positions (in display order) of units whose name or package_name contains query
+
+        Args:
+            query: Case-insensitive substring (empty: all units)
+            platforms: Optional platform filter (lowercase, e.g. {"android"})
+            ad_formats: Optional ad_format filter (e.g. {"REWARD", "INTER"})
+        """
+        query = (query or "").lower()
+        positions = self._search(query)[0] if query else list(range(len(self.units)))
+        for field, allowed in (("platform", platforms), ("ad_format", ad_formats)):
+            if allowed:
+                values = self._facet_values[field]
+                positions = [position for position in positions if values[position] in allowed]
+        return positions
+
+    def facet_counts(self, query: Optional[str] = None) -> Dict[str, Counter]:
+        """Facet counts ({"platform", "ad_format", "package_name"} -> Counter) of the query result"""
+        query = (query or "").lower()
+        return self._search(query)[1] if query else self.facets
+
+
+def build_ad_unit_index(units: List[Dict]) -> AdUnitIndex:
+    """Build the picker index for a fetched ad unit list"""
+    started = time.perf_counter()
+    index = AdUnitIndex(units)
+    logger.info(f"[AppLovin] Indexed {len(index)} ad units ({len(index._postings)} tokens) "
+                f"in {(time.perf_counter() - started) * 1000:.0f} ms")
+    return index
+
+
+def page_count(total: int, page_size: int) -> int:
+    return max(1, -(-total // page_size))
+
+
+def page_bounds(total: int, page: int, page_size: int) -> Tuple[int, int, int]:
+    """Clamp a 1-based page number and return (page, start, end) for slicing"""
+    page = min(max(1, page), page_count(total, page_size))
+    start = (page - 1) * page_size
+    return page, start, min(start + page_size, total)
+
+
+def merge_editor_diff(edits: Dict, window_labels: List, editor_state: Optional[Dict]) -> Dict:
+    """Fold a data_editor's edited_rows (window positions) into row-label keyed edits
+
+    Args:
+        edits: row label -> {column: value}, updated in place
+        window_labels: Row labels of the rendered window, by position
+        editor_state: st.session_state[editor key] ({"edited_rows": {...}, ...})
+
+    Returns:
+        edits
+    """
+    for position, changes in ((editor_state or {}).get("edited_rows") or {}).items():
+        position = int(position)
+        if 0 <= position < len(window_labels):
+            edits.setdefault(window_labels[position], {}).update(changes)
+    return edits
+
+
+def apply_grid_edits(df, edits: Dict):
+    """Copy of df with the collected edits applied (unknown categories are added)"""
+    import pandas as pd  # deferred: only needed when a grid is materialized
+
+    if not edits:
+        return df
+    result = df.copy()
+    for label, changes in edits.items():
+        if label not in result.index:
+            continue
+        for column, value in changes.items():
+            if column not in result.columns:
+                continue
+            dtype = result[column].dtype
+            if isinstance(dtype, pd.CategoricalDtype) and value is not None and value not in dtype.categories:
+                result[column] = result[column].cat.add_categories([value])
+            result.at[label, column] = value
+    return result
@@ -0,0 +1,158 @@
+"""Background network health probes with a TTL-cached status for the sidebar"""
+import logging
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+from typing import Dict, List, Optional
+
+from utils.helpers import get_config, get_env_var
+
+logger = logging.getLogger(__name__)
+
+# Probe statuses
+STATUS_OK = "ok"
+STATUS_CONFIGURED = "configured"  # credentials set, no live check (probes off or no cheap call)
+STATUS_EMPTY = "empty"        # call succeeded but returned nothing (list APIs swallow auth errors)
+STATUS_ERROR = "error"
+STATUS_NOT_SET = "not_set"
+STATUS_PENDING = "pending"    # not probed yet or result older than TTL
+
+PROBE_INTERVAL_SECONDS = 300
+PROBE_TTL_SECONDS = 600
+
+
+def has_network_credentials(network: str) -> bool:
+    """Whether any complete credential set for the network is configured"""
+    from network_configs import get_network_credential_keys
+
+    config = get_config()
+    return any(config.has(*keys) for keys in get_network_credential_keys(network))
+
+
+def is_probe_enabled() -> bool:
+    """Whether live health probes are turned on (NETWORK_HEALTH_PROBE=true)"""
+    return str(get_env_var("NETWORK_HEALTH_PROBE") or "").lower() in ("1", "true", "yes")
+
+
+def has_probe_call(network: str) -> bool:
+    """Whether the network client has a cheap authenticated call (token fetch or 1-item list)
+
+    Networks without one (full list downloads only, or no list API) are checked by credentials only.
+    """
+    from utils.network_manager import get_network_manager
+
+    return get_network_manager().supports_probe(network)
+
+
+class HealthProbeService:
+    """Periodically probes every configured network in a background thread
+
+    Results are kept per network with a timestamp; readers (the sidebar) only
+    read the cache and never wait for a network call. Without the thread (or
+    for networks without a probe call) the status comes from the credentials.
+    """
+
+    def __init__(self, interval: float = PROBE_INTERVAL_SECONDS, ttl: float = PROBE_TTL_SECONDS):
+        self.interval = interval
+        self.ttl = ttl
+        self._results: Dict[str, Dict] = {}
+        self._lock = threading.Lock()
+        self._refresh_event = threading.Event()
+        self._thread = None
+
+    def probe(self, network: str) -> Dict:
+        """Probe one network now and cache the result"""
+        from utils.network_manager import get_network_manager
+
+        result = {"status": STATUS_NOT_SET, "latency_ms": None, "checked_at": time.time(), "error": None}
+        if not has_probe_call(network):
+            return self.get_status(network)
+        if has_network_credentials(network):
+            start = time.perf_counter()
+            try:
+                has_data = get_network_manager().probe(network)
+                result["status"] = STATUS_OK if has_data else STATUS_EMPTY
+            except Exception as e:
+                logger.warning(f"[{network.title()}] Health probe failed: {str(e)}")
+                result["status"] = STATUS_ERROR
+                result["error"] = str(e)
+            result["latency_ms"] = (time.perf_counter() - start) * 1000
+            result["checked_at"] = time.time()
+
+        with self._lock:
+            self._results[network] = result
+        return result
+
+    def probe_all(self, networks: Optional[List[str]] = None):
+        """Probe networks in parallel"""
+        from network_configs import get_available_networks
+
+        networks = [network for network in networks or get_available_networks() if has_probe_call(network)]
+        if not networks:
+            return
+        with ThreadPoolExecutor(max_workers=min(len(networks), 5), thread_name_prefix="health_probe") as executor:
+            list(executor.map(self.probe, networks))
+
+    def get_status(self, network: str) -> Dict:
+        """Cached status for a network (STATUS_PENDING if missing or older than TTL)"""
+        with self._lock:
+            result = self._results.get(network)
+        if not result:
+            if not has_network_credentials(network):
+                status = STATUS_NOT_SET
+            elif self.running and has_probe_call(network):
+                status = STATUS_PENDING
+            else:
+                status = STATUS_CONFIGURED
+            return {"status": status, "latency_ms": None, "checked_at": None, "error": None}
+        if time.time() - result["checked_at"] > self.ttl:
+            return {**result, "status": STATUS_PENDING}
+        return result
+
+    def last_checked(self) -> Optional[datetime]:
+        """Time of the most recent probe"""
+        with self._lock:
+            checked = [r["checked_at"] for r in self._results.values() if r["checked_at"]]
+        return datetime.fromtimestamp(max(checked)) if checked else None
+
+    def request_refresh(self):
+        """Ask the background thread to probe again now"""
+        self._refresh_event.set()
+
+    @property
+    def running(self) -> bool:
+        return bool(self._thread and self._thread.is_alive())
+
+    def start(self):
+        """Start the background probe loop (idempotent)"""
+        if self.running:
+            return
+        self._thread = threading.Thread(target=self._run, name="network_health_probe", daemon=True)
+        self._thread.start()
+
+    def _run(self):
+        while True:
+            try:
+                self.probe_all()
+            except Exception as e:
+                logger.warning(f"[HealthProbe] Probe round failed: {str(e)}")
+            self._refresh_event.wait(self.interval)
+            self._refresh_event.clear()
+
+
+_health_probe_service: Optional[HealthProbeService] = None
+_health_probe_lock = threading.Lock()
+
+
+def get_health_probe_service() -> HealthProbeService:
+    """Get the process-wide health probe service (started on first use if NETWORK_HEALTH_PROBE is on)"""
+    global _health_probe_service
+    if _health_probe_service is None:
+        with _health_probe_lock:
+            if _health_probe_service is None:
+                service = HealthProbeService()
+                if is_probe_enabled():
+                    service.start()
+                _health_probe_service = service
+    return _health_probe_service
@@ -2,15 +2,121 @@
 import os
 import json
 import logging
+import threading
+import time
+from collections.abc import Mapping
 from typing import Dict, Optional, Any, List
-import streamlit as st
-from dotenv import load_dotenv
-
-# Load .env file when module is imported
-load_dotenv()
 
 logger = logging.getLogger(__name__)
 
+# Seconds between secrets/.env file change checks
+_CONFIG_CHECK_INTERVAL = 2.0
+
+
+def _secrets_file_paths() -> List[str]:
+    """Streamlit secrets.toml locations (project and user level)"""
+    return [
+        os.path.join(os.getcwd(), ".streamlit", "secrets.toml"),
+        os.path.join(os.path.expanduser("~"), ".streamlit", "secrets.toml"),
+    ]
+
+
+def _file_mtime(path: Optional[str]) -> Optional[float]:
+    try:
+        return os.path.getmtime(path) if path else None
+    except OSError:
+        return None
+
+
+class ResolvedConfig:
+    """Streamlit secrets and environment variables flattened into one dict
+    
+    Priority (same as the previous per-call lookup): top-level secrets, then keys
+    inside secrets sections (e.g. [ironsource] SECRET_KEY), then environment / .env.
+    The dict is rebuilt only when secrets.toml or .env changes (checked at most
+    every _CONFIG_CHECK_INTERVAL seconds), so lookups are plain dict reads.
+    """
+    
+    def __init__(self):
+        self._values: Dict[str, str] = {}
+        self._fingerprint = None
+        self._dotenv_path = None
+        self._next_check = 0.0
+        self._lock = threading.Lock()
+        self.reload()
+    
+    def _current_fingerprint(self) -> tuple:
+        return tuple(_file_mtime(path) for path in [self._dotenv_path] + _secrets_file_paths())
+    
+    def reload(self, dotenv_override: bool = False):
+        """Rebuild the flattened config from secrets and environment"""
+        from dotenv import load_dotenv, find_dotenv
+        
+        with self._lock:
+            self._dotenv_path = find_dotenv(usecwd=True) or None
+            load_dotenv(self._dotenv_path, override=dotenv_override)
+            values = dict(os.environ)
+            
+            try:
+                import streamlit as st
+                secrets = st.secrets
+                top_level = {}
+                nested = {}
+                for section in list(secrets.keys()):
+                    value = secrets[section]
+                    if isinstance(value, Mapping):
+                        for key, nested_value in value.items():
+                            if key not in nested and nested_value is not None and not isinstance(nested_value, Mapping):
+                                nested[key] = str(nested_value)
+                    elif value is not None:
+                        top_level[section] = str(value)
+                values.update(nested)
+                values.update(top_level)
+            except Exception as e:
+                # No secrets.toml (local .env only) or Streamlit not available
+                logger.debug(f"[Env] Streamlit secrets not available: {str(e)}")
+            
+            self._values = values
+            self._fingerprint = self._current_fingerprint()
+            self._next_check = time.monotonic() + _CONFIG_CHECK_INTERVAL
+        logger.debug(f"[Env] Resolved config with {len(values)} keys")
+    
+    def _refresh_if_changed(self):
+        now = time.monotonic()
+        if now < self._next_check:
+            return
+        self._next_check = now + _CONFIG_CHECK_INTERVAL
+        if self._current_fingerprint() != self._fingerprint:
+            logger.info("[Env] secrets.toml or .env changed, reloading config")
+            self.reload(dotenv_override=True)
+    
+    def get(self, key: str, default: Optional[str] = None) -> Optional[str]:
+        """Get a config value (default if not set)"""
+        self._refresh_if_changed()
+        return self._values.get(key, default)
+    
+    def has(self, *keys: str) -> bool:
+        """Whether all keys are set to non-empty values"""
+        self._refresh_if_changed()
+        return all(self._values.get(key) for key in keys)
+    
+    def __contains__(self, key: str) -> bool:
+        return self.has(key)
+
+
+_resolved_config: Optional[ResolvedConfig] = None
+_resolved_config_lock = threading.Lock()
+
+
+def get_config() -> ResolvedConfig:
+    """Get the process-wide resolved config (built on first use)"""
+    global _resolved_config
+    if _resolved_config is None:
+        with _resolved_config_lock:
+            if _resolved_config is None:
+                _resolved_config = ResolvedConfig()
+    return _resolved_config
+
 
 def get_env_var(key: str, default: Optional[str] = None) -> Optional[str]:
     """
@@ -23,50 +129,7 @@ def get_env_var(key: str, default: Optional[str] = None) -> Optional[str]:
     Returns:
         Environment variable value or default
     """
-    # Try Streamlit secrets first (for Streamlit Cloud)
-    try:
-        if hasattr(st, 'secrets') and st.secrets:
-            # Try direct access first
-            try:
-                if key in st.secrets:
-                    value = st.secrets[key]
-                    logger.debug(f"[Env] Found {key} in Streamlit secrets")
-                    return str(value) if value is not None else default
-            except (KeyError, AttributeError, TypeError):
-                pass
-            
-            # Try using .get() method if available
-            try:
-                if hasattr(st.secrets, 'get'):
-                    value = st.secrets.get(key)
-                    if value is not None:
-                        logger.debug(f"[Env] Found {key} in Streamlit secrets via .get()")
-                        return str(value)
-            except Exception:
-                pass
-            
-            # Try nested access (e.g., st.secrets["ironsource"]["SECRET_KEY"])
-            try:
-                if isinstance(st.secrets, dict):
-                    for top_level_key in st.secrets.keys():
-                        try:
-                            nested_dict = st.secrets[top_level_key]
-                            if isinstance(nested_dict, dict) and key in nested_dict:
-                                value = nested_dict[key]
-                                logger.debug(f"[Env] Found {key} in Streamlit secrets[{top_level_key}]")
-                                return str(value) if value is not None else default
-                        except (KeyError, AttributeError, TypeError):
-                            continue
-            except Exception:
-                pass
-    except Exception as e:
-        logger.debug(f"[Env] Error accessing Streamlit secrets: {str(e)}")
-    
-    # Fallback to environment variables (from .env file or system env)
-    env_value = os.getenv(key, default)
-    if env_value:
-        logger.debug(f"[Env] Found {key} in environment variables")
-    return env_value
+    return get_config().get(key, default)
 
 
 def mask_sensitive_data(data: Any) -> Any:
@@ -0,0 +1,348 @@
+"""Shared HTTP session and single-pass JSON parsing for network API responses"""
+import contextvars
+import hashlib
+import json
+import logging
+import threading
+from collections import OrderedDict
+from contextlib import contextmanager
+from typing import Any, Callable, Dict, Iterator, List, NamedTuple, Optional, Sequence
+
+import requests
+from requests.adapters import HTTPAdapter
+
+from utils.request_scheduler import get_request_scheduler, network_for_url
+
+logger = logging.getLogger(__name__)
+
+# Optional faster JSON backend
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# Optional incremental parser (records are filtered while the body is read)
+try:
+    import ijson
+    from ijson.common import ObjectBuilder
+except ImportError:
+    ijson = None
+
+JSON_BACKEND = "orjson" if orjson is not None else "json"
+
+# requests decodes gzip/deflate transparently; ask for it explicitly on every call
+ACCEPT_ENCODING = "gzip, deflate"
+POOL_MAXSIZE = 10
+
+# Large bodies are logged as a summary instead of the full masked dump
+LOG_MAX_ITEMS = 20
+LOG_MAX_CHARS = 20000
+
+_session_local = threading.local()
+
+# Failed requests of the current context (see track_request_failures)
+_failures_var: contextvars.ContextVar = contextvars.ContextVar("request_failures", default=None)
+
+
+def get_session() -> requests.Session:
+    """Per-thread pooled session (keep-alive, compression negotiated)"""
+    session = getattr(_session_local, "session", None)
+    if session is None:
+        session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=POOL_MAXSIZE, pool_maxsize=POOL_MAXSIZE)
+        session.mount("https://", adapter)
+        session.mount("http://", adapter)
+        session.headers["Accept-Encoding"] = ACCEPT_ENCODING
+        _session_local.session = session
+    return session
+
+
+@contextmanager
+def track_request_failures():
+    """Collect the requests that fail inside this block (error status or body, request exception)
+
+    Lets callers tell an API failure apart from an empty result for functions that
+    return [] either way. Requests sent from other threads are not seen.
+
+    Yields:
+        List of failure descriptions, filled as requests fail
+    """
+    failures = []
+    token = _failures_var.set(failures)
+    try:
+        yield failures
+    finally:
+        _failures_var.reset(token)
+
+
+def request(
+    method: str,
+    url: str,
+    operation: Optional[str] = None,
+    refresh_auth: Optional[Callable[[Optional[Dict]], Optional[Dict]]] = None,
+    **kwargs
+) -> requests.Response:
+    """requests.request through the shared session, with the network's retry policy
+
+    Each attempt holds one of the network's request slots in the request scheduler
+    (priority from utils.request_scheduler.request_priority; interactive by default),
+    released while waiting to retry. Transient failures, 429 and 401 are handled by
+    utils.retry_policy.send_with_retry.
+
+    Args:
+        method: HTTP method
+        url: Request URL
+        operation: Retry policy ("read" or "write"; default: "read" for GET, else "write")
+        refresh_auth: Returns refreshed headers after a 401 (None: 401 is not retried)
+        **kwargs: Passed to requests (headers, params, json, data, timeout, stream, ...)
+
+    Raises:
+        requests.exceptions.RequestException: Last attempt failed without a response
+    """
+    from utils.retry_policy import OK, classify_response, send_with_retry
+
+    network = network_for_url(url)
+    headers = kwargs.pop("headers", None)
+    stream = bool(kwargs.get("stream"))
+    failures = _failures_var.get()
+
+    def send(request_headers: Optional[Dict]) -> requests.Response:
+        with get_request_scheduler().slot(network):
+            return get_session().request(method=method, url=url, headers=request_headers, **kwargs)
+
+    try:
+        response = send_with_retry(
+            network,
+            operation or ("read" if method.upper() == "GET" else "write"),
+            send,
+            headers=headers,
+            refresh_auth=refresh_auth,
+            stream=stream
+        )
+    except requests.exceptions.RequestException as e:
+        if failures is not None:
+            failures.append(f"{method} {url}: {type(e).__name__}")
+        raise
+    if failures is not None and response.status_code != 304:
+        outcome = classify_response(network, response, stream=stream)
+        if outcome != OK:
+            failures.append(f"{method} {url}: HTTP {response.status_code} ({outcome})")
+    return response
+
+
+def loads(data):
+    """Parse JSON bytes/str with the configured backend"""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def dumps_for_log(data: Any) -> str:
+    """Indented JSON for logging (falls back to str for non-serializable values)"""
+    if orjson is not None:
+        try:
+            return orjson.dumps(data, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS).decode("utf-8")
+        except TypeError:
+            pass
+    return json.dumps(data, indent=2, ensure_ascii=False, default=str)
+
+
+def parse_json(response: requests.Response, default: Any = None) -> Any:
+    """Parse a response body once
+
+    The parsed object is cached on the response and `response.json()` is rebound
+    to return it, so later callers in the same request path do not parse again.
+
+    Args:
+        response: Response object
+        default: Returned for an empty body
+
+    Returns:
+        Parsed JSON (default if the body is empty)
+
+    Raises:
+        json.JSONDecodeError: Body is not JSON (orjson's error subclasses it)
+    """
+    if "_parsed_json" in response.__dict__:
+        return response.__dict__["_parsed_json"]
+    content = response.content
+    if not content or not content.strip():
+        return default
+    parsed = loads(content)
+    response.__dict__["_parsed_json"] = parsed
+    response.json = lambda **kwargs: parsed
+    return parsed
+
+
+def summarize_for_log(data: Any, mask: Optional[Callable[[Any], Any]] = None) -> str:
+    """JSON text for logging; long lists are cut to LOG_MAX_ITEMS items"""
+    if isinstance(data, list) and len(data) > LOG_MAX_ITEMS:
+        head = mask(data[:LOG_MAX_ITEMS]) if mask else data[:LOG_MAX_ITEMS]
+        return f"{dumps_for_log(head)}\n... ({len(data) - LOG_MAX_ITEMS} more items, {len(data)} total)"
+    text = dumps_for_log(mask(data) if mask else data)
+    if len(text) > LOG_MAX_CHARS:
+        return f"{text[:LOG_MAX_CHARS]}\n... ({len(text)} chars total)"
+    return text
+
+
+def extract_records(result: Any, keys: Sequence[str] = ("data", "list")) -> List:
+    """Record list from a response that is either a list or a dict wrapping one
+
+    Args:
+        result: Parsed response
+        keys: Dict keys to try in priority order
+    """
+    if isinstance(result, list):
+        return result
+    if isinstance(result, dict):
+        for key in keys:
+            if key in result:
+                records = result[key]
+                return records if isinstance(records, list) else []
+    return []
+
+
+def _iter_stream_items(raw, prefixes: Sequence[str]) -> Iterator[Any]:
+    """Yield array items under the first matching prefix while the body is read"""
+    chosen = None
+    builder = None
+    depth = 0
+    for prefix, event, value in ijson.parse(raw, use_float=True):
+        if builder is None:
+            if event in ("start_map", "start_array") and prefix in prefixes and chosen in (None, prefix):
+                chosen = prefix
+                builder = ObjectBuilder()
+                builder.event(event, value)
+                depth = 1
+            continue
+        builder.event(event, value)
+        if event in ("start_map", "start_array"):
+            depth += 1
+        elif event in ("end_map", "end_array"):
+            depth -= 1
+            if depth == 0:
+                yield builder.value
+                builder = None
+
+
+def iter_json_records(
+    response: requests.Response,
+    keys: Sequence[str] = ("data", "list"),
+    predicate: Optional[Callable[[Dict], bool]] = None
+) -> Iterator[Dict]:
+    """Iterate records of a list response, filtering as they are parsed
+
+    With ijson installed and a response opened with stream=True, records are built
+    one at a time from the (decompressed) socket stream and rejected records are
+    never kept. Otherwise the body is parsed once with parse_json.
+
+    Args:
+        response: Response object (stream=True for incremental parsing)
+        keys: Dict keys wrapping the record list (a top-level array is always accepted)
+        predicate: Optional filter applied to each record
+    """
+    if ijson is not None and response.__dict__.get("_content") is False:
+        response.raw.decode_content = True
+        records = _iter_stream_items(response.raw, ["item"] + [f"{key}.item" for key in keys])
+    else:
+        records = iter(extract_records(parse_json(response), keys))
+    for record in records:
+        if predicate is None or predicate(record):
+            yield record
+
+
+class _ValidatorEntry:
+    """Cached validators and parsed value for one inventory URL"""
+
+    __slots__ = ("etag", "last_modified", "digest", "value")
+
+    def __init__(self, etag: Optional[str], last_modified: Optional[str], digest: str, value: Any):
+        self.etag = etag
+        self.last_modified = last_modified
+        self.digest = digest
+        self.value = value
+
+
+class ConditionalResult(NamedTuple):
+    status_code: int       # 200 for a revalidated (304) cache hit
+    data: Any              # parsed (and transformed) body, None on error
+    not_modified: bool     # True if the cached value was reused (304 or same content hash)
+    response: requests.Response
+
+
+# Conditional GET cache: (url, params) -> _ValidatorEntry (LRU)
+CONDITIONAL_CACHE_MAX_ENTRIES = 64
+_conditional_cache: "OrderedDict[tuple, _ValidatorEntry]" = OrderedDict()
+_conditional_lock = threading.Lock()
+
+
+def get_json_conditional(
+    url: str,
+    headers: Optional[Dict] = None,
+    params: Optional[Dict] = None,
+    timeout: int = 30,
+    transform: Optional[Callable[[Any], Any]] = None,
+    refresh_auth: Optional[Callable[[Optional[Dict]], Optional[Dict]]] = None
+) -> ConditionalResult:
+    """GET an inventory endpoint, revalidating the cached parsed body
+
+    Sends If-None-Match / If-Modified-Since when the last response had an
+    ETag / Last-Modified and reuses the cached value on 304. Without validators
+    the body is hashed; an unchanged body is not parsed or transformed again.
+    The cached value is shared, so callers must copy it before mutating.
+
+    Args:
+        url: Request URL
+        headers: Request headers
+        params: Query parameters
+        timeout: Request timeout in seconds
+        transform: Applied once to the parsed body before caching (e.g., extract + filter)
+        refresh_auth: Returns refreshed headers after a 401 (see request)
+
+    Returns:
+        ConditionalResult
+    """
+    key = (url, tuple(sorted((params or {}).items())))
+    with _conditional_lock:
+        entry = _conditional_cache.get(key)
+    request_headers = dict(headers or {})
+    if entry is not None:
+        if entry.etag:
+            request_headers["If-None-Match"] = entry.etag
+        if entry.last_modified:
+            request_headers["If-Modified-Since"] = entry.last_modified
+
+    response = request("GET", url, refresh_auth=refresh_auth, headers=request_headers, params=params, timeout=timeout)
+    if response.status_code == 304 and entry is not None:
+        logger.info(f"[HTTP] Not modified (304): {url}")
+        return ConditionalResult(200, entry.value, True, response)
+    if response.status_code != 200:
+        return ConditionalResult(response.status_code, None, False, response)
+
+    etag = response.headers.get("ETag")
+    last_modified = response.headers.get("Last-Modified")
+    digest = hashlib.sha1(response.content).hexdigest()
+    if entry is not None and entry.digest == digest:
+        logger.info(f"[HTTP] Unchanged body (hash match): {url}")
+        entry.etag, entry.last_modified = etag, last_modified
+        return ConditionalResult(200, entry.value, True, response)
+
+    value = parse_json(response)
+    if transform is not None:
+        value = transform(value)
+    with _conditional_lock:
+        _conditional_cache[key] = _ValidatorEntry(etag, last_modified, digest, value)
+        _conditional_cache.move_to_end(key)
+        while len(_conditional_cache) > CONDITIONAL_CACHE_MAX_ENTRIES:
+            _conditional_cache.popitem(last=False)
+    return ConditionalResult(200, value, False, response)
+
+
+def clear_conditional_cache(url_prefix: Optional[str] = None):
+    """Drop cached validators (all, or URLs starting with url_prefix), e.g. after a create"""
+    with _conditional_lock:
+        if url_prefix is None:
+            _conditional_cache.clear()
+            return
+        for key in [key for key in _conditional_cache if key[0].startswith(url_prefix)]:
+            del _conditional_cache[key]
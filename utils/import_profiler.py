@@ -0,0 +1,142 @@
+"""Import-time profiling report for app startup and page modules"""
+import argparse
+import logging
+import os
+import subprocess
+import sys
+import time
+from typing import Dict, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# Modules imported by app.py (cold start)
+STARTUP_MODULES = [
+    "utils.helpers",
+    "utils.session_manager",
+    "utils.network_manager",
+    "network_configs",
+]
+
+# Modules imported when switching to the main pages
+PAGE_MODULES = [
+    "components.create_app_new_ui",
+    "components.bulk_create_app",
+    "components.create_unit_common",
+    "components.create_unit_app_selector",
+    "utils.ad_network_query",
+    "utils.app_store_helper",
+]
+
+
+def profile_import(module: str, top: int = 5) -> Dict:
+    """Import a module in a fresh interpreter with -X importtime
+
+    Args:
+        module: Dotted module name
+        top: Number of heaviest nested imports to report
+
+    Returns:
+        {"module", "total_ms", "wall_ms", "heaviest": [(name, cumulative_ms)], "error"}
+    """
+    start = time.perf_counter()
+    proc = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        cwd=PROJECT_ROOT,
+        capture_output=True,
+        text=True
+    )
+    wall_ms = (time.perf_counter() - start) * 1000
+
+    # Lines: "import time: self [us] | cumulative | imported package"
+    timings: List[Tuple[str, float]] = []
+    total_ms = None
+    for line in proc.stderr.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        try:
+            _, cumulative, name = line[len("import time:"):].split("|")
+            cumulative_ms = int(cumulative.strip()) / 1000
+        except ValueError:
+            continue
+        name = name.rstrip()
+        timings.append((name.strip(), cumulative_ms))
+        if name.strip() == module and len(name) - len(name.lstrip()) == 1:
+            total_ms = cumulative_ms
+
+    error = None
+    if proc.returncode != 0:
+        error = (proc.stderr.strip().splitlines() or ["import failed"])[-1]
+
+    nested = [(name, ms) for name, ms in timings if name != module]
+    heaviest = sorted(nested, key=lambda item: item[1], reverse=True)[:top]
+    return {
+        "module": module,
+        "total_ms": total_ms,
+        "wall_ms": wall_ms,
+        "heaviest": heaviest,
+        "error": error,
+    }
+
+
+def profile_network_configs() -> Dict[str, float]:
+    """Load every network config once and return per-config load time (ms)"""
+    if PROJECT_ROOT not in sys.path:
+        sys.path.insert(0, PROJECT_ROOT)
+    from network_configs import NETWORK_REGISTRY
+
+    for network in NETWORK_REGISTRY:
+        NETWORK_REGISTRY[network]
+    return dict(NETWORK_REGISTRY.load_times)
+
+
+def print_report(results: List[Dict], config_times: Optional[Dict[str, float]] = None):
+    """Print the import-time report"""
+    print(f"{'module':<40} {'import ms':>10} {'process ms':>11}")
+    print("-" * 63)
+    for result in results:
+        total = f"{result['total_ms']:.1f}" if result["total_ms"] is not None else "-"
+        print(f"{result['module']:<40} {total:>10} {result['wall_ms']:>11.1f}")
+        if result["error"]:
+            print(f"    ! {result['error']}")
+        for name, ms in result["heaviest"]:
+            print(f"    {name:<36} {ms:>10.1f}")
+    if config_times:
+        print()
+        print(f"{'network config (first access)':<40} {'ms':>10}")
+        print("-" * 51)
+        for network, ms in sorted(config_times.items(), key=lambda item: item[1], reverse=True):
+            print(f"{network:<40} {ms:>10.1f}")
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """Run the report; exit code 1 if a module exceeds --budget-ms"""
+    parser = argparse.ArgumentParser(description="Import-time profiling report")
+    parser.add_argument("modules", nargs="*", help="Modules to profile (default: startup + page modules)")
+    parser.add_argument("--top", type=int, default=5, help="Heaviest nested imports to show per module")
+    parser.add_argument("--budget-ms", type=float, default=None, help="Fail if any module import exceeds this")
+    parser.add_argument("--no-configs", action="store_true", help="Skip per-network config load times")
+    args = parser.parse_args(argv)
+
+    modules = args.modules or STARTUP_MODULES + PAGE_MODULES
+    results = [profile_import(module, top=args.top) for module in modules]
+    config_times = None
+    if not args.no_configs:
+        try:
+            config_times = profile_network_configs()
+        except Exception as e:
+            print(f"network config profiling failed: {str(e)}")
+    print_report(results, config_times)
+
+    if args.budget_ms is not None:
+        over = [r for r in results if r["total_ms"] is not None and r["total_ms"] > args.budget_ms]
+        for result in over:
+            print(f"over budget: {result['module']} {result['total_ms']:.1f} ms > {args.budget_ms:.1f} ms")
+        return 1 if over else 0
+    return 0
+
+
+if __name__ == "__main__":
+    # Usage: python -m utils.import_profiler [modules...] [--budget-ms 300]
+    sys.exit(main())
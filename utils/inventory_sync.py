@@ -0,0 +1,334 @@
+"""Background inventory sync: keeps app lists and unit caches of every configured network warm
+
+Runs inside the app (INVENTORY_SYNC=true) or as a separate process:
+
+    python -m utils.inventory_sync
+
+App lists are written to snapshot files (INVENTORY_SYNC_DIR), so an app process
+with INVENTORY_SYNC on reads lists synced by a separate process too. Unit caches
+(IronSource instances, Pangle units, Vungle placements) and recent apps are
+process-local and only warmed by the in-app worker. With sync off, nothing is
+recorded or served and app lists are always fetched live.
+"""
+import json
+import logging
+import os
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+from typing import Dict, List, Optional
+
+from utils.health_probe import has_network_credentials
+from utils.helpers import get_env_var
+from utils.http_json import track_request_failures
+from utils.request_scheduler import BACKGROUND, request_priority
+
+logger = logging.getLogger(__name__)
+
+# Seconds between sync rounds (override with INVENTORY_SYNC_INTERVAL_SECONDS);
+# matches the Pangle/Vungle unit cache TTL so warmed unit lists stay fresh
+SYNC_INTERVAL_SECONDS = 300
+
+# Synced app lists are served for this many intervals (a missed round does not drop them)
+MAX_AGE_INTERVALS = 2
+
+# Newest apps per network whose units are warmed (override with INVENTORY_SYNC_UNIT_APPS)
+UNIT_SYNC_APP_LIMIT = 20
+
+# Recent apps kept warm for the Create Unit app selector
+RECENT_APPS_LIMIT = 3
+
+# App list snapshots, one JSON file per network (override with INVENTORY_SYNC_DIR)
+DEFAULT_SNAPSHOT_DIR = os.path.join(os.path.expanduser("~"), ".ad-network-hub", "inventory")
+
+
+def is_sync_enabled() -> bool:
+    """Whether the in-app background sync is turned on (INVENTORY_SYNC=true)"""
+    return str(get_env_var("INVENTORY_SYNC") or "").lower() in ("1", "true", "yes")
+
+
+def _env_number(key: str, default, cast):
+    value = get_env_var(key)
+    try:
+        return max(1, cast(value)) if value else default
+    except ValueError:
+        return default
+
+
+class InventorySyncService:
+    """Shared inventory cache refreshed by a background thread
+
+    Holds each network's app list with its sync time. Readers get the synced
+    list while it is fresh and not invalidated (a create on that network
+    invalidates it) and otherwise fall back to a live fetch (get_warm_apps).
+    """
+
+    def __init__(self, interval: Optional[float] = None, snapshot_dir: Optional[str] = None,
+                 unit_app_limit: Optional[int] = None):
+        self.interval = interval or _env_number("INVENTORY_SYNC_INTERVAL_SECONDS", SYNC_INTERVAL_SECONDS, float)
+        self.max_age = self.interval * MAX_AGE_INTERVALS
+        self.snapshot_dir = snapshot_dir or get_env_var("INVENTORY_SYNC_DIR") or DEFAULT_SNAPSHOT_DIR
+        self.unit_app_limit = unit_app_limit or _env_number("INVENTORY_SYNC_UNIT_APPS", UNIT_SYNC_APP_LIMIT, int)
+        # network -> {"apps", "synced_at", "units", "error"}
+        self._results: Dict[str, Dict] = {}
+        # network -> time of the last create (lists synced before it are stale)
+        self._invalidated: Dict[str, float] = {}
+        # network -> mtime of the snapshot file last read or written
+        self._snapshot_mtimes: Dict[str, float] = {}
+        self._lock = threading.Lock()
+        self._refresh_event = threading.Event()
+        self._pending: set = set()
+        self._thread = None
+        self._looping = False
+
+    def _snapshot_path(self, network: str) -> str:
+        return os.path.join(self.snapshot_dir, f"{network}.json")
+
+    def _write_snapshot(self, network: str, apps: List[Dict], synced_at: float):
+        path = self._snapshot_path(network)
+        try:
+            os.makedirs(self.snapshot_dir, exist_ok=True)
+            tmp_path = f"{path}.tmp"
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                json.dump({"network": network, "synced_at": synced_at, "apps": apps}, f, ensure_ascii=False, default=str)
+            os.replace(tmp_path, path)
+            with self._lock:
+                self._snapshot_mtimes[network] = os.path.getmtime(path)
+        except OSError as e:
+            logger.warning(f"[InventorySync] Failed to write {path}: {str(e)}")
+
+    def _load_snapshot(self, network: str):
+        """Read the network's snapshot if a newer one was written (e.g., by a separate sync process)"""
+        path = self._snapshot_path(network)
+        try:
+            mtime = os.path.getmtime(path)
+        except OSError:
+            return
+        with self._lock:
+            if self._snapshot_mtimes.get(network, 0) >= mtime:
+                return
+            self._snapshot_mtimes[network] = mtime
+        try:
+            with open(path, "r", encoding="utf-8") as f:
+                snapshot = json.load(f)
+        except (OSError, ValueError) as e:
+            logger.warning(f"[InventorySync] Failed to read {path}: {str(e)}")
+            return
+        apps, synced_at = snapshot.get("apps"), snapshot.get("synced_at")
+        if not isinstance(apps, list) or not synced_at:
+            return
+        with self._lock:
+            current = self._results.get(network)
+            if current is None or (current.get("synced_at") or 0) < synced_at:
+                self._results[network] = {"apps": apps, "synced_at": synced_at, "units": None, "error": None}
+
+    def record_apps(self, network: str, apps: List[Dict], synced_at: Optional[float] = None):
+        """Store a fetched app list as the network's synced inventory (also used by manual refreshes)
+
+        Ignored while sync is inactive, so a manual refresh never leaves a list behind
+        that nothing keeps fresh.
+
+        Args:
+            network: Network name
+            apps: Full app list
+            synced_at: Time the fetch started (default: now)
+        """
+        if not self.active:
+            return
+        synced_at = synced_at or time.time()
+        with self._lock:
+            previous = self._results.get(network) or {}
+            self._results[network] = {"apps": apps, "synced_at": synced_at, "units": previous.get("units"), "error": None}
+        self._write_snapshot(network, apps, synced_at)
+
+    def get_apps(self, network: str) -> Optional[List[Dict]]:
+        """Synced app list, or None if there is none, it is older than max_age or a create invalidated it"""
+        self._load_snapshot(network)
+        with self._lock:
+            result = self._results.get(network)
+            invalidated = self._invalidated.get(network, 0)
+        if not result or result.get("apps") is None:
+            return None
+        synced_at = result["synced_at"]
+        if synced_at <= invalidated or time.time() - synced_at > self.max_age:
+            return None
+        return result["apps"]
+
+    def last_synced(self, network: str) -> Optional[datetime]:
+        """Time of the network's last successful sync"""
+        self._load_snapshot(network)
+        with self._lock:
+            result = self._results.get(network)
+        synced_at = result.get("synced_at") if result else None
+        return datetime.fromtimestamp(synced_at) if synced_at else None
+
+    def get_status(self, network: str) -> Dict:
+        """{"synced_at": datetime or None, "apps": count or None, "units": warmed unit lists or None, "error"}"""
+        self._load_snapshot(network)
+        with self._lock:
+            result = dict(self._results.get(network) or {})
+        return {
+            "synced_at": datetime.fromtimestamp(result["synced_at"]) if result.get("synced_at") else None,
+            "apps": len(result["apps"]) if result.get("apps") is not None else None,
+            "units": result.get("units"),
+            "error": result.get("error"),
+        }
+
+    def invalidate(self, network: str):
+        """Stop serving the network's synced apps (a new app was created) and resync it soon"""
+        with self._lock:
+            self._invalidated[network] = time.time()
+        self.request_refresh(network)
+
+    def sync(self, network: str) -> Dict:
+        """Refresh one network's apps, recent apps and unit caches at background priority"""
+        from utils.network_manager import get_network_manager
+
+        if not has_network_credentials(network):
+            return self.get_status(network)
+        network_manager = get_network_manager()
+        started = time.time()
+        with request_priority(BACKGROUND):
+            with track_request_failures() as failures:
+                try:
+                    apps = network_manager.get_apps(network)
+                except Exception as e:
+                    apps, error = None, str(e)
+                else:
+                    # List APIs return [] on errors too: an empty list counts only if no request failed
+                    error = None
+                    if apps is None or (not apps and failures):
+                        error = f"App list request failed ({failures[-1] if failures else 'no result'})"
+            if error:
+                logger.warning(f"[InventorySync] {network}: {error}")
+                with self._lock:
+                    self._results.setdefault(network, {"apps": None, "synced_at": None, "units": None})["error"] = error
+                return self.get_status(network)
+
+            self.record_apps(network, apps, synced_at=started)
+            try:
+                network_manager.prime_recent_apps(network, apps, RECENT_APPS_LIMIT)
+                units = self._warm_units(network, apps)
+            except Exception as e:
+                logger.warning(f"[InventorySync] {network}: warming caches failed: {str(e)}")
+                units = None
+        with self._lock:
+            # No entry if the service went inactive since the sync started (record_apps skipped it)
+            result = self._results.get(network)
+            if result is not None:
+                result["units"] = units
+        logger.info(f"[InventorySync] {network}: {len(apps)} apps"
+                    f"{f', {units} unit lists' if units else ''} in {time.time() - started:.1f}s")
+        return self.get_status(network)
+
+    def _warm_units(self, network: str, apps: List[Dict]) -> Optional[int]:
+        """Load unit caches for the newest apps (networks with a unit cache only)
+
+        Returns:
+            Number of unit lists loaded, None for networks without a unit cache
+        """
+        from utils.ad_network_query import load_ironsource_instances, load_pangle_units, load_vungle_units
+        from utils.app_records import AppRecord
+        from utils.network_manager import sort_apps_newest_first
+
+        if network == "vungle":
+            return load_vungle_units()
+        if network not in ("ironsource", "pangle"):
+            return None
+        newest = sort_apps_newest_first(apps)[:self.unit_app_limit]
+        records = [AppRecord.from_api(network, app) for app in newest]
+        if network == "ironsource":
+            index = load_ironsource_instances([record.app_key for record in records], refresh=True)
+            return len(newest) - len(index.errors)
+        return load_pangle_units([record.app_id for record in records], refresh=True)
+
+    def sync_all(self, networks: Optional[List[str]] = None):
+        """Sync networks in parallel (the request scheduler keeps each network within its limits)"""
+        from network_configs import get_available_networks
+
+        networks = networks or get_available_networks()
+        with ThreadPoolExecutor(max_workers=min(len(networks), 5), thread_name_prefix="inventory_sync") as executor:
+            list(executor.map(self.sync, networks))
+
+    def request_refresh(self, network: Optional[str] = None):
+        """Ask the background thread to sync now (one network, or all if None)"""
+        with self._lock:
+            self._pending.add(network)
+        self._refresh_event.set()
+
+    @property
+    def running(self) -> bool:
+        return self._looping or bool(self._thread and self._thread.is_alive())
+
+    @property
+    def active(self) -> bool:
+        """Whether synced lists are recorded and served (INVENTORY_SYNC on, or the sync loop runs here)"""
+        return is_sync_enabled() or self.running
+
+    def start(self):
+        """Start the background sync loop (idempotent)"""
+        if self.running:
+            return
+        self._thread = threading.Thread(target=self.run_forever, name="inventory_sync", daemon=True)
+        self._thread.start()
+
+    def run_forever(self):
+        """Sync all networks every interval; refresh requests cut the wait short"""
+        self._looping = True
+        networks = None
+        while True:
+            try:
+                self.sync_all(networks)
+            except Exception as e:
+                logger.warning(f"[InventorySync] Sync round failed: {str(e)}")
+            self._refresh_event.wait(self.interval)
+            self._refresh_event.clear()
+            with self._lock:
+                pending, self._pending = self._pending, set()
+            # Refresh requests for specific networks only; a timeout or a None request syncs all
+            networks = sorted(pending) if pending and None not in pending else None
+
+
+_inventory_sync_service: Optional[InventorySyncService] = None
+_inventory_sync_lock = threading.Lock()
+
+
+def get_inventory_sync_service() -> InventorySyncService:
+    """Get the process-wide inventory sync service (started on first use if INVENTORY_SYNC is on)"""
+    global _inventory_sync_service
+    if _inventory_sync_service is None:
+        with _inventory_sync_lock:
+            if _inventory_sync_service is None:
+                service = InventorySyncService()
+                if is_sync_enabled():
+                    service.start()
+                _inventory_sync_service = service
+    return _inventory_sync_service
+
+
+def run_sync_process():
+    """Run the sync loop in the foreground as this process's service (separate process mode)"""
+    global _inventory_sync_service
+    with _inventory_sync_lock:
+        if _inventory_sync_service is None:
+            _inventory_sync_service = InventorySyncService()
+    logger.info(f"[InventorySync] Syncing every {_inventory_sync_service.interval:.0f}s "
+                f"into {_inventory_sync_service.snapshot_dir}")
+    _inventory_sync_service.run_forever()
+
+
+def get_warm_apps(network: str) -> List[Dict]:
+    """Network app list from the synced inventory, or a live fetch if sync is off or the list is missing/stale"""
+    service = get_inventory_sync_service()
+    apps = service.get_apps(network) if service.active else None
+    if apps is not None:
+        return apps
+    from utils.network_manager import get_network_manager
+    return get_network_manager().get_apps(network)
+
+
+if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO, format="%(asctime)s %(levelname)s %(name)s: %(message)s")
+    from utils import inventory_sync  # the importable module owns the service singleton
+    inventory_sync.run_sync_process()
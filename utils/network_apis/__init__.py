@@ -1,14 +1,27 @@
 # utils/network_apis/__init__.py
 """Network API implementations"""
+import importlib
+
 from .base_network_api import BaseNetworkAPI
-from .ironsource_api import IronSourceAPI
-from .bigoads_api import BigOAdsAPI
-from .mintegral_api import MintegralAPI
-from .inmobi_api import InMobiAPI
-from .fyber_api import FyberAPI
-from .applovin_api import AppLovinAPI
-from .unity_api import UnityAPI
-from .pangle_api import PangleAPI
-from .vungle_api import VungleAPI
-
-__all__ = ['BaseNetworkAPI', 'IronSourceAPI', 'BigOAdsAPI', 'MintegralAPI', 'InMobiAPI', 'FyberAPI', 'AppLovinAPI', 'UnityAPI', 'PangleAPI', 'VungleAPI']
\ No newline at end of file
+
+# API classes are imported on first access so loading one client does not import all of them
+_API_MODULES = {
+    'IronSourceAPI': '.ironsource_api',
+    'BigOAdsAPI': '.bigoads_api',
+    'MintegralAPI': '.mintegral_api',
+    'InMobiAPI': '.inmobi_api',
+    'FyberAPI': '.fyber_api',
+    'AppLovinAPI': '.applovin_api',
+    'UnityAPI': '.unity_api',
+    'PangleAPI': '.pangle_api',
+    'VungleAPI': '.vungle_api',
+}
+
+
+def __getattr__(name: str):
+    if name in _API_MODULES:
+        return getattr(importlib.import_module(_API_MODULES[name], __name__), name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+__all__ = ['BaseNetworkAPI', 'IronSourceAPI', 'BigOAdsAPI', 'MintegralAPI', 'InMobiAPI', 'FyberAPI', 'AppLovinAPI', 'UnityAPI', 'PangleAPI', 'VungleAPI']
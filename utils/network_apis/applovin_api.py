@@ -6,6 +6,7 @@ import logging
 import sys
 from .base_network_api import BaseNetworkAPI
 from utils.helpers import get_env_var, mask_sensitive_data
+from utils.http_json import request as http_request
 
 logger = logging.getLogger(__name__)
 
@@ -83,7 +84,7 @@ class AppLovinAPI(BaseNetworkAPI):
         logger.info(f"[AppLovin] Request Payload: {json.dumps(payload, indent=2)}")
         
         try:
-            response = requests.post(url, json=payload, headers=headers, timeout=30)
+            response = http_request("POST", url, json=payload, headers=headers, timeout=30)
             
             logger.info(f"[AppLovin] Response Status: {response.status_code}")
             
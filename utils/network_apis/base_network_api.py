@@ -5,6 +5,7 @@ import json
 import logging
 from abc import ABC, abstractmethod
 from utils.helpers import mask_sensitive_data
+from utils.http_json import parse_json, request, summarize_for_log
 
 logger = logging.getLogger(__name__)
 
@@ -66,6 +67,26 @@ class BaseNetworkAPI(ABC):
         # Override in subclasses if network supports unit listing
         return []
     
+    def probe(self) -> Optional[bool]:
+        """Cheap authenticated call for health checks (token fetch or 1-item list)
+        
+        Returns:
+            True if the call returned data, False if it returned nothing,
+            None if the network has no cheap call (override in subclasses)
+        """
+        return None
+    
+    def _refresh_auth(self, headers: Optional[Dict]) -> Optional[Dict]:
+        """Refresh credentials after a 401
+        
+        Args:
+            headers: Headers of the rejected request
+            
+        Returns:
+            Headers to resend with, or None if the network cannot refresh
+        """
+        return None
+    
     def _make_request(
         self,
         method: str,
@@ -74,9 +95,16 @@ class BaseNetworkAPI(ABC):
         data: Optional[Dict] = None,
         json_data: Optional[Dict] = None,
         params: Optional[Dict] = None,
-        timeout: int = 30
+        timeout: int = 30,
+        stream: bool = False,
+        operation: Optional[str] = None
     ) -> requests.Response:
-        """Make HTTP request with logging
+        """Make HTTP request with logging and retries
+        
+        The body is parsed once here (for logging); response.json() then returns
+        the same object. With stream=True the body is left unread for
+        utils.http_json.iter_json_records. Transient failures are retried by
+        utils.http_json.request (401 goes through _refresh_auth once).
         
         Args:
             method: HTTP method (GET, POST, PUT, PATCH, DELETE)
@@ -86,6 +114,8 @@ class BaseNetworkAPI(ABC):
             json_data: Request JSON data
             params: Query parameters
             timeout: Request timeout in seconds
+            stream: Do not read the body (incremental parsing by the caller)
+            operation: Retry policy ("read" or "write"; default: "read" for GET, else "write")
             
         Returns:
             Response object
@@ -104,30 +134,33 @@ class BaseNetworkAPI(ABC):
             self.logger.info(f"[{self.network_name}] Request Params: {json.dumps(mask_sensitive_data(params), indent=2)}")
         
         try:
-            response = requests.request(
-                method=method,
-                url=url,
+            response = request(
+                method,
+                url,
+                operation=operation,
+                refresh_auth=self._refresh_auth,
                 headers=headers,
                 data=data,
                 json=json_data,
                 params=params,
-                timeout=timeout
+                timeout=timeout,
+                stream=stream
             )
             
             self.logger.info(f"[{self.network_name}] Response Status: {response.status_code}")
+            if stream:
+                return response
             
-            # Check if response is empty before trying to parse JSON
-            response_text = response.text.strip()
-            if response_text:
-                try:
-                    response_data = response.json()
-                    self.logger.info(f"[{self.network_name}] Response Data: {json.dumps(mask_sensitive_data(response_data), indent=2)}")
-                except json.JSONDecodeError:
-                    # Non-JSON response is OK, just log it
-                    self.logger.warning(f"[{self.network_name}] Response is not JSON: {response_text[:500]}")
-            else:
-                # Empty response is OK, just log it
-                self.logger.info(f"[{self.network_name}] Response is empty (status {response.status_code})")
+            try:
+                response_data = parse_json(response)
+                if response_data is None:
+                    # Empty response is OK, just log it
+                    self.logger.info(f"[{self.network_name}] Response is empty (status {response.status_code})")
+                else:
+                    self.logger.info(f"[{self.network_name}] Response Data: {summarize_for_log(response_data, mask_sensitive_data)}")
+            except ValueError:
+                # Non-JSON response is OK, just log it
+                self.logger.warning(f"[{self.network_name}] Response is not JSON: {response.text[:500]}")
             
             return response
         except requests.exceptions.RequestException as e:
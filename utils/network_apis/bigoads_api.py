@@ -268,7 +268,7 @@ class BigOAdsAPI(BaseNetworkAPI):
         self.logger.info(f"[BigOAds] Request Payload: {json.dumps(payload, indent=2)}")
         
         try:
-            response = self._make_request("POST", url, headers=headers, json_data=payload)
+            response = self._make_request("POST", url, headers=headers, json_data=payload, operation="read")
             response.raise_for_status()
             
             result = response.json()
@@ -52,7 +52,7 @@ class FyberAPI(BaseNetworkAPI):
         self.logger.info(f"[Fyber] Request Payload: {json.dumps(mask_sensitive_data(payload), indent=2)}")
         
         try:
-            response = self._make_request("POST", auth_url, headers=headers, json_data=payload, timeout=30)
+            response = self._make_request("POST", auth_url, headers=headers, json_data=payload, timeout=30, operation="read")
             
             if response.status_code == 200:
                 result = response.json()
@@ -84,6 +84,10 @@ class FyberAPI(BaseNetworkAPI):
             self.logger.error(f"[Fyber] ❌ API Error (Get Access Token): {str(e)}")
             return None
     
+    def probe(self) -> Optional[bool]:
+        """Health check: fetch (or reuse) the access token"""
+        return bool(self.get_access_token())
+    
     def get_access_token(self) -> Optional[str]:
         """Get Fyber (DT) Access Token (public method)
         
@@ -196,11 +196,19 @@ class InMobiAPI(BaseNetworkAPI):
                 "msg": str(e)
             }
     
-    def get_apps(self, app_key: Optional[str] = None) -> List[Dict]:
+    def probe(self) -> Optional[bool]:
+        """Health check: list the newest app only"""
+        return bool(self.get_apps(limit=1))
+    
+    def get_apps(self, app_key: Optional[str] = None, limit: Optional[int] = None) -> List[Dict]:
         """Get apps list from InMobi API
         
         API: GET https://publisher.inmobi.com/rest/api/v2/apps
         Headers: x-client-id, x-account-id, x-client-secret
+        
+        Args:
+            app_key: Unused (kept for interface compatibility)
+            limit: Page length (newest apps first); default 10
         """
         url = "https://publisher.inmobi.com/rest/api/v2/apps"
         
@@ -219,7 +227,7 @@ class InMobiAPI(BaseNetworkAPI):
         # Query parameters
         params = {
             "pageNum": 1,
-            "pageLength": 10,
+            "pageLength": limit or 10,
             "status": "ACTIVE",
         }
         
@@ -6,6 +6,7 @@ import logging
 from .base_network_api import BaseNetworkAPI
 from ..network_auth.ironsource_auth import IronSourceAuth
 from utils.helpers import get_env_var, mask_sensitive_data
+from utils.http_json import get_json_conditional, parse_json, summarize_for_log
 
 logger = logging.getLogger(__name__)
 
@@ -17,6 +18,26 @@ class IronSourceAPI(BaseNetworkAPI):
         super().__init__("IronSource")
         self.auth = IronSourceAuth()
    
+    def _refresh_auth(self, headers: Optional[Dict]) -> Optional[Dict]:
+        """Get a new bearer token after a 401 (retry_policy resends with the returned headers)"""
+        refresh_token = get_env_var("IRONSOURCE_REFRESH_TOKEN")
+        secret_key = get_env_var("IRONSOURCE_SECRET_KEY")
+        if not (refresh_token and secret_key):
+            self.logger.error("[IronSource] No refresh token available. Please set IRONSOURCE_REFRESH_TOKEN and IRONSOURCE_SECRET_KEY in .env file")
+            return None
+        self.logger.warning("[IronSource] Received 401 Unauthorized. Token may be expired. Attempting to refresh...")
+        rejected = str((headers or {}).get("Authorization", "")).replace("Bearer ", "", 1) or None
+        self.auth.invalidate_token(rejected)
+        new_token = self.auth.get_token()
+        if not new_token or new_token == rejected:
+            self.logger.error("[IronSource] Token refresh failed. Please check IRONSOURCE_REFRESH_TOKEN and IRONSOURCE_SECRET_KEY")
+            return None
+        return {**(headers or {}), "Authorization": f"Bearer {new_token}"}
+    
+    def probe(self) -> Optional[bool]:
+        """Health check: fetch (or reuse) the bearer token"""
+        return bool(self.auth.get_token())
+    
     def create_app(self, payload: Dict) -> Dict:
         """Create app via IronSource API"""
         headers = self.auth.get_headers()
@@ -53,42 +74,9 @@ class IronSourceAPI(BaseNetworkAPI):
                     error_code = str(response.status_code)
                     self.logger.error(f"[IronSource] Error Response Text: {error_msg}")
                 
-                # For 401, try token refresh
+                # 401 was already retried once with a refreshed token (_refresh_auth)
                 if response.status_code == 401:
-                    self.logger.warning("[IronSource] Received 401 Unauthorized. Token may be expired. Attempting to refresh...")
-                    
-                    # Try to refresh token
-                    refresh_token = get_env_var("IRONSOURCE_REFRESH_TOKEN")
-                    secret_key = get_env_var("IRONSOURCE_SECRET_KEY")
-                    
-                    if refresh_token and secret_key:
-                        new_token = self.auth.refresh_token(refresh_token, secret_key)
-                        if new_token:
-                            # Retry request with new token
-                            self.logger.info("[IronSource] Retrying request with refreshed token...")
-                            headers["Authorization"] = f"Bearer {new_token}"
-                            response = self._make_request("POST", url, headers=headers, json_data=payload)
-                            self.logger.info(f"[IronSource] Retry Response Status: {response.status_code}")
-                            
-                            # Check if retry succeeded
-                            if response.status_code >= 400:
-                                try:
-                                    retry_error_body = response.json()
-                                    retry_error_msg = retry_error_body.get("message") or retry_error_body.get("msg") or retry_error_body.get("error") or response.text
-                                    retry_error_code = retry_error_body.get("code") or retry_error_body.get("errorCode") or str(response.status_code)
-                                except:
-                                    retry_error_msg = response.text or f"HTTP {response.status_code}"
-                                    retry_error_code = str(response.status_code)
-                                
-                                return {
-                                    "status": 1,
-                                    "code": retry_error_code,
-                                    "msg": retry_error_msg
-                                }
-                        else:
-                            self.logger.error("[IronSource] Token refresh failed. Please check IRONSOURCE_REFRESH_TOKEN and IRONSOURCE_SECRET_KEY")
-                    else:
-                        self.logger.error("[IronSource] No refresh token available. Please set IRONSOURCE_REFRESH_TOKEN and IRONSOURCE_SECRET_KEY in .env file")
+                    self.logger.error("[IronSource] Unauthorized after token refresh. Please check IRONSOURCE_REFRESH_TOKEN and IRONSOURCE_SECRET_KEY")
                 
                 return {
                     "status": 1,
@@ -264,11 +252,11 @@ class IronSourceAPI(BaseNetworkAPI):
             except json.JSONDecodeError as e:
                 # Invalid JSON response
                 self.logger.error(f"[IronSource] JSON decode error: {str(e)}")
-                self.logger.error(f"[IronSource] Response text: {response_text[:500]}")
+                self.logger.error(f"[IronSource] Response text: {response.text[:500]}")
                 return {
                     "status": 1,
                     "code": "JSON_ERROR",
-                    "msg": f"Invalid JSON response: {str(e)}. Response: {response_text[:200]}"
+                    "msg": f"Invalid JSON response: {str(e)}. Response: {response.text[:200]}"
                 }
             
             # IronSource API response format may vary, normalize it
@@ -406,11 +394,11 @@ class IronSourceAPI(BaseNetworkAPI):
             except json.JSONDecodeError as e:
                 # Invalid JSON response
                 self.logger.error(f"[IronSource] JSON decode error: {str(e)}")
-                self.logger.error(f"[IronSource] Response text: {response_text[:500]}")
+                self.logger.error(f"[IronSource] Response text: {response.text[:500]}")
                 return {
                     "status": 1,
                     "code": "JSON_ERROR",
-                    "msg": f"Invalid JSON response: {str(e)}. Response: {response_text[:200]}"
+                    "msg": f"Invalid JSON response: {str(e)}. Response: {response.text[:200]}"
                 }
             
             # IronSource API response format may vary, normalize it
@@ -529,21 +517,17 @@ class IronSourceAPI(BaseNetworkAPI):
                     "msg": error_msg
                 }
             
-            # Success response
-            response_text = response.text.strip()
-            if not response_text:
-                self.logger.warning(f"[IronSource] Empty response body (status {response.status_code})")
-                return {
-                    "status": 0,
-                    "code": 0,
-                    "msg": "Success (empty response)",
-                    "result": []
-                }
-            
+            # Success response (already parsed and logged once by _make_request)
             try:
-                result = response.json()
-                # Log response
-                self.logger.info(f"[IronSource] Response Body: {json.dumps(mask_sensitive_data(result), indent=2)}")
+                result = parse_json(response)
+                if result is None:
+                    self.logger.warning(f"[IronSource] Empty response body (status {response.status_code})")
+                    return {
+                        "status": 0,
+                        "code": 0,
+                        "msg": "Success (empty response)",
+                        "result": []
+                    }
                 
                 # Normalize response - should be a list
                 instances = result if isinstance(result, list) else result.get("instances", result.get("data", result.get("list", [])))
@@ -553,11 +537,11 @@ class IronSourceAPI(BaseNetworkAPI):
             except json.JSONDecodeError as e:
                 # Invalid JSON response
                 self.logger.error(f"[IronSource] JSON decode error: {str(e)}")
-                self.logger.error(f"[IronSource] Response text: {response_text[:500]}")
+                self.logger.error(f"[IronSource] Response text: {response.text[:500]}")
                 return {
                     "status": 1,
                     "code": "JSON_ERROR",
-                    "msg": f"Invalid JSON response: {str(e)}. Response: {response_text[:200]}"
+                    "msg": f"Invalid JSON response: {str(e)}. Response: {response.text[:200]}"
                 }
             
             return {
@@ -644,11 +628,16 @@ class IronSourceAPI(BaseNetworkAPI):
             masked_headers = {k: "***MASKED***" if k.lower() == "authorization" else v for k, v in headers.items()}
             self.logger.info(f"[IronSource] Request Headers: {json.dumps(masked_headers, indent=2)}")
             
-            response = self._make_request("GET", url, headers=headers, params=params if params else None)
+            # Conditional GET: an unchanged app list reuses the cached parsed body
+            fetched = get_json_conditional(url, headers=headers, params=params if params else None,
+                                           refresh_auth=self._refresh_auth)
+            response = fetched.response
+            self.logger.info(f"[IronSource] Response Status: {response.status_code}{' (cached body reused)' if fetched.not_modified else ''}")
             
-            if response.status_code == 200:
-                result = response.json()
-                self.logger.info(f"[IronSource] Response Body: {json.dumps(mask_sensitive_data(result), indent=2)}")
+            if fetched.status_code == 200:
+                result = fetched.data if fetched.data is not None else []
+                if not fetched.not_modified:
+                    self.logger.info(f"[IronSource] Response Body: {summarize_for_log(result, mask_sensitive_data)}")
                 
                 # IronSource API 응답 형식에 맞게 파싱
                 # 응답은 JSON 배열 또는 객체일 수 있음
@@ -282,8 +282,17 @@ class MintegralAPI(BaseNetworkAPI):
                 "msg": str(e)
             }
     
-    def get_apps(self, app_key: Optional[str] = None) -> List[Dict]:
-        """Get media list from Mintegral API"""
+    def probe(self) -> Optional[bool]:
+        """Health check: list the newest app only"""
+        return bool(self.get_apps(limit=1))
+    
+    def get_apps(self, app_key: Optional[str] = None, limit: Optional[int] = None) -> List[Dict]:
+        """Get media list from Mintegral API
+        
+        Args:
+            app_key: Unused (kept for interface compatibility)
+            limit: Only fetch the first page with this many apps (newest first)
+        """
         url = "https://dev.mintegral.com/v2/app/open_api_list"
         
         if not self.skey or not self.secret:
@@ -300,6 +309,9 @@ class MintegralAPI(BaseNetworkAPI):
             "time": str(current_time),
             "sign": signature
         }
+        if limit:
+            request_params["page"] = 1
+            request_params["per_page"] = limit
         
         headers = {
             "Content-Type": "application/x-www-form-urlencoded"
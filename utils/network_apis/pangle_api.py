@@ -10,9 +10,43 @@ import hashlib
 import re
 from .base_network_api import BaseNetworkAPI
 from utils.helpers import get_env_var, mask_sensitive_data
+from utils.http_json import parse_json, request, summarize_for_log
 
 logger = logging.getLogger(__name__)
 
+# Unit list paging
+PANGLE_PAGE_SIZE = 500  # Max page size
+PANGLE_MAX_PAGES = 20
+
+
+def _to_standard_unit(slot: Dict) -> Dict:
+    """Map a Pangle ad_slot_list item to the standard unit format"""
+    return {
+        "slotCode": str(slot.get("ad_slot_id", "")),
+        "adSlotId": slot.get("ad_slot_id"),
+        "name": slot.get("ad_slot_name", ""),
+        "adType": slot.get("ad_slot_type"),
+        "status": slot.get("status"),
+        "appId": slot.get("app_id"),
+        "appName": slot.get("app_name", ""),
+        "renderType": slot.get("render_type"),
+        "maskRuleId": slot.get("mask_rule_id"),
+        "maskRuleIds": slot.get("mask_rule_ids", []),
+        "biddingType": slot.get("bidding_type"),
+        "adCategories": slot.get("ad_categories", []),
+        "width": slot.get("width"),
+        "height": slot.get("height"),
+        "orientation": slot.get("orientation"),
+        "rewardName": slot.get("reward_name"),
+        "rewardCount": slot.get("reward_count"),
+        "rewardIsCallback": slot.get("reward_is_callback"),
+        "rewardCallbackUrl": slot.get("reward_callback_url"),
+        "rewardSecurityKey": slot.get("reward_security_key"),
+        "cpm": slot.get("cpm"),
+        "useMediation": slot.get("use_mediation"),
+        "acceptMaterialType": slot.get("accept_material_type"),
+    }
+
 
 class PangleAPI(BaseNetworkAPI):
     """Pangle (TikTok) API implementation"""
@@ -255,7 +289,7 @@ class PangleAPI(BaseNetworkAPI):
             logger.info(f"[Pangle] {json.dumps(log_params, indent=2, ensure_ascii=False)}")
             logger.info(f"[Pangle] ===============================================")
             
-            response = requests.post(url, json=request_params, headers=headers, timeout=30)
+            response = request("POST", url, json=request_params, headers=headers, timeout=30)
             
             # Log response status
             print(f"[Pangle] Response Status: {response.status_code}", file=sys.stderr)
@@ -368,7 +402,7 @@ class PangleAPI(BaseNetworkAPI):
         logger.info(f"[Pangle] Request Params: {json.dumps(mask_sensitive_data(request_params), indent=2)}")
         
         try:
-            response = requests.post(url, json=request_params, headers=headers, timeout=30)
+            response = request("POST", url, json=request_params, headers=headers, timeout=30)
             
             logger.info(f"[Pangle] Response Status: {response.status_code}")
             
@@ -528,7 +562,7 @@ class PangleAPI(BaseNetworkAPI):
         logger.info(f"[Pangle] Request Params: {json.dumps(mask_sensitive_data(request_params), indent=2)}")
         
         try:
-            response = requests.post(url, json=request_params, headers=headers, timeout=30)
+            response = request("POST", url, operation="read", json=request_params, headers=headers, timeout=30)
             
             logger.info(f"[Pangle] Response Status: {response.status_code}")
             
@@ -582,13 +616,16 @@ class PangleAPI(BaseNetworkAPI):
                     logger.error(f"[Pangle] Error Response (text): {e.response.text}")
             return []
     
-    def get_units(self, app_code: str) -> List[Dict]:
-        """Get ad placements (units) list for an app from Pangle API
+    def get_units(self, app_code: Optional[str] = None, app_codes: Optional[List[str]] = None) -> Optional[List[Dict]]:
+        """Get ad placements (units) list for one or more apps from Pangle API
         
         API: POST /union/media/open_api/code/query
         
+        The app_id filter is applied server-side; results are paged until a short page.
+        
         Args:
             app_code: App ID (site_id) to filter by
+            app_codes: Several App IDs to query in one request (combined with app_code)
             
         Returns:
             List of ad unit dicts with standard format:
@@ -598,31 +635,19 @@ class PangleAPI(BaseNetworkAPI):
             - status: status
             - appId: app_id
             - etc.
+            None if a request failed (never a partial list, so callers do not cache it)
         """
         if not self.security_key:
             logger.error("[Pangle] PANGLE_SECURITY_KEY not found in environment")
-            return []
-        
-        # Build auth params
-        auth_params = self._build_auth_params()
-        if not auth_params:
-            logger.error("[Pangle] Failed to build auth params for get_units")
-            return []
-        
-        # Build request parameters
-        request_params = auth_params.copy()
-        request_params.update({
-            "page": 1,
-            "page_size": 500,  # Max page size
-        })
+            return None
         
-        # Add app_id filter if app_code is provided
-        if app_code:
+        # app_id filter (server-side)
+        app_ids = []
+        for code in ([app_code] if app_code else []) + list(app_codes or []):
             try:
-                app_id_int = int(app_code)
-                request_params["app_id"] = [app_id_int]
+                app_ids.append(int(code))
             except (ValueError, TypeError):
-                logger.warning(f"[Pangle] Invalid app_code format: {app_code}, ignoring filter")
+                logger.warning(f"[Pangle] Invalid app_code format: {code}, ignoring filter")
         
         # Build URL
         url = f"{self.base_url}/union/media/open_api/code/query"
@@ -632,71 +657,61 @@ class PangleAPI(BaseNetworkAPI):
             "Accept": "application/json"
         }
         
-        logger.info(f"[Pangle] API Request: POST {url}")
-        logger.info(f"[Pangle] Request Params: {json.dumps(mask_sensitive_data(request_params), indent=2)}")
-        
-        try:
-            response = requests.post(url, json=request_params, headers=headers, timeout=30)
-            
-            logger.info(f"[Pangle] Response Status: {response.status_code}")
-            
-            response.raise_for_status()
-            
-            result = response.json()
-            
-            logger.info(f"[Pangle] Response Body: {json.dumps(mask_sensitive_data(result), indent=2)}")
+        units = []
+        for page in range(1, PANGLE_MAX_PAGES + 1):
+            # Signature (timestamp/nonce) is per request
+            auth_params = self._build_auth_params()
+            if not auth_params:
+                logger.error("[Pangle] Failed to build auth params for get_units")
+                return None
+            
+            request_params = auth_params.copy()
+            request_params.update({
+                "page": page,
+                "page_size": PANGLE_PAGE_SIZE,
+            })
+            if app_ids:
+                request_params["app_id"] = app_ids
+            
+            logger.info(f"[Pangle] API Request: POST {url}")
+            logger.info(f"[Pangle] Request Params: {json.dumps(mask_sensitive_data(request_params), indent=2)}")
             
-            # Check response code
-            error_code = result.get("code") or result.get("ret_code")
-            if error_code != 0 and error_code is not None:
-                error_msg = result.get("message") or result.get("msg") or "Unknown error"
-                logger.error(f"[Pangle] API Error (Get Units): {error_code} - {error_msg}")
-                return []
-            
-            # Extract ad_slot_list from response
-            data = result.get("data", {})
-            ad_slot_list = data.get("ad_slot_list", [])
-            
-            logger.info(f"[Pangle] Retrieved {len(ad_slot_list)} ad units")
-            
-            # Convert to standard format
-            units = []
-            for slot in ad_slot_list:
-                # Map Pangle API response to standard format
-                units.append({
-                    "slotCode": str(slot.get("ad_slot_id", "")),
-                    "adSlotId": slot.get("ad_slot_id"),
-                    "name": slot.get("ad_slot_name", ""),
-                    "adType": slot.get("ad_slot_type"),
-                    "status": slot.get("status"),
-                    "appId": slot.get("app_id"),
-                    "appName": slot.get("app_name", ""),
-                    "renderType": slot.get("render_type"),
-                    "maskRuleId": slot.get("mask_rule_id"),
-                    "maskRuleIds": slot.get("mask_rule_ids", []),
-                    "biddingType": slot.get("bidding_type"),
-                    "adCategories": slot.get("ad_categories", []),
-                    "width": slot.get("width"),
-                    "height": slot.get("height"),
-                    "orientation": slot.get("orientation"),
-                    "rewardName": slot.get("reward_name"),
-                    "rewardCount": slot.get("reward_count"),
-                    "rewardIsCallback": slot.get("reward_is_callback"),
-                    "rewardCallbackUrl": slot.get("reward_callback_url"),
-                    "rewardSecurityKey": slot.get("reward_security_key"),
-                    "cpm": slot.get("cpm"),
-                    "useMediation": slot.get("use_mediation"),
-                    "acceptMaterialType": slot.get("accept_material_type"),
-                })
-            
-            return units
-            
-        except requests.exceptions.RequestException as e:
-            logger.error(f"[Pangle] API Error (Get Units): {str(e)}")
-            if hasattr(e, 'response') and e.response is not None:
-                try:
-                    error_body = e.response.json()
-                    logger.error(f"[Pangle] Error Response: {json.dumps(error_body, indent=2)}")
-                except:
-                    logger.error(f"[Pangle] Error Response (text): {e.response.text}")
-            return []
\ No newline at end of file
+            try:
+                response = request("POST", url, operation="read", json=request_params, headers=headers, timeout=30)
+                
+                logger.info(f"[Pangle] Response Status: {response.status_code}")
+                
+                response.raise_for_status()
+                
+                result = parse_json(response, default={})
+                
+                logger.info(f"[Pangle] Response Body: {summarize_for_log(result, mask_sensitive_data)}")
+                
+                # Check response code
+                error_code = result.get("code") or result.get("ret_code")
+                if error_code != 0 and error_code is not None:
+                    error_msg = result.get("message") or result.get("msg") or "Unknown error"
+                    logger.error(f"[Pangle] API Error (Get Units): {error_code} - {error_msg}")
+                    return None
+                
+                # Extract ad_slot_list from response
+                data = result.get("data", {})
+                ad_slot_list = data.get("ad_slot_list", [])
+                units.extend(_to_standard_unit(slot) for slot in ad_slot_list)
+                
+                if len(ad_slot_list) < PANGLE_PAGE_SIZE:
+                    break
+            except requests.exceptions.RequestException as e:
+                logger.error(f"[Pangle] API Error (Get Units): {str(e)}")
+                if hasattr(e, 'response') and e.response is not None:
+                    try:
+                        error_body = e.response.json()
+                        logger.error(f"[Pangle] Error Response: {json.dumps(error_body, indent=2)}")
+                    except:
+                        logger.error(f"[Pangle] Error Response (text): {e.response.text}")
+                return None
+        else:
+            logger.warning(f"[Pangle] Stopped after {PANGLE_MAX_PAGES} pages; unit list may be incomplete")
+        
+        logger.info(f"[Pangle] Retrieved {len(units)} ad units")
+        return units
@@ -8,10 +8,32 @@ import urllib.parse
 import sys
 from .base_network_api import BaseNetworkAPI
 from utils.helpers import get_env_var, mask_sensitive_data
+from utils.http_json import extract_records, get_json_conditional, parse_json, request
 
 logger = logging.getLogger(__name__)
 
 
+def _parse_projects(result) -> List[Dict]:
+    """Project list from a projects response (list or dict)"""
+    projects = extract_records(result, ("data", "projects", "list"))
+    
+    # For Unity, ensure stores field is preserved (can be JSON string or dict)
+    # The API might return stores as a JSON string that needs parsing
+    for project in projects:
+        stores = project.get("stores", "")
+        if stores and isinstance(stores, str):
+            # Try to parse if it's a JSON string
+            try:
+                # Handle escaped JSON strings
+                parsed_stores = json.loads(stores)
+                # Keep both original string and parsed dict for compatibility
+                project["stores_parsed"] = parsed_stores
+            except (json.JSONDecodeError, TypeError):
+                # If parsing fails, keep original string
+                pass
+    return projects
+
+
 class UnityAPI(BaseNetworkAPI):
     """Unity API implementation"""
     
@@ -91,7 +113,7 @@ class UnityAPI(BaseNetworkAPI):
         logger.info(f"[Unity] Request Payload: {json.dumps(mask_sensitive_data(payload), indent=2)}")
         
         try:
-            response = requests.post(url, json=payload, headers=headers, timeout=30)
+            response = request("POST", url, json=payload, headers=headers, timeout=30)
             
             logger.info(f"[Unity] Response Status: {response.status_code}")
             
@@ -233,7 +255,7 @@ class UnityAPI(BaseNetworkAPI):
         logger.info(f"[Unity] Request Payload: {json.dumps(mask_sensitive_data(ad_units_payload), indent=2)}")
         
         try:
-            response = requests.post(url, json=ad_units_payload, headers=headers, timeout=30)
+            response = request("POST", url, json=ad_units_payload, headers=headers, timeout=30)
             
             logger.info(f"[Unity] Response Status: {response.status_code}")
             
@@ -332,7 +354,7 @@ class UnityAPI(BaseNetworkAPI):
         logger.info(f"[Unity] Request Payload: {json.dumps(mask_sensitive_data(placements_payload), indent=2)}")
         
         try:
-            response = requests.post(url, json=placements_payload, headers=headers, timeout=30)
+            response = request("POST", url, json=placements_payload, headers=headers, timeout=30)
             
             logger.info(f"[Unity] Response Status: {response.status_code}")
             
@@ -466,7 +488,7 @@ class UnityAPI(BaseNetworkAPI):
         logger.info(f"[Unity] Request Payload: {json.dumps(mask_sensitive_data(ad_units_payload), indent=2)}")
         
         try:
-            response = requests.patch(url, json=ad_units_payload, headers=headers, timeout=30)
+            response = request("PATCH", url, json=ad_units_payload, headers=headers, timeout=30)
             
             logger.info(f"[Unity] Response Status: {response.status_code}")
             
@@ -546,34 +568,12 @@ class UnityAPI(BaseNetworkAPI):
         logger.info(f"[Unity] Fetching projects from {url}")
         
         try:
-            response = requests.get(url, headers=headers, timeout=30)
+            # Conditional GET: an unchanged project list is not parsed again
+            fetched = get_json_conditional(url, headers=headers, timeout=30, transform=_parse_projects)
+            response = fetched.response
             
-            if response.status_code == 200:
-                result = response.json()
-                
-                # Parse response - can be list or dict
-                projects = []
-                if isinstance(result, list):
-                    projects = result
-                elif isinstance(result, dict):
-                    projects = result.get("data", result.get("projects", result.get("list", [])))
-                    if not isinstance(projects, list):
-                        projects = []
-                
-                # For Unity, ensure stores field is preserved (can be JSON string or dict)
-                # The API might return stores as a JSON string that needs parsing
-                for project in projects:
-                    stores = project.get("stores", "")
-                    if stores and isinstance(stores, str):
-                        # Try to parse if it's a JSON string
-                        try:
-                            # Handle escaped JSON strings
-                            parsed_stores = json.loads(stores)
-                            # Keep both original string and parsed dict for compatibility
-                            project["stores_parsed"] = parsed_stores
-                        except (json.JSONDecodeError, TypeError):
-                            # If parsing fails, keep original string
-                            pass
+            if fetched.status_code == 200:
+                projects = list(fetched.data)
                 
                 logger.info(f"[Unity] Retrieved {len(projects)} projects")
                 if projects:
@@ -592,7 +592,7 @@ class UnityAPI(BaseNetworkAPI):
             logger.error(f"[Unity] Error fetching projects: {str(e)}")
             return []
     
-    def get_ad_units(self, project_id: str) -> Dict:
+    def get_ad_units(self, project_id: str) -> Optional[Dict]:
         """Get ad units for a Unity project
         
         API: GET https://services.api.unity.com/monetize/v1/projects/{projectId}/adunits
@@ -601,26 +601,27 @@ class UnityAPI(BaseNetworkAPI):
             project_id: Unity project ID
             
         Returns:
-            Dict with "apple" and "google" keys containing ad units
+            Dict with "apple" and "google" keys containing ad units ({} if the project
+            has none), None if the request failed
         """
         if not self.key_id or not self.secret_key:
             logger.error("[Unity] UNITY_KEY_ID or UNITY_SECRET_KEY not found")
-            return {}
+            return None
         
         headers = self._get_headers(content_type=None)
         
         if not headers:
-            return {}
+            return None
         
         url = f"https://services.api.unity.com/monetize/v1/projects/{project_id}/adunits"
         
         logger.info(f"[Unity] Fetching ad units from {url}")
         
         try:
-            response = requests.get(url, headers=headers, timeout=30)
+            response = request("GET", url, headers=headers, timeout=30)
             
             if response.status_code == 200:
-                result = response.json()
+                result = parse_json(response, default={})
                 logger.info(f"[Unity] Retrieved ad units for project {project_id}")
                 logger.info(f"[Unity] Ad units response type: {type(result)}")
                 if isinstance(result, dict):
@@ -642,7 +643,7 @@ class UnityAPI(BaseNetworkAPI):
                     logger.error("[Unity] Permission denied")
                 elif response.status_code == 404:
                     logger.error(f"[Unity] Project {project_id} not found")
-                return {}
+                return None
         except requests.exceptions.RequestException as e:
             logger.error(f"[Unity] Error fetching ad units: {str(e)}")
-            return {}
\ No newline at end of file
+            return None
\ No newline at end of file
@@ -5,6 +5,7 @@ import json
 import logging
 from .base_network_api import BaseNetworkAPI
 from utils.helpers import get_env_var, mask_sensitive_data
+from utils.http_json import request as http_request
 
 logger = logging.getLogger(__name__)
 
@@ -16,6 +17,10 @@ class VungleAPI(BaseNetworkAPI):
         super().__init__("Vungle")
         self.base_url = "https://publisher-api.vungle.com/api/v1"
     
+    def probe(self) -> Optional[bool]:
+        """Health check: fetch (or reuse) the JWT token"""
+        return bool(self._get_jwt_token())
+    
     def _get_jwt_token(self) -> Optional[str]:
         """Get Vungle JWT Token for API calls
         
@@ -46,7 +51,7 @@ class VungleAPI(BaseNetworkAPI):
         logger.info(f"[Vungle] Requesting JWT token from {auth_url}")
         
         try:
-            response = requests.get(auth_url, headers=headers, timeout=30)
+            response = http_request("GET", auth_url, headers=headers, timeout=30)
             
             if response.status_code == 200:
                 result = response.json()
@@ -341,7 +346,7 @@ class VungleAPI(BaseNetworkAPI):
         
         try:
             # Use PATCH method
-            response = requests.patch(url, headers=headers, json=payload, timeout=30)
+            response = http_request("PATCH", url, headers=headers, json=payload, timeout=30)
             
             self.logger.info(f"[Vungle] Response Status: {response.status_code}")
             
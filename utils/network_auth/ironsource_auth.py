@@ -5,8 +5,10 @@ import json
 import time
 import base64
 import logging
+import threading
 from .base_auth import BaseAuth
 from utils.helpers import get_env_var
+from utils.http_json import request as http_request
 
 logger = logging.getLogger(__name__)
 
@@ -16,6 +18,11 @@ class IronSourceAuth(BaseAuth):
     
     def __init__(self):
         super().__init__("IronSource")
+        # Last fetched bearer token (reused until it is about to expire)
+        self._cached_token = None
+        # Token the API rejected (401); never handed out again, even from .env
+        self._rejected_token = None
+        self._token_lock = threading.Lock()
     
     def _is_token_expired(self, token: str) -> bool:
         """Check if JWT token is expired by parsing exp claim
@@ -96,7 +103,9 @@ class IronSourceAuth(BaseAuth):
         bearer_token = self.get_env_var("IRONSOURCE_BEARER_TOKEN") or self.get_env_var("IRONSOURCE_API_TOKEN")
         
         # If bearer token exists, check if it's still valid (1 hour buffer)
-        if bearer_token:
+        if bearer_token and bearer_token == self._rejected_token:
+            logger.info("[IronSource] Existing bearer token was rejected by the API, refreshing...")
+        elif bearer_token:
             logger.info("[IronSource] Found existing bearer token, checking expiration...")
             if not self._is_token_expired(bearer_token):
                 logger.info("[IronSource] Using existing valid bearer token")
@@ -104,16 +113,33 @@ class IronSourceAuth(BaseAuth):
             else:
                 logger.info("[IronSource] Existing bearer token is expired or will expire soon, refreshing...")
         
-        # Fetch new token using secret_key and refresh_token
-        logger.info("[IronSource] Fetching new bearer token...")
-        new_token = self.refresh_token(refresh_token, secret_key)
+        with self._token_lock:
+            # Reuse the token fetched earlier (e.g. by client warm-up) while it is valid
+            if self._cached_token and not self._is_token_expired(self._cached_token):
+                return self._cached_token
+            
+            # Fetch new token using secret_key and refresh_token
+            logger.info("[IronSource] Fetching new bearer token...")
+            new_token = self.refresh_token(refresh_token, secret_key)
+            
+            if new_token:
+                logger.info("[IronSource] Successfully obtained new bearer token")
+                self._cached_token = new_token
+                return new_token
+            else:
+                logger.error("[IronSource] Failed to obtain bearer token. Check logs above for details.")
+                return None
+    
+    def invalidate_token(self, token: Optional[str] = None):
+        """Drop a bearer token the API rejected (401); the next get_token fetches a new one
         
-        if new_token:
-            logger.info("[IronSource] Successfully obtained new bearer token")
-            return new_token
-        else:
-            logger.error("[IronSource] Failed to obtain bearer token. Check logs above for details.")
-            return None
+        Args:
+            token: Rejected token (default: the cached one)
+        """
+        with self._token_lock:
+            self._rejected_token = token or self._cached_token
+            if token is None or token == self._cached_token:
+                self._cached_token = None
     
     def get_headers(self) -> Optional[Dict[str, str]]:
         """Get IronSource API headers with automatic token refresh
@@ -152,7 +178,7 @@ class IronSourceAuth(BaseAuth):
             logger.info(f"[IronSource] Token URL: GET {url}")
             logger.info(f"[IronSource] Headers: {json.dumps({k: '***MASKED***' if 'token' in k.lower() or 'key' in k.lower() else v for k, v in headers.items()}, indent=2)}")
             
-            response = requests.get(url, headers=headers, timeout=30)
+            response = http_request("GET", url, headers=headers, timeout=30)
             
             logger.info(f"[IronSource] Token response status: {response.status_code}")
             
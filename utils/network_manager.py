@@ -5,11 +5,110 @@ import requests
 import base64
 import time
 import hashlib
-from typing import Dict, List, Optional, Any
+import importlib
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timezone
+from typing import TYPE_CHECKING, Dict, List, Optional, Any
 from utils.helpers import get_env_var, mask_sensitive_data
+from utils.http_json import extract_records, get_json_conditional, iter_json_records, request as http_request
+from utils.request_scheduler import BACKGROUND, network_concurrency, request_priority, with_current_priority
+from utils.create_ledger import STATE_DONE, STATE_INFLIGHT, create_dedup_key, dedup_fields, get_create_ledger, is_dedup_enabled
+from utils.inventory_sync import get_inventory_sync_service, is_sync_enabled
+
+if TYPE_CHECKING:
+    from utils.app_records import AppRecordBatch
 
 logger = logging.getLogger(__name__)
 
+# Network API clients: network -> (module, class), imported on first use
+NETWORK_API_CLIENTS = {
+    "ironsource": ("utils.network_apis.ironsource_api", "IronSourceAPI"),
+    "bigoads": ("utils.network_apis.bigoads_api", "BigOAdsAPI"),
+    "mintegral": ("utils.network_apis.mintegral_api", "MintegralAPI"),
+    "inmobi": ("utils.network_apis.inmobi_api", "InMobiAPI"),
+    "fyber": ("utils.network_apis.fyber_api", "FyberAPI"),
+    "applovin": ("utils.network_apis.applovin_api", "AppLovinAPI"),
+    "unity": ("utils.network_apis.unity_api", "UnityAPI"),
+    "pangle": ("utils.network_apis.pangle_api", "PangleAPI"),
+    "vungle": ("utils.network_apis.vungle_api", "VungleAPI"),
+}
+
+# Networks whose app list API supports a server-side limit (newest first)
+SERVER_LIMITED_APP_LISTS = ["mintegral", "inmobi"]
+
+# App creation time fields (field names vary by network)
+_APP_CREATED_FIELDS = ["createTime", "createdAt", "create_time", "created_at", "creationDate", "createdTime"]
+
+
+def _parse_created_time(value) -> Optional[float]:
+    """Parse an app creation time into epoch seconds
+    
+    Networks return epoch seconds, epoch milliseconds (as numbers or digit strings)
+    or ISO 8601 strings; naive ISO values are taken as UTC.
+    
+    Returns:
+        Epoch seconds, or None if the value is missing or not a timestamp
+    """
+    if value is None or isinstance(value, bool) or value == "":
+        return None
+    try:
+        timestamp = float(value)
+    except (TypeError, ValueError):
+        try:
+            parsed = datetime.fromisoformat(str(value).strip().replace("Z", "+00:00"))
+        except ValueError:
+            return None
+        if parsed.tzinfo is None:
+            parsed = parsed.replace(tzinfo=timezone.utc)
+        return parsed.timestamp()
+    # 1e11 seconds is far in the future, so larger values are milliseconds (or finer)
+    while timestamp > 1e11:
+        timestamp /= 1000
+    return timestamp
+
+
+def _app_created_timestamp(app: Dict) -> Optional[float]:
+    for field in _APP_CREATED_FIELDS:
+        timestamp = _parse_created_time(app.get(field))
+        if timestamp is not None:
+            return timestamp
+    return None
+
+
+def sort_apps_newest_first(apps: List[Dict]) -> List[Dict]:
+    """Sort apps by creation time (newest first)
+    
+    Apps without a parseable creation time go last in API order (API order is kept
+    if no app has one).
+    """
+    timestamps = [_app_created_timestamp(app) for app in apps]
+    order = sorted(range(len(apps)), key=lambda i: (timestamps[i] is not None, timestamps[i] or 0.0), reverse=True)
+    return [apps[i] for i in order]
+
+
+def _is_create_success(response: Optional[Dict]) -> bool:
+    return bool(response) and (response.get("status") == 0 or response.get("code") == 0)
+
+
+def _is_outcome_unknown(response: Optional[Dict]) -> bool:
+    """Whether a failed create may still have gone through (timeout / dropped connection)"""
+    msg = str((response or {}).get("msg", "")).lower()
+    return any(marker in msg for marker in ("timed out", "timeout", "connection aborted", "connection reset"))
+
+
+def _deduplicated_response(response: Dict) -> Dict:
+    """Copy of a recorded create response, marked as not sent again"""
+    result = dict(response)
+    result["deduplicated"] = True
+    return result
+
+
+def _is_active(record: Dict) -> bool:
+    """Vungle application/placement status filter"""
+    return str(record.get("status", "")).lower() == "active"
+
+
 # Note: This is a placeholder for the actual AdNetworkManager
 # In a real implementation, this would import from BE/services/ad_network_manager.py
 # For now, we'll create a mock implementation for demonstration
@@ -20,67 +119,242 @@ class MockNetworkManager:
     
     def __init__(self):
         self.clients = {}
-        # Initialize network API instances
-        self._ironsource_api = None
-        self._bigoads_api = None
-        self._mintegral_api = None
-        self._inmobi_api = None
-        self._fyber_api = None
-        self._applovin_api = None
-        self._unity_api = None
-        self._pangle_api = None
-        self._vungle_api = None
+        # Network API instances (created lazily by _get_api, kept as _<network>_api attributes)
+        for network in NETWORK_API_CLIENTS:
+            setattr(self, f"_{network}_api", None)
+        self._clients_lock = threading.Lock()
+        self._client_locks = {network: threading.Lock() for network in NETWORK_API_CLIENTS}
+        # Set when GET /placements?applicationId= returns other apps' placements
+        self.vungle_app_filter_ignored = False
+        # Recent apps per network: network -> (fetched limit or None for full list, apps newest first)
+        self._recent_apps_cache = {}
+        self._recent_apps_lock = threading.Lock()
     
     def get_client(self, network: str):
         """Get API client for a network"""
         return self.clients.get(network)
     
-    def create_app(self, network: str, payload: Dict) -> Dict:
-        """Create app via network API"""
+    def _get_api(self, network: str):
+        """Get the network API client, creating it once (thread-safe)
+        
+        Args:
+            network: Network name (key of NETWORK_API_CLIENTS)
+        
+        Returns:
+            Network API instance
+        """
+        attr = f"_{network}_api"
+        client = getattr(self, attr, None)
+        if client is not None:
+            return client
+        
+        with self._clients_lock:
+            lock = self._client_locks.setdefault(network, threading.Lock())
+        # Per-network lock: parallel workers never build duplicate clients (and auth state),
+        # while slow construction for one network does not block the others
+        with lock:
+            client = getattr(self, attr, None)
+            if client is None:
+                module_path, class_name = NETWORK_API_CLIENTS[network]
+                start = time.perf_counter()
+                client_cls = getattr(importlib.import_module(module_path), class_name)
+                client = client_cls()
+                setattr(self, attr, client)
+                self.clients[network] = client
+                logger.info(f"[{client_cls.__name__}] Client created in {(time.perf_counter() - start) * 1000:.0f} ms")
+        return client
+    
+    def warm_up(self, networks: Optional[List[str]] = None, fetch_tokens: bool = True) -> Dict[str, Optional[str]]:
+        """Pre-create network clients (imports + credentials) and fetch auth tokens
+        
+        Runs networks in parallel so the first real request does not pay import and
+        token handshake costs.
+        
+        Args:
+            networks: Networks to warm up (default: all registered clients)
+            fetch_tokens: Also fetch tokens for clients that cache them
+        
+        Returns:
+            network -> error message (None on success)
+        """
+        networks = [n for n in (networks or NETWORK_API_CLIENTS) if n in NETWORK_API_CLIENTS]
+        
+        def warm_one(network: str) -> Optional[str]:
+            try:
+                client = self._get_api(network)
+                if fetch_tokens and network == "ironsource":
+                    with request_priority(BACKGROUND):
+                        client.auth.get_token()
+                return None
+            except Exception as e:
+                logger.warning(f"[{network.title()}] Warm-up failed: {str(e)}")
+                return str(e)
+        
+        if not networks:
+            return {}
+        with ThreadPoolExecutor(max_workers=min(len(networks), 5), thread_name_prefix="client_warmup") as executor:
+            return dict(zip(networks, executor.map(warm_one, networks)))
+    
+    def supports_probe(self, network: str) -> bool:
+        """Whether the network's client has a cheap health check call (imports the client class only)"""
+        from utils.network_apis import BaseNetworkAPI
+        
+        if network not in NETWORK_API_CLIENTS:
+            return False
+        module_path, class_name = NETWORK_API_CLIENTS[network]
+        client_cls = getattr(importlib.import_module(module_path), class_name)
+        return client_cls.probe is not BaseNetworkAPI.probe
+    
+    def probe(self, network: str) -> Optional[bool]:
+        """Run the network client's health check call
+        
+        Returns:
+            True if the call returned data, False if it returned nothing,
+            None if the network has no cheap call
+        """
+        return self._get_api(network).probe()
+    
+    def create_app(self, network: str, payload: Dict, dedupe: bool = True) -> Dict:
+        """Create app via network API (deduplicated unless dedupe=False, see _create_once)"""
+        response = self._create_once(network, "app", payload, None, lambda: self._create_app(network, payload),
+                                     dedupe=dedupe)
+        if _is_create_success(response) and not response.get("deduplicated"):
+            # New app changes the network's recent apps list and synced inventory
+            self.invalidate_recent_apps(network)
+            get_inventory_sync_service().invalidate(network)
+        return response
+    
+    def _create_once(self, network: str, kind: str, payload: Dict, app_key: Optional[str], create,
+                     dedupe: bool = True) -> Dict:
+        """Run a create call at most once per dedup key
+        
+        The key (network, parent app, platform, store ID, slot type, name) is
+        claimed in the local create ledger first. A recorded success is returned
+        without calling the API while the app/unit is still in the network's
+        inventory (deleted since: created again). If an earlier attempt's outcome
+        is unknown (timeout, crash), the inventory is checked before creating.
+        
+        Args:
+            network: Network name
+            kind: "app" or "unit"
+            payload: Create payload
+            app_key: Parent app key (IronSource units)
+            create: Performs the API call and returns its response
+            dedupe: False (or CREATE_DEDUP=false) always calls the API; the result is still recorded
+        
+        Returns:
+            API response; a replayed or found-in-inventory result has "deduplicated": True
+        """
+        key = create_dedup_key(network, kind, payload, app_key)
+        if key is None:
+            return create()
+        
+        fields = dedup_fields(network, kind, payload, app_key)
+        label = fields["name"] or fields["store_id"]
+        ledger = get_create_ledger()
+        if not (dedupe and is_dedup_enabled()):
+            ledger.forget(key)
+        previous = ledger.claim(key, fields)
+        if previous is not None and previous["state"] == STATE_DONE:
+            # Recorded success: replay it only while the app/unit still exists
+            try:
+                still_exists = self._find_created(network, kind, fields) is not None
+            except LookupError as e:
+                logger.warning(f"[{network.title()}] Could not verify recorded {kind} ({label}): {str(e)}")
+                still_exists = True
+            if still_exists:
+                logger.info(f"[{network.title()}] Duplicate {kind} create skipped ({label})")
+                return _deduplicated_response(previous.get("response") or {"status": 0, "code": 0, "msg": "Success"})
+            logger.info(f"[{network.title()}] Recorded {kind} no longer exists, creating again ({label})")
+            ledger.forget(key)
+            previous = ledger.claim(key, fields)
+        if previous is not None:
+            if previous["state"] == STATE_DONE:
+                return _deduplicated_response(previous.get("response") or {"status": 0, "code": 0, "msg": "Success"})
+            if previous["state"] == STATE_INFLIGHT:
+                return {
+                    "status": 1,
+                    "code": "CREATE_IN_PROGRESS",
+                    "msg": f"The same {kind} is still being created; try again shortly"
+                }
+            # Earlier attempt may have gone through: look it up before creating again
+            try:
+                existing = self._find_created(network, kind, fields)
+            except LookupError as e:
+                logger.warning(f"[{network.title()}] Inventory lookup for {kind} dedup failed: {str(e)}")
+                existing = None
+            if existing is not None:
+                logger.info(f"[{network.title()}] {kind.title()} already exists ({label})")
+                response = {"status": 0, "code": 0, "msg": "Already exists", "result": existing}
+                ledger.complete(key, response)
+                return _deduplicated_response(response)
+        
+        try:
+            response = create()
+        except Exception:
+            ledger.release(key, outcome_unknown=True)
+            raise
+        if _is_create_success(response):
+            ledger.complete(key, response)
+        else:
+            ledger.release(key, outcome_unknown=_is_outcome_unknown(response))
+        return response
+    
+    def forget_created_units(self, network: str, parent: str):
+        """Drop recorded unit creates under a parent app (its units were deactivated/archived/deleted)"""
+        dropped = get_create_ledger().forget_units(network, parent)
+        if dropped:
+            logger.info(f"[{network.title()}] Forgot {dropped} recorded unit creates for {parent}")
+    
+    def _find_created(self, network: str, kind: str, fields: Dict) -> Optional[Dict]:
+        """Fresh inventory lookup for an app/unit matching dedup fields
+        
+        Returns:
+            The matching app/unit dict, or None if the inventory does not have it
+        
+        Raises:
+            LookupError: The lookup failed or came back empty (list APIs return [] on errors)
+        """
+        try:
+            if kind == "app":
+                from utils.app_records import get_app_record_batch
+                batch = get_app_record_batch(network, self.get_apps(network))
+                if not len(batch):
+                    raise LookupError(f"no {network} apps returned")
+                row = batch.find_by_package(fields["store_id"], fields["platform"] or None)
+                if row is None and fields["name"]:
+                    row = next((
+                        row for row, name in enumerate(batch.names)
+                        if str(name).lower() == fields["name"]
+                        and (not fields["platform"] or batch.platforms[row] == fields["platform"])
+                    ), None)
+                return batch.apps[row] if row is not None else None
+            
+            from utils.ad_network_query import clear_unit_caches, get_ironsource_units, get_network_units
+            from utils.app_records import UnitRecord
+            clear_unit_caches()
+            if network == "ironsource":
+                units = get_ironsource_units(fields["parent"])
+            else:
+                units = get_network_units(network, fields["parent"])
+            if not units:
+                raise LookupError(f"no units returned for {fields['parent']}")
+            return next((
+                unit for unit in units
+                if isinstance(unit, dict) and str(UnitRecord.from_api(network, unit).name).lower() == fields["name"]
+            ), None)
+        except LookupError:
+            raise
+        except Exception as e:
+            raise LookupError(str(e)) from e
+    
+    def _create_app(self, network: str, payload: Dict) -> Dict:
+        """Dispatch app creation to the network API"""
         if network == "ironsource":
             return self._create_ironsource_app(payload)
-        elif network == "pangle":
-            # Use new PangleAPI
-            if self._pangle_api is None:
-                from utils.network_apis.pangle_api import PangleAPI
-                self._pangle_api = PangleAPI()
-            return self._pangle_api.create_app(payload)
-        elif network == "bigoads":
-            # Use new BigOAdsAPI
-            if self._bigoads_api is None:
-                from utils.network_apis.bigoads_api import BigOAdsAPI
-                self._bigoads_api = BigOAdsAPI()
-            return self._bigoads_api.create_app(payload)
-        elif network == "mintegral":
-            # Use new MintegralAPI
-            if self._mintegral_api is None:
-                from utils.network_apis.mintegral_api import MintegralAPI
-                self._mintegral_api = MintegralAPI()
-            return self._mintegral_api.create_app(payload)
-        elif network == "inmobi":
-            # Use new InMobiAPI
-            if self._inmobi_api is None:
-                from utils.network_apis.inmobi_api import InMobiAPI
-                self._inmobi_api = InMobiAPI()
-            return self._inmobi_api.create_app(payload)
-        elif network == "fyber":
-            # Use new FyberAPI
-            if self._fyber_api is None:
-                from utils.network_apis.fyber_api import FyberAPI
-                self._fyber_api = FyberAPI()
-            return self._fyber_api.create_app(payload)
-        elif network == "unity":
-            # Use new UnityAPI
-            if self._unity_api is None:
-                from utils.network_apis.unity_api import UnityAPI
-                self._unity_api = UnityAPI()
-            return self._unity_api.create_app(payload)
-        elif network == "vungle":
-            # Use new VungleAPI
-            if self._vungle_api is None:
-                from utils.network_apis.vungle_api import VungleAPI
-                self._vungle_api = VungleAPI()
-            return self._vungle_api.create_app(payload)
+        if network in NETWORK_API_CLIENTS and network != "applovin":
+            # AppLovin does not support app creation via API (falls through to mock)
+            return self._get_api(network).create_app(payload)
         
         # Mock implementation for other networks
         logger.info(f"[{network.title()}] API Request: Create App (Mock)")
@@ -205,11 +479,7 @@ class MockNetworkManager:
         1. Get bearer token (with automatic refresh if needed)
         2. Return headers with Authorization: Bearer {token}
         """
-        # Use new IronSourceAuth
-        if self._ironsource_api is None:
-            from utils.network_apis.ironsource_api import IronSourceAPI
-            self._ironsource_api = IronSourceAPI()
-        return self._ironsource_api.auth.get_headers()
+        return self._get_api("ironsource").auth.get_headers()
     
     def _refresh_ironsource_token(self, refresh_token: str, secret_key: str) -> Optional[str]:
         """Get IronSource bearer token using refresh token and secret key
@@ -231,7 +501,7 @@ class MockNetworkManager:
             logger.info(f"[IronSource] Token URL: GET {url}")
             logger.info(f"[IronSource] Headers: {json.dumps(mask_sensitive_data(headers), indent=2)}")
             
-            response = requests.get(url, headers=headers, timeout=30)
+            response = http_request("GET", url, headers=headers, timeout=30)
             
             logger.info(f"[IronSource] Token response status: {response.status_code}")
             
@@ -269,75 +539,24 @@ class MockNetworkManager:
     
     def _create_ironsource_app(self, payload: Dict) -> Dict:
         """Create app via IronSource API (wrapper for compatibility)"""
-        # Use new IronSourceAPI
-        if self._ironsource_api is None:
-            from utils.network_apis.ironsource_api import IronSourceAPI
-            self._ironsource_api = IronSourceAPI()
-        return self._ironsource_api.create_app(payload)
+        return self._get_api("ironsource").create_app(payload)
     
-    def create_unit(self, network: str, payload: Dict, app_key: Optional[str] = None) -> Dict:
-        """Create unit via network API
+    def create_unit(self, network: str, payload: Dict, app_key: Optional[str] = None, dedupe: bool = True) -> Dict:
+        """Create unit via network API (deduplicated, see _create_once)
         
         Args:
             network: Network name
             payload: Unit creation payload (for IronSource, this is a single ad unit object)
             app_key: App key (required for IronSource)
+            dedupe: False always calls the API (no replay of a recorded create)
         """
-        if network == "ironsource":
-            # Use new IronSourceAPI
-            if self._ironsource_api is None:
-                from utils.network_apis.ironsource_api import IronSourceAPI
-                self._ironsource_api = IronSourceAPI()
-            return self._ironsource_api.create_unit(payload, app_key=app_key)
-        elif network == "bigoads":
-            # Use new BigOAdsAPI
-            if self._bigoads_api is None:
-                from utils.network_apis.bigoads_api import BigOAdsAPI
-                self._bigoads_api = BigOAdsAPI()
-            return self._bigoads_api.create_unit(payload, app_key=app_key)
-        elif network == "pangle":
-            # Use new PangleAPI
-            if self._pangle_api is None:
-                from utils.network_apis.pangle_api import PangleAPI
-                self._pangle_api = PangleAPI()
-            return self._pangle_api.create_unit(payload, app_key=app_key)
-        elif network == "mintegral":
-            # Use new MintegralAPI
-            if self._mintegral_api is None:
-                from utils.network_apis.mintegral_api import MintegralAPI
-                self._mintegral_api = MintegralAPI()
-            return self._mintegral_api.create_unit(payload, app_key=app_key)
-        elif network == "inmobi":
-            # Use new InMobiAPI
-            if self._inmobi_api is None:
-                from utils.network_apis.inmobi_api import InMobiAPI
-                self._inmobi_api = InMobiAPI()
-            return self._inmobi_api.create_unit(payload, app_key=app_key)
-        elif network == "fyber":
-            # Use new FyberAPI
-            if self._fyber_api is None:
-                from utils.network_apis.fyber_api import FyberAPI
-                self._fyber_api = FyberAPI()
-            return self._fyber_api.create_unit(payload, app_key=app_key)
-        elif network == "applovin":
-            # Use new AppLovinAPI
-            if self._applovin_api is None:
-                from utils.network_apis.applovin_api import AppLovinAPI
-                self._applovin_api = AppLovinAPI()
-            return self._applovin_api.create_unit(payload, app_key=app_key)
-        elif network == "unity":
-            # Unity uses create_ad_units directly, but for consistency:
-            # Use new UnityAPI
-            if self._unity_api is None:
-                from utils.network_apis.unity_api import UnityAPI
-                self._unity_api = UnityAPI()
-            return self._unity_api.create_unit(payload, app_key=app_key)
-        elif network == "vungle":
-            # Use new VungleAPI
-            if self._vungle_api is None:
-                from utils.network_apis.vungle_api import VungleAPI
-                self._vungle_api = VungleAPI()
-            return self._vungle_api.create_unit(payload, app_key=app_key)
+        return self._create_once(network, "unit", payload, app_key,
+                                 lambda: self._create_unit(network, payload, app_key=app_key), dedupe=dedupe)
+    
+    def _create_unit(self, network: str, payload: Dict, app_key: Optional[str] = None) -> Dict:
+        """Dispatch unit creation to the network API"""
+        if network in NETWORK_API_CLIENTS:
+            return self._get_api(network).create_unit(payload, app_key=app_key)
         
         # Mock implementation for other networks
         logger.info(f"[{network.title()}] API Request: Create Unit (Mock)")
@@ -356,6 +575,65 @@ class MockNetworkManager:
         logger.info(f"[{network.title()}] Response (Mock): {json.dumps(mock_response, indent=2)}")
         return mock_response
     
+    def create_units(self, network: str, payloads: List[Dict], app_key: Optional[str] = None,
+                     dedupe: bool = True) -> List[Dict]:
+        """Create several units on one network concurrently (within the network's request limits)
+        
+        Args:
+            network: Network name
+            payloads: Unit creation payloads (one per unit, e.g. RV/IS/BN)
+            app_key: App key (required for IronSource)
+            dedupe: False always calls the API (see create_unit)
+        
+        Returns:
+            List of responses in the same order as payloads
+        """
+        if not payloads:
+            return []
+        
+        max_concurrent = network_concurrency(network)
+        
+        def create_one(payload: Dict) -> Dict:
+            try:
+                return self.create_unit(network, payload, app_key=app_key, dedupe=dedupe)
+            except Exception as e:
+                logger.exception(f"[{network.title()}] Error creating unit")
+                return {
+                    "status": 1,
+                    "code": "UNEXPECTED_ERROR",
+                    "msg": str(e)
+                }
+        
+        if len(payloads) == 1 or max_concurrent == 1:
+            return [create_one(payload) for payload in payloads]
+        
+        # Workers keep the caller's request priority (interactive one-click or bulk run);
+        # the request scheduler keeps them within the network's limits
+        with ThreadPoolExecutor(max_workers=min(len(payloads), max_concurrent)) as executor:
+            return list(executor.map(with_current_priority(create_one), payloads))
+    
+    def create_units_across_networks(self, payloads_by_network: Dict[str, List[Dict]]) -> Dict[str, List[Dict]]:
+        """Create default units for one product on several networks at once
+        
+        Networks run in parallel; units within a network go through create_units.
+        
+        Args:
+            payloads_by_network: network -> unit creation payloads
+        
+        Returns:
+            network -> list of responses (same order as the payloads)
+        """
+        networks = [network for network, payloads in payloads_by_network.items() if payloads]
+        if not networks:
+            return {}
+        
+        with ThreadPoolExecutor(max_workers=min(len(networks), 5)) as executor:
+            futures = {
+                network: executor.submit(with_current_priority(self.create_units), network, payloads_by_network[network])
+                for network in networks
+            }
+            return {network: future.result() for network, future in futures.items()}
+    
     def _create_ironsource_placements(self, app_key: str, ad_units: List[Dict]) -> Dict:
         """Create placements via IronSource API (wrapper for compatibility)
         
@@ -363,11 +641,7 @@ class MockNetworkManager:
             app_key: Application key from IronSource platform
             ad_units: List of ad unit objects to create
         """
-        # Use new IronSourceAPI
-        if self._ironsource_api is None:
-            from utils.network_apis.ironsource_api import IronSourceAPI
-            self._ironsource_api = IronSourceAPI()
-        return self._ironsource_api.create_placements(app_key, ad_units)
+        return self._get_api("ironsource").create_placements(app_key, ad_units)
     
     def _update_ironsource_ad_units(self, app_key: str, ad_units: List[Dict]) -> Dict:
         """Update (activate) ad units via IronSource API (wrapper for compatibility)
@@ -382,11 +656,11 @@ class MockNetworkManager:
                 - isPaused (optional): false to activate
                 - mediationAdUnitName (optional): new name
         """
-        # Use new IronSourceAPI
-        if self._ironsource_api is None:
-            from utils.network_apis.ironsource_api import IronSourceAPI
-            self._ironsource_api = IronSourceAPI()
-        return self._ironsource_api.update_ad_units(app_key, ad_units)
+        response = self._get_api("ironsource").update_ad_units(app_key, ad_units)
+        if response.get("status") == 0 and any(unit.get("isPaused") for unit in ad_units):
+            # Paused units do not count as created any more
+            self.forget_created_units("ironsource", app_key)
+        return response
     
     def _get_ironsource_instances(self, app_key: str) -> Dict:
         """Get instances via IronSource API (wrapper for compatibility)
@@ -399,11 +673,36 @@ class MockNetworkManager:
         Returns:
             Dict with status, code, msg, and result (list of instances)
         """
-        # Use new IronSourceAPI
-        if self._ironsource_api is None:
-            from utils.network_apis.ironsource_api import IronSourceAPI
-            self._ironsource_api = IronSourceAPI()
-        return self._ironsource_api.get_instances(app_key)
+        return self._get_api("ironsource").get_instances(app_key)
+    
+    def _get_ironsource_instances_bulk(self, app_keys: List[str]) -> Dict[str, Dict]:
+        """Get instances for several IronSource apps concurrently (within the request limits)
+        
+        Args:
+            app_keys: Application keys (duplicates are fetched once)
+        
+        Returns:
+            app_key -> get_instances response dict (status, code, msg, result)
+        """
+        app_keys = list(dict.fromkeys(key for key in app_keys if key))
+        if not app_keys:
+            return {}
+        
+        def fetch_one(app_key: str) -> Dict:
+            try:
+                return self._get_ironsource_instances(app_key)
+            except Exception as e:
+                logger.exception(f"[IronSource] Error fetching instances for {app_key}")
+                return {
+                    "status": 1,
+                    "code": "UNEXPECTED_ERROR",
+                    "msg": str(e)
+                }
+        
+        # Workers keep the caller's priority (bulk UI run, or background sync warming caches)
+        fetch = with_current_priority(fetch_one)
+        with ThreadPoolExecutor(max_workers=min(len(app_keys), network_concurrency("ironsource")), thread_name_prefix="ironsource_instances") as executor:
+            return dict(zip(app_keys, executor.map(fetch, app_keys)))
     
     def _generate_bigoads_sign(self, developer_id: str, token: str) -> tuple[str, str]:
         """Generate BigOAds API signature
@@ -508,7 +807,7 @@ class MockNetworkManager:
         
         try:
             # Use form-urlencoded (matching Media List API pattern)
-            response = requests.post(url, data=request_params, headers=headers, timeout=30)
+            response = http_request("POST", url, data=request_params, headers=headers, timeout=30)
             
             logger.info(f"[Mintegral] Response Status: {response.status_code}")
             
@@ -638,7 +937,7 @@ class MockNetworkManager:
         
         try:
             # GET request with params (as per reference code)
-            response = requests.get(url, headers=headers, params=request_params, timeout=30)
+            response = http_request("GET", url, headers=headers, params=request_params, timeout=30)
             
             print(f"[Mintegral] Response Status: {response.status_code}", file=sys.stderr)
             logger.info(f"[Mintegral] Response Status: {response.status_code}")
@@ -766,7 +1065,7 @@ class MockNetworkManager:
         
         try:
             # Use data= instead of json= for form-urlencoded
-            response = requests.post(url, data=api_payload, headers=headers, timeout=30)
+            response = http_request("POST", url, data=api_payload, headers=headers, timeout=30)
             
             logger.info(f"[Mintegral] Response Status: {response.status_code}")
             
@@ -877,7 +1176,7 @@ class MockNetworkManager:
         logger.info(f"[BigOAds] Request Payload: {json.dumps(mask_sensitive_data(cleaned_payload), indent=2)}")
         
         try:
-            response = requests.post(url, json=cleaned_payload, headers=headers)
+            response = http_request("POST", url, json=cleaned_payload, headers=headers)
             
             # Log response even if status code is not 200
             logger.info(f"[BigOAds] Response Status: {response.status_code}")
@@ -956,7 +1255,7 @@ class MockNetworkManager:
         logger.info(f"[InMobi] Request Payload: {json.dumps(mask_sensitive_data(cleaned_payload), indent=2)}")
         
         try:
-            response = requests.post(url, json=cleaned_payload, headers=headers, timeout=30)
+            response = http_request("POST", url, json=cleaned_payload, headers=headers, timeout=30)
             
             # Log response even if status code is not 200
             logger.info(f"[InMobi] Response Status: {response.status_code}")
@@ -1027,10 +1326,7 @@ class MockNetworkManager:
         Returns:
             Access token string or None if failed
         """
-        if self._fyber_api is None:
-            from utils.network_apis.fyber_api import FyberAPI
-            self._fyber_api = FyberAPI()
-        return self._fyber_api.get_access_token()
+        return self._get_api("fyber").get_access_token()
     
     def _create_fyber_app(self, payload: Dict) -> Dict:
         """Create app via Fyber (DT) API"""
@@ -1057,7 +1353,7 @@ class MockNetworkManager:
         logger.info(f"[Fyber] Request Payload: {json.dumps(mask_sensitive_data(payload), indent=2)}")
         
         try:
-            response = requests.post(url, json=payload, headers=headers, timeout=30)
+            response = http_request("POST", url, json=payload, headers=headers, timeout=30)
             
             # Log response even if status code is not 200
             logger.info(f"[Fyber] Response Status: {response.status_code}")
@@ -1123,10 +1419,7 @@ class MockNetworkManager:
         Returns:
             API response dict
         """
-        if self._unity_api is None:
-            from utils.network_apis.unity_api import UnityAPI
-            self._unity_api = UnityAPI()
-        return self._unity_api.create_ad_units(project_id, store_name, ad_units_payload)
+        return self._get_api("unity").create_ad_units(project_id, store_name, ad_units_payload)
     
     def _update_unity_ad_units(self, project_id: str, store_name: str, ad_units_payload: Dict) -> Dict:
         """Update Unity ad units (wrapper for compatibility)
@@ -1134,10 +1427,12 @@ class MockNetworkManager:
         Note: This is a wrapper method for backward compatibility.
         New code should use UnityAPI.update_ad_units directly.
         """
-        if self._unity_api is None:
-            from utils.network_apis.unity_api import UnityAPI
-            self._unity_api = UnityAPI()
-        return self._unity_api.update_ad_units(project_id, store_name, ad_units_payload)
+        response = self._get_api("unity").update_ad_units(project_id, store_name, ad_units_payload)
+        if response.get("status") == 0 and any(
+            isinstance(update, dict) and update.get("archive") for update in (ad_units_payload or {}).values()
+        ):
+            self.forget_created_units("unity", project_id)
+        return response
 
     def _create_unity_placements(self, project_id: str, store_name: str, ad_unit_id: str, placements_payload: List[Dict]) -> Dict:
         """Create Unity placements (wrapper for compatibility)
@@ -1145,21 +1440,15 @@ class MockNetworkManager:
         Note: This is a wrapper method for backward compatibility.
         New code should use UnityAPI.create_placements directly.
         """
-        if self._unity_api is None:
-            from utils.network_apis.unity_api import UnityAPI
-            self._unity_api = UnityAPI()
-        return self._unity_api.create_placements(project_id, store_name, ad_unit_id, placements_payload)
+        return self._get_api("unity").create_placements(project_id, store_name, ad_unit_id, placements_payload)
     
-    def _get_unity_ad_units(self, project_id: str) -> Dict:
-        """Get Unity ad units (wrapper for compatibility)
+    def _get_unity_ad_units(self, project_id: str) -> Optional[Dict]:
+        """Get Unity ad units, None if the request failed (wrapper for compatibility)
         
         Note: This is a wrapper method for backward compatibility.
         New code should use UnityAPI.get_ad_units directly.
         """
-        if self._unity_api is None:
-            from utils.network_apis.unity_api import UnityAPI
-            self._unity_api = UnityAPI()
-        return self._unity_api.get_ad_units(project_id)
+        return self._get_api("unity").get_ad_units(project_id)
 
     def _create_fyber_unit(self, payload: Dict) -> Dict:
         """Create placement (unit) via Fyber (DT) API
@@ -1189,7 +1478,7 @@ class MockNetworkManager:
         logger.info(f"[Fyber] Request Payload: {json.dumps(mask_sensitive_data(payload), indent=2)}")
         
         try:
-            response = requests.post(url, json=payload, headers=headers, timeout=30)
+            response = http_request("POST", url, json=payload, headers=headers, timeout=30)
             
             # Log response even if status code is not 200
             logger.info(f"[Fyber] Response Status: {response.status_code}")
@@ -1280,7 +1569,7 @@ class MockNetworkManager:
         logger.info(f"[BigOAds] Payload values: {list(payload.values())}")
         
         try:
-            response = requests.post(url, json=payload, headers=headers, timeout=30)
+            response = http_request("POST", url, json=payload, headers=headers, timeout=30)
             
             print(f"[BigOAds] Response Status: {response.status_code}", file=sys.stderr)
             print(f"[BigOAds] Response Headers: {dict(response.headers)}", file=sys.stderr)
@@ -1387,7 +1676,7 @@ class MockNetworkManager:
         logger.info(f"[InMobi] Request Payload: {json.dumps(mask_sensitive_data(payload), indent=2)}")
         
         try:
-            response = requests.post(url, json=payload, headers=headers, timeout=30)
+            response = http_request("POST", url, json=payload, headers=headers, timeout=30)
             
             # Log response even if status code is not 200
             logger.info(f"[InMobi] Response Status: {response.status_code}")
@@ -1447,11 +1736,7 @@ class MockNetworkManager:
         Args:
             app_key: Optional app key to filter by. If provided, only returns that app.
         """
-        # Use new IronSourceAPI
-        if self._ironsource_api is None:
-            from utils.network_apis.ironsource_api import IronSourceAPI
-            self._ironsource_api = IronSourceAPI()
-        return self._ironsource_api.get_apps(app_key=app_key)
+        return self._get_api("ironsource").get_apps(app_key=app_key)
     
     def _get_bigoads_apps(self) -> List[Dict]:
         """Get apps list from BigOAds API"""
@@ -1489,7 +1774,7 @@ class MockNetworkManager:
         logger.info(f"[BigOAds] Request Payload: {json.dumps(payload, indent=2)}")
         
         try:
-            response = requests.post(url, json=payload, headers=headers)
+            response = http_request("POST", url, json=payload, headers=headers)
             
             logger.info(f"[BigOAds] Response Status: {response.status_code}")
             
@@ -1590,7 +1875,7 @@ class MockNetworkManager:
         logger.info(f"[InMobi] Request Params: {json.dumps(params, indent=2)}")
         
         try:
-            response = requests.get(url, headers=headers, params=params, timeout=30)
+            response = http_request("GET", url, headers=headers, params=params, timeout=30)
             
             logger.info(f"[InMobi] Response Status: {response.status_code}")
             
@@ -1712,7 +1997,7 @@ class MockNetworkManager:
         logger.info(f"[Fyber] Params: {json.dumps(params, indent=2)}")
         
         try:
-            response = requests.get(url, headers=headers, params=params, timeout=30)
+            response = http_request("GET", url, headers=headers, params=params, timeout=30)
             
             logger.info(f"[Fyber] Response Status: {response.status_code}")
             
@@ -1813,7 +2098,7 @@ class MockNetworkManager:
         logger.info(f"[Vungle] Requesting JWT token from {auth_url}")
         
         try:
-            response = requests.get(auth_url, headers=headers, timeout=30)
+            response = http_request("GET", auth_url, headers=headers, timeout=30)
             
             if response.status_code == 200:
                 result = response.json()
@@ -1864,31 +2149,16 @@ class MockNetworkManager:
         logger.info(f"[Vungle] Fetching applications from {applications_url}")
         
         try:
-            response = requests.get(applications_url, headers=headers, timeout=30)
-            
-            if response.status_code == 200:
-                result = response.json()
-                
-                # Parse response - can be list or dict
-                applications = []
-                if isinstance(result, list):
-                    applications = result
-                elif isinstance(result, dict):
-                    applications = result.get("data", result.get("applications", result.get("list", [])))
-                    if not isinstance(applications, list):
-                        applications = []
-                
-                # Filter by status: only return "active" applications
-                if applications:
-                    logger.info(f"[Vungle] Filtering applications by status=active (before: {len(applications)} applications)")
-                    active_applications = []
-                    for app in applications:
-                        app_status = app.get("status", "").lower() if isinstance(app.get("status"), str) else str(app.get("status", "")).lower()
-                        if app_status == "active":
-                            active_applications.append(app)
-                    applications = active_applications
-                    logger.info(f"[Vungle] Filtered to {len(applications)} active applications")
-                
+            # Conditional GET: unchanged lists reuse the cached parsed + filtered list
+            fetched = get_json_conditional(
+                applications_url, headers=headers, timeout=30,
+                transform=lambda result: [app for app in extract_records(result, ("data", "applications", "list")) if _is_active(app)]
+            )
+            response = fetched.response
+            
+            if fetched.status_code == 200:
+                # Parse response (list or dict), keep only "active" applications
+                applications = list(fetched.data)
                 logger.info(f"[Vungle] Retrieved {len(applications)} applications")
                 return applications
             else:
@@ -1934,54 +2204,34 @@ class MockNetworkManager:
         logger.info(f"[Vungle] Fetching placements for applicationId={app_id} from {placements_url}")
         
         try:
-            response = requests.get(placements_url, headers=headers, params=params, timeout=30)
+            response = http_request("GET", placements_url, headers=headers, params=params, timeout=30, stream=True)
             
             if response.status_code == 200:
-                result = response.json()
+                # Parse response (list or dict); client-side applicationId filter (in case API
+                # ignores the query parameter) and status=active filter are applied while reading
+                other_apps = 0
                 
-                # Parse response - can be list or dict
-                placements = []
-                if isinstance(result, list):
-                    placements = result
-                elif isinstance(result, dict):
-                    placements = result.get("data", result.get("placements", result.get("list", [])))
-                    if not isinstance(placements, list):
-                        placements = []
-                
-                # Additional client-side filtering (in case API ignores query parameter)
-                if app_id and placements:
-                    logger.info(f"[Vungle] Filtering placements by applicationId={app_id} (before: {len(placements)} placements)")
-                    filtered_placements = []
-                    for placement in placements:
-                        app_info = placement.get("application", {})
-                        # Handle application as string (JSON) or dict
-                        if isinstance(app_info, str):
-                            try:
-                                import json
-                                app_info = json.loads(app_info)
-                            except (json.JSONDecodeError, TypeError):
-                                logger.warning(f"[Vungle] Failed to parse application JSON in filtering: {app_info[:100]}")
-                                continue
-                        
-                        if isinstance(app_info, dict):
-                            placement_app_id = app_info.get("id")
-                            # Compare as strings to handle both string and number types
-                            if str(placement_app_id) == str(app_id):
-                                filtered_placements.append(placement)
-                    placements = filtered_placements
-                    logger.info(f"[Vungle] Filtered to {len(placements)} placements for applicationId={app_id}")
-                
-                # Filter by status: only return "active" placements
-                if placements:
-                    logger.info(f"[Vungle] Filtering placements by status=active (before: {len(placements)} placements)")
-                    active_placements = []
-                    for placement in placements:
-                        placement_status = placement.get("status", "").lower() if isinstance(placement.get("status"), str) else str(placement.get("status", "")).lower()
-                        if placement_status == "active":
-                            active_placements.append(placement)
-                    placements = active_placements
-                    logger.info(f"[Vungle] Filtered to {len(placements)} active placements")
+                def _matches(placement: Dict) -> bool:
+                    nonlocal other_apps
+                    app_info = placement.get("application", {})
+                    # Handle application as string (JSON) or dict
+                    if isinstance(app_info, str):
+                        try:
+                            app_info = json.loads(app_info)
+                        except (json.JSONDecodeError, TypeError):
+                            logger.warning(f"[Vungle] Failed to parse application JSON in filtering: {app_info[:100]}")
+                            return False
+                    # Compare as strings to handle both string and number types
+                    if not isinstance(app_info, dict) or str(app_info.get("id")) != str(app_id):
+                        other_apps += 1
+                        return False
+                    return _is_active(placement)
                 
+                placements = list(iter_json_records(response, ("data", "placements", "list"), _matches))
+                if other_apps:
+                    # Server ignored applicationId; per-app lookups should use the indexed full list instead
+                    self.vungle_app_filter_ignored = True
+                    logger.warning(f"[Vungle] applicationId filter ignored by server ({other_apps} placements of other apps)")
                 logger.info(f"[Vungle] Retrieved {len(placements)} placements for applicationId={app_id}")
                 return placements
             else:
@@ -2020,31 +2270,16 @@ class MockNetworkManager:
         logger.info(f"[Vungle] Fetching all placements from {placements_url}")
         
         try:
-            response = requests.get(placements_url, headers=headers, timeout=30)
-            
-            if response.status_code == 200:
-                result = response.json()
-                
-                # Parse response - can be list or dict
-                placements = []
-                if isinstance(result, list):
-                    placements = result
-                elif isinstance(result, dict):
-                    placements = result.get("data", result.get("placements", result.get("list", [])))
-                    if not isinstance(placements, list):
-                        placements = []
-                
-                # Filter by status: only return "active" placements
-                if placements:
-                    logger.info(f"[Vungle] Filtering placements by status=active (before: {len(placements)} placements)")
-                    active_placements = []
-                    for placement in placements:
-                        placement_status = placement.get("status", "").lower() if isinstance(placement.get("status"), str) else str(placement.get("status", "")).lower()
-                        if placement_status == "active":
-                            active_placements.append(placement)
-                    placements = active_placements
-                    logger.info(f"[Vungle] Filtered to {len(placements)} active placements")
-                
+            # Conditional GET: unchanged lists reuse the cached parsed + filtered list
+            fetched = get_json_conditional(
+                placements_url, headers=headers, timeout=30,
+                transform=lambda result: [placement for placement in extract_records(result, ("data", "placements", "list")) if _is_active(placement)]
+            )
+            response = fetched.response
+            
+            if fetched.status_code == 200:
+                # Parse response (list or dict), keep only "active" placements
+                placements = list(fetched.data)
                 logger.info(f"[Vungle] Retrieved {len(placements)} placements")
                 return placements
             else:
@@ -2064,10 +2299,7 @@ class MockNetworkManager:
         Note: This is a wrapper method for backward compatibility.
         New code should use UnityAPI.get_apps directly.
         """
-        if self._unity_api is None:
-            from utils.network_apis.unity_api import UnityAPI
-            self._unity_api = UnityAPI()
-        return self._unity_api.get_apps(app_key=None)
+        return self._get_api("unity").get_apps(app_key=None)
     
     
     def get_apps(self, network: str, app_key: Optional[str] = None) -> List[Dict]:
@@ -2078,35 +2310,15 @@ class MockNetworkManager:
             app_key: Optional app key to filter by (for IronSource)
         """
         if network == "bigoads":
-            # Use new BigOAdsAPI
-            if self._bigoads_api is None:
-                from utils.network_apis.bigoads_api import BigOAdsAPI
-                self._bigoads_api = BigOAdsAPI()
-            return self._bigoads_api.get_apps(app_key=app_key)
+            return self._get_api("bigoads").get_apps(app_key=app_key)
         elif network == "ironsource":
-            # Use new IronSourceAPI
-            if self._ironsource_api is None:
-                from utils.network_apis.ironsource_api import IronSourceAPI
-                self._ironsource_api = IronSourceAPI()
-            return self._ironsource_api.get_apps(app_key=app_key)
+            return self._get_api("ironsource").get_apps(app_key=app_key)
         elif network == "mintegral":
-            # Use new MintegralAPI
-            if self._mintegral_api is None:
-                from utils.network_apis.mintegral_api import MintegralAPI
-                self._mintegral_api = MintegralAPI()
-            return self._mintegral_api.get_apps(app_key=app_key)
+            return self._get_api("mintegral").get_apps(app_key=app_key)
         elif network == "inmobi":
-            # Use new InMobiAPI
-            if self._inmobi_api is None:
-                from utils.network_apis.inmobi_api import InMobiAPI
-                self._inmobi_api = InMobiAPI()
-            return self._inmobi_api.get_apps(app_key=app_key)
+            return self._get_api("inmobi").get_apps(app_key=app_key)
         elif network == "fyber":
-            # Use new FyberAPI
-            if self._fyber_api is None:
-                from utils.network_apis.fyber_api import FyberAPI
-                self._fyber_api = FyberAPI()
-            return self._fyber_api.get_apps(app_key=app_key)
+            return self._get_api("fyber").get_apps(app_key=app_key)
         elif network == "vungle":
             # Use GET /applications API to get applications list
             applications = self._get_vungle_applications()
@@ -2137,18 +2349,10 @@ class MockNetworkManager:
             
             return formatted_apps
         elif network == "unity":
-            # Use new UnityAPI
-            if self._unity_api is None:
-                from utils.network_apis.unity_api import UnityAPI
-                self._unity_api = UnityAPI()
             # Unity does not use app_key, but we pass it for interface consistency
-            return self._unity_api.get_apps(app_key=None)
+            return self._get_api("unity").get_apps(app_key=None)
         elif network == "pangle":
-            # Use new PangleAPI
-            if self._pangle_api is None:
-                from utils.network_apis.pangle_api import PangleAPI
-                self._pangle_api = PangleAPI()
-            return self._pangle_api.get_apps(app_key=app_key)
+            return self._get_api("pangle").get_apps(app_key=app_key)
         
         # Mock implementation for other networks
         return [
@@ -2166,14 +2370,74 @@ class MockNetworkManager:
             }
         ]
     
-    def get_units(self, network: str, app_code: str) -> List[Dict]:
-        """Get units list for an app"""
+    def get_app_records(self, network: str, app_key: Optional[str] = None) -> "AppRecordBatch":
+        """Get apps list as a normalized columnar batch (see utils.app_records)
+        
+        Args:
+            network: Network name
+            app_key: Optional app key to filter by (for IronSource)
+        """
+        from utils.app_records import get_app_record_batch
+        return get_app_record_batch(network, self.get_apps(network, app_key=app_key))
+    
+    def get_recent_apps(self, network: str, limit: int = 3, refresh: bool = False) -> List[Dict]:
+        """Get the newest apps of a network (cached until refresh or a successful create)
+        
+        Mintegral and InMobi are asked for the first page only (server-side limit);
+        other networks fetch the full list once and serve a sorted slice from the cache.
+        
+        Args:
+            network: Network name
+            limit: Number of newest apps to return
+            refresh: Ignore the cache and query the API again
+        
+        Returns:
+            Up to `limit` apps, newest first
+        """
+        with self._recent_apps_lock:
+            cached = self._recent_apps_cache.get(network)
+        if cached and not refresh:
+            fetched_limit, apps = cached
+            if fetched_limit is None or fetched_limit >= limit:
+                return apps[:limit]
+        
+        if network in SERVER_LIMITED_APP_LISTS:
+            apps = self._get_api(network).get_apps(limit=limit)
+            fetched_limit = limit
+        else:
+            apps = sort_apps_newest_first(self.get_apps(network))
+            fetched_limit = None
+        
+        # Empty results are not cached (likely an API/auth error)
+        if apps:
+            with self._recent_apps_lock:
+                self._recent_apps_cache[network] = (fetched_limit, apps)
+        return apps[:limit]
+    
+    def prime_recent_apps(self, network: str, apps: List[Dict], limit: int = 3):
+        """Fill the recent apps cache from a freshly fetched full app list (background sync)
+        
+        Mintegral and InMobi recent apps come from the server's first page
+        (newest first), so that page is fetched instead.
+        """
+        if network in SERVER_LIMITED_APP_LISTS:
+            self.get_recent_apps(network, limit=limit, refresh=True)
+        elif apps:
+            with self._recent_apps_lock:
+                self._recent_apps_cache[network] = (None, sort_apps_newest_first(apps))
+    
+    def invalidate_recent_apps(self, network: Optional[str] = None):
+        """Drop cached recent apps (all networks if network is None)"""
+        with self._recent_apps_lock:
+            if network is None:
+                self._recent_apps_cache.clear()
+            else:
+                self._recent_apps_cache.pop(network, None)
+    
+    def get_units(self, network: str, app_code: str) -> Optional[List[Dict]]:
+        """Get units list for an app (Pangle: None if the request failed)"""
         if network == "pangle":
-            # Use new PangleAPI
-            if self._pangle_api is None:
-                from utils.network_apis.pangle_api import PangleAPI
-                self._pangle_api = PangleAPI()
-            return self._pangle_api.get_units(app_code=app_code)
+            return self._get_api("pangle").get_units(app_code=app_code)
         
         # Mock implementation for other networks
         return [
@@ -2193,14 +2457,27 @@ class MockNetworkManager:
 
 # Global instance
 _network_manager = None
+_network_manager_lock = threading.Lock()
 
 
 def get_network_manager():
-    """Get or create network manager instance"""
+    """Get or create network manager instance
+    
+    Set NETWORK_CLIENT_WARMUP=true to pre-create clients and fetch tokens in the
+    background when the manager is first created, and INVENTORY_SYNC=true to
+    start the background inventory sync (utils.inventory_sync).
+    """
     global _network_manager
     if _network_manager is None:
-        # In real implementation, initialize from BE/services/ad_network_manager.py
-        # For now, use mock
-        _network_manager = MockNetworkManager()
+        with _network_manager_lock:
+            if _network_manager is None:
+                # In real implementation, initialize from BE/services/ad_network_manager.py
+                # For now, use mock
+                manager = MockNetworkManager()
+                if str(get_env_var("NETWORK_CLIENT_WARMUP") or "").lower() in ("1", "true", "yes"):
+                    threading.Thread(target=manager.warm_up, name="network_client_warmup", daemon=True).start()
+                _network_manager = manager
+                if is_sync_enabled():
+                    get_inventory_sync_service()
     return _network_manager
 
@@ -0,0 +1,98 @@
+"""Process-level store for large payloads referenced from session state by key"""
+import logging
+import threading
+import time
+import uuid
+from collections import OrderedDict
+from typing import Any, Optional
+
+from utils.helpers import get_env_var
+
+logger = logging.getLogger(__name__)
+
+# Defaults (override with PAYLOAD_STORE_MAX_ENTRIES / PAYLOAD_STORE_TTL_SECONDS)
+DEFAULT_MAX_ENTRIES = 256
+DEFAULT_TTL_SECONDS = 6 * 60 * 60
+
+
+class PayloadStore:
+    """Thread-safe LRU store of raw API responses / large lists
+
+    Session state only keeps the returned reference string, so Streamlit does not
+    pickle and diff the payload on every rerun. Entries expire after the TTL and the
+    least recently used entries are evicted above max_entries.
+    """
+
+    def __init__(self, max_entries: int = DEFAULT_MAX_ENTRIES, ttl: float = DEFAULT_TTL_SECONDS):
+        self.max_entries = max_entries
+        self.ttl = ttl
+        self._entries: "OrderedDict[str, tuple]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def put(self, data: Any, ref: Optional[str] = None) -> str:
+        """Store a payload and return its reference
+
+        Args:
+            data: Payload to store
+            ref: Existing reference to overwrite (new one is generated if None)
+
+        Returns:
+            Reference string to keep in session state
+        """
+        ref = ref or uuid.uuid4().hex
+        with self._lock:
+            self._entries[ref] = (time.time(), data)
+            self._entries.move_to_end(ref)
+            self._evict_locked()
+        return ref
+
+    def get(self, ref: Optional[str], default: Any = None) -> Any:
+        """Get a payload by reference (default if missing or expired)"""
+        if not ref:
+            return default
+        with self._lock:
+            entry = self._entries.get(ref)
+            if entry is None:
+                return default
+            stored_at, data = entry
+            if time.time() - stored_at > self.ttl:
+                del self._entries[ref]
+                return default
+            self._entries.move_to_end(ref)
+            return data
+
+    def discard(self, ref: Optional[str]):
+        """Remove a payload"""
+        if not ref:
+            return
+        with self._lock:
+            self._entries.pop(ref, None)
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def _evict_locked(self):
+        now = time.time()
+        expired = [ref for ref, (stored_at, _) in self._entries.items() if now - stored_at > self.ttl]
+        for ref in expired:
+            del self._entries[ref]
+        while len(self._entries) > self.max_entries:
+            ref, _ = self._entries.popitem(last=False)
+            logger.debug(f"[PayloadStore] Evicted {ref}")
+
+
+_payload_store: Optional[PayloadStore] = None
+_payload_store_lock = threading.Lock()
+
+
+def get_payload_store() -> PayloadStore:
+    """Get the process-wide payload store"""
+    global _payload_store
+    if _payload_store is None:
+        with _payload_store_lock:
+            if _payload_store is None:
+                _payload_store = PayloadStore(
+                    max_entries=int(get_env_var("PAYLOAD_STORE_MAX_ENTRIES") or DEFAULT_MAX_ENTRIES),
+                    ttl=float(get_env_var("PAYLOAD_STORE_TTL_SECONDS") or DEFAULT_TTL_SECONDS)
+                )
+    return _payload_store
@@ -0,0 +1,203 @@
+"""Priority-aware scheduling of network API requests (interactive > bulk > background)"""
+import contextvars
+import heapq
+import itertools
+import logging
+import threading
+import time
+from contextlib import contextmanager
+from typing import Callable, Dict, Optional, Tuple
+from urllib.parse import urlsplit
+
+logger = logging.getLogger(__name__)
+
+# Priority classes (lower runs first)
+INTERACTIVE = 0   # single clicks: "최근 생성한 App 조회", one create
+BULK = 1          # bulk fetch / create / update runs
+BACKGROUND = 2    # background sync
+
+PRIORITY_NAMES = {INTERACTIVE: "interactive", BULK: "bulk", BACKGROUND: "background"}
+
+# API host -> network (requests to other hosts share the "other" limits)
+NETWORK_HOSTS = {
+    "platform.ironsrc.com": "ironsource",
+    "www.bigossp.com": "bigoads",
+    "dev.mintegral.com": "mintegral",
+    "publisher.inmobi.com": "inmobi",
+    "console.fyber.com": "fyber",
+    "o.applovin.com": "applovin",
+    "services.api.unity.com": "unity",
+    "open-api.pangleglobal.com": "pangle",
+    "publisher-api.vungle.com": "vungle",
+    "auth-api.vungle.com": "vungle",
+}
+
+# Per-network request limits: (max concurrent requests, min seconds between request starts).
+# Covers every call, unit creates and bulk inventory reads included
+NETWORK_REQUEST_LIMITS = {
+    "bigoads": (2, 0.5),  # BigOAds has strict QPS limit
+    "applovin": (3, 0.5),  # unit creates need 0.5s spacing
+    "ironsource": (4, 0.1),  # bulk instance reads
+    "unity": (3, 0.0),  # provisioning writes
+}
+_DEFAULT_REQUEST_LIMIT = (6, 0.0)
+
+# Share of a network's slots lower priorities may hold, so an interactive call
+# never queues behind a full set of bulk requests (at least one slot each)
+_PRIORITY_SLOT_SHARE = {INTERACTIVE: 1.0, BULK: 0.75, BACKGROUND: 0.5}
+
+# Waits longer than this are logged
+_SLOW_WAIT_SECONDS = 1.0
+
+_priority_var: contextvars.ContextVar = contextvars.ContextVar("request_priority", default=INTERACTIVE)
+
+
+def current_priority() -> int:
+    """Priority of requests made from the current context"""
+    return _priority_var.get()
+
+
+@contextmanager
+def request_priority(priority: int):
+    """Run requests in this block with the given priority
+
+    Worker threads do not inherit it; wrap their functions with with_current_priority.
+    """
+    token = _priority_var.set(priority)
+    try:
+        yield
+    finally:
+        _priority_var.reset(token)
+
+
+def with_current_priority(fn: Callable) -> Callable:
+    """Bind the caller's priority to fn (for ThreadPoolExecutor workers)"""
+    priority = current_priority()
+
+    def run(*args, **kwargs):
+        with request_priority(priority):
+            return fn(*args, **kwargs)
+    return run
+
+
+def network_for_url(url: str) -> str:
+    """Network key of an API URL ("other" if the host is unknown)"""
+    return NETWORK_HOSTS.get(urlsplit(url).hostname or "", "other")
+
+
+def network_concurrency(network: str) -> int:
+    """Max concurrent requests of a network (sizes worker pools that call it)"""
+    return get_request_scheduler().gate(network).max_concurrent
+
+
+class PriorityGate:
+    """Concurrency slots and start spacing for one network, granted in priority order
+
+    Waiters are served highest priority first (FIFO within a class). Lower
+    classes may only fill their share of the slots, leaving room for
+    interactive requests.
+    """
+
+    def __init__(self, network: str, max_concurrent: int, min_interval: float):
+        self.network = network
+        self.max_concurrent = max_concurrent
+        self.min_interval = min_interval
+        self._cond = threading.Condition()
+        self._waiters = []
+        self._seq = itertools.count()
+        self._active = 0
+        self._last_start = 0.0
+
+    def _capacity(self, priority: int) -> int:
+        return max(1, int(self.max_concurrent * _PRIORITY_SLOT_SHARE.get(priority, 0.5)))
+
+    def acquire(self, priority: int) -> float:
+        """Wait for a slot; returns seconds waited"""
+        started = time.monotonic()
+        entry = (priority, next(self._seq))
+        with self._cond:
+            heapq.heappush(self._waiters, entry)
+            try:
+                while True:
+                    if self._waiters[0] == entry and self._active < self._capacity(priority):
+                        wait = self._last_start + self.min_interval - time.monotonic()
+                        if wait <= 0:
+                            break
+                        self._cond.wait(wait)
+                    else:
+                        self._cond.wait()
+            except BaseException:
+                self._waiters.remove(entry)
+                heapq.heapify(self._waiters)
+                self._cond.notify_all()
+                raise
+            heapq.heappop(self._waiters)
+            self._active += 1
+            self._last_start = time.monotonic()
+            # Next waiter re-checks (it may fit in the remaining slots)
+            self._cond.notify_all()
+        return time.monotonic() - started
+
+    def release(self):
+        with self._cond:
+            self._active -= 1
+            self._cond.notify_all()
+
+    def stats(self) -> Dict:
+        with self._cond:
+            queued = {}
+            for priority, _ in self._waiters:
+                name = PRIORITY_NAMES.get(priority, str(priority))
+                queued[name] = queued.get(name, 0) + 1
+            return {"active": self._active, "max_concurrent": self.max_concurrent, "queued": queued}
+
+
+class RequestScheduler:
+    """Per-network priority gates shared by every API request of the process"""
+
+    def __init__(self, limits: Optional[Dict[str, Tuple[int, float]]] = None):
+        self.limits = dict(NETWORK_REQUEST_LIMITS if limits is None else limits)
+        self._gates: Dict[str, PriorityGate] = {}
+        self._lock = threading.Lock()
+
+    def gate(self, network: str) -> PriorityGate:
+        with self._lock:
+            gate = self._gates.get(network)
+            if gate is None:
+                max_concurrent, min_interval = self.limits.get(network, _DEFAULT_REQUEST_LIMIT)
+                gate = PriorityGate(network, max_concurrent, min_interval)
+                self._gates[network] = gate
+            return gate
+
+    @contextmanager
+    def slot(self, network: str, priority: Optional[int] = None):
+        """Hold one of the network's request slots (priority: current context's by default)"""
+        priority = current_priority() if priority is None else priority
+        gate = self.gate(network)
+        waited = gate.acquire(priority)
+        if waited > _SLOW_WAIT_SECONDS:
+            logger.info(f"[Scheduler] {network} {PRIORITY_NAMES.get(priority, priority)} request waited {waited:.1f}s")
+        try:
+            yield
+        finally:
+            gate.release()
+
+    def stats(self) -> Dict[str, Dict]:
+        """network -> {"active", "max_concurrent", "queued": {priority name: count}}"""
+        with self._lock:
+            gates = dict(self._gates)
+        return {network: gate.stats() for network, gate in gates.items()}
+
+
+_request_scheduler: Optional[RequestScheduler] = None
+_request_scheduler_lock = threading.Lock()
+
+
+def get_request_scheduler() -> RequestScheduler:
+    """Get the process-wide request scheduler"""
+    global _request_scheduler
+    if _request_scheduler is None:
+        with _request_scheduler_lock:
+            if _request_scheduler is None:
+                _request_scheduler = RequestScheduler()
+    return _request_scheduler
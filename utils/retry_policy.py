@@ -0,0 +1,214 @@
+"""Retry policies and per-network response classification for network API requests"""
+import logging
+import random
+import time
+from email.utils import parsedate_to_datetime
+from typing import Callable, Dict, Optional
+
+import requests
+
+logger = logging.getLogger(__name__)
+
+# Response classes
+OK = "ok"
+RETRYABLE = "retryable"          # transient server/network error
+AUTH_REFRESH = "auth_refresh"    # credentials expired: refresh, then resend
+RATE_LIMITED = "rate_limited"    # back off (Retry-After if given), then resend
+FATAL = "fatal"                  # client error or business failure: do not resend
+
+RETRYABLE_STATUS_CODES = (408, 500, 502, 503, 504)
+
+# Body messages that mean "slow down" on networks that answer HTTP 200 with an error code
+_RATE_LIMIT_MARKERS = ("too many", "too frequent", "frequency", "qps", "rate limit", "limit exceeded")
+
+
+class RetryPolicy:
+    """Retry limits for one kind of operation
+
+    Args:
+        max_attempts: Attempts including the first one
+        base_delay: Backoff base in seconds (full jitter: uniform(0, base * 2^n), capped)
+        max_delay: Cap for one backoff / Retry-After wait
+        budget: Max seconds spent on one call including waits (no retry would exceed it)
+        resend_unsafe: Resend after errors where the request may have been processed
+            (timeouts, 500/502/504); off for writes, which rely on the create ledger instead
+    """
+
+    __slots__ = ("max_attempts", "base_delay", "max_delay", "budget", "resend_unsafe")
+
+    def __init__(self, max_attempts: int, base_delay: float, max_delay: float, budget: float,
+                 resend_unsafe: bool = True):
+        self.max_attempts = max_attempts
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+        self.budget = budget
+        self.resend_unsafe = resend_unsafe
+
+    def backoff(self, retry: int) -> float:
+        """Jittered delay before retry number `retry` (1-based)"""
+        return random.uniform(0, min(self.max_delay, self.base_delay * (2 ** retry)))
+
+
+# Policy per operation ("read": GET/list calls, "write": create/update calls)
+RETRY_POLICIES = {
+    "read": RetryPolicy(max_attempts=4, base_delay=0.5, max_delay=8.0, budget=60.0),
+    "write": RetryPolicy(max_attempts=3, base_delay=1.0, max_delay=10.0, budget=60.0, resend_unsafe=False),
+}
+
+
+def _body_error(response: requests.Response, success_codes) -> Optional[str]:
+    """Error class of an HTTP 200 body whose code is not a success code (None if success/unknown)"""
+    from utils.http_json import parse_json  # http_json sends every request through this module
+
+    try:
+        body = parse_json(response)
+    except ValueError:
+        return None
+    if not isinstance(body, dict):
+        return None
+    code = body.get("code", body.get("ret_code"))
+    if code is None or code in success_codes or body.get("status") == 0:
+        return None
+    message = str(body.get("msg") or body.get("message") or "").lower()
+    if any(marker in message for marker in _RATE_LIMIT_MARKERS):
+        return RATE_LIMITED
+    return FATAL
+
+
+def _body_classifier(*success_codes) -> Callable[[requests.Response], Optional[str]]:
+    return lambda response: _body_error(response, success_codes)
+
+
+# Networks reporting failures inside HTTP 200 bodies: network -> classifier (None = use HTTP status)
+NETWORK_BODY_CLASSIFIERS: Dict[str, Callable[[requests.Response], Optional[str]]] = {
+    "bigoads": _body_classifier("100", 0),
+    "mintegral": _body_classifier(200, 0),
+    "pangle": _body_classifier(0),
+}
+
+
+def classify_response(network: str, response: requests.Response, stream: bool = False) -> str:
+    """Map a response to OK / RETRYABLE / AUTH_REFRESH / RATE_LIMITED / FATAL
+
+    Args:
+        network: Network key (lowercase, e.g. "bigoads")
+        response: Response to classify
+        stream: Body not read yet (only the status code is used)
+    """
+    status = response.status_code
+    if status == 401:
+        return AUTH_REFRESH
+    if status == 429:
+        return RATE_LIMITED
+    if status in RETRYABLE_STATUS_CODES:
+        return RETRYABLE
+    if status >= 400:
+        return FATAL
+    classifier = NETWORK_BODY_CLASSIFIERS.get(network)
+    if classifier is not None and not stream:
+        return classifier(response) or OK
+    return OK
+
+
+def classify_exception(error: Exception) -> str:
+    """Connection errors and timeouts are retryable; anything else is fatal"""
+    if isinstance(error, (requests.exceptions.ConnectionError, requests.exceptions.Timeout)):
+        return RETRYABLE
+    return FATAL
+
+
+def _is_safe_to_resend(response: Optional[requests.Response], error: Optional[Exception]) -> bool:
+    """Whether the failed request was certainly not processed (a write can be sent again)"""
+    if error is not None:
+        return isinstance(error, requests.exceptions.ConnectTimeout)
+    return response is not None and response.status_code == 503
+
+
+def retry_after_seconds(response: Optional[requests.Response]) -> Optional[float]:
+    """Retry-After header as seconds (delta or HTTP date), None if absent or invalid"""
+    value = response.headers.get("Retry-After") if response is not None else None
+    if not value:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        return max(0.0, parsedate_to_datetime(value).timestamp() - time.time())
+    except (TypeError, ValueError):
+        return None
+
+
+def send_with_retry(
+    network: str,
+    operation: str,
+    send: Callable[[Optional[Dict]], requests.Response],
+    headers: Optional[Dict] = None,
+    refresh_auth: Optional[Callable[[Optional[Dict]], Optional[Dict]]] = None,
+    stream: bool = False
+) -> requests.Response:
+    """Send a request, retrying by the operation's policy and the network's classification
+
+    AUTH_REFRESH calls refresh_auth once (new headers, or None if it cannot refresh).
+    RATE_LIMITED waits for Retry-After when given (else backoff). Writes are resent
+    only when the failed attempt certainly was not processed, or after 401/429.
+
+    Args:
+        network: Network key (lowercase)
+        operation: "read" or "write" (key of RETRY_POLICIES)
+        send: Sends one attempt with the given headers
+        headers: Request headers
+        refresh_auth: Returns refreshed headers after a 401
+        stream: Response body is read later by the caller (classified by status only)
+
+    Returns:
+        Last response (may be an error response; callers keep their own handling)
+
+    Raises:
+        requests.exceptions.RequestException: Last attempt failed without a response
+    """
+    policy = RETRY_POLICIES.get(operation, RETRY_POLICIES["read"])
+    started = time.monotonic()
+    auth_refreshed = False
+    attempt = 0
+    while True:
+        attempt += 1
+        response, error = None, None
+        try:
+            response = send(headers)
+            outcome = classify_response(network, response, stream=stream)
+        except requests.exceptions.RequestException as e:
+            error = e
+            outcome = classify_exception(e)
+
+        if outcome in (OK, FATAL) or attempt >= policy.max_attempts:
+            break
+        if outcome == AUTH_REFRESH:
+            if auth_refreshed or refresh_auth is None:
+                break
+            auth_refreshed = True
+            new_headers = refresh_auth(headers)
+            if not new_headers:
+                break
+            headers = new_headers
+            delay = 0.0
+        elif outcome == RETRYABLE and not policy.resend_unsafe and not _is_safe_to_resend(response, error):
+            break
+        else:
+            delay = policy.backoff(attempt)
+            if outcome == RATE_LIMITED:
+                retry_after = retry_after_seconds(response)
+                if retry_after is not None:
+                    delay = retry_after
+            if delay > policy.max_delay or time.monotonic() - started + delay > policy.budget:
+                logger.warning(f"[{network.title()}] Retry budget exhausted ({outcome}, wait {delay:.1f}s)")
+                break
+
+        reason = f"HTTP {response.status_code}" if response is not None else type(error).__name__
+        logger.warning(f"[{network.title()}] {outcome} ({reason}); retry {attempt}/{policy.max_attempts - 1} in {delay:.1f}s")
+        if delay > 0:
+            time.sleep(delay)
+
+    if error is not None:
+        raise error
+    return response
@@ -1,8 +1,41 @@
 """Session state management utilities"""
+from collections import deque
 from datetime import datetime
-from typing import Dict, List, Optional
+from typing import Any, Dict, List, Optional
 import streamlit as st
 
+from utils.helpers import get_env_var
+from utils.inventory_sync import get_inventory_sync_service
+from utils.payload_store import get_payload_store
+
+# History ring buffer sizes (override with SESSION_HISTORY_LIMIT_<KIND>, e.g. SESSION_HISTORY_LIMIT_CREATED_APPS)
+HISTORY_LIMITS = {
+    'created_apps': 50,
+    'created_units': 200,
+    'error_log': 100,
+}
+
+# Fields kept in history records (everything else stays in the API response / caches)
+APP_HISTORY_FIELDS = ('appCode', 'appKey', 'appId', 'name', 'platform', 'hasAndroid', 'hasIOS')
+UNIT_HISTORY_FIELDS = ('slotCode', 'name', 'appCode', 'slotType', 'adType', 'platform')
+MAX_ERROR_LENGTH = 500
+
+
+def _history_limit(kind: str) -> int:
+    """Configured ring buffer size for a history kind"""
+    value = get_env_var(f"SESSION_HISTORY_LIMIT_{kind.upper()}")
+    try:
+        return max(1, int(value)) if value else HISTORY_LIMITS[kind]
+    except ValueError:
+        return HISTORY_LIMITS[kind]
+
+
+def _compact_record(network: str, data: Dict, fields: tuple) -> Dict:
+    """History record with only the fields we display"""
+    record = {'network': network, 'timestamp': datetime.now().isoformat()}
+    record.update({field: data[field] for field in fields if data.get(field) is not None})
+    return record
+
 
 class SessionManager:
     """Manage Streamlit session state"""
@@ -19,17 +52,11 @@ class SessionManager:
         if 'units_cache' not in st.session_state:
             st.session_state.units_cache = {}
         
-        if 'created_apps' not in st.session_state:
-            st.session_state.created_apps = []
-        
-        if 'created_units' not in st.session_state:
-            st.session_state.created_units = []
+        for kind in HISTORY_LIMITS:
+            SessionManager._get_history_buffer(kind)
         
         if 'last_sync_time' not in st.session_state:
             st.session_state.last_sync_time = {}
-        
-        if 'error_log' not in st.session_state:
-            st.session_state.error_log = []
     
     @staticmethod
     def switch_network(network_name: str):
@@ -54,6 +81,33 @@ class SessionManager:
         """Get cached apps for a network"""
         return st.session_state.get('apps_cache', {}).get(network, [])
     
+    @staticmethod
+    def get_last_sync_time(network: str) -> Optional[datetime]:
+        """Last sync of a network: this session's fetch or the background inventory sync, whichever is newer"""
+        if 'last_sync_time' not in st.session_state:
+            st.session_state.last_sync_time = {}
+        session_time = st.session_state.last_sync_time.get(network)
+        synced_time = get_inventory_sync_service().last_synced(network)
+        if synced_time and (session_time is None or synced_time > session_time):
+            st.session_state.last_sync_time[network] = synced_time
+            return synced_time
+        return session_time
+    
+    @staticmethod
+    def get_last_sync_age(network: str) -> str:
+        """Age of the last sync for display (e.g., "5분 전", "Never")"""
+        sync_time = SessionManager.get_last_sync_time(network)
+        if sync_time is None:
+            return "Never"
+        seconds = max(0, int((datetime.now() - sync_time).total_seconds()))
+        if seconds < 60:
+            return "방금 전"
+        if seconds < 3600:
+            return f"{seconds // 60}분 전"
+        if seconds < 86400:
+            return f"{seconds // 3600}시간 전"
+        return sync_time.strftime("%Y-%m-%d %H:%M")
+    
     @staticmethod
     def cache_units(network: str, app_code: str, units: List[Dict]):
         """Cache units for a specific app"""
@@ -71,14 +125,9 @@ class SessionManager:
     @staticmethod
     def add_created_app(network: str, app_data: Dict):
         """Add created app to history"""
-        if 'created_apps' not in st.session_state:
-            st.session_state.created_apps = []
-        app_entry = {
-            'network': network,
-            'timestamp': datetime.now().isoformat(),
-            **app_data
-        }
-        st.session_state.created_apps.append(app_entry)
+        SessionManager._get_history_buffer('created_apps').append(
+            _compact_record(network, app_data, APP_HISTORY_FIELDS)
+        )
         
         # Store the most recently created app code for this network
         if 'last_created_app_code' not in st.session_state:
@@ -103,22 +152,66 @@ class SessionManager:
     @staticmethod
     def add_created_unit(network: str, unit_data: Dict):
         """Add created unit to history"""
-        if 'created_units' not in st.session_state:
-            st.session_state.created_units = []
-        st.session_state.created_units.append({
-            'network': network,
-            'timestamp': datetime.now().isoformat(),
-            **unit_data
-        })
+        SessionManager._get_history_buffer('created_units').append(
+            _compact_record(network, unit_data, UNIT_HISTORY_FIELDS)
+        )
     
     @staticmethod
     def log_error(network: str, error: str):
         """Log an error"""
-        if 'error_log' not in st.session_state:
-            st.session_state.error_log = []
-        st.session_state.error_log.append({
+        SessionManager._get_history_buffer('error_log').append({
             'network': network,
             'timestamp': datetime.now().isoformat(),
-            'error': error
+            'error': str(error)[:MAX_ERROR_LENGTH]
         })
-
+    
+    @staticmethod
+    def get_history(kind: str, limit: Optional[int] = None) -> List[Dict]:
+        """Get history records, oldest first
+        
+        Args:
+            kind: 'created_apps', 'created_units' or 'error_log'
+            limit: Return only the most recent N records
+        """
+        records = list(st.session_state.get(kind, []))
+        return records[-limit:] if limit else records
+    
+    @staticmethod
+    def _get_history_buffer(kind: str) -> deque:
+        """Ring buffer for a history kind (migrates lists from older sessions)"""
+        limit = _history_limit(kind)
+        buffer = st.session_state.get(kind)
+        if not isinstance(buffer, deque) or buffer.maxlen != limit:
+            buffer = deque(buffer or [], maxlen=limit)
+            st.session_state[kind] = buffer
+        return buffer
+    
+    @staticmethod
+    def stash_payload(key: str, data: Any):
+        """Keep a large payload (raw API response, full list) out of session state
+        
+        The payload goes to the process-level store; session state only holds its
+        reference under `key`. Read it back with get_payload(key).
+        """
+        ref = st.session_state.get(key)
+        st.session_state[key] = get_payload_store().put(data, ref=ref if isinstance(ref, str) else None)
+    
+    @staticmethod
+    def get_payload(key: str, default: Any = None) -> Any:
+        """Get a payload stashed with stash_payload (default if missing or evicted)"""
+        ref = st.session_state.get(key)
+        if ref is None or not isinstance(ref, str):
+            return ref if ref is not None else default
+        return get_payload_store().get(ref, default)
+    
+    @staticmethod
+    def has_payload(key: str) -> bool:
+        """Whether a stashed payload is still available"""
+        return SessionManager.get_payload(key) is not None
+    
+    @staticmethod
+    def clear_payload(key: str):
+        """Drop a stashed payload and its reference"""
+        ref = st.session_state.pop(key, None)
+        if isinstance(ref, str):
+            get_payload_store().discard(ref)
@@ -0,0 +1,280 @@
+"""Bulk Unity provisioning: archive → create ad units → create placements across projects/stores"""
+import logging
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, List, Optional
+
+from utils.app_records import parse_unity_stores
+from utils.request_scheduler import BULK, request_priority, with_current_priority
+
+logger = logging.getLogger(__name__)
+
+UNITY_STORES = ("apple", "google")
+
+# Default ad units per store (same set as the Create Unit UI: "iOS RV Bidding", "AOS RV Bidding", ...)
+UNITY_AD_UNIT_SLOTS = {
+    "RV": {"adFormat": "rewarded", "short": "rv"},
+    "IS": {"adFormat": "interstitial", "short": "is"},
+    "BN": {"adFormat": "banner", "short": "bn"},
+}
+
+# Plan steps (in order)
+STEP_ARCHIVE = "archive"
+STEP_CREATE_AD_UNITS = "create_ad_units"
+STEP_CREATE_PLACEMENTS = "create_placements"
+
+MAX_PARALLEL_TARGETS = 4
+
+
+def unity_placement_name(store_id: Optional[str], store_name: str, short_format: str) -> str:
+    """Placement name used by the Create Unit UI, e.g. "app aos unity rv bidding"
+
+    Args:
+        store_id: Google storeId of the project (last package segment is used)
+        store_name: "apple" or "google"
+        short_format: "rv", "is", or "bn"
+    """
+    os_str = "ios" if store_name == "apple" else "aos"
+    last_part = store_id.split(".")[-1].lower() if store_id else "unknown"
+    return f"{last_part} {os_str} unity {short_format} bidding"
+
+
+def default_unity_ad_units(store_name: str, store_id: Optional[str] = None) -> List[Dict]:
+    """RV/IS/BN ad unit payload for one store, each with its bidding placement inline"""
+    prefix = "iOS" if store_name == "apple" else "AOS"
+    return [
+        {
+            "name": f"{prefix} {slot_key} Bidding",
+            "adFormat": slot["adFormat"],
+            "addPlacements": [{
+                "name": unity_placement_name(store_id, store_name, slot["short"]),
+                "placementType": "bidding"
+            }]
+        }
+        for slot_key, slot in UNITY_AD_UNIT_SLOTS.items()
+    ]
+
+
+def _store_ad_unit_ids(store_data) -> List[str]:
+    """Ad unit ids of one store from a get_ad_units response ({id: {...}}, {"adUnits": {...}} or a list)"""
+    if isinstance(store_data, dict):
+        ad_units = store_data.get("adUnits", store_data)
+        return list(ad_units.keys()) if isinstance(ad_units, dict) else []
+    if isinstance(store_data, list):
+        return [str(unit.get("id")) for unit in store_data if isinstance(unit, dict) and unit.get("id")]
+    return []
+
+
+def _existing_ad_unit_ids(existing: Dict[str, Optional[Dict]], target: "UnityProvisionTarget") -> Optional[List[str]]:
+    """Ad unit ids of the target's store from the per-project reads
+
+    Returns:
+        Ids to archive ([] if the project was not read or has none), None if the read failed
+    """
+    if target.project_id not in existing:
+        return []
+    ad_units = existing[target.project_id]
+    if ad_units is None:
+        return None
+    return _store_ad_unit_ids(ad_units.get(target.store_name))
+
+
+def _created_ad_unit_ids(result) -> Dict[str, str]:
+    """Ad unit name -> id from a create_ad_units result"""
+    if isinstance(result, dict):
+        result = result.get("adUnits", result)
+    items = result.items() if isinstance(result, dict) else ((unit.get("id"), unit) for unit in result or [])
+    created = {}
+    for ad_unit_id, unit in items:
+        if isinstance(unit, dict) and ad_unit_id:
+            created[unit.get("name") or str(ad_unit_id)] = str(unit.get("id") or ad_unit_id)
+    return created
+
+
+class UnityProvisionTarget:
+    """One (project, store) to provision
+
+    Args:
+        project_id: Unity project ID
+        store_name: "apple" or "google"
+        archive: Archive the store's existing ad units first
+        ad_units: Ad unit payload (default: RV/IS/BN with inline bidding placements)
+        placements: Extra placements per ad unit name, created after the ad units
+    """
+
+    __slots__ = ("project_id", "store_name", "archive", "ad_units", "placements")
+
+    def __init__(self, project_id: str, store_name: str, archive: bool = True,
+                 ad_units: Optional[List[Dict]] = None, placements: Optional[Dict[str, List[Dict]]] = None):
+        self.project_id = str(project_id).strip()
+        self.store_name = store_name
+        self.archive = archive
+        self.ad_units = ad_units
+        self.placements = placements or {}
+
+    def steps(self) -> List[str]:
+        steps = [STEP_ARCHIVE] if self.archive else []
+        steps.append(STEP_CREATE_AD_UNITS)
+        if self.placements:
+            steps.append(STEP_CREATE_PLACEMENTS)
+        return steps
+
+    def __repr__(self) -> str:
+        return f"UnityProvisionTarget({self.project_id!r}, {self.store_name!r}, steps={self.steps()!r})"
+
+
+def plan_unity_provisioning(targets: List[UnityProvisionTarget]) -> Dict[str, List[Dict]]:
+    """Group targets by project and list the steps of each
+
+    Returns:
+        project_id -> [{"store_name", "steps"}] (duplicate (project, store) targets dropped)
+    """
+    plan = defaultdict(list)
+    seen = set()
+    for target in targets:
+        key = (target.project_id, target.store_name)
+        if key in seen or target.store_name not in UNITY_STORES:
+            logger.warning(f"[Unity] Skipping target {target!r} (duplicate or unknown store)")
+            continue
+        seen.add(key)
+        plan[target.project_id].append({"store_name": target.store_name, "steps": target.steps()})
+    return dict(plan)
+
+
+def _project_store_ids(projects: List[Dict]) -> Dict[str, Optional[str]]:
+    """project id -> Google storeId (used for placement names on both stores)"""
+    store_ids = {}
+    for project in projects or []:
+        stores = parse_unity_stores(project.get("stores_parsed") or project.get("stores"))
+        store_ids[str(project.get("id"))] = (stores.get("google") or {}).get("storeId") or None
+    return store_ids
+
+
+def _run_target(target: UnityProvisionTarget, existing_ids: Optional[List[str]], store_id: Optional[str],
+                network_manager) -> Dict:
+    """Run archive → create ad units → create placements for one target (stops at the first failure)
+
+    existing_ids is None when the project's ad units could not be read; an
+    archiving target then fails instead of creating units next to the old ones.
+    """
+    report = {
+        "project_id": target.project_id,
+        "store_name": target.store_name,
+        "status": "success",
+        "archived": 0,
+        "created_ad_units": {},
+        "created_placements": 0,
+        "failed_step": None,
+        "error": None,
+    }
+
+    def fail(step: str, response: Dict) -> Dict:
+        report.update(status="failed", failed_step=step, error=response.get("msg", "Unknown error"))
+        logger.error(f"[Unity] {step} failed for {target.project_id}/{target.store_name}: {report['error']}")
+        return report
+
+    try:
+        if target.archive and existing_ids is None:
+            return fail(STEP_ARCHIVE, {"msg": "Failed to read existing ad units (nothing archived or created)"})
+        if target.archive and existing_ids:
+            response = network_manager._update_unity_ad_units(
+                target.project_id, target.store_name, {ad_unit_id: {"archive": True} for ad_unit_id in existing_ids}
+            )
+            if response.get("status") != 0:
+                return fail(STEP_ARCHIVE, response)
+            report["archived"] = len(existing_ids)
+
+        payload = target.ad_units if target.ad_units is not None else default_unity_ad_units(target.store_name, store_id)
+        response = network_manager._create_unity_ad_units(target.project_id, target.store_name, payload)
+        if response.get("status") != 0:
+            return fail(STEP_CREATE_AD_UNITS, response)
+        created = _created_ad_unit_ids(response.get("result"))
+        report["created_ad_units"] = created
+
+        for ad_unit_name, placements_payload in target.placements.items():
+            ad_unit_id = created.get(ad_unit_name)
+            if not ad_unit_id:
+                return fail(STEP_CREATE_PLACEMENTS, {"msg": f"Ad unit '{ad_unit_name}' was not created"})
+            response = network_manager._create_unity_placements(
+                target.project_id, target.store_name, ad_unit_id, placements_payload
+            )
+            if response.get("status") != 0:
+                return fail(STEP_CREATE_PLACEMENTS, response)
+            report["created_placements"] += len(placements_payload)
+    except Exception as e:
+        logger.exception(f"[Unity] Error provisioning {target.project_id}/{target.store_name}")
+        report.update(status="failed", error=str(e))
+    return report
+
+
+def provision_unity_targets(
+    targets: List[UnityProvisionTarget],
+    network_manager=None,
+    max_workers: int = MAX_PARALLEL_TARGETS
+) -> Dict:
+    """Provision many Unity (project, store) targets
+
+    Existing ad units are read once per project (only if a target of it archives),
+    then targets run concurrently; steps within a target stay sequential. All
+    calls share Unity's request limits in the request scheduler.
+
+    Args:
+        targets: Targets to provision
+        network_manager: Network manager (default: process-wide instance)
+        max_workers: Max targets in flight
+
+    Returns:
+        {"total", "succeeded", "failed", "targets": [per-target report]}
+    """
+    if network_manager is None:
+        from utils.network_manager import get_network_manager
+        network_manager = get_network_manager()
+    # Provisioning requests yield to interactive ones in the request scheduler
+    with request_priority(BULK):
+        return _provision(targets, network_manager, max_workers)
+
+
+def _provision(targets: List[UnityProvisionTarget], network_manager, max_workers: int) -> Dict:
+    plan = plan_unity_provisioning(targets)
+    by_key = {(target.project_id, target.store_name): target for target in reversed(targets)}
+    planned = [by_key[(project_id, step["store_name"])] for project_id, steps in plan.items() for step in steps]
+    if not planned:
+        return {"total": 0, "succeeded": 0, "failed": 0, "targets": []}
+
+    # Google storeId per project (placement names); one cached project list read
+    store_ids = {}
+    if any(target.ad_units is None for target in planned):
+        try:
+            store_ids = _project_store_ids(network_manager.get_apps("unity"))
+        except Exception as e:
+            logger.warning(f"[Unity] Failed to fetch projects for placement names: {str(e)}")
+
+    # One ad units read per project
+    archive_projects = list(dict.fromkeys(target.project_id for target in planned if target.archive))
+
+    def read_project(project_id: str) -> Optional[Dict]:
+        """Ad units of a project ({} if it has none), None if the read failed"""
+        try:
+            return network_manager._get_unity_ad_units(project_id)
+        except Exception as e:
+            logger.warning(f"[Unity] Failed to read ad units for {project_id}: {str(e)}")
+            return None
+
+    existing = {}
+    if archive_projects:
+        with ThreadPoolExecutor(max_workers=min(len(archive_projects), max_workers),
+                                thread_name_prefix="unity_provision_read") as executor:
+            existing = dict(zip(archive_projects, executor.map(with_current_priority(read_project), archive_projects)))
+
+    logger.info(f"[Unity] Provisioning {len(planned)} targets across {len(plan)} projects")
+
+    def run_target(target: UnityProvisionTarget) -> Dict:
+        return _run_target(target, _existing_ad_unit_ids(existing, target), store_ids.get(target.project_id),
+                           network_manager)
+
+    with ThreadPoolExecutor(max_workers=min(len(planned), max_workers),
+                            thread_name_prefix="unity_provision") as executor:
+        reports = list(executor.map(with_current_priority(run_target), planned))
+
+    succeeded = sum(1 for report in reports if report["status"] == "success")
+    return {"total": len(reports), "succeeded": succeeded, "failed": len(reports) - succeeded, "targets": reports}